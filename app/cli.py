@@ -16,6 +16,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from core.runtime_config import reload_config
+
 console = Console()
 app = typer.Typer(add_completion=False, help="Gigatrader operational helper")
 
@@ -34,7 +36,9 @@ def _load_env() -> None:
     """Load environment variables from the default `.env` file."""
 
     load_dotenv(override=False)
-    os.environ.setdefault("ALPACA_PAPER", "true")
+    if "ALPACA_PAPER" not in os.environ:
+        os.environ["ALPACA_PAPER"] = "true"
+        reload_config()
 
 
 def _read_yaml_or_json(path: Path) -> dict:
@@ -6,13 +6,14 @@ import datetime as dt
 import logging
 import math
 import os
-from collections import deque
-from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Deque, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 from core.config import get_alpaca_settings
+from core.trading_calendar import get_calendar
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,24 +21,21 @@ LOGGER = logging.getLogger(__name__)
 _DEFAULT_STALENESS_SECONDS = 5
 _SNAPSHOT_SKEW_THRESHOLD = 2.0  # seconds
 _MAX_LATENCY_SAMPLES = 500
-_REGULAR_START_UTC = dt.time(hour=13, minute=30)  # 09:30 ET
-_REGULAR_END_UTC = dt.time(hour=20, minute=0)  # 16:00 ET
-
+_INITIAL_CAPACITY = 64
 
-@dataclass(slots=True)
-class SymbolHealth:
-    """Mutable state tracked for an individual symbol."""
-
-    last_event_ts: Optional[dt.datetime] = None
-    last_ingest_ts: Optional[dt.datetime] = None
-    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=_MAX_LATENCY_SAMPLES))
-    status: str = "STALE"
-    last_transition: Optional[dt.datetime] = None
-    last_price: Optional[float] = None
+_STALE = 0
+_OK = 1
+_STATUS_NAMES = ("STALE", "OK")
 
 
 class FeedHealth:
-    """Track feed health metrics and expose diagnostic helpers."""
+    """Track feed health metrics and expose diagnostic helpers.
+
+    State is kept column-wise in numpy arrays indexed by a per-symbol id (last
+    event/ingest timestamps as epoch seconds, status codes, last prices and a
+    fixed-size latency ring per symbol), so universe-wide sweeps such as
+    :meth:`stale_symbols` and :meth:`snapshot` are single vectorized passes.
+    """
 
     def __init__(
         self,
@@ -45,7 +43,9 @@ class FeedHealth:
         historical_client: Optional[object] = None,
         on_state_change: Optional[Callable[[str, str], None]] = None,
     ) -> None:
-        self._symbols: Dict[str, SymbolHealth] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._allocate(_INITIAL_CAPACITY)
         self._historical_client = historical_client
         self._on_state_change = on_state_change
         self._market_open = True
@@ -53,11 +53,37 @@ class FeedHealth:
 
     # ------------------------------------------------------------------
     # Symbol lifecycle helpers
-    def _ensure_symbol(self, symbol: str) -> SymbolHealth:
+    def _allocate(self, capacity: int) -> None:
+        """Size every column to ``capacity`` rows, keeping existing rows."""
+
+        size = len(self._names)
+        columns = {
+            "_last_event": ((capacity,), np.nan, np.float64),
+            "_last_ingest": ((capacity,), np.nan, np.float64),
+            "_last_transition": ((capacity,), np.nan, np.float64),
+            "_last_price": ((capacity,), np.nan, np.float64),
+            "_status": ((capacity,), _STALE, np.int8),
+            # Unwritten ring slots stay NaN so nanquantile ignores them.
+            "_latencies": ((capacity, _MAX_LATENCY_SAMPLES), np.nan, np.float64),
+            "_latency_writes": ((capacity,), 0, np.int64),
+        }
+        for attr, (shape, fill, dtype) in columns.items():
+            column = np.full(shape, fill, dtype=dtype)
+            previous = getattr(self, attr, None)
+            if previous is not None and size:
+                column[:size] = previous[:size]
+            setattr(self, attr, column)
+
+    def _ensure_symbol(self, symbol: str) -> int:
         symbol = symbol.upper()
-        if symbol not in self._symbols:
-            self._symbols[symbol] = SymbolHealth()
-        return self._symbols[symbol]
+        index = self._ids.get(symbol)
+        if index is None:
+            index = len(self._names)
+            if index == self._last_event.shape[0]:
+                self._allocate(index * 2)
+            self._ids[symbol] = index
+            self._names.append(symbol)
+        return index
 
     def set_market_open(self, is_open: bool) -> None:
         """Record whether the market is currently open."""
@@ -69,75 +95,111 @@ class FeedHealth:
     def note_event(self, symbol: str, event_ts: dt.datetime, ingest_ts: dt.datetime) -> None:
         """Record the arrival of a streamed bar or trade event."""
 
-        stats = self._ensure_symbol(symbol)
-        event_ts = _ensure_utc(event_ts)
-        ingest_ts = _ensure_utc(ingest_ts)
+        index = self._ensure_symbol(symbol)
+        event_sec = _ensure_utc(event_ts).timestamp()
+        ingest_sec = _ensure_utc(ingest_ts).timestamp()
 
-        stats.last_event_ts = event_ts
-        stats.last_ingest_ts = ingest_ts
-        latency = (ingest_ts - event_ts).total_seconds()
+        self._last_event[index] = event_sec
+        self._last_ingest[index] = ingest_sec
+        latency = ingest_sec - event_sec
         if latency >= 0:
-            stats.latencies.append(latency)
-        self._set_status(symbol, "OK", ingest_ts)
+            writes = int(self._latency_writes[index])
+            self._latencies[index, writes % _MAX_LATENCY_SAMPLES] = latency
+            self._latency_writes[index] = writes + 1
+        self._set_status(index, _OK, ingest_sec)
 
     def update_last_price(self, symbol: str, price: Optional[float]) -> None:
         """Persist the latest observed stream price for later comparisons."""
 
         if price is None:
             return
-        stats = self._ensure_symbol(symbol)
-        stats.last_price = float(price)
+        self._last_price[self._ensure_symbol(symbol)] = float(price)
 
     def is_stale(self, symbol: str, now: dt.datetime, staleness_sec: int) -> bool:
         """Return ``True`` when the feed is stale for ``symbol``."""
 
-        stats = self._symbols.get(symbol.upper())
-        if stats is None:
+        index = self._ids.get(symbol.upper())
+        if index is None:
             return True
         if not self._market_open:
             return False
-        if stats.last_event_ts is None:
+        last = self._last_event[index]
+        if math.isnan(last):
             return True
-        now = _ensure_utc(now)
-        delta = (now - stats.last_event_ts).total_seconds()
-        if delta > staleness_sec:
-            self._set_status(symbol, "STALE", now)
+        now_sec = _ensure_utc(now).timestamp()
+        if now_sec - last > staleness_sec:
+            self._set_status(index, _STALE, now_sec)
             return True
         return False
 
+    def stale_symbols(self, now: dt.datetime, staleness_sec: float) -> List[str]:
+        """Every tracked symbol that is stale at ``now``, in one vectorized sweep."""
+
+        size = len(self._names)
+        if not size or not self._market_open:
+            return []
+        now_sec = _ensure_utc(now).timestamp()
+        # NaN (never seen) compares False, so it lands on the stale side.
+        stale = ~(now_sec - self._last_event[:size] <= staleness_sec)
+        stale_indices = np.flatnonzero(stale)
+        for index in np.flatnonzero(stale & (self._status[:size] != _STALE)):
+            if not math.isnan(self._last_event[index]):
+                self._set_status(int(index), _STALE, now_sec)
+        return [self._names[index] for index in stale_indices]
+
     # ------------------------------------------------------------------
     # Summaries
     def get_status(self, symbol: str) -> str:
         """Return the current flag for ``symbol``."""
 
-        stats = self._symbols.get(symbol.upper())
-        return stats.status if stats else "UNKNOWN"
+        index = self._ids.get(symbol.upper())
+        return _STATUS_NAMES[self._status[index]] if index is not None else "UNKNOWN"
 
     def latency_summary(self, symbol: str) -> dict:
         """Return latency percentiles for ``symbol``."""
 
-        stats = self._symbols.get(symbol.upper())
-        if stats is None or not stats.latencies:
+        index = self._ids.get(symbol.upper())
+        if index is None or not self._latency_writes[index]:
             return {"p50": None, "p95": None}
-        values = sorted(stats.latencies)
-        p50 = _percentile(values, 0.5)
-        p95 = _percentile(values, 0.95)
-        return {"p50": p50, "p95": p95}
+        count = min(int(self._latency_writes[index]), _MAX_LATENCY_SAMPLES)
+        p50, p95 = np.quantile(self._latencies[index, :count], (0.5, 0.95))
+        return {"p50": float(p50), "p95": float(p95)}
+
+    def latency_summaries(self, symbols: Optional[Sequence[str]] = None) -> Dict[str, dict]:
+        """Latency percentiles for many symbols in one vectorized pass."""
+
+        requested = self._names if symbols is None else [sym.upper() for sym in symbols]
+        result: Dict[str, dict] = {name: {"p50": None, "p95": None} for name in requested}
+        names = [name for name in requested if name in self._ids]
+        if not names:
+            return result
+        indices = np.array([self._ids[name] for name in names], dtype=np.int64)
+        counts = np.minimum(self._latency_writes[indices], _MAX_LATENCY_SAMPLES)
+        has_samples = counts > 0
+        quantiles = _row_quantiles(self._latencies[indices], counts, (0.5, 0.95))
+        for column in np.flatnonzero(has_samples):
+            result[names[column]] = {
+                "p50": float(quantiles[0, column]),
+                "p95": float(quantiles[1, column]),
+            }
+        return result
 
     def snapshot(self) -> List[dict]:
         """Return a summary of symbol states for UI/CLI rendering."""
 
+        latencies = self.latency_summaries()
         report: List[dict] = []
-        for symbol in sorted(self._symbols):
-            stats = self._symbols[symbol]
+        for symbol in sorted(self._names):
+            index = self._ids[symbol]
+            price = self._last_price[index]
             report.append(
                 {
                     "symbol": symbol,
-                    "status": stats.status,
-                    "last_event_ts": stats.last_event_ts,
-                    "last_ingest_ts": stats.last_ingest_ts,
-                    "latency": self.latency_summary(symbol),
-                    "last_price": stats.last_price,
+                    "status": _STATUS_NAMES[self._status[index]],
+                    "last_event_ts": _from_epoch(self._last_event[index]),
+                    "last_ingest_ts": _from_epoch(self._last_ingest[index]),
+                    "latency": latencies[symbol],
+                    "last_price": None if math.isnan(price) else float(price),
                 }
             )
         return report
@@ -161,9 +223,11 @@ class FeedHealth:
         snapshots = client.get_stock_snapshots(request)
         mismatches: List[dict] = []
         for symbol in symbols:
-            stats = self._symbols.get(symbol.upper())
-            stream_ts = stats.last_event_ts if stats else None
-            stream_price = stats.last_price if stats else None
+            index = self._ids.get(symbol.upper())
+            stream_ts = _from_epoch(self._last_event[index]) if index is not None else None
+            stream_price = None
+            if index is not None and not math.isnan(self._last_price[index]):
+                stream_price = float(self._last_price[index])
             snapshot = snapshots.get(symbol)
             snapshot_ts = _extract_snapshot_timestamp(snapshot)
             snapshot_price = _extract_snapshot_price(snapshot)
@@ -223,38 +287,33 @@ class FeedHealth:
             bars = symbol_bars.get(symbol, [])
             if not bars:
                 continue
-            bars.sort(key=_extract_bar_timestamp)
-            previous_ts: Optional[dt.datetime] = None
-            for bar in bars:
-                current_ts = _extract_bar_timestamp(bar)
-                if previous_ts is None:
-                    previous_ts = current_ts
-                    continue
-                delta = (current_ts - previous_ts).total_seconds()
-                if _is_regular_session(previous_ts) and _is_regular_session(current_ts):
-                    missing = int(delta // 60) - 1
-                    if missing > 0:
-                        gaps.append(
-                            {
-                                "symbol": symbol,
-                                "start": previous_ts,
-                                "end": current_ts,
-                                "missing_minutes": missing,
-                            }
-                        )
-                previous_ts = current_ts
+            timestamps = np.sort(
+                np.fromiter(
+                    (_extract_bar_timestamp(bar).timestamp() for bar in bars),
+                    dtype=np.float64,
+                    count=len(bars),
+                )
+            )
+            gaps.extend(
+                {
+                    "symbol": symbol,
+                    "start": _from_epoch(previous),
+                    "end": _from_epoch(current),
+                    "missing_minutes": missing,
+                }
+                for previous, current, missing in _session_gaps(timestamps)
+            )
         return gaps
 
     # ------------------------------------------------------------------
     # Internal helpers
-    def _set_status(self, symbol: str, status: str, timestamp: dt.datetime) -> None:
-        stats = self._ensure_symbol(symbol)
-        if stats.status != status:
-            stats.status = status
-            stats.last_transition = timestamp
+    def _set_status(self, index: int, status: int, timestamp: float) -> None:
+        if self._status[index] != status:
+            self._status[index] = status
+            self._last_transition[index] = timestamp
             if self._on_state_change:
                 try:
-                    self._on_state_change(symbol.upper(), status)
+                    self._on_state_change(self._names[index], _STATUS_NAMES[status])
                 except Exception:  # noqa: BLE001
                     LOGGER.exception("FeedHealth state change callback failed")
 
@@ -333,23 +392,6 @@ def _ensure_utc(timestamp: dt.datetime) -> dt.datetime:
     return timestamp.astimezone(dt.timezone.utc)
 
 
-def _percentile(values: List[float], quantile: float) -> float:
-    if not values:
-        raise ValueError("values must not be empty")
-    if quantile <= 0:
-        return values[0]
-    if quantile >= 1:
-        return values[-1]
-    index = quantile * (len(values) - 1)
-    lower = math.floor(index)
-    upper = math.ceil(index)
-    if lower == upper:
-        return values[int(index)]
-    lower_val = values[lower]
-    upper_val = values[upper]
-    return lower_val + (upper_val - lower_val) * (index - lower)
-
-
 def _extract_snapshot_timestamp(snapshot: object) -> Optional[dt.datetime]:
     candidate = None
     if snapshot is None:
@@ -444,9 +486,44 @@ def _normalise_bar_response(response: object) -> Dict[str, List[object]]:
     return {}
 
 
-def _is_regular_session(timestamp: dt.datetime) -> bool:
-    timestamp = _ensure_utc(timestamp)
-    market_time = timestamp.time()
-    if market_time < _REGULAR_START_UTC or market_time > _REGULAR_END_UTC:
-        return False
-    return True
+def _session_gaps(timestamps: np.ndarray) -> List[tuple]:
+    """``(previous, current, missing_minutes)`` for gaps between sorted bar times.
+
+    ``timestamps`` are epoch seconds. Only pairs where both bars fall in a
+    regular session are considered, and missing minutes are counted on the
+    trading calendar's session-minute index, so nights, weekends, holidays and
+    early closes are not gaps.
+    """
+
+    if timestamps.size < 2:
+        return []
+    session_minute = get_calendar().session_minutes(timestamps)
+    missing = np.diff(session_minute) - 1
+    candidates = np.flatnonzero(np.nan_to_num(missing, nan=0.0) > 0)
+    return [
+        (float(timestamps[i]), float(timestamps[i + 1]), int(missing[i])) for i in candidates
+    ]
+
+
+def _row_quantiles(rows: np.ndarray, counts: np.ndarray, qs: Sequence[float]) -> np.ndarray:
+    """Linear-interpolated quantiles of the first ``counts[i]`` values of each row.
+
+    Unused slots are NaN and sort to the end, so one sort plus a gather
+    replaces a per-row percentile loop. Returns shape ``(len(qs), len(rows))``.
+    """
+
+    ordered = np.sort(rows, axis=1)
+    last = np.maximum(counts - 1, 0)
+    position = np.asarray(qs, dtype=np.float64)[:, None] * last[None, :]
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    row_index = np.arange(len(rows))[None, :]
+    low_values = ordered[row_index, lower]
+    high_values = ordered[row_index, upper]
+    return low_values + (high_values - low_values) * (position - lower)
+
+
+def _from_epoch(value: float) -> Optional[dt.datetime]:
+    if math.isnan(value):
+        return None
+    return dt.datetime.fromtimestamp(float(value), tz=dt.timezone.utc)
@@ -6,11 +6,13 @@ import logging
 import os
 import random
 import time
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Iterable, Mapping, Optional
 from uuid import uuid4
 
 import requests
 
+from core.rate_governor import Lane, RateGovernor, classify, get_governor
 from services.ops.alerts import audit_log
 from backend.utils.structlog import jlog
 
@@ -57,6 +59,166 @@ _STATUS_MAP = {
 }
 
 
+def resolve_endpoint(
+    base_url: str | None = None,
+    key_id: str | None = None,
+    secret_key: str | None = None,
+) -> tuple[str, str | None, str | None]:
+    """Resolve base URL and credentials from arguments and the environment."""
+    paper_base = os.getenv("ALPACA_PAPER_BASE", "https://paper-api.alpaca.markets")
+    live_base = os.getenv("ALPACA_LIVE_BASE", "https://api.alpaca.markets")
+    env_base = os.getenv("ALPACA_BASE_URL") or os.getenv("APCA_API_BASE_URL")
+    resolved_base = base_url or env_base or paper_base
+    resolved_base = resolved_base.rstrip("/") or paper_base.rstrip("/")
+
+    key_id = (
+        key_id
+        or os.getenv("ALPACA_API_KEY")
+        or os.getenv("ALPACA_KEY_ID")
+        or os.getenv("ALPACA_API_KEY_ID")
+        or os.getenv("APCA_API_KEY_ID")
+    )
+    secret_key = (
+        secret_key
+        or os.getenv("ALPACA_API_SECRET")
+        or os.getenv("ALPACA_SECRET_KEY")
+        or os.getenv("ALPACA_API_SECRET_KEY")
+        or os.getenv("APCA_API_SECRET_KEY")
+    )
+
+    # Keep the live endpoint when explicitly requested, otherwise default to paper.
+    resolved_mode = os.getenv("BROKER_MODE", "paper").strip().lower()
+    if resolved_mode == "live" and base_url is None and env_base is None:
+        resolved_base = live_base.rstrip("/")
+
+    return resolved_base, key_id, secret_key
+
+
+RETRY_AFTER_MAX_SEC = 300.0
+"""Sanity ceiling for a broker ``Retry-After`` header."""
+
+
+def retry_delay(
+    response: Any, backoff: float, cap: float, retry_after_max: float = RETRY_AFTER_MAX_SEC
+) -> float:
+    """Seconds to wait before retrying ``response``.
+
+    A ``Retry-After`` header (delta-seconds or HTTP date) wins over the
+    jittered exponential ``backoff`` and is honoured up to
+    ``retry_after_max``; ``cap`` only bounds the exponential path.
+    """
+
+    headers = getattr(response, "headers", None) or {}
+    raw = headers.get("Retry-After") or headers.get("retry-after")
+    if raw:
+        try:
+            delay = float(raw)
+        except (TypeError, ValueError):
+            try:
+                delay = parsedate_to_datetime(str(raw)).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = -1.0
+        if delay >= 0:
+            return min(delay, retry_after_max)
+    return min(backoff + random.uniform(0, backoff), cap)
+
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def pause_or_block(governor: RateGovernor, response: Any, delay: float) -> float:
+    """Return the seconds the caller should sleep itself before retrying.
+
+    A 429 is account-wide, so its delay is handed to ``governor`` (which holds
+    every caller) and the retry simply waits in ``acquire``; other retryable
+    statuses only concern this request.
+    """
+
+    if getattr(response, "status_code", None) == 429:
+        governor.block(delay)
+        return 0.0
+    return delay
+
+
+def log_submit_start(adapter: Any, payload: Mapping[str, Any]) -> str:
+    """Emit the pre-submit order logs and return the trace id."""
+
+    trace_id = str(payload.get("client_order_id") or uuid4().hex)
+    log.info(
+        "alpaca.submit_order",
+        extra={
+            "trace_id": trace_id,
+            "symbol": payload.get("symbol"),
+            "qty": payload.get("qty"),
+            "side": payload.get("side"),
+            "dry_run": getattr(adapter, "dry_run", None),
+            "profile": getattr(adapter, "profile", None),
+        },
+    )
+    try:
+        jlog(
+            "trade.adapter.request",
+            endpoint="alpaca/orders",
+            body=dict(payload),
+        )
+    except Exception:  # pragma: no cover - logging guard
+        log.debug("failed to emit trade.adapter.request", exc_info=True)
+    return trace_id
+
+
+def log_submit_failed(adapter: Any, trace_id: str, payload: Mapping[str, Any]) -> None:
+    log.exception(
+        "alpaca.submit_order.failed",
+        extra={
+            "trace_id": trace_id,
+            "symbol": payload.get("symbol"),
+            "dry_run": getattr(adapter, "dry_run", None),
+            "profile": getattr(adapter, "profile", None),
+        },
+    )
+
+
+def log_submit_done(adapter: Any, trace_id: str, status_code: int, data: Any) -> None:
+    order_id = None
+    status = None
+    if isinstance(data, Mapping):
+        order_id = data.get("id") or data.get("order_id")
+        status = data.get("status")
+    log.info(
+        "alpaca.submit_order.ok",
+        extra={
+            "trace_id": trace_id,
+            "alpaca_id": order_id,
+            "status": status,
+            "dry_run": getattr(adapter, "dry_run", None),
+            "profile": getattr(adapter, "profile", None),
+        },
+    )
+    try:
+        jlog(
+            "trade.adapter.response",
+            status_code=status_code,
+            body=data,
+        )
+    except Exception:  # pragma: no cover - logging guard
+        log.debug("failed to emit trade.adapter.response", exc_info=True)
+
+
+def block_dry_run(adapter: Any, payload: Mapping[str, Any]) -> None:
+    if "client_order_id" not in payload:
+        raise ValueError("client_order_id is required")
+    if getattr(adapter, "dry_run", False):
+        try:
+            jlog(
+                "trade.adapter.block",
+                reason="dry_run",
+                payload=dict(payload),
+            )
+        except Exception:  # pragma: no cover - logging guard
+            log.debug("failed to emit trade.adapter.block", exc_info=True)
+        raise RuntimeError("dry_run is True — refusing to submit order to Alpaca")
+
+
 class AlpacaAdapter:
     """Minimal REST client used by the backend, orchestrator and UI."""
 
@@ -71,32 +233,9 @@ class AlpacaAdapter:
         max_attempts: int = 4,
         backoff_base: float = 0.5,
         backoff_cap: float = 8.0,
+        governor: Optional[RateGovernor] = None,
     ) -> None:
-        paper_base = os.getenv("ALPACA_PAPER_BASE", "https://paper-api.alpaca.markets")
-        live_base = os.getenv("ALPACA_LIVE_BASE", "https://api.alpaca.markets")
-        env_base = os.getenv("ALPACA_BASE_URL") or os.getenv("APCA_API_BASE_URL")
-        resolved_base = base_url or env_base or paper_base
-        resolved_base = resolved_base.rstrip("/") or paper_base.rstrip("/")
-
-        key_id = (
-            key_id
-            or os.getenv("ALPACA_API_KEY")
-            or os.getenv("ALPACA_KEY_ID")
-            or os.getenv("ALPACA_API_KEY_ID")
-            or os.getenv("APCA_API_KEY_ID")
-        )
-        secret_key = (
-            secret_key
-            or os.getenv("ALPACA_API_SECRET")
-            or os.getenv("ALPACA_SECRET_KEY")
-            or os.getenv("ALPACA_API_SECRET_KEY")
-            or os.getenv("APCA_API_SECRET_KEY")
-        )
-
-        # Keep the live endpoint when explicitly requested, otherwise default to paper.
-        resolved_mode = os.getenv("BROKER_MODE", "paper").strip().lower()
-        if resolved_mode == "live" and base_url is None and env_base is None:
-            resolved_base = live_base.rstrip("/")
+        resolved_base, key_id, secret_key = resolve_endpoint(base_url, key_id, secret_key)
 
         self.base = resolved_base
         self.timeout = timeout
@@ -115,6 +254,7 @@ class AlpacaAdapter:
         self._max_attempts = max(1, int(max_attempts))
         self._backoff_base = max(0.1, float(backoff_base))
         self._backoff_cap = max(self._backoff_base, float(backoff_cap))
+        self._governor = governor or get_governor()
         self._last_headers: dict[str, str] | None = None
         self.dry_run: bool = False
         self.profile: str | None = None
@@ -142,39 +282,8 @@ class AlpacaAdapter:
         return self._get(f"/v2/orders/{order_id}")
 
     def place_order(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
-        if "client_order_id" not in payload:
-            raise ValueError("client_order_id is required")
-        if getattr(self, "dry_run", False):
-            try:
-                jlog(
-                    "trade.adapter.block",
-                    reason="dry_run",
-                    payload=dict(payload),
-                )
-            except Exception:  # pragma: no cover - logging guard
-                log.debug("failed to emit trade.adapter.block", exc_info=True)
-            raise RuntimeError("dry_run is True — refusing to submit order to Alpaca")
-
-        trace_id = str(payload.get("client_order_id") or uuid4().hex)
-        log.info(
-            "alpaca.submit_order",
-            extra={
-                "trace_id": trace_id,
-                "symbol": payload.get("symbol"),
-                "qty": payload.get("qty"),
-                "side": payload.get("side"),
-                "dry_run": getattr(self, "dry_run", None),
-                "profile": getattr(self, "profile", None),
-            },
-        )
-        try:
-            jlog(
-                "trade.adapter.request",
-                endpoint="alpaca/orders",
-                body=dict(payload),
-            )
-        except Exception:  # pragma: no cover - logging guard
-            log.debug("failed to emit trade.adapter.request", exc_info=True)
+        block_dry_run(self, payload)
+        trace_id = log_submit_start(self, payload)
         try:
             response = self._post(
                 "/v2/orders",
@@ -183,40 +292,10 @@ class AlpacaAdapter:
                 headers={"X-Trace-Id": trace_id},
             )
         except Exception:
-            log.exception(
-                "alpaca.submit_order.failed",
-                extra={
-                    "trace_id": trace_id,
-                    "symbol": payload.get("symbol"),
-                    "dry_run": getattr(self, "dry_run", None),
-                    "profile": getattr(self, "profile", None),
-                },
-            )
+            log_submit_failed(self, trace_id, payload)
             raise
         data = response.json()
-        order_id = None
-        status = None
-        if isinstance(data, Mapping):
-            order_id = data.get("id") or data.get("order_id")
-            status = data.get("status")
-        log.info(
-            "alpaca.submit_order.ok",
-            extra={
-                "trace_id": trace_id,
-                "alpaca_id": order_id,
-                "status": status,
-                "dry_run": getattr(self, "dry_run", None),
-                "profile": getattr(self, "profile", None),
-            },
-        )
-        try:
-            jlog(
-                "trade.adapter.response",
-                status_code=response.status_code,
-                body=data,
-            )
-        except Exception:  # pragma: no cover - logging guard
-            log.debug("failed to emit trade.adapter.response", exc_info=True)
+        log_submit_done(self, trace_id, response.status_code, data)
         return data
 
     def cancel_order(self, order_id: str) -> bool:
@@ -275,13 +354,17 @@ class AlpacaAdapter:
         *,
         headers: Optional[Mapping[str, str]] = None,
         retry: bool = True,
+        lane: Optional[Lane] = None,
         **kwargs: Any,
     ) -> requests.Response:
         url = f"{self.base}{path}"
         attempt = 0
         backoff = self._backoff_base
         merged_headers = dict(headers or {})
+        endpoint, default_lane = classify(method, path)
+        lane = default_lane if lane is None else lane
         while True:
+            self._governor.acquire(endpoint, lane)
             request_callable = getattr(self.sess, "request", None)
             if callable(request_callable):
                 response = request_callable(
@@ -304,12 +387,16 @@ class AlpacaAdapter:
                 self._last_headers = dict(response.headers)  # type: ignore[arg-type]
             except Exception:  # pragma: no cover - defensive guard
                 self._last_headers = None
+            self._governor.observe(self._last_headers)
             self._audit(method, url, kwargs, response)
             if not retry:
                 return response
-            if response.status_code in {429, 500, 502, 503, 504} and attempt < self._max_attempts - 1:
-                sleep_for = backoff + random.uniform(0, backoff)
-                time.sleep(min(sleep_for, self._backoff_cap))
+            if response.status_code in RETRY_STATUSES and attempt < self._max_attempts - 1:
+                self._governor.record_retry()
+                delay = retry_delay(response, backoff, self._backoff_cap)
+                pause = pause_or_block(self._governor, response, delay)
+                if pause > 0:
+                    time.sleep(pause)
                 backoff = min(backoff * 2, self._backoff_cap)
                 attempt += 1
                 continue
@@ -362,21 +449,28 @@ class AlpacaAdapter:
         method: str,
         url: str,
         kwargs: Mapping[str, Any],
-        response: requests.Response,
+        response: Any,
     ) -> None:
-        payload = {
-            "broker": "alpaca",
-            "method": method,
-            "url": url,
-            "status": response.status_code,
-            "ok": response.ok,
-            "key_tail": self._key_id_tail,
-            "ts": time.time(),
-        }
-        try:
-            audit_log(payload)
-        except Exception:  # noqa: BLE001 - audit logging must never break requests
-            log.exception("failed to emit audit log")
+        emit_audit(self._key_id_tail, method, url, response)
+
+
+def emit_audit(key_tail: str | None, method: str, url: str, response: Any) -> None:
+    ok = getattr(response, "ok", None)
+    if ok is None:
+        ok = 200 <= int(response.status_code) < 300
+    payload = {
+        "broker": "alpaca",
+        "method": method,
+        "url": url,
+        "status": response.status_code,
+        "ok": ok,
+        "key_tail": key_tail,
+        "ts": time.time(),
+    }
+    try:
+        audit_log(payload)
+    except Exception:  # noqa: BLE001 - audit logging must never break requests
+        log.exception("failed to emit audit log")
 
 
 def _safe_float(value: Any) -> Optional[float]:
@@ -388,7 +482,7 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
-def _map_http_error(response: requests.Response, exc: requests.HTTPError) -> Exception:
+def _map_http_error(response: Any, exc: Exception) -> Exception:
     payload: Any | None
     try:
         payload = response.json()
@@ -0,0 +1,254 @@
+"""Non-blocking HTTP adapter for Alpaca's REST API.
+
+``AsyncAlpacaAdapter`` mirrors the method surface of
+:class:`~app.execution.alpaca_adapter.AlpacaAdapter` with coroutine methods so
+event-loop callers can ``await`` broker calls instead of blocking the loop for
+the whole retry window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import httpx
+
+from core.rate_governor import Lane, RateGovernor, classify, get_governor
+
+from .alpaca_adapter import (
+    RETRY_STATUSES,
+    AlpacaAdapter,
+    _map_http_error,
+    block_dry_run,
+    emit_audit,
+    log_submit_done,
+    log_submit_failed,
+    log_submit_start,
+    pause_or_block,
+    resolve_endpoint,
+    retry_delay,
+)
+
+log = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncAlpacaAdapter:
+    """Async REST client sharing a keep-alive connection pool across calls."""
+
+    map_order_state = staticmethod(AlpacaAdapter.map_order_state)
+    normalize_order = staticmethod(AlpacaAdapter.normalize_order)
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        key_id: str | None = None,
+        secret_key: str | None = None,
+        *,
+        timeout: float = 10.0,
+        client: Optional[httpx.AsyncClient] = None,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool | None = None,
+        governor: Optional[RateGovernor] = None,
+    ) -> None:
+        resolved_base, key_id, secret_key = resolve_endpoint(base_url, key_id, secret_key)
+        self.base = resolved_base
+        self.timeout = timeout
+        self._headers = {
+            "APCA-API-KEY-ID": key_id or "",
+            "APCA-API-SECRET-KEY": secret_key or "",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 keep-alive.
+        self._http2 = _http2_available() if http2 is None else bool(http2 and _http2_available())
+        self._client = client
+        self._owns_client = client is None
+        if client is not None:
+            client.headers.update(self._headers)
+        self._key_id_tail = (key_id or "")[-4:] or None
+        self._key_id = key_id or ""
+        self._secret_key = secret_key or ""
+        self._max_attempts = max(1, int(max_attempts))
+        self._backoff_base = max(0.1, float(backoff_base))
+        self._backoff_cap = max(self._backoff_base, float(backoff_cap))
+        self._governor = governor or get_governor()
+        self._last_headers: dict[str, str] | None = None
+        self.dry_run: bool = False
+        self.profile: str | None = None
+        self.name: str = "alpaca"
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base,
+                headers=self._headers,
+                timeout=self.timeout,
+                limits=self._limits,
+                http2=self._http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncAlpacaAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Public Alpaca REST helpers
+    # ------------------------------------------------------------------
+    def is_configured(self) -> bool:
+        return bool(self._key_id and self._secret_key)
+
+    async def get_account(self) -> Dict[str, Any]:
+        return await self._get("/v2/account")
+
+    async def list_positions(self) -> list[dict]:
+        data = await self._get("/v2/positions")
+        return list(data) if isinstance(data, Iterable) else []
+
+    async def list_orders(self, *, status: str = "all", limit: int = 50) -> list[dict]:
+        payload = {"status": status, "limit": int(limit)}
+        data = await self._get("/v2/orders", params=payload)
+        return list(data) if isinstance(data, Iterable) else []
+
+    async def get_order(self, order_id: str) -> Dict[str, Any]:
+        return await self._get(f"/v2/orders/{order_id}")
+
+    async def place_order(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        block_dry_run(self, payload)
+        trace_id = log_submit_start(self, payload)
+        try:
+            response = await self._post(
+                "/v2/orders",
+                json=dict(payload),
+                idempotency_key=str(payload["client_order_id"]),
+                headers={"X-Trace-Id": trace_id},
+            )
+        except Exception:
+            log_submit_failed(self, trace_id, payload)
+            raise
+        data = response.json()
+        log_submit_done(self, trace_id, response.status_code, data)
+        return data
+
+    async def cancel_order(self, order_id: str) -> bool:
+        await self._delete(f"/v2/orders/{order_id}")
+        return True
+
+    @property
+    def last_headers(self) -> Mapping[str, str] | None:
+        return dict(self._last_headers) if self._last_headers is not None else None
+
+    # ------------------------------------------------------------------
+    # Compatibility helpers for legacy callers
+    # ------------------------------------------------------------------
+    async def fetch_account(self) -> Dict[str, Any]:
+        return await self.get_account()
+
+    async def fetch_positions(self) -> list[dict]:
+        return await self.list_positions()
+
+    async def fetch_orders(self, *, status: str = "all", limit: int = 50) -> list[dict]:
+        return await self.list_orders(status=status, limit=limit)
+
+    # ------------------------------------------------------------------
+    # Internal HTTP helpers
+    # ------------------------------------------------------------------
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        retry: bool = True,
+        lane: Optional[Lane] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        client = self._get_client()
+        url = f"{self.base}{path}"
+        attempt = 0
+        backoff = self._backoff_base
+        endpoint, default_lane = classify(method, path)
+        lane = default_lane if lane is None else lane
+        while True:
+            await self._governor.acquire_async(endpoint, lane)
+            response = await client.request(method, url, headers=dict(headers or {}), **kwargs)
+            self._last_headers = dict(response.headers)
+            self._governor.observe(self._last_headers)
+            emit_audit(self._key_id_tail, method, url, response)
+            if not retry:
+                return response
+            if response.status_code in RETRY_STATUSES and attempt < self._max_attempts - 1:
+                self._governor.record_retry()
+                delay = retry_delay(response, backoff, self._backoff_cap)
+                pause = pause_or_block(self._governor, response, delay)
+                if pause > 0:
+                    # Yield to the event loop while waiting; other requests keep flowing.
+                    await asyncio.sleep(pause)
+                backoff = min(backoff * 2, self._backoff_cap)
+                attempt += 1
+                continue
+            return response
+
+    async def _get(self, path: str, **kwargs: Any) -> Any:
+        response = await self._request("GET", path, **kwargs)
+        _raise_for_status(response)
+        return response.json()
+
+    async def _post(
+        self,
+        path: str,
+        *,
+        idempotency_key: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        merged_headers: dict[str, str] = {}
+        if headers:
+            merged_headers.update(headers)
+        if idempotency_key:
+            merged_headers.setdefault("Idempotency-Key", idempotency_key)
+        response = await self._request("POST", path, headers=merged_headers or None, **kwargs)
+        _raise_for_status(response)
+        return response
+
+    async def _delete(self, path: str, **kwargs: Any) -> bool:
+        response = await self._request("DELETE", path, **kwargs)
+        if response.status_code not in (200, 204):
+            _raise_for_status(response)
+        return True
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        raise _map_http_error(response, exc) from exc
+
+
+__all__ = ["AsyncAlpacaAdapter"]
@@ -2,30 +2,374 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import re
 import threading
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+DURABILITY_LEVELS = ("buffered", "flush", "fsync")
+
+
+class AuditWriteError(OSError):
+    """An audit event could not be written to the log."""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%d")
+
+
+def _event_order_id(event: Dict[str, Any]) -> str:
+    cid = event.get("client_order_id")
+    if not cid:
+        order = event.get("order")
+        if isinstance(order, dict):
+            cid = order.get("client_order_id")
+    # Tabs/newlines would corrupt the index line format.
+    return str(cid or "").replace("\t", " ").replace("\n", " ")
+
+
+def _parse_line(raw: bytes) -> Optional[Dict[str, Any]]:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        payload = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+@dataclass(slots=True)
+class _SegmentIndex:
+    """Line start offsets of one segment plus client_order_id -> offsets."""
+
+    offsets: array = field(default_factory=lambda: array("q"))
+    by_order: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, offset: int, cid: str) -> None:
+        self.offsets.append(offset)
+        if cid:
+            self.by_order.setdefault(cid, []).append(offset)
+
+
+def _index_path(segment: Path) -> Path:
+    return segment.with_name(segment.name + ".idx")
+
+
+def _load_index(segment: Path) -> _SegmentIndex:
+    """Read ``segment``'s sidecar index, re-indexing any lines it is missing."""
+
+    index = _SegmentIndex()
+    try:
+        size = segment.stat().st_size
+    except FileNotFoundError:
+        return index
+    try:
+        with _index_path(segment).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                offset_raw, _, cid = line.rstrip("\n").partition("\t")
+                try:
+                    offset = int(offset_raw)
+                except ValueError:
+                    continue
+                # Entries past EOF belong to writes that never reached the data file.
+                if offset >= size:
+                    break
+                index.add(offset, cid)
+    except FileNotFoundError:
+        pass
+
+    resume = 0
+    with segment.open("rb") as handle:
+        if index.offsets:
+            handle.seek(index.offsets[-1])
+            handle.readline()
+            resume = handle.tell()
+        if resume >= size:
+            return index
+        handle.seek(resume)
+        missing: List[str] = []
+        while True:
+            offset = handle.tell()
+            raw = handle.readline()
+            if not raw:
+                break
+            payload = _parse_line(raw)
+            if payload is None:
+                continue
+            cid = _event_order_id(payload)
+            index.add(offset, cid)
+            missing.append(f"{offset}\t{cid}\n")
+    if missing:
+        with _index_path(segment).open("a", encoding="utf-8") as handle:
+            handle.writelines(missing)
+    return index
 
 
 class AuditLog:
-    """Simple thread-safe append-only JSON-lines log."""
+    """Thread-safe append-only JSON-lines log with rotation and an offset index.
+
+    ``append`` queues the event for a background writer that keeps the file
+    handle open. ``durability`` controls when ``append`` returns: ``flush``
+    (the default) waits until the event's batch is written to the OS, so it
+    survives a process crash; ``fsync`` additionally waits for it to be on
+    disk; ``buffered`` returns immediately and events reach the file within
+    ``flush_interval``. If the write fails, waiting appenders get an
+    :class:`AuditWriteError` instead of blocking.
+
+    The active file rotates to ``<stem>.<YYYYMMDD>.<n><suffix>`` on a UTC day
+    change or once it exceeds ``max_bytes``. Each segment has a ``.idx``
+    sidecar of line offsets and client order IDs, so ``tail`` and ``find``
+    seek to the lines they need instead of reading whole files.
+    """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        durability: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        backup_count: Optional[int] = None,
+        rotate_daily: bool = True,
+    ) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
             self.path.touch()
+        level = (durability or os.getenv("AUDIT_DURABILITY", "flush")).lower()
+        if level not in DURABILITY_LEVELS:
+            raise ValueError(f"unknown audit durability: {level}")
+        self.durability = level
+        if flush_interval is None:
+            flush_interval = _env_float("AUDIT_FLUSH_MS", 200.0) / 1000.0
+        self.flush_interval = flush_interval
+        if max_bytes is None:
+            max_bytes = int(_env_float("AUDIT_MAX_BYTES", 64 * 1024 * 1024))
+        self.max_bytes = int(max_bytes)
+        if backup_count is None:
+            backup_count = int(_env_float("AUDIT_BACKUP_COUNT", 30))
+        self.backup_count = int(backup_count)
+        self.rotate_daily = rotate_daily
+
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._pending: List[Tuple[bytes, str]] = []
+        self._queued_seq = 0
+        self._written_seq = 0
+        # Highest sequence number lost to a failed write, and why.
+        self._failed_seq = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+
+        self._index = _load_index(self.path)
+        self._handle = self.path.open("ab")
+        self._index_handle = _index_path(self.path).open("a", encoding="utf-8")
+        self._size = self._handle.tell()
+        self._day = self._segment_day()
+        atexit.register(self.close)
 
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
     def append(self, event: Dict[str, Any]) -> None:
         """Append a single event as a JSON line."""
 
-        line = json.dumps(event, sort_keys=True)
-        with self._lock:
-            with self.path.open("a", encoding="utf-8") as handle:
-                handle.write(line)
-                handle.write("\n")
+        line = (json.dumps(event, sort_keys=True) + "\n").encode("utf-8")
+        cid = _event_order_id(event)
+        with self._cond:
+            if self._closed:
+                raise ValueError("audit log is closed")
+            self._pending.append((line, cid))
+            self._queued_seq += 1
+            seq = self._queued_seq
+            self._ensure_worker()
+            if self.durability == "buffered":
+                return
+            self._cond.notify_all()
+            while self._written_seq < seq and not self._closed:
+                if self._failed_seq >= seq:
+                    raise AuditWriteError(f"audit write failed: {self._error}") from self._error
+                # Timed so a writer that died is noticed and replaced.
+                self._cond.wait(timeout=max(self.flush_interval, 0.05))
+                self._ensure_worker()
+
+    def flush(self) -> None:
+        """Write every queued event to the file now."""
+
+        error = self._drain()
+        if error is not None:
+            raise AuditWriteError(f"audit write failed: {error}") from error
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=5.0)
+        self._drain()
+        with self._write_lock:
+            self._handle.close()
+            self._index_handle.close()
+        atexit.unregister(self.close)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self.durability == "buffered" or not self._pending:
+                    # Buffered mode lets a whole interval accumulate per write.
+                    self._cond.wait(timeout=self.flush_interval)
+                if self._closed:
+                    return
+                if not self._pending:
+                    self._worker = None
+                    return
+            self._drain()
+
+    def _drain(self) -> Optional[BaseException]:
+        """Write the pending batch; a write error is recorded and returned."""
+
+        with self._write_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+                seq = self._queued_seq
+            try:
+                if batch and not self._handle.closed:
+                    self._write(batch)
+            except Exception as exc:  # noqa: BLE001 - surfaced to the waiting appenders
+                with self._cond:
+                    self._failed_seq = max(self._failed_seq, seq)
+                    self._error = exc
+                    self._cond.notify_all()
+                return exc
+            with self._cond:
+                self._written_seq = max(self._written_seq, seq)
+                self._cond.notify_all()
+            return None
+
+    def _write(self, batch: List[Tuple[bytes, str]]) -> None:
+        index_lines: List[str] = []
+        today = _today()
+        for line, cid in batch:
+            if self._size and self._should_rotate(len(line), today):
+                self._flush_handles(index_lines)
+                index_lines = []
+                self._rotate()
+            offset = self._size
+            self._handle.write(line)
+            self._size += len(line)
+            self._index.add(offset, cid)
+            index_lines.append(f"{offset}\t{cid}\n")
+        self._flush_handles(index_lines)
+
+    def _flush_handles(self, index_lines: List[str]) -> None:
+        # Data goes out before its index entries; ``_load_index`` drops
+        # entries that point past the end of the data file.
+        self._handle.flush()
+        if self.durability == "fsync":
+            os.fsync(self._handle.fileno())
+        if index_lines:
+            self._index_handle.writelines(index_lines)
+            self._index_handle.flush()
+
+    # ------------------------------------------------------------------
+    # Rotation
+    # ------------------------------------------------------------------
+    def _segment_day(self) -> str:
+        if self._size:
+            mtime = self.path.stat().st_mtime
+            return datetime.fromtimestamp(mtime, timezone.utc).strftime("%Y%m%d")
+        return _today()
+
+    def _should_rotate(self, incoming: int, today: str) -> bool:
+        if self.max_bytes > 0 and self._size + incoming > self.max_bytes:
+            return True
+        return self.rotate_daily and today != self._day
+
+    def _rotate(self) -> None:
+        self._handle.close()
+        self._index_handle.close()
+        seq = 1
+        while True:
+            target = self.path.with_name(f"{self.path.stem}.{self._day}.{seq}{self.path.suffix}")
+            if not target.exists():
+                break
+            seq += 1
+        os.replace(self.path, target)
+        index = _index_path(self.path)
+        if index.exists():
+            os.replace(index, _index_path(target))
+        self._handle = self.path.open("ab")
+        self._index_handle = _index_path(self.path).open("a", encoding="utf-8")
+        self._size = 0
+        self._day = _today()
+        self._index = _SegmentIndex()
+        self._prune()
+
+    def _prune(self) -> None:
+        if self.backup_count <= 0:
+            return
+        rotated = self.segments()[:-1]
+        for old in rotated[: max(0, len(rotated) - self.backup_count)]:
+            for victim in (old, _index_path(old)):
+                try:
+                    victim.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def segments(self) -> List[Path]:
+        """Rotated segments (oldest first) followed by the active file."""
+
+        pattern = re.compile(
+            rf"^{re.escape(self.path.stem)}\.(\d{{8}})\.(\d+){re.escape(self.path.suffix)}$"
+        )
+        rotated: List[Tuple[str, int, Path]] = []
+        for candidate in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}"):
+            match = pattern.match(candidate.name)
+            if match:
+                rotated.append((match.group(1), int(match.group(2)), candidate))
+        rotated.sort()
+        return [item[2] for item in rotated] + [self.path]
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _read_at(self, segment: Path, offsets: List[int]) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        try:
+            handle = segment.open("rb")
+        except FileNotFoundError:
+            return events
+        with handle:
+            for offset in offsets:
+                handle.seek(offset)
+                payload = _parse_line(handle.readline())
+                if payload is not None:
+                    events.append(payload)
+        return events
 
     def tail(self, n: int = 50) -> List[Dict[str, Any]]:
         """Return the latest ``n`` events (oldest first)."""
@@ -33,24 +377,40 @@ class AuditLog:
         if n <= 0:
             return []
 
-        with self._lock:
-            if not self.path.exists():
-                return []
-            lines = self.path.read_text(encoding="utf-8").splitlines()
-
-        events: List[Dict[str, Any]] = []
-        for raw in lines[-n:]:
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, dict):
-                events.append(payload)
+        self.flush()
+        with self._write_lock:
+            offsets = list(self._index.offsets[-n:])
+        events = self._read_at(self.path, offsets)
+        if len(offsets) < n:
+            for segment in reversed(self.segments()[:-1]):
+                missing = n - len(offsets)
+                older = list(_load_index(segment).offsets[-missing:])
+                offsets = older + offsets
+                events = self._read_at(segment, older) + events
+                if len(offsets) >= n:
+                    break
         return events
 
+    def find(self, client_order_id: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return events recorded for ``client_order_id`` (oldest first).
+
+        The active segment is always searched; rotated segments are searched
+        newest first until ``limit`` events have been found.
+        """
+
+        self.flush()
+        with self._write_lock:
+            offsets = list(self._index.by_order.get(client_order_id, ()))
+        events = self._read_at(self.path, offsets)
+        for segment in reversed(self.segments()[:-1]):
+            if limit is not None and len(events) >= limit:
+                break
+            older = _load_index(segment).by_order.get(client_order_id)
+            if older:
+                events = self._read_at(segment, older) + events
+        if limit is not None:
+            events = events[-limit:]
+        return events
 
-__all__ = ["AuditLog"]
 
+__all__ = ["AuditLog", "AuditWriteError", "DURABILITY_LEVELS"]
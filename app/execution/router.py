@@ -21,7 +21,8 @@ from core.runtime_flags import get_runtime_flags
 
 from app.execution.audit import AuditLog
 from app.oms.store import OmsStore, TERMINAL_STATES
-from services.policy.gates import should_trade
+from services.execution.idempotency import IdempotencyIndex
+from services.policy.gates import get_policy_engine
 from services.policy.sizing import size_position
 from services.telemetry import metrics
 
@@ -107,6 +108,19 @@ class OrderRouter:
             mock_mode = self._flags.mock_mode
         self.mock_mode = bool(mock_mode)
         self.broker = adapter or make_broker_adapter(self._flags)
+        intents = getattr(state, "intents", None)
+        self.intents = intents if isinstance(intents, IdempotencyIndex) else IdempotencyIndex()
+        if self.intents.loader is None:
+            self.intents.loader = self._load_intent
+            recent = getattr(store, "intent_hashes_since", None)
+            if callable(recent):
+                self.intents.warm(recent(time.time() - self.intents.window_sec))
+
+    def _load_intent(self, intent_hash: str, since: float) -> str | None:
+        prior = self.store.get_order_by_intent(intent_hash, since=since)
+        if prior and prior.get("client_order_id"):
+            return str(prior["client_order_id"])
+        return None
 
     # ------------------------------------------------------------------
     def _metrics_inc(self, key: str, value: int = 1) -> None:
@@ -176,7 +190,7 @@ class OrderRouter:
         )
         self._metrics_state(state)
         if state == "filled":
-            self._metrics_inc("oms_fills_total")
+            self._metrics_inc("oms_filled_orders_total")
         elif state == "rejected":
             self._metrics_inc("oms_rejects_total")
         elif state == "canceled":
@@ -222,9 +236,8 @@ class OrderRouter:
                 sl_price = round(limit_price * (1 - side_multiplier * sl_pct), 2)
 
         if not cid and not dry_run:
-            prior = self.store.get_order_by_intent(intent_hash)
-            if prior and prior.get("client_order_id"):
-                cid = str(prior["client_order_id"])
+            # Memory first; the Bloom filter keeps fresh intents off SQLite.
+            cid = self.intents.get(intent_hash)
 
         if not cid and self.state.seen(intent_hash):
             cid = self.state.client_id_for(intent_hash)
@@ -237,6 +250,7 @@ class OrderRouter:
                 "router.invalid_qty", extra={"symbol": symbol, "qty": intent.qty}
             )
             if not dry_run:
+                self.intents.note(intent_hash)
                 self.store.upsert_order(
                     client_order_id=cid,
                     state="rejected",
@@ -280,7 +294,9 @@ class OrderRouter:
             if stop_val is not None:
                 policy_context.setdefault("atr", abs(limit_price - stop_val))
 
-        allow_trade, gate_info = should_trade(policy_context)
+        gate = get_policy_engine().evaluate(policy_context)
+        allow_trade = gate.allow
+        gate_info = gate.as_dict()
         policy_context.update(gate_info)
         policy_context.setdefault("requested_qty", requested_qty)
         if not allow_trade:
@@ -359,6 +375,7 @@ class OrderRouter:
                 extra={"symbol": symbol, "side": intent.side, "reason": reason},
             )
             if not dry_run:
+                self.intents.note(intent_hash)
                 self.store.upsert_order(
                     client_order_id=cid,
                     state="rejected",
@@ -461,6 +478,7 @@ class OrderRouter:
         }
         intent_snapshot["policy"] = policy_context
 
+        self.intents.note(intent_hash)
         self.store.upsert_order(
             client_order_id=cid,
             state="new",
@@ -20,6 +20,8 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for minimal envs
 
 import copy
 import logging
+import os
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -183,6 +185,31 @@ REGISTRY_DIR.mkdir(parents=True, exist_ok=True)
 DEFAULT_MODEL_NAME = "intraday_lr"
 
 
+def symbol_model_name(symbol: str, name: str = DEFAULT_MODEL_NAME) -> str:
+    return f"{name}_{symbol.upper()}"
+
+
+def _atomic_dump(obj: Any, path: Path) -> None:
+    """Write ``obj`` next to ``path`` and rename it into place.
+
+    Readers (``load_from_registry``, the API) never observe a half-written
+    artifact even while a retrain is running.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    try:
+        joblib.dump(obj, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 @dataclass
 class SklearnModel:
     estimator: Any = field(default_factory=lambda: LogisticRegression(max_iter=500, class_weight="balanced"))
@@ -311,7 +338,7 @@ class SklearnModel:
             "created_at": self.created_at or datetime.utcnow(),
             "calibrated": bool(self._calibrated),
         }
-        joblib.dump(artifact, path)
+        _atomic_dump(artifact, Path(path))
 
     @classmethod
     def load(cls, path: Path) -> "SklearnModel":
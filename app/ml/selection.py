@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import copy
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Mapping
 
 import numpy as np
 import pandas as pd
@@ -49,28 +53,184 @@ if XGBClassifier is not None:
     )
 
 
-def evaluate_candidates(X: pd.DataFrame, y: pd.Series) -> SelectionResult:
-    best_key = None
-    best_auc = -np.inf
-    best_metrics: dict[str, float] = {}
-    best_model: SklearnModel | None = None
-
-    for key, estimator in CANDIDATES.items():
-        model = SklearnModel(estimator=estimator)
-        model.fit(X, y)
-        metrics = model.metrics or {}
-        auc = metrics.get("auc", float("nan"))
-        logger.info("Candidate %s metrics %s", key, metrics)
-        if np.isnan(auc):
-            auc = 0.0
-        if auc > best_auc:
-            best_auc = auc
-            best_key = key
-            best_metrics = metrics
-            best_model = model
-
-    if best_model is None or best_key is None:
-        raise RuntimeError("No candidate models evaluated")
-
-    save_to_registry(best_model)
-    return SelectionResult(best_key, best_metrics, best_model)
+# Datasets handed to each pool worker once via the initializer so individual
+# fit tasks only carry ``(symbol, key, estimator)`` instead of the full matrix.
+_SHARED_DATA: Dict[str, tuple[pd.DataFrame, pd.Series]] = {}
+
+
+def _init_worker(datasets: Mapping[str, tuple[pd.DataFrame, pd.Series]]) -> None:
+    global _SHARED_DATA
+    _SHARED_DATA = dict(datasets)
+
+
+def _fit_candidate(
+    symbol: str, key: str, estimator: Any, fraction: float = 1.0
+) -> tuple[str, str, SklearnModel]:
+    X, y = _SHARED_DATA[symbol]
+    if fraction < 1.0:
+        rows = max(int(len(X) * fraction), 1)
+        X, y = X.iloc[:rows], y.iloc[:rows]
+    model = SklearnModel(estimator=copy.deepcopy(estimator))
+    model.fit(X, y)
+    return symbol, key, model
+
+
+def _auc(metrics: Mapping[str, float] | None) -> float:
+    auc = (metrics or {}).get("auc", float("nan"))
+    return 0.0 if np.isnan(auc) else float(auc)
+
+
+def _default_workers() -> int:
+    raw = os.getenv("ML_TRAIN_WORKERS")
+    if raw:
+        try:
+            return max(int(raw), 1)
+        except ValueError:
+            logger.warning("Invalid ML_TRAIN_WORKERS=%r; using cpu count", raw)
+    return os.cpu_count() or 1
+
+
+@dataclass
+class TrainingScheduler:
+    """Fit candidate x symbol combinations concurrently and pick a winner per symbol.
+
+    Candidates are first screened on the leading ``screen_fraction`` of each
+    symbol's rows; any candidate whose holdout AUC trails the best screened
+    candidate by more than ``abandon_margin`` is dropped before the full fit.
+    Set ``abandon_margin`` to ``None`` to fully fit every candidate.
+
+    Pool workers are spawned rather than forked, since training is reached
+    from a threaded server where a forked child could inherit held locks.
+    Runs with fewer than ``min_pool_tasks`` fits train inline instead of
+    paying the pool start-up.
+    """
+
+    candidates: Mapping[str, Any] = field(default_factory=lambda: dict(CANDIDATES))
+    max_workers: int | None = None
+    screen_fraction: float = 0.3
+    abandon_margin: float | None = 0.05
+    min_screen_rows: int = 200
+    min_pool_tasks: int = 8
+    abandoned: dict[str, list[str]] = field(default_factory=dict, init=False)
+
+    def run(
+        self, datasets: Mapping[str, tuple[pd.DataFrame, pd.Series]]
+    ) -> dict[str, SelectionResult]:
+        if not self.candidates:
+            raise RuntimeError("No candidate models evaluated")
+        datasets = {
+            symbol: (X.reset_index(drop=True), y.reset_index(drop=True))
+            for symbol, (X, y) in datasets.items()
+        }
+        if not datasets:
+            return {}
+
+        tasks = len(datasets) * len(self.candidates)
+        workers = min(self.max_workers or _default_workers(), tasks)
+        executor: Executor | None = None
+        if workers > 1 and tasks >= self.min_pool_tasks:
+            try:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(datasets,),
+                )
+            except (OSError, NotImplementedError) as exc:  # pragma: no cover - restricted hosts
+                logger.warning("Process pool unavailable (%s); training inline", exc)
+        if executor is None:
+            _init_worker(datasets)
+
+        try:
+            survivors = self._screen(datasets, executor)
+            fitted = self._dispatch(
+                [(symbol, key) for symbol, keys in survivors.items() for key in keys], 1.0, executor
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            else:
+                _init_worker({})
+
+        results: dict[str, SelectionResult] = {}
+        for symbol, keys in survivors.items():
+            best_key: str | None = None
+            best_auc = -np.inf
+            for key in keys:
+                model = fitted[(symbol, key)]
+                logger.info("Candidate %s metrics for %s: %s", key, symbol, model.metrics)
+                auc = _auc(model.metrics)
+                if auc > best_auc:
+                    best_auc = auc
+                    best_key = key
+            if best_key is None:
+                raise RuntimeError(f"No candidate models evaluated for {symbol}")
+            best_model = fitted[(symbol, best_key)]
+            results[symbol] = SelectionResult(best_key, best_model.metrics or {}, best_model)
+        return results
+
+    def _screen(
+        self,
+        datasets: Mapping[str, tuple[pd.DataFrame, pd.Series]],
+        executor: Executor | None,
+    ) -> dict[str, list[str]]:
+        keys = list(self.candidates)
+        survivors = {symbol: list(keys) for symbol in datasets}
+        self.abandoned = {}
+        if self.abandon_margin is None or len(keys) < 2:
+            return survivors
+        screened = [
+            symbol
+            for symbol, (X, _) in datasets.items()
+            if len(X) * self.screen_fraction >= self.min_screen_rows
+        ]
+        if not screened:
+            return survivors
+
+        fitted = self._dispatch(
+            [(symbol, key) for symbol in screened for key in keys], self.screen_fraction, executor
+        )
+        for symbol in screened:
+            scores = {key: _auc(fitted[(symbol, key)].metrics) for key in keys}
+            cutoff = max(scores.values()) - self.abandon_margin
+            survivors[symbol] = [key for key in keys if scores[key] >= cutoff]
+            dropped = [key for key in keys if scores[key] < cutoff]
+            if dropped:
+                self.abandoned[symbol] = dropped
+                logger.info(
+                    "Abandoned candidates %s for %s after screening %s", dropped, symbol, scores
+                )
+        return survivors
+
+    def _dispatch(
+        self,
+        tasks: Iterable[tuple[str, str]],
+        fraction: float,
+        executor: Executor | None,
+    ) -> dict[tuple[str, str], SklearnModel]:
+        out: dict[tuple[str, str], SklearnModel] = {}
+        if executor is None:
+            for symbol, key in tasks:
+                _, _, model = _fit_candidate(symbol, key, self.candidates[key], fraction)
+                out[(symbol, key)] = model
+            return out
+        futures = [
+            executor.submit(_fit_candidate, symbol, key, self.candidates[key], fraction)
+            for symbol, key in tasks
+        ]
+        for future in futures:
+            symbol, key, model = future.result()
+            out[(symbol, key)] = model
+        return out
+
+
+def evaluate_candidates(
+    X: pd.DataFrame,
+    y: pd.Series,
+    *,
+    scheduler: TrainingScheduler | None = None,
+) -> SelectionResult:
+    scheduler = scheduler or TrainingScheduler()
+    result = scheduler.run({"__single__": (X, y)})["__single__"]
+    save_to_registry(result.sklearn_model)
+    return result
@@ -8,8 +8,8 @@ import pandas as pd
 
 from app.data.market import IMarketDataClient, bars_to_df
 from .features import build_features
-from .models import DEFAULT_MODEL_NAME
-from .selection import evaluate_candidates
+from .models import DEFAULT_MODEL_NAME, symbol_model_name
+from .selection import TrainingScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +26,13 @@ def train_intraday_classifier(
     symbols: Iterable[str],
     client: IMarketDataClient,
     out_dir: str | Path = "artifacts/registry",
+    *,
+    scheduler: TrainingScheduler | None = None,
 ) -> dict[str, dict[str, float]]:
     out_path = Path(out_dir)
     out_path.mkdir(parents=True, exist_ok=True)
-    metrics: dict[str, dict[str, float]] = {}
 
+    datasets: dict[str, tuple[pd.DataFrame, pd.Series]] = {}
     for symbol in symbols:
         bars = client.get_bars(symbol, timeframe="1Min", limit=2000)
         df = bars_to_df(bars)
@@ -38,13 +40,22 @@ def train_intraday_classifier(
         labels = make_labels(df.iloc[-len(feature_df) :].reset_index(drop=True))
         # align lengths
         min_len = min(len(feature_df), len(labels))
-        feature_df = feature_df.iloc[:min_len]
-        labels = labels.iloc[:min_len]
-        result = evaluate_candidates(feature_df, labels)
+        datasets[symbol] = (feature_df.iloc[:min_len], labels.iloc[:min_len])
+
+    results = (scheduler or TrainingScheduler()).run(datasets)
+
+    metrics: dict[str, dict[str, float]] = {}
+    for symbol, result in results.items():
         metrics[symbol] = result.metrics
-        artifact_path = out_path / f"{DEFAULT_MODEL_NAME}.joblib"
-        result.sklearn_model.save(artifact_path)
-        logger.info("Trained model for %s with metrics %s", symbol, result.metrics)
+        result.sklearn_model.save(out_path / f"{symbol_model_name(symbol)}.joblib")
+        logger.info(
+            "Trained %s model for %s with metrics %s", result.model_key, symbol, result.metrics
+        )
+    if results:
+        # The unsuffixed artifact keeps serving /ml/predict; it tracks the last
+        # trained symbol exactly as the serial trainer did.
+        last = results[list(results)[-1]]
+        last.sklearn_model.save(out_path / f"{DEFAULT_MODEL_NAME}.joblib")
     return metrics
 
 
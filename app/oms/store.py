@@ -10,6 +10,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
 
+from services.telemetry.registry import DB_WRITE_SECONDS
+
 __all__ = [
     "OmsStore",
     "ORDER_STATES",
@@ -55,6 +57,7 @@ _CREATE_TABLES = (
     """,
     "CREATE UNIQUE INDEX IF NOT EXISTS idx_orders_client_id ON orders(client_order_id);",
     "CREATE INDEX IF NOT EXISTS idx_orders_state ON orders(state);",
+    "CREATE INDEX IF NOT EXISTS idx_orders_intent ON orders(intent_hash, last_update_ts);",
     """
     CREATE TABLE IF NOT EXISTS executions (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -94,6 +97,10 @@ def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _iso_from_epoch(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
 def _json_dumps(payload: Mapping[str, Any] | None) -> str | None:
     if not payload:
         return None
@@ -150,7 +157,7 @@ class OmsStore:
             "last_update_ts": _utcnow(),
             "raw_json": _json_dumps(raw),
         }
-        with self._lock, self._conn:
+        with DB_WRITE_SECONDS.labels(table="orders").time(), self._lock, self._conn:
             self._conn.execute(
                 """
                 INSERT INTO orders (
@@ -208,7 +215,7 @@ class OmsStore:
         assigns = ", ".join(f"{col} = :{col}" for col in fields)
         payload = dict(fields)
         payload["client_order_id"] = client_order_id
-        with self._lock, self._conn:
+        with DB_WRITE_SECONDS.labels(table="orders").time(), self._lock, self._conn:
             self._conn.execute(
                 f"UPDATE orders SET {assigns} WHERE client_order_id = :client_order_id",
                 payload,
@@ -232,7 +239,7 @@ class OmsStore:
             "event_ts": event_ts or _utcnow(),
             "raw_json": _json_dumps(raw),
         }
-        with self._lock, self._conn:
+        with DB_WRITE_SECONDS.labels(table="executions").time(), self._lock, self._conn:
             self._conn.execute(
                 """
                 INSERT INTO executions (
@@ -246,7 +253,7 @@ class OmsStore:
 
     def replace_positions(self, positions: Iterable[Mapping[str, Any]]) -> None:
         now = _utcnow()
-        with self._lock, self._conn:
+        with DB_WRITE_SECONDS.labels(table="positions").time(), self._lock, self._conn:
             self._conn.execute("DELETE FROM positions")
             for position in positions:
                 payload = {
@@ -277,7 +284,7 @@ class OmsStore:
             "message": message,
             "details": json.dumps(details, sort_keys=True, default=str) if details else None,
         }
-        with self._lock, self._conn:
+        with DB_WRITE_SECONDS.labels(table="journal").time(), self._lock, self._conn:
             self._conn.execute(
                 """
                 INSERT INTO journal (ts, category, message, details)
@@ -331,15 +338,32 @@ class OmsStore:
             row = cursor.fetchone()
         return dict(row) if row else None
 
-    def get_order_by_intent(self, intent_hash: str) -> Optional[Dict[str, Any]]:
+    def get_order_by_intent(
+        self, intent_hash: str, *, since: float | None = None
+    ) -> Optional[Dict[str, Any]]:
+        """Latest order for ``intent_hash``, optionally updated after epoch ``since``."""
+
+        query = "SELECT * FROM orders WHERE intent_hash = ?"
+        params: List[Any] = [intent_hash]
+        if since is not None:
+            query += " AND last_update_ts >= ?"
+            params.append(_iso_from_epoch(since))
+        query += " ORDER BY last_update_ts DESC LIMIT 1"
         with self._lock, self._conn:
-            cursor = self._conn.execute(
-                "SELECT * FROM orders WHERE intent_hash = ? ORDER BY last_update_ts DESC LIMIT 1",
-                (intent_hash,),
-            )
+            cursor = self._conn.execute(query, params)
             row = cursor.fetchone()
         return dict(row) if row else None
 
+    def intent_hashes_since(self, since: float) -> List[str]:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "SELECT DISTINCT intent_hash FROM orders "
+                "WHERE intent_hash IS NOT NULL AND last_update_ts >= ?",
+                (_iso_from_epoch(since),),
+            )
+            rows = cursor.fetchall()
+        return [str(row[0]) for row in rows]
+
     def metrics_snapshot(self) -> Dict[str, Any]:
         with self._lock, self._conn:
             cursor = self._conn.execute(
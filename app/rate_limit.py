@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Callable, TypeVar
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from core.rate_governor import Lane, RateGovernor
 
 T = TypeVar("T")
 
@@ -24,11 +26,25 @@ def _extract_retry_after(headers: object) -> float | None:
         return None
 
 
-async def backoff_request(fn: Callable[[], Awaitable[T]], max_retries: int = 5) -> T:
-    """Execute an async HTTP call, backing off on HTTP 429 responses."""
+async def backoff_request(
+    fn: Callable[[], Awaitable[T]],
+    max_retries: int = 5,
+    *,
+    governor: Optional[RateGovernor] = None,
+    endpoint: str = "orders",
+    lane: Lane = Lane.CRITICAL,
+) -> T:
+    """Execute an async HTTP call, backing off on HTTP 429 responses.
+
+    With a ``governor`` every attempt first takes a token for ``endpoint`` and
+    a 429 blocks the governor (and therefore every other caller) instead of
+    sleeping locally.
+    """
 
     delay = 1.0
     for attempt in range(max_retries + 1):
+        if governor is not None:
+            await governor.acquire_async(endpoint, lane)
         try:
             return await fn()
         except Exception as exc:  # pragma: no cover - specific client errors not available
@@ -38,9 +54,14 @@ async def backoff_request(fn: Callable[[], Awaitable[T]], max_retries: int = 5)
                 retry_after = _extract_retry_after(headers)
                 if retry_after is not None:
                     delay = max(delay, retry_after)
+                if governor is not None:
+                    governor.block(delay)
                 if attempt == max_retries:
                     raise RateLimitError("Max retries exceeded after 429 responses") from exc
-                await asyncio.sleep(delay)
+                if governor is not None:
+                    governor.record_retry()
+                else:
+                    await asyncio.sleep(delay)
                 delay = min(delay * 2, 30.0)
                 continue
             raise
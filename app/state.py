@@ -6,9 +6,13 @@ import threading
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
-from services.risk.state import Position, StateProvider
+from services.execution.idempotency import IdempotencyIndex
+from services.risk.state import Position, RiskSnapshot, StateProvider
+
+_TERMINAL_BROKER_STATES = {"filled", "canceled", "cancelled", "expired", "rejected", "done_for_day"}
 
 
 def _model_to_dict(obj: Any) -> Dict[str, Any]:
@@ -63,14 +67,20 @@ class IntentRecord:
 class ExecutionState(StateProvider):
     """State provider feeding risk manager + idempotent router."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, intents: Optional[IdempotencyIndex] = None) -> None:
         self._lock = threading.RLock()
-        self._intent_by_key: Dict[str, IntentRecord] = {}
+        # Intent key -> client order ID lives in the shared, bounded index;
+        # per-order details are dropped when the index expires the entry.
+        self.intents = intents if intents is not None else IdempotencyIndex()
+        self.intents.add_evict_listener(self._on_intent_evicted)
         self._intent_by_cid: Dict[str, IntentRecord] = {}
         self._open_orders: Dict[str, Dict[str, Any]] = {}
         self._positions: Dict[str, Position] = {}
         self._last_trade_ts: Dict[str, float] = {}
         self._portfolio_notional: float = 0.0
+        self._open_positions = 0
+        self._version = 0
+        self._snapshot: Optional[RiskSnapshot] = None
         self._account: Dict[str, Any] = {
             "id": "",
             "status": "",
@@ -85,18 +95,15 @@ class ExecutionState(StateProvider):
     # ------------------------------------------------------------------
     # Intent helpers
     def seen(self, key: str) -> bool:
-        with self._lock:
-            return key in self._intent_by_key
+        return key in self.intents
 
     def client_id_for(self, key: str) -> Optional[str]:
-        with self._lock:
-            record = self._intent_by_key.get(key)
-            return record.client_order_id if record else None
+        return self.intents.get(key)
 
     def remember(self, key: str, cid: str, *, symbol: Optional[str] = None, side: Optional[str] = None) -> None:
         record = IntentRecord(key=key, client_order_id=cid, symbol=symbol, side=side)
         with self._lock:
-            self._intent_by_key[key] = record
+            self.intents.put(key, cid)
             self._intent_by_cid[cid] = record
             if symbol:
                 self._last_trade_ts[symbol.upper()] = record.created_at
@@ -110,14 +117,19 @@ class ExecutionState(StateProvider):
                 return
             record.client_order_id = new_cid
             self._intent_by_cid[new_cid] = record
-            self._intent_by_key[record.key] = record
+            self.intents.rebind(old_cid, new_cid)
 
     def forget(self, key: str) -> None:
         with self._lock:
-            record = self._intent_by_key.pop(key, None)
-            if record is None:
-                return
-            self._intent_by_cid.pop(record.client_order_id, None)
+            cid = self.intents.forget(key)
+            if cid is not None:
+                self._intent_by_cid.pop(cid, None)
+
+    def _on_intent_evicted(self, key: str, cid: str) -> None:
+        with self._lock:
+            record = self._intent_by_cid.get(cid)
+            if record is not None and record.key == key:
+                del self._intent_by_cid[cid]
 
     def map_provider_id(self, cid: str, provider_id: Optional[str]) -> None:
         with self._lock:
@@ -152,8 +164,11 @@ class ExecutionState(StateProvider):
                 if record is None:
                     record = IntentRecord(key=cid, client_order_id=cid, symbol=normalised.get("symbol"))
                     self._intent_by_cid[cid] = record
-                    self._intent_by_key.setdefault(cid, record)
+                    if cid not in self.intents:
+                        self.intents.put(cid, cid)
                 record.provider_order_id = normalised.get("id")
+                if normalised["status"] in _TERMINAL_BROKER_STATES:
+                    self.intents.mark_terminal(cid)
                 if normalised.get("symbol"):
                     self._last_trade_ts.setdefault(normalised["symbol"], record.created_at)
             self._open_orders = snapshot
@@ -181,6 +196,8 @@ class ExecutionState(StateProvider):
                 notional += abs(notional_value)
             self._positions = mapped
             self._portfolio_notional = notional
+            self._open_positions = sum(1 for pos in mapped.values() if abs(pos.qty) > 0)
+            self._version += 1
 
     def update_account(self, account: Any) -> None:
         data = _model_to_dict(account)
@@ -213,6 +230,7 @@ class ExecutionState(StateProvider):
                     or float(self._account.get("multiplier", 1.0)),
                 }
             )
+            self._version += 1
 
     # ------------------------------------------------------------------
     # Risk provider hooks
@@ -232,6 +250,23 @@ class ExecutionState(StateProvider):
         with self._lock:
             return float(self._account.get("equity", 0.0))
 
+    def risk_snapshot(self) -> RiskSnapshot:
+        with self._lock:
+            cached = self._snapshot
+            if cached is not None and cached.version == self._version:
+                return cached
+            # ``update_positions`` swaps in a fresh dict, so the proxy stays
+            # consistent with this version.
+            self._snapshot = RiskSnapshot(
+                version=self._version,
+                day_pnl=float(self._account.get("day_pnl", 0.0)),
+                portfolio_notional=float(self._portfolio_notional),
+                account_equity=float(self._account.get("equity", 0.0)),
+                open_positions=self._open_positions,
+                positions=MappingProxyType(self._positions),
+            )
+            return self._snapshot
+
     def last_trade_age(self, symbol: str) -> Optional[float]:
         with self._lock:
             ts = self._last_trade_ts.get(symbol.upper())
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from dotenv import load_dotenv
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 try:
@@ -35,13 +35,18 @@ from backend.routers import (
     telemetry,
 )
 from backend.routers.deps import (
+    get_broker,
+    get_broker_adapter,
     get_kill_switch,
+    get_metrics,
     get_orchestrator,
+    get_risk_manager,
     get_stream_manager,
 )
 from backend.broker.adapter import get_broker as get_trade_broker
 from backend.services import reconcile
 from backend.services.alpaca_client import get_trading_client
+from backend.services.dashboard_snapshot import DashboardSnapshotter
 from backend.services.orchestrator import get_orchestrator_status
 from backend.services.orchestrator_manager import orchestrator_manager
 from backend.services.universe_registry import (
@@ -50,6 +55,8 @@ from backend.services.universe_registry import (
     set_override_universe,
 )
 from core.broker_config import is_mock
+from core.kill_switch import close_watchers
+from core.runtime_config import install_reload_signal
 from core.runtime_flags import RuntimeFlags, get_runtime_flags
 from core.settings import get_settings
 from backend.schemas import OrderRequest, OrderResponse
@@ -244,6 +251,7 @@ async def _lifespan(_: FastAPI):
     )
     try:
         loop = asyncio.get_event_loop()
+        install_reload_signal(loop)
         get_stream_manager().start(loop)
     except Exception:
         pass
@@ -258,6 +266,7 @@ async def _lifespan(_: FastAPI):
             pass
 
     yield
+    close_watchers()
 
 
 app = FastAPI(title="Gigatrader API", lifespan=_lifespan)
@@ -720,6 +729,72 @@ def live_start(req: StartReq | None = None):
 _register_compat_route("/live/start", live_start, ["POST"], tag="live")
 
 
+def _dashboard_telemetry() -> Dict[str, Any]:
+    return telemetry.telemetry_metrics(
+        broker=get_broker(), orch=get_orchestrator(), risk_manager=get_risk_manager()
+    )
+
+
+def _dashboard_broker_status() -> Dict[str, Any]:
+    return broker.broker_status(service=get_broker(), adapter=get_broker_adapter())
+
+
+def _dashboard_orders() -> List[Dict[str, Any]]:
+    return broker.orders(status="closed", limit=50, service=get_broker())
+
+
+async def _dashboard_execution_tail() -> Dict[str, Any]:
+    return await debug.execution_tail(limit=100)
+
+
+_dashboard = DashboardSnapshotter(
+    {
+        "telemetry": _dashboard_telemetry,
+        "status": status,
+        "broker": _dashboard_broker_status,
+        "account": lambda: broker.account(service=get_broker()),
+        "positions": lambda: broker.positions(service=get_broker()),
+        "orders": _dashboard_orders,
+        "stream": stream.stream_status,
+        "orchestrator": orchestrator.orchestrator_status,
+        "orchestrator_debug": orchestrator.orchestrator_debug,
+        "runtime_flags": get_runtime_flags,
+        "execution_tail": _dashboard_execution_tail,
+        "strategy": strategy.strategy_config,
+        "risk": risk.risk_config,
+        "pnl": pnl.pnl_summary,
+        "exposure": lambda: telemetry.telemetry_exposure(metrics=get_metrics()),
+        "logs": lambda: logs.recent_logs(limit=200),
+    },
+    volatile={"stream": ("last_heartbeat", "history")},
+)
+
+
+@app.get("/dashboard/snapshot")
+async def dashboard_snapshot(
+    request: Request,
+    response: Response,
+    since: Optional[int] = Query(None, ge=0),
+    epoch: Optional[str] = Query(None),
+) -> Any:
+    """Every Control Center section in one versioned payload.
+
+    Send the last ``ETag`` as ``If-None-Match`` to get ``304`` while nothing
+    changed, or ``since``/``epoch`` from a previous payload to receive only
+    the sections that changed after that version.
+    """
+
+    await _dashboard.refresh()
+    etag = _dashboard.etag
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return _dashboard.view(since=since, epoch=epoch).as_dict()
+
+
+_register_compat_route("/dashboard/snapshot", dashboard_snapshot, ["GET"], tag="dashboard")
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -3,7 +3,9 @@ from pathlib import Path
 from typing import List, Set
 import os
 from zoneinfo import ZoneInfo
-from datetime import datetime, time
+from datetime import datetime, time, timezone
+
+from core.trading_calendar import get_calendar
 
 _DEFAULT_FILE = os.getenv("EXTENDED_UNIVERSE_FILE", "config/extended_tickers.txt")
 
@@ -26,13 +28,11 @@ def load_extended_tickers(path: str | None = None) -> List[str]:
     return out
 
 def is_rth(now: datetime | None = None) -> bool:
-    """Regular Trading Hours: 9:30–16:00 ET, Mon–Fri (no holiday logic here)."""
-    et = (now or datetime.utcnow()).astimezone(ZoneInfo("America/New_York"))
-    wd = et.weekday()  # 0 Mon .. 4 Fri
-    if wd > 4:
-        return False
-    t = et.time()
-    return time(9, 30) <= t < time(16, 0)
+    """Regular Trading Hours: 9:30–16:00 ET on NYSE sessions.
+
+    Holidays and early closes are honoured.
+    """
+    return get_calendar().is_open((now or datetime.now(timezone.utc)).timestamp())
 
 def is_extended(now: datetime | None = None) -> bool:
     """
@@ -1,4 +1,4 @@
-"""Broker endpoints that proxy Alpaca without local caching."""
+"""Broker endpoints backed by the shared broker snapshot."""
 
 from __future__ import annotations
 
@@ -78,13 +78,9 @@ def orders(
     status: str = Query("all"),
     limit: int = Query(50, ge=1, le=500),
     service: BrokerService = Depends(get_broker),
-    adapter: Any = Depends(get_broker_adapter),
 ) -> list[dict]:
     try:
-        if hasattr(adapter, "list_orders"):
-            raw = adapter.list_orders(status=status, limit=limit)
-        else:
-            raw = service.get_orders(status=status, limit=limit)
+        raw = service.get_orders(status=status, limit=limit)
         if raw and hasattr(AlpacaAdapter, "normalize_order"):
             return [AlpacaAdapter.normalize_order(order) for order in raw]
         return raw or []
@@ -103,11 +99,10 @@ def trades_alias(
     status: str = Query("all"),
     limit: int = Query(50, ge=1, le=500),
     service: BrokerService = Depends(get_broker),
-    adapter: Any = Depends(get_broker_adapter),
 ) -> list[dict]:
     """Compatibility shim for legacy clients expecting /trades."""
 
-    return orders(status=status, limit=limit, service=service, adapter=adapter)
+    return orders(status=status, limit=limit, service=service)
 
 
 @router.delete("/orders/{order_id}")
@@ -10,6 +10,9 @@ from typing import Any, Dict
 import httpx
 from fastapi import APIRouter, Query
 
+from core.runtime_config import get_config, reload_config
+from services.runtime.tracing import get_tracer
+
 router = APIRouter()
 
 _EXECUTION_LOG_PATH = Path("logs/execution_debug.log")
@@ -35,6 +38,30 @@ async def execution_tail(limit: int = Query(50, ge=1, le=500)) -> dict:
     return {"path": str(_EXECUTION_LOG_PATH), "lines": lines}
 
 
+@router.get("/traces")
+async def pipeline_traces(format: str = Query("json", pattern="^(json|chrome)$")) -> Dict[str, Any]:
+    """Sampled bar-to-order pipeline traces, as JSON or Chrome trace events."""
+
+    tracer = get_tracer()
+    if format == "chrome":
+        return tracer.chrome_trace()
+    return {"enabled": tracer.enabled, "sample_rate": tracer.sample_rate, "traces": tracer.dump()}
+
+
+@router.get("/config")
+async def runtime_config() -> Dict[str, Any]:
+    """The runtime configuration snapshot the trading hot paths are reading."""
+
+    return get_config().as_dict()
+
+
+@router.post("/config/reload")
+async def reload_runtime_config() -> Dict[str, Any]:
+    """Rebuild the configuration snapshot from file, env and overrides."""
+
+    return reload_config().as_dict()
+
+
 @router.get("/routes")
 async def debug_routes() -> Dict[str, Dict[str, Any]]:
     """Probe key routes and return their status without propagating failures."""
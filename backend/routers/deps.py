@@ -14,6 +14,11 @@ from core.runtime_flags import get_runtime_flags
 
 from backend.services import reconcile
 from backend.services.broker_factory import make_broker_adapter
+from backend.services.broker_snapshot import (
+    ORDER_BOOK_LIMIT,
+    BrokerSnapshot,
+    get_broker_snapshot,
+)
 from backend.services.orchestrator import OrchestratorSupervisor
 from backend.services.stream_factory import StreamService, make_stream_service
 
@@ -73,15 +78,52 @@ def get_broker_adapter() -> Any:
         if _BROKER_ADAPTER is None or signature != _BROKER_SIGNATURE:
             _BROKER_ADAPTER = make_broker_adapter(flags)
             _BROKER_SIGNATURE = signature
+            # State cached for the previous broker/account no longer applies.
+            get_broker_snapshot().clear()
         return _BROKER_ADAPTER
 
 
-class BrokerService:
-    """Thin wrapper exposing broker helpers expected by the routers."""
+_OPEN_ORDER_STATUSES = frozenset(
+    {
+        "new",
+        "accepted",
+        "pending_new",
+        "partially_filled",
+        "open",
+    }
+)
+_CLOSED_ORDER_STATUSES = frozenset(
+    {
+        "filled",
+        "canceled",
+        "rejected",
+        "expired",
+        "done_for_day",
+        "stopped",
+        "suspended",
+        "calculated",
+        "replaced",
+    }
+)
+
 
-    def __init__(self, adapter: Any | None = None, *, flags=None) -> None:
+class BrokerService:
+    """Thin wrapper exposing broker helpers expected by the routers.
+
+    With a ``snapshot`` the reads are served from the shared
+    :class:`BrokerSnapshot` and only reach the broker once it is stale.
+    """
+
+    def __init__(
+        self,
+        adapter: Any | None = None,
+        *,
+        flags=None,
+        snapshot: BrokerSnapshot | None = None,
+    ) -> None:
         self._flags = flags or get_runtime_flags()
         self._adapter = adapter or make_broker_adapter(self._flags)
+        self._snapshot = snapshot
 
     @property
     def adapter(self):
@@ -92,45 +134,41 @@ class BrokerService:
         return self._flags
 
     def get_account(self) -> Dict[str, Any]:
-        return self._adapter.fetch_account()
+        if self._snapshot is None:
+            return self._adapter.fetch_account()
+        return self._snapshot.account(self._adapter.fetch_account)
 
     def get_positions(self) -> List[Dict[str, Any]]:
-        return self._adapter.fetch_positions()
+        if self._snapshot is None:
+            return self._adapter.fetch_positions()
+        return self._snapshot.positions(self._adapter.fetch_positions)
 
     def get_orders(self, *, status: str = "all", limit: int = 50) -> List[Dict[str, Any]]:
-        orders = self._adapter.fetch_orders()
         scope = status.lower()
         if scope not in {"all", "open", "closed"}:
             raise ValueError(f"unsupported status scope: {status}")
+        if self._snapshot is None:
+            orders = self._adapter.fetch_orders()
+        else:
+            orders = self._snapshot.orders(self._fetch_order_book)
 
         if scope == "all":
-            filtered = orders
-        else:
-            open_statuses = {
-                "new",
-                "accepted",
-                "pending_new",
-                "partially_filled",
-                "open",
-            }
-            closed_statuses = {
-                "filled",
-                "canceled",
-                "rejected",
-                "expired",
-                "done_for_day",
-                "stopped",
-                "suspended",
-                "calculated",
-                "replaced",
-            }
-            wanted = open_statuses if scope == "open" else closed_statuses
-            filtered = [
-                order
-                for order in orders
-                if str(order.get("status", "")).lower() in wanted
-            ]
-        return filtered[:limit]
+            return orders[:limit]
+        wanted = _OPEN_ORDER_STATUSES if scope == "open" else _CLOSED_ORDER_STATUSES
+        filtered: List[Dict[str, Any]] = []
+        for order in orders:
+            if str(order.get("status", "")).lower() in wanted:
+                filtered.append(order)
+                if len(filtered) >= limit:
+                    break
+        if self._snapshot is not None and len(filtered) < limit and len(orders) >= ORDER_BOOK_LIMIT:
+            # The cached book only holds the most recent orders; older ones
+            # in this scope have to come from the broker.
+            return list(self._adapter.fetch_orders(status=scope, limit=limit))
+        return filtered
+
+    def _fetch_order_book(self) -> List[Dict[str, Any]]:
+        return self._adapter.fetch_orders(status="all", limit=ORDER_BOOK_LIMIT)
 
     def last_headers(self) -> Mapping[str, str] | None:
         last_headers = getattr(self._adapter, "last_headers", None)
@@ -141,6 +179,16 @@ class BrokerService:
         return None
 
     def cancel_all_orders(self) -> int:
+        if self._snapshot is None:
+            return self._cancel_all_orders()
+        # Work from (and leave behind) a fresh view of the open orders.
+        self._snapshot.invalidate()
+        try:
+            return self._cancel_all_orders()
+        finally:
+            self._snapshot.invalidate()
+
+    def _cancel_all_orders(self) -> int:
         cancel_all = getattr(self._adapter, "cancel_all_orders", None)
         if callable(cancel_all):
             result = cancel_all()
@@ -420,6 +468,19 @@ class RiskConfigService:
 class MetricsService:
     """Expose P&L and exposure summaries used by the Control Center."""
 
+    def __init__(self, snapshot: BrokerSnapshot | None = None) -> None:
+        self._snapshot = snapshot
+
+    def _account(self) -> Dict[str, Any]:
+        if self._snapshot is None:
+            return reconcile.pull_account()
+        return self._snapshot.account(reconcile.pull_account)
+
+    def _positions(self) -> List[Dict[str, Any]]:
+        if self._snapshot is None:
+            return reconcile.pull_positions()
+        return self._snapshot.positions(reconcile.pull_positions)
+
     def pnl_summary(self) -> Dict[str, float]:
         if is_mock():
             return {
@@ -428,7 +489,7 @@ class MetricsService:
                 "unrealized": 0.0,
                 "cumulative": 0.0,
             }
-        acct = reconcile.pull_account()
+        acct = self._account()
         realized = float(acct.get("daytrade_pl") or acct.get("day_pl") or 0.0)
         unrealized = float(
             acct.get("unrealized_pl")
@@ -450,7 +511,7 @@ class MetricsService:
         if is_mock():
             return {"net": 0.0, "gross": 0.0, "by_symbol": []}
         try:
-            positions = reconcile.pull_positions()
+            positions = self._positions()
         except Exception:
             return {"net": 0.0, "gross": 0.0, "by_symbol": []}
         by_symbol: List[Dict[str, Any]] = []
@@ -485,7 +546,7 @@ def get_kill_switch() -> KillSwitch:
 def get_broker() -> BrokerService:
     flags = get_runtime_flags()
     adapter = get_broker_adapter()
-    return BrokerService(adapter=adapter, flags=flags)
+    return BrokerService(adapter=adapter, flags=flags, snapshot=get_broker_snapshot())
 
 
 def get_stream_manager() -> StreamService:
@@ -519,5 +580,5 @@ def get_orchestrator() -> OrchestratorSupervisor:
 def get_metrics() -> MetricsService:
     global _metrics
     if _metrics is None:
-        _metrics = MetricsService()
+        _metrics = MetricsService(get_broker_snapshot())
     return _metrics
@@ -1,10 +1,20 @@
 """Metrics endpoints consumed by the UI."""
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from services.telemetry.registry import CONTENT_TYPE, get_registry
 
 router = APIRouter()
 
 
+@router.get("", response_class=PlainTextResponse)
+def exposition() -> PlainTextResponse:
+    """Prometheus text exposition of the process-wide metrics registry."""
+
+    return PlainTextResponse(get_registry().render(), media_type=CONTENT_TYPE)
+
+
 @router.get("/summary")
 async def summary() -> dict:
     """Return a minimal metrics payload even when live data is unavailable."""
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Sequence
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 
 from backend.models.orchestrator import OrchestratorStatus
 from backend.routers.deps import (
@@ -18,6 +20,7 @@ from backend.routers.deps import (
     get_risk_manager,
 )
 from backend.services.orchestrator import OrchestratorSupervisor
+from backend.services.telemetry_stream import format_sse, get_telemetry_hub
 
 router = APIRouter(prefix="/telemetry", tags=["telemetry"])
 
@@ -354,4 +357,65 @@ def telemetry_exposure(metrics: MetricsService = Depends(get_metrics)) -> Dict[s
         return {"net": 0.0, "gross": 0.0, "by_symbol": []}
 
 
+# SSE comment sent while idle so proxies keep the connection open.
+_SSE_KEEPALIVE_SEC = 15.0
+
+
+def _parse_topics(topics: Optional[str]) -> Optional[List[str]]:
+    if not topics:
+        return None
+    return [topic.strip().lower() for topic in topics.split(",") if topic.strip()]
+
+
+@router.get("/stream")
+async def telemetry_stream(topics: Optional[str] = Query(None)) -> StreamingResponse:
+    """Server-sent events: order, fill, position, metrics, breakers and log deltas."""
+
+    client = await get_telemetry_hub().connect(_parse_topics(topics))
+
+    async def _events() -> AsyncIterator[str]:
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(client.get(), timeout=_SSE_KEEPALIVE_SEC)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            await client.close()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def telemetry_ws(websocket: WebSocket, topics: Optional[str] = None) -> None:
+    """WebSocket variant of :func:`telemetry_stream` (JSON envelopes)."""
+
+    await websocket.accept()
+    client = await get_telemetry_hub().connect(_parse_topics(topics))
+
+    async def _until_disconnect() -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    disconnected = asyncio.ensure_future(_until_disconnect())
+    try:
+        while True:
+            next_event = asyncio.ensure_future(client.get())
+            await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                next_event.cancel()
+                break
+            await websocket.send_json(next_event.result())
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        disconnected.cancel()
+        await client.close()
+
 __all__ = ["router"]
@@ -1,52 +1,122 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
-from typing import List, Optional, Dict, Any
-from pathlib import Path
+import asyncio
 import json
-import itertools
+import os
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from backend.services.log_query import LogQuery, event_timestamp, read_after, tail as tail_file
 
 router = APIRouter(tags=["logs"])
 
 _LOG_PATH = Path("runtime") / "logs.ndjson"
+_UI_DIAG = Path("logs") / "ui_diagnostics.ndjson"
+
+CURSOR_HEADER = "X-Log-Cursor"
+_FOLLOW_POLL_SEC = float(os.getenv("LOG_FOLLOW_POLL_MS", "500")) / 1000.0
+_HEARTBEAT_SEC = 15.0
+
+
+def _sources() -> Tuple[Path, Path]:
+    return _LOG_PATH, _UI_DIAG
+
+
+def _parse_cursor(raw: Optional[str]) -> Optional[List[int]]:
+    if not raw:
+        return None
+    parts = raw.split(":")
+    try:
+        offsets = [max(0, int(part)) for part in parts]
+    except ValueError:
+        return None
+    offsets += [0] * (len(_sources()) - len(offsets))
+    return offsets[: len(_sources())]
+
+
+def _format_cursor(offsets: List[int]) -> str:
+    return ":".join(str(offset) for offset in offsets)
+
+
+def _query_sources(
+    limit: int, query: LogQuery, cursor: Optional[List[int]]
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    out: List[Dict[str, Any]] = []
+    offsets: List[int] = []
+    for idx, path in enumerate(_sources()):
+        if cursor is None:
+            events, offset = tail_file(path, limit, query)
+        else:
+            events, offset = read_after(path, cursor[idx], limit, query)
+        out.extend(events)
+        offsets.append(offset)
+    out.sort(key=event_timestamp)
+    return out, offsets
 
 
 @router.get("/logs")
-def logs_tail(tail: int = Query(200, ge=1, le=5000), level: Optional[str] = None) -> List[Dict[str, Any]]:
+def logs_tail(
+    response: Response,
+    tail: int = Query(200, ge=1, le=5000),
+    level: Optional[str] = None,
+    event: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> List[Dict[str, Any]]:
     """
     Returns a list of log events (most recent last). Each line is NDJSON.
-    Optional level filter (case-insensitive contains).
+    Optional level/event filters (case-insensitive contains) and a since/until
+    time range (ISO-8601 or epoch seconds) are applied server side.
+
+    The ``X-Log-Cursor`` response header marks the end of what was read; pass
+    it back as ``cursor`` to receive only events appended since then.
     """
-    if not _LOG_PATH.exists():
-        return []
-    lines = _LOG_PATH.read_text(encoding="utf-8").splitlines()
-    last = list(itertools.islice(lines, max(0, len(lines) - tail), len(lines)))
-    out = []
-    for ln in last:
-        try:
-            evt = json.loads(ln)
-            if level and level.lower() not in str(evt.get("level", "")).lower():
-                continue
-            out.append(evt)
-        except Exception:
+    query = LogQuery.build(level=level, event=event, since=since, until=until)
+    events, offsets = _query_sources(tail, query, _parse_cursor(cursor))
+    response.headers[CURSOR_HEADER] = _format_cursor(offsets)
+    return events
+
+
+async def _follow(
+    request: Request, query: LogQuery, cursor: Optional[List[int]]
+) -> AsyncIterator[str]:
+    if cursor is None:
+        # Start at EOF: followers only want new lines.
+        _, cursor = _query_sources(0, query, None)
+    last_sent = time.monotonic()
+    while not await request.is_disconnected():
+        events, cursor = await asyncio.to_thread(_query_sources, 500, query, cursor)
+        if events:
+            token = _format_cursor(cursor)
+            for evt in events:
+                yield f"id: {token}\ndata: {json.dumps(evt, default=str)}\n\n"
+            last_sent = time.monotonic()
             continue
+        if time.monotonic() - last_sent >= _HEARTBEAT_SEC:
+            yield ": keepalive\n\n"
+            last_sent = time.monotonic()
+        await asyncio.sleep(_FOLLOW_POLL_SEC)
+
+
+@router.get("/logs/stream")
+async def logs_stream(
+    request: Request,
+    level: Optional[str] = None,
+    event: Optional[str] = None,
+    cursor: Optional[str] = None,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """Server-sent events follow mode; reconnects resume from ``Last-Event-ID``."""
 
-    _UI_DIAG = Path("logs") / "ui_diagnostics.ndjson"
-    if _UI_DIAG.exists():
-        try:
-            diag_lines = _UI_DIAG.read_text(encoding="utf-8").splitlines()
-            for ln in diag_lines[-tail:]:
-                try:
-                    evt = json.loads(ln)
-                    out.append(evt)
-                except Exception:
-                    continue
-        except Exception:
-            pass
-
-    # optional: sort by timestamp when present
-    def _ts(e):
-        return e.get("timestamp") or e.get("summary", {}).get("timestamp") or ""
-
-    out.sort(key=_ts)
-    return out
+    query = LogQuery.build(level=level, event=event)
+    start = _parse_cursor(cursor or last_event_id)
+    return StreamingResponse(
+        _follow(request, query, start),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -7,6 +7,7 @@ from typing import Dict, Any
 from fastapi import APIRouter
 
 from backend.pacing import load_pacing_snapshot
+from core.rate_governor import get_governor
 
 router = APIRouter(tags=["pacing"])
 
@@ -15,5 +16,7 @@ router = APIRouter(tags=["pacing"])
 def pacing_snapshot() -> Dict[str, Any]:
     """Return pacing/rate-limit telemetry for the control center UI."""
 
-    return load_pacing_snapshot()
+    snapshot = load_pacing_snapshot()
+    snapshot["budget"] = get_governor().snapshot()
+    return snapshot
 
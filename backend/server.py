@@ -25,7 +25,6 @@ import logging
 import random
 import time
 from decimal import Decimal
-from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -45,13 +44,25 @@ from app.ml.features import FEATURE_LIST
 from core.config import MOCK_MODE, TradeLoopConfig, get_signal_defaults, get_audit_config
 from core.runtime_flags import get_runtime_flags
 from app.execution.alpaca_adapter import AlpacaAdapter, AlpacaOrderError, AlpacaUnauthorized
+from app.execution.alpaca_async import AsyncAlpacaAdapter
 
 from app.execution.router import ExecIntent, OrderRouter
 from app.risk import RiskManager
 from app.state import ExecutionState
 from core.config import alpaca_config_ok
-from core.kill_switch import KillSwitch
+from core.kill_switch import KillSwitch, close_watchers
+from core.runtime_config import reload_config
+from services.execution.idempotency import get_idempotency_index
+from services.execution.updates import get_update_bus
+from backend.services.broker_snapshot import ORDER_BOOK_LIMIT, get_broker_snapshot
 from services.safety import breakers
+from services.telemetry.registry import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Registry,
+    get_registry,
+)
 from backend.pacing import load_pacing_snapshot
 from app.trade.orchestrator import TradeOrchestrator
 from app.execution.audit import AuditLog
@@ -75,31 +86,50 @@ _FALSEY = {"false", "0", "no", "off"}
 
 
 class OmsMetrics:
-    def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._counters: Dict[str, float] = defaultdict(float)
-        self._states: Dict[str, float] = defaultdict(float)
-        self._flags: Dict[str, float] = {}
+    """OMS counters and flags, recorded in the shared telemetry registry."""
+
+    # Exported from startup (at zero) so scrapes see every series.
+    COUNTERS = (
+        "oms_submissions_total",
+        "oms_filled_orders_total",
+        "oms_rejects_total",
+        "oms_cancels_total",
+        "oms_reconcile_runs_total",
+    )
+
+    def __init__(self, registry: Optional[Registry] = None) -> None:
+        self._registry = registry or get_registry()
+        self._counters: Dict[str, Counter] = {
+            key: self._registry.counter(key) for key in self.COUNTERS
+        }
+        self._flags: Dict[str, Gauge] = {}
+        self._states = self._registry.counter(
+            "oms_order_state_transitions_total",
+            "OMS order state transitions by new state.",
+            ("state",),
+        )
 
     def increment(self, key: str, value: float = 1.0) -> None:
-        with self._lock:
-            self._counters[key] += value
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, self._registry.counter(key))
+        counter.inc(value)
 
     def note_state(self, state: str) -> None:
-        with self._lock:
-            self._states[state] += 1.0
+        self._states.labels(state=state).inc()
 
     def set_flag(self, key: str, value: float) -> None:
-        with self._lock:
-            self._flags[key] = float(value)
+        gauge = self._flags.get(key)
+        if gauge is None:
+            gauge = self._flags.setdefault(key, self._registry.gauge(key))
+        gauge.set(float(value))
 
     def snapshot(self) -> Dict[str, Dict[str, float]]:
-        with self._lock:
-            return {
-                "counters": dict(self._counters),
-                "states": dict(self._states),
-                "flags": dict(self._flags),
-            }
+        return {
+            "counters": {key: counter.value for key, counter in list(self._counters.items())},
+            "states": {key[0]: child.value for key, child in self._states.children()},
+            "flags": {key: gauge.value for key, gauge in list(self._flags.items())},
+        }
 
 
 def _to_float(value: Any) -> Optional[float]:
@@ -234,7 +264,7 @@ except Exception as exc:
 
 _signal_engine = SignalEngine(_data_client, config=get_signal_defaults())
 
-_execution_state = ExecutionState()
+_execution_state = ExecutionState(intents=get_idempotency_index())
 
 
 _broker = AlpacaAdapter()
@@ -353,9 +383,16 @@ OMS_DB_PATH = Path(os.getenv("OMS_DB_PATH", "runtime/oms.db"))
 OMS_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 USE_WEBSOCKET = os.getenv("USE_WEBSOCKET", "true").lower() not in _FALSEY
 CANCEL_AT_CLOSE = os.getenv("CANCEL_AT_CLOSE", "false").lower() not in _FALSEY
+# Orders per reconcile cycle, and how often the snapshot's full book is refilled.
+RECON_ORDER_PAGE = 50
+RECON_ORDER_BOOK_SEC = float(os.getenv("RECON_ORDER_BOOK_SEC", "60"))
 
 _oms_store = OmsStore(OMS_DB_PATH)
 _oms_metrics = OmsMetrics()
+_OMS_ORDERS_BY_STATE = get_registry().gauge(
+    "oms_orders_total", "Orders in the OMS store by current state.", ("state",)
+)
+_OMS_FILLS = get_registry().gauge("oms_fills_total", "Fill executions in the OMS store.")
 
 _use_mock_broker = MOCK_MODE or not _broker.is_configured()
 if _use_mock_broker:
@@ -422,7 +459,7 @@ def _update_oms_state(
     if prev_state != state:
         _oms_metrics.note_state(state)
         if state == "filled":
-            _oms_metrics.increment("oms_fills_total")
+            _oms_metrics.increment("oms_filled_orders_total")
         elif state == "rejected":
             _oms_metrics.increment("oms_rejects_total")
         elif state == "canceled":
@@ -455,7 +492,7 @@ async def lifespan(app: FastAPI):
 
     if _broker.is_configured() and not _use_mock_broker:
         try:
-            _broker.fetch_and_merge_orders(_oms_store)
+            await asyncio.to_thread(_broker.fetch_and_merge_orders, _oms_store)
         except AlpacaUnauthorized:
             log.warning("startup reconcile skipped: alpaca unauthorized")
         except AlpacaOrderError as exc:
@@ -466,18 +503,33 @@ async def lifespan(app: FastAPI):
     stop_flag = False
     stream_stop = asyncio.Event()
 
+    # Reconcile polls run on the event loop; the async adapter keeps them off it.
+    recon_broker = AsyncAlpacaAdapter(base_url=_broker.base)
+
     async def recon_loop() -> None:
         nonlocal stop_flag
-        broker = _broker
+        broker = recon_broker
         backoff_schedule = [2.0, 3.0, 5.0, 8.0, 10.0]
         backoff_index = 0
         auth_logged = False
+        book_refreshed_at: Optional[float] = None
         while not stop_flag:
             delay = backoff_schedule[min(backoff_index, len(backoff_schedule) - 1)]
+            # OMS reconciliation only needs the latest page; the broker
+            # snapshot's full order book is refilled on a slower cadence.
+            book_due = (
+                book_refreshed_at is None
+                or time.monotonic() - book_refreshed_at >= RECON_ORDER_BOOK_SEC
+            )
+            pulls = [
+                broker.fetch_orders(status="all", limit=RECON_ORDER_PAGE),
+                broker.fetch_positions(),
+                broker.fetch_account(),
+            ]
+            if book_due:
+                pulls.append(broker.fetch_orders(status="all", limit=ORDER_BOOK_LIMIT))
             try:
-                orders = broker.fetch_orders()
-                positions = broker.fetch_positions()
-                account = broker.fetch_account()
+                orders, positions, account, *rest = await asyncio.gather(*pulls)
             except AlpacaUnauthorized:
                 if not auth_logged:
                     log.warning(
@@ -500,6 +552,7 @@ async def lifespan(app: FastAPI):
                 continue
 
             auth_logged = False
+            book = rest[0] if rest else None
             for order in orders:
                 cid = str(order.get("client_order_id") or "").strip()
                 if not cid:
@@ -525,6 +578,12 @@ async def lifespan(app: FastAPI):
             _execution_state.update_orders(orders)
             _execution_state.update_positions(positions)
             _execution_state.update_account(account)
+            snapshot = get_broker_snapshot()
+            snapshot.update(account=account, positions=positions, orders=book)
+            if book is None:
+                snapshot.merge_orders(orders)
+            else:
+                book_refreshed_at = time.monotonic()
             _oms_metrics.increment("oms_reconcile_runs_total")
             backoff_index = 0
             await asyncio.sleep(backoff_schedule[0])
@@ -533,6 +592,8 @@ async def lifespan(app: FastAPI):
         cid = str(payload.get("client_order_id") or "").strip()
         if not cid:
             return
+        get_update_bus().publish_order(payload)
+        get_broker_snapshot().apply_order_update(payload)
         order_info = payload.get("order")
         if not isinstance(order_info, dict):
             order_info = None
@@ -711,8 +772,10 @@ async def lifespan(app: FastAPI):
             task.cancel()
             try:
                 await task
-            except Exception:
+            except (asyncio.CancelledError, Exception):
                 pass
+        await recon_broker.aclose()
+        close_watchers()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1198,21 +1261,14 @@ def force_sync_order(client_order_id: str):
 @app.get("/metrics")
 def metrics() -> PlainTextResponse:
     store_snapshot = _oms_store.metrics_snapshot()
-    metrics_snapshot = _oms_metrics.snapshot()
-    lines: List[str] = []
     orders_by_state = store_snapshot.get("orders_by_state", {})
-    for state, count in sorted(orders_by_state.items()):
-        lines.append(f"oms_orders_total{{state=\"{state}\"}} {int(count)}")
-    counters = metrics_snapshot.get("counters", {})
-    fills_total = int(store_snapshot.get("fills_total", 0))
-    lines.append(f"oms_submissions_total {int(counters.get('oms_submissions_total', 0))}")
-    lines.append(f"oms_fills_total {fills_total}")
-    lines.append(f"oms_rejects_total {int(counters.get('oms_rejects_total', 0))}")
-    lines.append(f"oms_cancels_total {int(counters.get('oms_cancels_total', 0))}")
-    lines.append(f"oms_reconcile_runs_total {int(counters.get('oms_reconcile_runs_total', 0))}")
-    stream_flag = metrics_snapshot.get("flags", {}).get("alpaca_stream_connected", 0.0)
-    lines.append(f"alpaca_stream_connected {int(stream_flag)}")
-    return PlainTextResponse("\n".join(lines) + "\n")
+    for (state,), child in _OMS_ORDERS_BY_STATE.children():
+        if state not in orders_by_state:
+            child.set(0)
+    for state, count in orders_by_state.items():
+        _OMS_ORDERS_BY_STATE.labels(state=state).set(count)
+    _OMS_FILLS.set(store_snapshot.get("fills_total", 0))
+    return PlainTextResponse(get_registry().render(), media_type=METRICS_CONTENT_TYPE)
 
 
 @app.get("/pacing")
@@ -1230,6 +1286,7 @@ def paper_start(preset: Optional[str] = None):
         pass
     if preset:
         os.environ["RISK_PROFILE"] = preset
+        reload_config()
     start_background_runner(profile="paper")
     if runner_last_error:
         return JSONResponse(status_code=500, content={"error": runner_last_error})
@@ -1509,7 +1566,7 @@ def sentiment(symbol: str, hours_back: int = 24, limit: int = 50):
 
     try:
         from services.sentiment.fetchers import AlpacaNewsFetcher
-        from services.sentiment.scoring import heuristic_score
+        from services.sentiment.scoring import heuristic_scores
     except Exception as e:
         payload = {
             "symbol": symbol.upper(),
@@ -1527,7 +1584,9 @@ def sentiment(symbol: str, hours_back: int = 24, limit: int = 50):
             payload = {"symbol": symbol.upper(), "score": 0.0, "items": [], "note": "No news found"}
             _SENT_CACHE[key] = (now, payload)
             return payload
-        scores = [heuristic_score(i.get("headline",""), i.get("summary","")) for i in items]
+        scores = heuristic_scores(
+            [i.get("headline", "") for i in items], [i.get("summary", "") for i in items]
+        )
         score = sum(scores)/len(scores)
         payload = {"symbol": symbol.upper(), "score": round(score, 4), "count": len(items), "items": items[:10]}
         _SENT_CACHE[key] = (now, payload)
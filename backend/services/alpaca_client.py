@@ -6,6 +6,7 @@ from functools import lru_cache
 from alpaca.trading.client import TradingClient
 
 from core.broker_config import AlpacaConfig, is_mock
+from core.runtime_config import reload_config
 
 
 def _bool_env(name: str, default: bool = False) -> bool:
@@ -19,7 +20,9 @@ def get_trading_client() -> TradingClient:
     key = cfg.key_id or os.getenv("ALPACA_API_KEY_ID") or ""
     sec = cfg.secret_key or os.getenv("ALPACA_API_SECRET_KEY") or ""
     base_url = cfg.base_url or os.getenv("APCA_API_BASE_URL") or "https://paper-api.alpaca.markets"
-    os.environ["APCA_API_BASE_URL"] = base_url
+    if os.environ.get("APCA_API_BASE_URL") != base_url:
+        os.environ["APCA_API_BASE_URL"] = base_url
+        reload_config()
     paper = (not is_mock()) and ("paper" in base_url.lower())
     # If MOCK_MODE=true, callers should gate off before invoking this helper.
     return TradingClient(api_key=key, secret_key=sec, paper=paper)
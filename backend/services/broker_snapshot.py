@@ -0,0 +1,270 @@
+"""In-memory broker account/positions/orders snapshot shared by the API.
+
+The reconcile loop and the trade-update stream push fresh broker state in;
+HTTP handlers read it back without touching the broker as long as it is
+younger than ``BROKER_SNAPSHOT_MAX_AGE_SEC``. A read that finds its slot
+stale refreshes it, and concurrent readers of the same slot wait for that
+single refresh instead of issuing their own broker calls.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+DEFAULT_MAX_AGE_SEC = 5.0
+# Followers give up waiting on a refresh after this long and fetch themselves.
+_REFRESH_WAIT_SEC = 30.0
+
+ACCOUNT = "account"
+POSITIONS = "positions"
+ORDERS = "orders"
+_SLOTS = (ACCOUNT, POSITIONS, ORDERS)
+
+# Most recent orders the ORDERS slot is filled with by reconcile pushes and
+# read-through refreshes; matches the routers' maximum ``limit``.
+ORDER_BOOK_LIMIT = 500
+
+# Trade-update events that change positions and buying power.
+_FILL_EVENTS = {"fill", "partial_fill", "filled", "partially_filled"}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _order_key(order: Mapping[str, Any]) -> Optional[str]:
+    key = order.get("id") or order.get("order_id") or order.get("client_order_id")
+    return str(key) if key else None
+
+
+@dataclass(slots=True)
+class _Slot:
+    value: Any = None
+    fetched_at: Optional[float] = None
+    refreshing: Optional[threading.Event] = None
+    error: Optional[BaseException] = None
+
+
+class BrokerSnapshot:
+    """Read-through cache of broker state with single-flight refresh."""
+
+    def __init__(
+        self,
+        *,
+        max_age_sec: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_age_sec = (
+            max_age_sec
+            if max_age_sec is not None
+            else _env_float("BROKER_SNAPSHOT_MAX_AGE_SEC", DEFAULT_MAX_AGE_SEC)
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots: Dict[str, _Slot] = {name: _Slot() for name in _SLOTS}
+        self._orders: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0, "refreshes": 0, "pushes": 0}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def account(
+        self, fetch: Callable[[], Mapping[str, Any]], *, max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
+        return dict(self._read(ACCOUNT, fetch, max_age) or {})
+
+    def positions(
+        self, fetch: Callable[[], Iterable[Mapping[str, Any]]], *, max_age: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        return [dict(pos) for pos in self._read(POSITIONS, fetch, max_age) or []]
+
+    def orders(
+        self, fetch: Callable[[], Iterable[Mapping[str, Any]]], *, max_age: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Known orders, newest first."""
+
+        self._read(ORDERS, fetch, max_age)
+        with self._lock:
+            return [dict(order) for order in self._orders.values()]
+
+    def _read(self, name: str, fetch: Callable[[], Any], max_age: Optional[float]) -> Any:
+        limit = self.max_age_sec if max_age is None else max_age
+        with self._lock:
+            slot = self._slots[name]
+            if slot.fetched_at is not None and self._clock() - slot.fetched_at <= limit:
+                self._counters["hits"] += 1
+                return slot.value
+            self._counters["misses"] += 1
+            waiter = slot.refreshing
+            if waiter is None:
+                slot.refreshing = threading.Event()
+        if waiter is not None and waiter.wait(_REFRESH_WAIT_SEC):
+            with self._lock:
+                if slot.error is not None:
+                    raise slot.error
+                return slot.value
+        return self._refresh(name, fetch)
+
+    def _refresh(self, name: str, fetch: Callable[[], Any]) -> Any:
+        slot = self._slots[name]
+        try:
+            value = fetch()
+        except BaseException as exc:
+            with self._lock:
+                slot.error = exc
+                done, slot.refreshing = slot.refreshing, None
+            if done is not None:
+                done.set()
+            raise
+        with self._lock:
+            self._counters["refreshes"] += 1
+            self._store(name, value)
+            slot.error = None
+            done, slot.refreshing = slot.refreshing, None
+            result = slot.value
+        if done is not None:
+            done.set()
+        return result
+
+    # ------------------------------------------------------------------
+    # Pushes from the reconcile loop and trade-update stream
+    # ------------------------------------------------------------------
+    def update(
+        self,
+        *,
+        account: Optional[Mapping[str, Any]] = None,
+        positions: Optional[Iterable[Mapping[str, Any]]] = None,
+        orders: Optional[Iterable[Mapping[str, Any]]] = None,
+    ) -> None:
+        """Replace whichever slots were freshly pulled from the broker."""
+
+        with self._lock:
+            self._counters["pushes"] += 1
+            if account is not None:
+                self._store(ACCOUNT, account)
+            if positions is not None:
+                self._store(POSITIONS, positions)
+            if orders is not None:
+                self._store(ORDERS, orders)
+
+    def merge_orders(self, orders: Iterable[Mapping[str, Any]]) -> None:
+        """Merge a page of the most recent orders (newest first) into the book.
+
+        Older orders already in the book are kept, so reconcile can push a
+        small page each cycle. The slot only counts as fresh once a full
+        book has been stored; until then the next read still refreshes it.
+        """
+
+        with self._lock:
+            self._counters["pushes"] += 1
+            book: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+            for order in orders or []:
+                if isinstance(order, Mapping):
+                    book[_order_key(order) or str(len(book))] = dict(order)
+            for key, order in self._orders.items():
+                if len(book) >= ORDER_BOOK_LIMIT:
+                    break
+                book.setdefault(key, order)
+            self._orders = book
+            slot = self._slots[ORDERS]
+            if slot.fetched_at is not None:
+                slot.fetched_at = self._clock()
+
+    def ingest(self, snapshot: Mapping[str, Any]) -> None:
+        """Store a ``pull_all_if_live`` result unless it is a mock or error."""
+
+        if snapshot.get("mode") in {"mock", "error"}:
+            return
+        self.update(
+            account=snapshot.get("account"),
+            positions=snapshot.get("positions"),
+            orders=snapshot.get("orders"),
+        )
+
+    def apply_order_update(self, update: Mapping[str, Any]) -> None:
+        """Merge one trade update (Alpaca stream shape) into the order book."""
+
+        order = update.get("order")
+        if not isinstance(order, Mapping):
+            if "status" not in update:
+                return
+            order = update
+        key = _order_key(order)
+        if key is None:
+            return
+        event = str(update.get("event") or "").lower()
+        with self._lock:
+            self._counters["pushes"] += 1
+            current = self._orders.get(key)
+            if current is None:
+                self._orders[key] = dict(order)
+                self._orders.move_to_end(key, last=False)
+            else:
+                current.update(order)
+            if event in _FILL_EVENTS or str(order.get("status") or "").lower() in _FILL_EVENTS:
+                # Positions and buying power moved; the next read refetches them.
+                self._slots[POSITIONS].fetched_at = None
+                self._slots[ACCOUNT].fetched_at = None
+
+    def _store(self, name: str, value: Any) -> None:
+        slot = self._slots[name]
+        if name == ORDERS:
+            book: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+            for order in value or []:
+                if isinstance(order, Mapping):
+                    book[_order_key(order) or str(len(book))] = dict(order)
+            self._orders = book
+            slot.value = None
+        elif name == POSITIONS:
+            slot.value = [dict(pos) for pos in value or [] if isinstance(pos, Mapping)]
+        else:
+            slot.value = dict(value or {})
+        slot.fetched_at = self._clock()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def invalidate(self, *names: str) -> None:
+        with self._lock:
+            for name in names or _SLOTS:
+                self._slots[name].fetched_at = None
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in _SLOTS:
+                self._slots[name] = _Slot()
+            self._orders = OrderedDict()
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            ages = {
+                name: (now - slot.fetched_at) if slot.fetched_at is not None else None
+                for name, slot in self._slots.items()
+            }
+            return {"max_age_sec": self.max_age_sec, "age_sec": ages, **self._counters}
+
+
+_DEFAULT_SNAPSHOT: Optional[BrokerSnapshot] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_broker_snapshot() -> BrokerSnapshot:
+    """Process-wide snapshot fed by reconcile and the trade-update stream."""
+
+    global _DEFAULT_SNAPSHOT
+    with _DEFAULT_LOCK:
+        if _DEFAULT_SNAPSHOT is None:
+            _DEFAULT_SNAPSHOT = BrokerSnapshot()
+        return _DEFAULT_SNAPSHOT
+
+
+__all__ = ["ORDER_BOOK_LIMIT", "BrokerSnapshot", "get_broker_snapshot"]
@@ -0,0 +1,181 @@
+"""Versioned, aggregated Control Center snapshot.
+
+One request gathers every dashboard section concurrently. Each section is
+fingerprinted; the snapshot version only advances when a section's content
+changes, which lets clients revalidate with ``If-None-Match`` or ask for the
+sections changed since a version they already hold. Fields that move on
+every collection (heartbeats, timestamp histories) can be declared volatile
+per section; they are left out of the fingerprint and only refresh when
+something else in the section changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Union
+
+from fastapi.encoders import jsonable_encoder
+
+Section = Callable[[], Union[Any, Awaitable[Any]]]
+
+DEFAULT_MIN_INTERVAL_SEC = 1.0
+DEFAULT_SECTION_TIMEOUT_SEC = 5.0
+
+logger = logging.getLogger("gigatrader.dashboard")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _fingerprint(value: Any, error: Optional[str], volatile: frozenset[str] = frozenset()) -> str:
+    if volatile and isinstance(value, dict):
+        value = {key: item for key, item in value.items() if key not in volatile}
+    body = json.dumps([value, error], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class _SectionState:
+    value: Any = None
+    error: Optional[str] = None
+    fingerprint: Optional[str] = None
+    changed_at: int = 0
+
+
+@dataclass(slots=True)
+class DashboardView:
+    """What one client asked for: the whole snapshot or a delta."""
+
+    epoch: str
+    version: int
+    generated_at: float
+    full: bool
+    sections: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.epoch}-{self.version}"'
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "epoch": self.epoch,
+            "version": self.version,
+            "generated_at": self.generated_at,
+            "full": self.full,
+            "sections": self.sections,
+            "errors": self.errors,
+        }
+
+
+class DashboardSnapshotter:
+    """Collects dashboard sections and tracks which ones changed when."""
+
+    def __init__(
+        self,
+        sections: Mapping[str, Section],
+        *,
+        min_interval_sec: Optional[float] = None,
+        section_timeout_sec: Optional[float] = None,
+        volatile: Optional[Mapping[str, Iterable[str]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sections = dict(sections)
+        self.volatile = {name: frozenset(keys) for name, keys in (volatile or {}).items()}
+        self.min_interval_sec = (
+            min_interval_sec
+            if min_interval_sec is not None
+            else _env_float("DASHBOARD_SNAPSHOT_MIN_INTERVAL_SEC", DEFAULT_MIN_INTERVAL_SEC)
+        )
+        self.section_timeout_sec = (
+            section_timeout_sec
+            if section_timeout_sec is not None
+            else _env_float("DASHBOARD_SECTION_TIMEOUT_SEC", DEFAULT_SECTION_TIMEOUT_SEC)
+        )
+        self.epoch = uuid.uuid4().hex[:8]
+        self.version = 0
+        self._clock = clock
+        self._state: Dict[str, _SectionState] = {name: _SectionState() for name in self.sections}
+        self._collected_at: Optional[float] = None
+        self._generated_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.epoch}-{self.version}"'
+
+    async def refresh(self) -> None:
+        """Re-collect every section unless a collection is recent enough."""
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # Concurrent viewers share one collection per interval.
+            now = self._clock()
+            if self._collected_at is not None and now - self._collected_at < self.min_interval_sec:
+                return
+            names = list(self.sections)
+            results = await asyncio.gather(*(self._collect(name) for name in names))
+            bumped = False
+            for name, (value, error) in zip(names, results, strict=True):
+                state = self._state[name]
+                fingerprint = _fingerprint(value, error, self.volatile.get(name, frozenset()))
+                if fingerprint == state.fingerprint:
+                    continue
+                if not bumped:
+                    self.version += 1
+                    bumped = True
+                state.value, state.error = value, error
+                state.fingerprint = fingerprint
+                state.changed_at = self.version
+            self._collected_at = self._clock()
+            if bumped:
+                self._generated_at = time.time()
+
+    async def _collect(self, name: str) -> tuple[Any, Optional[str]]:
+        provider = self.sections[name]
+        try:
+            if inspect.iscoroutinefunction(provider):
+                result = provider()
+            else:
+                result = asyncio.to_thread(provider)
+            value = await asyncio.wait_for(result, timeout=self.section_timeout_sec)
+            return jsonable_encoder(value), None
+        except asyncio.TimeoutError:
+            return None, f"timed out after {self.section_timeout_sec:g}s"
+        except Exception as exc:  # noqa: BLE001 - one section must not fail the snapshot
+            logger.debug("dashboard section %s failed: %s", name, exc)
+            return None, str(exc) or exc.__class__.__name__
+
+    def view(self, *, since: Optional[int] = None, epoch: Optional[str] = None) -> DashboardView:
+        """Sections changed after ``since`` (all of them if it cannot be honoured)."""
+
+        full = since is None or epoch != self.epoch or since > self.version
+        view = DashboardView(
+            epoch=self.epoch,
+            version=self.version,
+            generated_at=self._generated_at,
+            full=full,
+        )
+        for name, state in self._state.items():
+            if not full and state.changed_at <= since:  # type: ignore[operator]
+                continue
+            view.sections[name] = state.value
+            if state.error is not None:
+                view.errors[name] = state.error
+        return view
+
+
+__all__ = ["DashboardSnapshotter", "DashboardView", "Section"]
@@ -0,0 +1,213 @@
+"""Seek-based queries over NDJSON log files.
+
+Tails are read backwards from EOF in fixed-size blocks, so the cost of a
+query depends on how many lines it returns rather than on the size of the
+file. Offsets double as cursors: ``read_after`` returns only lines appended
+after a previous query, which is what the diagnostics UI polls with.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BLOCK_SIZE = 64 * 1024
+
+
+def event_timestamp(event: Dict[str, Any]) -> str:
+    summary = event.get("summary")
+    nested = summary.get("timestamp") if isinstance(summary, dict) else None
+    return str(event.get("timestamp") or event.get("ts") or nested or "")
+
+
+def _parse_time(value: str | None) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(float(value), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        pass
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass(slots=True)
+class LogQuery:
+    """Server-side filter: level/event substrings and an inclusive time range."""
+
+    level: Optional[str] = None
+    event: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+    @classmethod
+    def build(
+        cls,
+        level: Optional[str] = None,
+        event: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> "LogQuery":
+        return cls(
+            level=level.lower() if level else None,
+            event=event.lower() if event else None,
+            since=_parse_time(since),
+            until=_parse_time(until),
+        )
+
+    def parse(self, raw: bytes) -> Optional[Dict[str, Any]]:
+        """Decode ``raw`` and return the event if it passes every filter."""
+
+        raw = raw.strip()
+        if not raw:
+            return None
+        # Cheap byte-level rejection before paying for json.loads.
+        if self.level or self.event:
+            lowered = raw.lower()
+            if self.level and self.level.encode() not in lowered:
+                return None
+            if self.event and self.event.encode() not in lowered:
+                return None
+        try:
+            evt = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(evt, dict):
+            return None
+        if self.level and self.level not in str(evt.get("level", "")).lower():
+            return None
+        if self.event:
+            name = evt.get("event") or evt.get("type") or evt.get("message") or ""
+            if self.event not in str(name).lower():
+                return None
+        if self.since or self.until:
+            ts = _parse_time(event_timestamp(evt))
+            if ts is None:
+                return None
+            if self.since and ts < self.since:
+                return None
+            if self.until and ts > self.until:
+                return None
+        return evt
+
+    def before_range(self, evt: Dict[str, Any]) -> bool:
+        """True when ``evt`` predates ``since`` (reverse scans can stop there)."""
+
+        if self.since is None:
+            return False
+        ts = _parse_time(event_timestamp(evt))
+        return ts is not None and ts < self.since
+
+
+def iter_lines_reverse(
+    path: Path, end: Optional[int] = None, block_size: int = BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Yield complete lines of ``path`` from ``end`` (default EOF) backwards."""
+
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        position = size if end is None else min(end, size)
+        remainder = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            chunk = handle.read(step) + remainder
+            lines = chunk.split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier block.
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line
+        if remainder:
+            yield remainder
+
+
+def file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def tail(
+    path: Path, limit: int, query: Optional[LogQuery] = None
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Last ``limit`` matching events (oldest first) and the cursor at EOF."""
+
+    query = query or LogQuery()
+    end = file_size(path)
+    if end == 0 or limit <= 0:
+        return [], end
+    with path.open("rb") as handle:
+        handle.seek(end - 1)
+        partial = handle.read(1) != b"\n"
+    out: List[Dict[str, Any]] = []
+    unfiltered = LogQuery()
+    lines = iter_lines_reverse(path, end)
+    if partial:
+        # A half-written last line is left for the next ``read_after``.
+        end -= len(next(lines, b""))
+    for raw in lines:
+        evt = query.parse(raw)
+        if evt is None:
+            if query.since is not None:
+                probe = unfiltered.parse(raw)
+                if probe is not None and query.before_range(probe):
+                    break
+            continue
+        out.append(evt)
+        if len(out) >= limit:
+            break
+    out.reverse()
+    return out, end
+
+
+def read_after(
+    path: Path, cursor: int, limit: int, query: Optional[LogQuery] = None
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Matching events appended after byte offset ``cursor`` and the new cursor.
+
+    At most ``limit`` events are returned; the cursor then points just past the
+    last one returned so the caller can page forward. A cursor beyond EOF
+    means the file was truncated or rotated, and reading restarts at 0.
+    """
+
+    query = query or LogQuery()
+    size = file_size(path)
+    if cursor > size:
+        cursor = 0
+    if cursor == size:
+        return [], cursor
+    out: List[Dict[str, Any]] = []
+    with path.open("rb") as handle:
+        handle.seek(cursor)
+        while len(out) < limit:
+            raw = handle.readline()
+            if not raw or not raw.endswith(b"\n"):
+                break
+            cursor += len(raw)
+            evt = query.parse(raw)
+            if evt is not None:
+                out.append(evt)
+    return out, cursor
+
+
+__all__ = [
+    "BLOCK_SIZE",
+    "LogQuery",
+    "event_timestamp",
+    "file_size",
+    "iter_lines_reverse",
+    "read_after",
+    "tail",
+]
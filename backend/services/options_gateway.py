@@ -23,6 +23,15 @@ def _coerce_float(value: Any) -> Optional[float]:
         return None
 
 
+def _greek(
+    contract: OptionContract, raw_greeks: Mapping[str, Any] | None, name: str
+) -> Optional[float]:
+    value = getattr(contract, name, None)
+    if value is None and raw_greeks:
+        value = raw_greeks.get(name)
+    return value
+
+
 def _expiry_to_str(value: Any) -> Optional[str]:
     if value is None:
         return None
@@ -120,10 +129,10 @@ class OptionGateway:
             "mid": contract.mid,
             "iv": contract.iv,
             "delta": contract.delta,
-            "gamma": raw_greeks.get("gamma") if raw_greeks else None,
-            "theta": raw_greeks.get("theta") if raw_greeks else None,
-            "vega": raw_greeks.get("vega") if raw_greeks else None,
-            "rho": raw_greeks.get("rho") if raw_greeks else None,
+            "gamma": _greek(contract, raw_greeks, "gamma"),
+            "theta": _greek(contract, raw_greeks, "theta"),
+            "vega": _greek(contract, raw_greeks, "vega"),
+            "rho": _greek(contract, raw_greeks, "rho"),
             "oi": contract.oi,
             "volume": contract.volume,
             "expiry": _expiry_to_str(contract.expiry),
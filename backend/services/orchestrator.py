@@ -9,10 +9,11 @@ from datetime import datetime, timezone
 from typing import Any, Deque, Dict, List, Optional
 
 from backend.models.orchestrator import BrokerProfile, KillSwitchStatus, OrchestratorStatus
-from core.kill_switch import KillSwitch
+from core.kill_switch import KillSwitch, KillSwitchEvent
 from core.market_hours import market_state
 from core.runtime_flags import get_runtime_flags
 from services.execution.preopen_queue import PreopenIntent, PreopenQueue
+from services.telemetry.registry import QUEUE_DEPTH
 
 
 _CURRENT_SUPERVISOR: "OrchestratorSupervisor" | None = None
@@ -39,6 +40,7 @@ _decision_snapshot: Dict[str, Any] = {
 }
 
 _preopen_queue = PreopenQueue()
+QUEUE_DEPTH.labels(queue="preopen").set_function(_preopen_queue.__len__)
 _preopen_queue_count: int = 0
 
 
@@ -425,6 +427,7 @@ class OrchestratorSupervisor:
             self._start_time = datetime.now(timezone.utc)
         self.mark_tick()
         heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        kill_switch_task = asyncio.create_task(self._kill_switch_loop())
 
         def _run() -> None:
             from services.runtime import runner as runtime_runner
@@ -435,9 +438,10 @@ class OrchestratorSupervisor:
         try:
             await asyncio.to_thread(_run)
         finally:
-            heartbeat_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await heartbeat_task
+            for task in (heartbeat_task, kill_switch_task):
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
             self._runtime_started = False
             self._internal_state = "stopped" if self._stop_requested else self._internal_state
             self.mark_tick()
@@ -447,6 +451,26 @@ class OrchestratorSupervisor:
             self.mark_tick()
             await asyncio.sleep(1.0)
 
+    async def _kill_switch_loop(self) -> None:
+        subscribe = getattr(self._kill_switch, "subscribe", None)
+        if not callable(subscribe):
+            return
+        queue = subscribe()
+        try:
+            while True:
+                self._on_kill_switch_event(await queue.get())
+        finally:
+            self._kill_switch.unsubscribe(queue)
+
+    def _on_kill_switch_event(self, event: KillSwitchEvent) -> None:
+        if event.action == "engaged":
+            if self._trade_guard_reason is None:
+                self._trade_guard_reason = "kill_switch_engaged"
+            log.warning("orchestrator.kill_switch.engaged", extra={"reason": event.reason})
+        elif self._trade_guard_reason == "kill_switch_engaged":
+            self._trade_guard_reason = None
+            log.info("orchestrator.kill_switch.reset", extra={"reason": event.reason})
+
     def mark_tick(self) -> None:
         self._last_heartbeat = datetime.now(timezone.utc)
 
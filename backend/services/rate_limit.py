@@ -5,14 +5,17 @@ import time
 from pathlib import Path
 from typing import Mapping
 
+from core.rate_governor import get_governor
+
 _RATE_LIMIT_PATH = Path("runtime") / "pacing.ndjson"
 
 
 def record_rate_limit(headers: Mapping[str, str] | None) -> None:
-    """Persist rate-limit headers for pacing diagnostics."""
+    """Feed rate-limit headers to the broker governor and persist them for pacing diagnostics."""
 
     if not headers:
         return
+    get_governor().observe(headers)
     relevant = {k: headers[k] for k in headers if k.lower().startswith("x-ratelimit")}
     if not relevant:
         return
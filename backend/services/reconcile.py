@@ -26,6 +26,7 @@ from core.broker_config import is_mock
 from core.runtime_flags import get_runtime_flags
 
 from .alpaca_client import get_trading_client
+from .broker_snapshot import ORDER_BOOK_LIMIT, get_broker_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ router = APIRouter()
 
 def pull_orders() -> List[Dict[str, Any]]:
     tc = get_trading_client()
-    orders = tc.get_orders(GetOrdersRequest(status=QueryOrderStatus.ALL))
+    orders = tc.get_orders(GetOrdersRequest(status=QueryOrderStatus.ALL, limit=ORDER_BOOK_LIMIT))
     out: List[Dict[str, Any]] = []
     for o in orders:
         out.append(o.__dict__.get("_raw", {}))
@@ -60,7 +61,7 @@ def pull_all_if_live() -> Dict[str, Any]:
     if is_mock() or flags.mock_mode:
         return {"mode": "mock", "orders": [], "positions": [], "account": {}}
     try:
-        return {
+        snapshot = {
             "mode": "paper" if flags.paper_trading else "live",
             "orders": pull_orders(),
             "positions": pull_positions(),
@@ -68,6 +69,8 @@ def pull_all_if_live() -> Dict[str, Any]:
         }
     except Exception as exc:  # pragma: no cover - defensive guard
         return {"mode": "error", "error": str(exc), "orders": [], "positions": [], "account": {}}
+    get_broker_snapshot().ingest(snapshot)
+    return snapshot
 
 
 def _get_reconciler(request: Request) -> Any:
@@ -0,0 +1,278 @@
+"""Server-push telemetry hub feeding the SSE and WebSocket endpoints.
+
+Sources are the in-process update bus (order, fill and position events),
+``TelemetryMetrics`` and ``breakers.breaker_state`` (sampled and published
+only when they change) and the application log (new lines only). Every client
+gets its own bounded :class:`core.event_bus.EventBus` subscription that
+coalesces by key: a slow client sees only the newest state per order, symbol
+or metric, and the oldest fills/log lines are dropped first once it is full.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional
+
+from core.event_bus import EventBus, Subscription
+from services.execution.updates import TOPICS as UPDATE_TOPICS
+from services.execution.updates import UpdateEvent, get_update_bus
+from services.safety import breakers
+from services.telemetry.metrics import metrics as telemetry_metrics
+from services.telemetry.registry import QUEUE_DEPTH
+
+METRICS = "metrics"
+BREAKERS = "breakers"
+LOG = "log"
+TOPICS = (*UPDATE_TOPICS, METRICS, BREAKERS, LOG)
+
+DEFAULT_INTERVAL_SEC = 0.5
+DEFAULT_CLIENT_QUEUE = 512
+_MAX_LOG_LINES_PER_TICK = 200
+
+logger = logging.getLogger("gigatrader.telemetry_stream")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _event_key(topic: str, event: Dict[str, Any]) -> Hashable:
+    # State-like topics keep only their newest value per entity; event-like
+    # topics (fills, log lines) are unique and only ever dropped oldest-first.
+    key = event.get("key")
+    return (topic, key) if key is not None else (topic, event["seq"])
+
+
+class TelemetryClient:
+    """One connected consumer; iterate it to receive event envelopes."""
+
+    def __init__(self, hub: "TelemetryHub") -> None:
+        self._hub = hub
+        self._handoff: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=1)
+        self._initial: Deque[Dict[str, Any]] = deque()
+        self.subscriptions: List[Subscription] = []
+
+    async def _deliver(self, event: Dict[str, Any]) -> None:
+        # Blocks the subscription worker, so the bus queue does the buffering.
+        await self._handoff.put(event)
+
+    async def get(self) -> Dict[str, Any]:
+        if self._initial:
+            return self._initial.popleft()
+        return await self._handoff.get()
+
+    def __aiter__(self) -> "TelemetryClient":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self.get()
+
+    @property
+    def dropped(self) -> int:
+        return sum(sub.dropped for sub in self.subscriptions)
+
+    async def close(self) -> None:
+        await self._hub.disconnect(self)
+
+
+class TelemetryHub:
+    """Fan-out of telemetry deltas to any number of streaming clients."""
+
+    def __init__(
+        self,
+        *,
+        interval_sec: Optional[float] = None,
+        client_queue: Optional[int] = None,
+        log_path: Optional[Path] = None,
+    ) -> None:
+        self.interval_sec = (
+            interval_sec
+            if interval_sec is not None
+            else _env_float("TELEMETRY_STREAM_INTERVAL_SEC", DEFAULT_INTERVAL_SEC)
+        )
+        self.client_queue = int(
+            client_queue
+            if client_queue is not None
+            else _env_float("TELEMETRY_STREAM_CLIENT_QUEUE", DEFAULT_CLIENT_QUEUE)
+        )
+        self.log_path = log_path or Path(os.getenv("APP_LOG_FILE", "logs/app.log"))
+        self._bus = EventBus(maxsize=self.client_queue, overflow="coalesce")
+        self._seq = itertools.count(1)
+        self._clients: List[TelemetryClient] = []
+        self._tasks: List[asyncio.Task[None]] = []
+        self._last: Dict[str, Any] = {}
+        self._log_offset: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+    async def connect(self, topics: Optional[Iterable[str]] = None) -> TelemetryClient:
+        wanted = [topic for topic in (topics or TOPICS) if topic in TOPICS] or list(TOPICS)
+        client = TelemetryClient(self)
+        for topic in wanted:
+            client.subscriptions.append(
+                await self._bus.subscribe(
+                    topic,
+                    client._deliver,
+                    maxsize=self.client_queue,
+                    overflow="coalesce",
+                    key=_event_key,
+                    name=f"telemetry-client:{topic}",
+                )
+            )
+        self._clients.append(client)
+        if not self._tasks:
+            self._start()
+        # New clients start from the current state rather than waiting for a change.
+        for topic in (METRICS, BREAKERS):
+            if topic in wanted and topic in self._last:
+                client._initial.append(self._envelope(topic, self._last[topic], key=topic))
+        return client
+
+    async def disconnect(self, client: TelemetryClient) -> None:
+        if client in self._clients:
+            self._clients.remove(client)
+        for sub in client.subscriptions:
+            await self._bus.unsubscribe(sub)
+        client.subscriptions.clear()
+        if not self._clients:
+            await self.stop()
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    def _envelope(self, topic: str, data: Any, *, key: Optional[Hashable] = None) -> Dict[str, Any]:
+        return {"topic": topic, "seq": next(self._seq), "ts": time.time(), "key": key, "data": data}
+
+    async def publish(self, topic: str, data: Any, *, key: Optional[Hashable] = None) -> None:
+        await self._bus.publish(topic, self._envelope(topic, data, key=key))
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._sample_state()
+        self._tasks = [
+            loop.create_task(self._pump_updates(), name="telemetry-stream:updates"),
+            loop.create_task(self._pump_samples(), name="telemetry-stream:samples"),
+        ]
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        self._log_offset = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+    async def _pump_updates(self) -> None:
+        sub = get_update_bus().subscribe(UPDATE_TOPICS, maxsize=self.client_queue)
+        try:
+            async for event in sub:
+                await self.publish(event.topic, _update_payload(event), key=_update_key(event))
+        finally:
+            sub.close()
+
+    async def _pump_samples(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_sec)
+            try:
+                for topic, value in self._sample_state():
+                    await self.publish(topic, value, key=topic)
+                for line in await asyncio.to_thread(self._read_new_log_lines):
+                    await self.publish(LOG, line)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pragma: no cover - a bad sample must not end the stream
+                logger.exception("telemetry_stream.sample_failed")
+
+    def _sample_state(self) -> List[tuple[str, Any]]:
+        changed: List[tuple[str, Any]] = []
+        samples = ((METRICS, telemetry_metrics.snapshot()), (BREAKERS, breakers.breaker_state()))
+        for topic, value in samples:
+            if topic == BREAKERS:
+                # ``last_checked`` moves on every evaluation; only publish real changes.
+                comparable = {k: v for k, v in value.items() if k != "last_checked"}
+                previous = self._last.get(topic)
+                prior = {k: v for k, v in (previous or {}).items() if k != "last_checked"}
+                if previous is not None and prior == comparable:
+                    continue
+            elif self._last.get(topic) == value:
+                continue
+            self._last[topic] = value
+            changed.append((topic, value))
+        return changed
+
+    def _read_new_log_lines(self) -> List[str]:
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return []
+        if self._log_offset is None or size < self._log_offset:
+            # First look (or the file was rotated): start from the end.
+            self._log_offset = size if self._log_offset is None else 0
+        if size == self._log_offset:
+            return []
+        with self.log_path.open("r", encoding="utf-8", errors="ignore") as handle:
+            handle.seek(self._log_offset)
+            chunk = handle.read()
+            # Leave a trailing partial line for the next tick.
+            complete, _, partial = chunk.rpartition("\n")
+            self._log_offset = handle.tell() - len(partial.encode("utf-8"))
+        lines = complete.splitlines() if complete else []
+        return lines[-_MAX_LOG_LINES_PER_TICK:]
+
+
+def _update_key(event: UpdateEvent) -> Optional[Hashable]:
+    if event.topic == "fill":
+        return None
+    if event.topic == "position":
+        return event.symbol
+    return event.client_order_id or event.order_id
+
+
+def _update_payload(event: UpdateEvent) -> Dict[str, Any]:
+    return {
+        "seq": event.seq,
+        "symbol": event.symbol,
+        "client_order_id": event.client_order_id,
+        "order_id": event.order_id,
+        "status": event.status,
+        "data": event.data,
+        "ts": event.ts,
+    }
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    body = json.dumps(event, default=str, separators=(",", ":"))
+    return f"id: {event['seq']}\nevent: {event['topic']}\ndata: {body}\n\n"
+
+
+_HUB: Optional[TelemetryHub] = None
+
+
+def get_telemetry_hub() -> TelemetryHub:
+    """Process-wide hub; created lazily on the serving event loop."""
+
+    global _HUB
+    if _HUB is None:
+        _HUB = TelemetryHub()
+        QUEUE_DEPTH.labels(queue="telemetry_stream").set_function(_HUB._bus.pending)
+    return _HUB
+
+
+__all__ = ["TOPICS", "TelemetryClient", "TelemetryHub", "format_sse", "get_telemetry_hub"]
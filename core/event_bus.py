@@ -1,29 +1,308 @@
-"""Lightweight event bus for decoupled components."""
+"""Lightweight event bus for decoupled components.
+
+Each subscription owns a bounded queue drained by its own worker task, so
+``publish`` only enqueues: a slow or failing handler delays (or drops) its
+own events and never the publisher's. Topics are matched with shell-style
+wildcards (``"bars.*"``, ``"*"``). What happens when a subscriber's queue is
+full is chosen per subscription:
+
+``block``
+    ``publish`` waits for room (backpressure onto the publisher).
+``drop_oldest``
+    The oldest queued event is discarded.
+``coalesce``
+    Only the newest queued event per ``key(topic, payload)`` is kept, e.g.
+    the latest quote per symbol.
+"""
 
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from typing import Any, Awaitable, Callable, DefaultDict, List
+import bisect
+import fnmatch
+import itertools
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Tuple
 
 EventHandler = Callable[[Any], Awaitable[None]]
+KeyFn = Callable[[str, Any], Hashable]
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "coalesce")
+
+# Upper bucket bounds in milliseconds.
+_LATENCY_BUCKETS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0
+)
+
+log = logging.getLogger("gigatrader.event_bus")
+
+
+def _topic_key(topic: str, payload: Any) -> Hashable:
+    return topic
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(_LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.buckets[bisect.bisect_left(_LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return _LATENCY_BUCKETS_MS[idx] if idx < len(_LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": self.max_ms if self.count else None,
+        }
+
+
+class Subscription:
+    """Handle returned by :meth:`EventBus.subscribe`."""
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        pattern: str,
+        handler: EventHandler,
+        *,
+        maxsize: int,
+        overflow: str,
+        key: KeyFn,
+        name: str,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow}")
+        self.pattern = pattern
+        self.handler = handler
+        self.maxsize = max(1, int(maxsize))
+        self.overflow = overflow
+        self.name = name
+        self.dropped = 0
+        self.errors = 0
+        self._bus = bus
+        self._key = key
+        self._wildcard = any(ch in pattern for ch in "*?[")
+        # Entries are (topic, payload, enqueued_at).
+        self._fifo: Deque[Tuple[str, Any, float]] = deque()
+        self._latest: "OrderedDict[Hashable, Tuple[str, Any, float]]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._room = asyncio.Event()
+        self._room.set()
+        self._worker: Optional[asyncio.Task[None]] = None
+        self.closed = False
+
+    def matches(self, topic: str) -> bool:
+        if self._wildcard:
+            return fnmatch.fnmatchcase(topic, self.pattern)
+        return topic == self.pattern
+
+    def __len__(self) -> int:
+        return len(self._latest) if self.overflow == "coalesce" else len(self._fifo)
+
+    async def _offer(self, topic: str, payload: Any) -> None:
+        item = (topic, payload, time.perf_counter())
+        if self.overflow == "coalesce":
+            key = self._key(topic, payload)
+            if key in self._latest:
+                # Replace in place so a hot key keeps its turn in line.
+                self.dropped += 1
+            elif len(self._latest) >= self.maxsize:
+                self._latest.popitem(last=False)
+                self.dropped += 1
+            self._latest[key] = item
+        elif len(self._fifo) < self.maxsize:
+            self._fifo.append(item)
+        elif self.overflow == "drop_oldest":
+            self._fifo.popleft()
+            self._fifo.append(item)
+            self.dropped += 1
+        else:
+            while len(self._fifo) >= self.maxsize and not self.closed:
+                self._room.clear()
+                await self._room.wait()
+            if self.closed:
+                return
+            self._fifo.append(item)
+        self._ready.set()
+
+    def _take(self) -> Optional[Tuple[str, Any, float]]:
+        if self.overflow == "coalesce":
+            if not self._latest:
+                return None
+            return self._latest.popitem(last=False)[1]
+        if not self._fifo:
+            return None
+        item = self._fifo.popleft()
+        self._room.set()
+        return item
+
+    async def _run(self) -> None:
+        while True:
+            item = self._take()
+            if item is None:
+                if self.closed:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            topic, payload, enqueued = item
+            try:
+                await self.handler(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors += 1
+                log.exception(
+                    "event_bus.handler_failed", extra={"topic": topic, "subscriber": self.name}
+                )
+            self._bus._observe_handle(topic, (time.perf_counter() - enqueued) * 1000.0)
+
+    def _start(self) -> None:
+        if self._worker is None:
+            loop = asyncio.get_running_loop()
+            self._worker = loop.create_task(self._run(), name=f"event-bus:{self.name}")
+
+    async def _stop(self, *, drain: bool) -> None:
+        self.closed = True
+        self._ready.set()
+        self._room.set()
+        worker = self._worker
+        if worker is None:
+            return
+        if not drain:
+            worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "pattern": self.pattern,
+            "overflow": self.overflow,
+            "pending": len(self),
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
 
 
 class EventBus:
-    """Async pub/sub event bus."""
+    """Async pub/sub event bus with per-subscriber queues and workers."""
+
+    def __init__(self, *, maxsize: int = 1000, overflow: str = "block") -> None:
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._subscriptions: List[Subscription] = []
+        self._routes: Dict[str, Tuple[Subscription, ...]] = {}
+        self._ids = itertools.count(1)
+        self._publish_latency: Dict[str, LatencyHistogram] = {}
+        self._handle_latency: Dict[str, LatencyHistogram] = {}
+
+    async def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        maxsize: Optional[int] = None,
+        overflow: Optional[str] = None,
+        key: Optional[KeyFn] = None,
+        name: Optional[str] = None,
+    ) -> Subscription:
+        """Register ``handler`` for ``event_type`` (wildcards allowed)."""
+
+        sub = Subscription(
+            self,
+            event_type,
+            handler,
+            maxsize=maxsize if maxsize is not None else self.maxsize,
+            overflow=overflow or self.overflow,
+            key=key or _topic_key,
+            name=name or f"{getattr(handler, '__qualname__', 'handler')}#{next(self._ids)}",
+        )
+        sub._start()
+        self._subscriptions.append(sub)
+        self._routes.clear()
+        return sub
 
-    def __init__(self) -> None:
-        self._subscribers: DefaultDict[str, List[EventHandler]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+    async def unsubscribe(self, subscription: Subscription, *, drain: bool = False) -> None:
+        """Detach ``subscription``; with ``drain`` queued events are handled first."""
 
-    async def subscribe(self, event_type: str, handler: EventHandler) -> None:
-        """Register ``handler`` for ``event_type``."""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            self._routes.clear()
+        await subscription._stop(drain=drain)
 
-        async with self._lock:
-            self._subscribers[event_type].append(handler)
+    async def close(self, *, drain: bool = False) -> None:
+        for sub in list(self._subscriptions):
+            await self.unsubscribe(sub, drain=drain)
+
+    def _targets(self, topic: str) -> Tuple[Subscription, ...]:
+        targets = self._routes.get(topic)
+        if targets is None:
+            targets = tuple(sub for sub in self._subscriptions if sub.matches(topic))
+            self._routes[topic] = targets
+        return targets
 
     async def publish(self, event_type: str, payload: Any) -> None:
-        """Publish ``payload`` to all subscribers."""
+        """Queue ``payload`` for every subscriber matching ``event_type``."""
+
+        started = time.perf_counter()
+        for sub in self._targets(event_type):
+            await sub._offer(event_type, payload)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self._histogram(self._publish_latency, event_type).observe(elapsed_ms)
+
+    def _observe_handle(self, topic: str, latency_ms: float) -> None:
+        self._histogram(self._handle_latency, topic).observe(latency_ms)
+
+    @staticmethod
+    def _histogram(table: Dict[str, LatencyHistogram], topic: str) -> LatencyHistogram:
+        hist = table.get(topic)
+        if hist is None:
+            hist = table[topic] = LatencyHistogram()
+        return hist
+
+    def pending(self) -> int:
+        """Events queued across all subscriptions."""
+
+        return sum(len(sub) for sub in self._subscriptions)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-topic publish/handle latency and per-subscriber queue state."""
+
+        return {
+            "publish_latency": {topic: h.snapshot() for topic, h in self._publish_latency.items()},
+            "handle_latency": {topic: h.snapshot() for topic, h in self._handle_latency.items()},
+            "subscribers": [sub.stats() for sub in self._subscriptions],
+        }
+
 
-        handlers = list(self._subscribers.get(event_type, ()))
-        await asyncio.gather(*(handler(payload) for handler in handlers))
+__all__ = ["EventBus", "EventHandler", "LatencyHistogram", "OVERFLOW_POLICIES", "Subscription"]
@@ -1,16 +1,365 @@
 from __future__ import annotations
 
+import asyncio
+import ctypes
+import ctypes.util
 import json
+import logging
 import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger("gigatrader.kill_switch")
+
+# inotify(7) constants; see <sys/inotify.h>.
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+# Even with inotify the file is re-checked now and then, in case its
+# directory was replaced or events were dropped.
+_RESYNC_SEC = 5.0
 
 
 def _iso_now() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _parse_payload(raw: str) -> Dict[str, Any]:
+    try:
+        data = json.loads(raw)
+        if isinstance(data, dict):
+            engaged = bool(data.get("engaged", True))
+            reason = data.get("reason") if isinstance(data.get("reason"), str) else None
+            engaged_at = data.get("engaged_at") if isinstance(data.get("engaged_at"), str) else None
+            return {"engaged": engaged, "reason": reason, "engaged_at": engaged_at}
+    except Exception:
+        pass
+    # Fallback for legacy payloads that only wrote the string "halt".
+    return {"engaged": True, "reason": None, "engaged_at": None}
+
+
+def _read_info(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {"engaged": False, "reason": None, "engaged_at": None}
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except Exception:
+        return {"engaged": True, "reason": None, "engaged_at": None}
+    return _parse_payload(raw)
+
+
+@dataclass(frozen=True, slots=True)
+class KillSwitchEvent:
+    """Published whenever the kill switch is engaged or reset."""
+
+    action: str
+    reason: Optional[str]
+    engaged_at: Optional[str]
+    ts: float
+
+
+def _inotify_fd(directory: Path) -> Optional[int]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(str(directory)), _IN_WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+    except (OSError, AttributeError):
+        return None
+    return fd
+
+
+def _inotify_names(buf: bytes) -> List[bytes]:
+    names: List[bytes] = []
+    pos = 0
+    while pos + _IN_EVENT_HEADER.size <= len(buf):
+        _, _, _, length = _IN_EVENT_HEADER.unpack_from(buf, pos)
+        pos += _IN_EVENT_HEADER.size
+        names.append(buf[pos : pos + length].rstrip(b"\0"))
+        pos += length
+    return names
+
+
+class KillSwitchWatcher:
+    """Keeps the kill-switch state of one file in memory.
+
+    A daemon thread follows the file's directory with inotify on Linux and
+    falls back to polling ``stat`` every ``KILL_SWITCH_POLL_MS`` elsewhere.
+    Reads of :meth:`info` never touch the filesystem. Changes are fanned out
+    to listeners (called on the watcher thread) and to asyncio queues handed
+    out by :meth:`subscribe`. :meth:`close` wakes the thread, joins it and
+    releases its inotify descriptor.
+    """
+
+    def __init__(self, path: Path, *, poll_interval: Optional[float] = None) -> None:
+        self.path = path
+        if poll_interval is None:
+            poll_interval = _env_float("KILL_SWITCH_POLL_MS", 250.0) / 1000.0
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # Sentinel so the first refresh always reads the file.
+        self._signature: Optional[Tuple[int, int, int]] = (-1, -1, -1)
+        self._info: Dict[str, Any] = {"engaged": False, "reason": None, "engaged_at": None}
+        self._listeners: List[Callable[[KillSwitchEvent], None]] = []
+        self._queues: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[KillSwitchEvent]"]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Write end of the pipe that interrupts the inotify ``select``.
+        self._wake_fd: Optional[int] = None
+        self.mode = "idle"
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+    @property
+    def engaged(self) -> bool:
+        return bool(self._info["engaged"])
+
+    @property
+    def closed(self) -> bool:
+        return self._stop.is_set()
+
+    @property
+    def running(self) -> bool:
+        """True while the watcher thread is following the file."""
+
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stop.is_set()
+
+    def info(self) -> Dict[str, Any]:
+        return dict(self._info)
+
+    def refresh(self, *, force: bool = False) -> None:
+        """Re-read the file if it changed and publish engage/reset transitions.
+
+        ``force`` re-reads it even when its ``stat`` signature looks unchanged;
+        in-process writers use it so their change is visible immediately.
+        """
+
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+                signature: Optional[Tuple[int, int, int]] = (
+                    st.st_ino,
+                    st.st_size,
+                    st.st_mtime_ns,
+                )
+            except FileNotFoundError:
+                signature = None
+            except OSError:
+                return
+            if signature == self._signature and not force:
+                return
+            self._signature = signature
+            previous = self._info
+            current = _read_info(self.path) if signature is not None else {
+                "engaged": False,
+                "reason": None,
+                "engaged_at": None,
+            }
+            self._info = current
+        if current != previous:
+            self._publish(
+                KillSwitchEvent(
+                    action="engaged" if current["engaged"] else "reset",
+                    reason=current["reason"] if current["engaged"] else previous["reason"],
+                    engaged_at=current["engaged_at"],
+                    ts=time.time(),
+                )
+            )
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+    def add_listener(self, callback: Callable[[KillSwitchEvent], None]) -> None:
+        with self._lock:
+            self._listeners.append(callback)
+        self.start()
+
+    def remove_listener(self, callback: Callable[[KillSwitchEvent], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def subscribe(self, maxsize: int = 16) -> "asyncio.Queue[KillSwitchEvent]":
+        """Return a queue fed with events; call from a running event loop."""
+
+        queue: "asyncio.Queue[KillSwitchEvent]" = asyncio.Queue(maxsize=maxsize)
+        with self._lock:
+            self._queues.append((asyncio.get_running_loop(), queue))
+        self.start()
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[KillSwitchEvent]") -> None:
+        with self._lock:
+            self._queues = [item for item in self._queues if item[1] is not queue]
+
+    def _publish(self, event: KillSwitchEvent) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+            queues = list(self._queues)
+        log.info(
+            "kill_switch.%s",
+            event.action,
+            extra={"path": str(self.path), "reason": event.reason},
+        )
+        for callback in listeners:
+            try:
+                callback(event)
+            except Exception:  # pragma: no cover - listener bugs must not stop the watcher
+                log.exception("kill_switch.listener_failed")
+        for loop, queue in queues:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                # Loop already closed; drop the subscription.
+                self.unsubscribe(queue)
+
+    # ------------------------------------------------------------------
+    # Watching
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="kill-switch-watch", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stop the watcher thread and wait for it to release its descriptors."""
+
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+            # Written under the lock so the thread cannot close the fd meanwhile.
+            if self._wake_fd is not None:
+                try:
+                    os.write(self._wake_fd, b"\0")
+                except OSError:
+                    pass
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self.mode = "idle"
+
+    stop = close
+
+    def _run(self) -> None:
+        fd = _inotify_fd(self.path.parent) if self.path.parent.is_dir() else None
+        wake_r: Optional[int] = None
+        if fd is not None:
+            wake_r, wake_w = os.pipe()
+            with self._lock:
+                self._wake_fd = wake_w
+        self.mode = "inotify" if fd is not None else "poll"
+        # Catch anything that changed between construction and the watch starting.
+        self.refresh()
+        try:
+            if fd is None:
+                while not self._stop.wait(self.poll_interval):
+                    self.refresh()
+                return
+            name = os.fsencode(self.path.name)
+            timeout = min(_RESYNC_SEC, max(self.poll_interval, 0.05))
+            last_sync = time.monotonic()
+            while not self._stop.is_set():
+                readable, _, _ = select.select([fd, wake_r], [], [], timeout)
+                if fd in readable:
+                    try:
+                        buf = os.read(fd, 64 * 1024)
+                    except BlockingIOError:
+                        continue
+                    if name in _inotify_names(buf):
+                        self.refresh()
+                        last_sync = time.monotonic()
+                        continue
+                if time.monotonic() - last_sync >= _RESYNC_SEC:
+                    self.refresh()
+                    last_sync = time.monotonic()
+        finally:
+            if fd is not None:
+                with self._lock:
+                    wake_w, self._wake_fd = self._wake_fd, None
+                for owned in (fd, wake_r, wake_w):
+                    if owned is not None:
+                        os.close(owned)
+
+
+def _offer(queue: "asyncio.Queue[KillSwitchEvent]", event: KillSwitchEvent) -> None:
+    if queue.full():
+        # Slow subscribers only need the latest transitions.
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+_WATCHERS: Dict[Path, KillSwitchWatcher] = {}
+_WATCHERS_LOCK = threading.Lock()
+
+
+def get_watcher(path: os.PathLike[str] | str) -> KillSwitchWatcher:
+    """Return the process-wide watcher for ``path``, starting it if needed."""
+
+    key = Path(os.path.abspath(path))
+    with _WATCHERS_LOCK:
+        watcher = _WATCHERS.get(key)
+        if watcher is None:
+            watcher = KillSwitchWatcher(key)
+            _WATCHERS[key] = watcher
+    watcher.start()
+    return watcher
+
+
+def close_watchers() -> None:
+    """Stop every process-wide watcher (application shutdown, tests)."""
+
+    with _WATCHERS_LOCK:
+        watchers = list(_WATCHERS.values())
+        _WATCHERS.clear()
+    for watcher in watchers:
+        watcher.close()
+
+
+def _watch_enabled() -> bool:
+    return os.getenv("KILL_SWITCH_WATCH", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
 class KillSwitch:
     """
     File-based kill switch.
@@ -22,11 +371,33 @@ class KillSwitch:
     The file now stores a small JSON payload so we can persist metadata such as
     the most recent reason or timestamp when the kill switch was engaged. Legacy
     callers that only check for file existence continue to work unchanged.
+
+    State reads, :meth:`engaged_sync` included, are served from a shared
+    :class:`KillSwitchWatcher`, which also pushes engage/reset events to
+    subscribers within milliseconds. :meth:`engage_sync` and
+    :meth:`reset_sync` update the watcher before returning, so this process
+    never misses its own switch; the file is only checked directly while no
+    watcher thread is running. Set ``KILL_SWITCH_WATCH=0`` to read the file
+    on every call.
     """
 
-    def __init__(self, path: Optional[os.PathLike[str] | str] = None):
+    def __init__(
+        self, path: Optional[os.PathLike[str] | str] = None, *, watch: Optional[bool] = None
+    ):
         env_path = os.getenv("KILL_SWITCH_FILE")
         self.path = Path(path if path is not None else (env_path if env_path else ".kill_switch"))
+        self._watch = _watch_enabled() if watch is None else watch
+        self._watcher: Optional[KillSwitchWatcher] = None
+
+    @property
+    def watcher(self) -> KillSwitchWatcher:
+        if self._watcher is None or self._watcher.closed:
+            self._watcher = get_watcher(self.path)
+        return self._watcher
+
+    def _sync_watcher(self) -> None:
+        if self._watcher is not None or self._watch:
+            self.watcher.refresh(force=True)
 
     # ---------- sync ----------
     def engage_sync(self, reason: Optional[str] = None) -> None:
@@ -42,6 +413,7 @@ class KillSwitch:
             # best-effort fallback
             with open(self.path, "w", encoding="utf-8") as handle:
                 handle.write(json.dumps(payload, ensure_ascii=False))
+        self._sync_watcher()
 
     def reset_sync(self) -> None:
         try:
@@ -49,30 +421,21 @@ class KillSwitch:
                 self.path.unlink()
         except Exception:
             pass
+        self._sync_watcher()
 
     def engaged_sync(self) -> bool:
+        if self._watch:
+            watcher = self.watcher
+            if watcher.running:
+                return watcher.engaged
         return self.path.exists()
 
     def info_sync(self) -> Dict[str, Any]:
         """Return metadata about the kill switch if available."""
 
-        if not self.path.exists():
-            return {"engaged": False, "reason": None, "engaged_at": None}
-        try:
-            raw = self.path.read_text(encoding="utf-8")
-        except Exception:
-            return {"engaged": True, "reason": None, "engaged_at": None}
-        try:
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                engaged = bool(data.get("engaged", True))
-                reason = data.get("reason") if isinstance(data.get("reason"), str) else None
-                engaged_at = data.get("engaged_at") if isinstance(data.get("engaged_at"), str) else None
-                return {"engaged": engaged, "reason": reason, "engaged_at": engaged_at}
-        except Exception:
-            pass
-        # Fallback for legacy payloads that only wrote the string "halt".
-        return {"engaged": True, "reason": None, "engaged_at": None}
+        if self._watch:
+            return self.watcher.info()
+        return _read_info(self.path)
 
     def reason_sync(self) -> Optional[str]:
         return self.info_sync().get("reason")
@@ -80,6 +443,19 @@ class KillSwitch:
     def engaged_at_sync(self) -> Optional[str]:
         return self.info_sync().get("engaged_at")
 
+    # ---------- events ----------
+    def subscribe(self, maxsize: int = 16) -> "asyncio.Queue[KillSwitchEvent]":
+        return self.watcher.subscribe(maxsize)
+
+    def unsubscribe(self, queue: "asyncio.Queue[KillSwitchEvent]") -> None:
+        self.watcher.unsubscribe(queue)
+
+    def add_listener(self, callback: Callable[[KillSwitchEvent], None]) -> None:
+        self.watcher.add_listener(callback)
+
+    def remove_listener(self, callback: Callable[[KillSwitchEvent], None]) -> None:
+        self.watcher.remove_listener(callback)
+
     # ---------- async wrappers ----------
     async def engage(self, reason: Optional[str] = None) -> None:
         self.engage_sync(reason=reason)
@@ -92,3 +468,6 @@ class KillSwitch:
 
     async def info(self) -> Dict[str, Any]:
         return self.info_sync()
+
+
+__all__ = ["KillSwitch", "KillSwitchEvent", "KillSwitchWatcher", "close_watchers", "get_watcher"]
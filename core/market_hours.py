@@ -1,54 +1,43 @@
-"""Helpers for determining US equity market trading hours."""
+"""Helpers for determining US equity market trading hours.
+
+Lookups go through the precomputed :mod:`core.trading_calendar`, so holidays
+and early closes are honoured and no timezone conversion happens per call.
+"""
 
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta, timezone
-from zoneinfo import ZoneInfo
+import time
+from datetime import datetime, timezone
 
-_EASTERN = ZoneInfo("America/New_York")
-_OPEN_TIME = time(9, 30)
-_CLOSE_TIME = time(16, 0)
+from core.trading_calendar import get_calendar
 
 
-def _normalize_now(now: datetime | None = None) -> datetime:
+def _epoch(now: datetime | float | None = None) -> float:
     if now is None:
-        now = datetime.now(timezone.utc)
+        return time.time()
+    if isinstance(now, (int, float)):
+        return float(now)
     if now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
-    return now.astimezone(_EASTERN)
+    return now.timestamp()
 
 
-def market_is_open(now: datetime | None = None) -> bool:
+def market_is_open(now: datetime | float | None = None) -> bool:
     """Return True if the regular US equity session is open for the provided time."""
 
-    local = _normalize_now(now)
-    if local.weekday() >= 5:  # Saturday/Sunday
-        return False
-    open_dt = datetime.combine(local.date(), _OPEN_TIME, tzinfo=_EASTERN)
-    close_dt = datetime.combine(local.date(), _CLOSE_TIME, tzinfo=_EASTERN)
-    return open_dt <= local < close_dt
+    return get_calendar().is_open(_epoch(now))
 
 
-def seconds_until_open(now: datetime | None = None) -> float:
-    """Return the seconds until the next regular session open."""
+def seconds_until_open(now: datetime | float | None = None) -> float:
+    """Return the seconds until the next regular session open.
 
-    local = _normalize_now(now)
-    # If market already open, next open is next business day
-    if market_is_open(local):
-        local = local + timedelta(days=1)
+    While the market is open this is the time until the following session's open.
+    """
 
-    days_ahead = 0
-    while True:
-        candidate = local + timedelta(days=days_ahead)
-        if candidate.weekday() < 5:
-            open_dt = datetime.combine(candidate.date(), _OPEN_TIME, tzinfo=_EASTERN)
-            if local <= open_dt:
-                delta = open_dt - local
-                return max(delta.total_seconds(), 0.0)
-        days_ahead += 1
+    return max(get_calendar().seconds_until_open(_epoch(now)), 0.0)
 
 
-def market_state(now: datetime | None = None) -> str:
+def market_state(now: datetime | float | None = None) -> str:
     """Return a string describing market state ("open" or "closed")."""
 
     return "open" if market_is_open(now) else "closed"
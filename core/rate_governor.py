@@ -0,0 +1,388 @@
+"""Process-wide broker request governor.
+
+Every Alpaca caller (sync REST adapter, async adapter, the execution
+engine's SDK wrapper and :class:`core.rate_limiter.RateLimitedQueue`) takes a
+token from the shared :class:`RateGovernor` before issuing a request. Tokens
+come from two buckets: one for the endpoint class (``orders``, ``data``,
+``account``) and one account-wide bucket mirroring the broker's per-key limit.
+
+Lanes decide who gets the last tokens: ``CRITICAL`` (order submit/cancel) may
+drain the buckets, ``NORMAL`` (signal/data fetches) and ``BACKGROUND``
+(reconcile polling) must leave a reserve and yield while a higher lane is
+waiting. ``X-RateLimit-*`` headers pace the account bucket so the remaining
+budget is spread over the time left in the broker's window, and a 429 blocks
+every caller until ``Retry-After`` instead of each caller retrying on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger("gigatrader.rate")
+
+ENDPOINT_CLASSES = ("orders", "data", "account")
+
+# Reset values above this are epoch seconds; smaller ones are seconds-until-reset.
+_EPOCH_THRESHOLD = 1e9
+# Upper bound for a single wait slice so waiters re-check lane priority.
+_MAX_SLICE_SEC = 0.25
+
+
+class Lane(enum.IntEnum):
+    """Request priority; lower values are served first."""
+
+    CRITICAL = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+# Fraction of bucket capacity each lane must leave untouched.
+DEFAULT_RESERVES: Dict[Lane, float] = {
+    Lane.CRITICAL: 0.0,
+    Lane.NORMAL: 0.1,
+    Lane.BACKGROUND: 0.25,
+}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _header(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    raw = headers.get(name)
+    if raw is None:
+        raw = headers.get(name.lower())
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def classify(method: str, path: str) -> Tuple[str, Lane]:
+    """Map an Alpaca REST call to its endpoint class and default lane."""
+
+    method = method.upper()
+    trading = path.startswith(("/v2/orders", "/v2/positions"))
+    if trading and method != "GET":
+        return "orders", Lane.CRITICAL
+    if trading:
+        # Order/position reads are reconcile polling.
+        return "account", Lane.BACKGROUND
+    if path.startswith(("/v2/account", "/v2/clock", "/v2/calendar", "/v2/assets")):
+        return "account", Lane.NORMAL
+    return "data", Lane.NORMAL
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    rate: float
+    capacity: float
+    tokens: float = -1.0
+    updated: float = 0.0
+    granted: int = 0
+    waited: int = 0
+    wait_sec: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.tokens < 0:
+            self.tokens = self.capacity
+
+    def refill(self, now: float) -> None:
+        if self.updated and now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def shortfall(self, floor: float) -> float:
+        """Seconds until a token can be taken without going below ``floor``."""
+        missing = 1.0 + floor - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else _MAX_SLICE_SEC
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "tokens": round(self.tokens, 3),
+            "capacity": self.capacity,
+            "rpm": round(self.rate * 60.0, 3),
+            "granted": self.granted,
+            "waited": self.waited,
+            "wait_sec": round(self.wait_sec, 3),
+        }
+
+
+class RateGovernor:
+    """Token-bucket admission control shared by all broker callers."""
+
+    def __init__(
+        self,
+        *,
+        limit_rpm: float = 200.0,
+        class_rpm: Optional[Mapping[str, float]] = None,
+        burst_sec: float = 10.0,
+        reserves: Optional[Mapping[Lane, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._wall = wall_clock
+        self._lock = threading.Lock()
+        self.limit_rpm = float(limit_rpm)
+        self.burst_sec = float(burst_sec)
+        self._account = self._make_bucket(self.limit_rpm)
+        rates = {name: self.limit_rpm for name in ENDPOINT_CLASSES}
+        rates.update(class_rpm or {})
+        self._buckets: Dict[str, TokenBucket] = {
+            name: self._make_bucket(rpm) for name, rpm in rates.items()
+        }
+        self._reserves = dict(DEFAULT_RESERVES)
+        self._reserves.update(reserves or {})
+        self._waiting: Dict[Lane, int] = {lane: 0 for lane in Lane}
+        self._lane_granted: Dict[Lane, int] = {lane: 0 for lane in Lane}
+        self._lane_wait_sec: Dict[Lane, float] = {lane: 0.0 for lane in Lane}
+        self._blocked_until = 0.0
+        self._paced_until = 0.0
+        self._remaining: Optional[float] = None
+        self._reset_at: Optional[float] = None
+        self.rate_limited = 0
+        self.retries = 0
+
+    def _make_bucket(self, rpm: float) -> TokenBucket:
+        rate = max(float(rpm), 1e-6) / 60.0
+        return TokenBucket(rate=rate, capacity=max(1.0, rate * self.burst_sec))
+
+    @classmethod
+    def from_env(cls) -> "RateGovernor":
+        limit = _env_float("BROKER_RATE_LIMIT_RPM", 200.0)
+        return cls(
+            limit_rpm=limit,
+            class_rpm={
+                "orders": _env_float("BROKER_RATE_ORDERS_RPM", limit),
+                "data": _env_float("BROKER_RATE_DATA_RPM", limit * 0.6),
+                "account": _env_float("BROKER_RATE_ACCOUNT_RPM", limit * 0.5),
+            },
+            burst_sec=_env_float("BROKER_RATE_BURST_SEC", 10.0),
+        )
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+    def _reserve(self, endpoint: str, lane: Lane) -> float:
+        """Take a token and return 0, or return how long to wait before retrying."""
+
+        bucket = self._buckets.get(endpoint) or self._buckets["data"]
+        with self._lock:
+            now = self._clock()
+            if self._blocked_until > now:
+                return self._blocked_until - now
+            if self._paced_until and now >= self._paced_until:
+                # The broker window has reset; drop predictive pacing.
+                self._paced_until = 0.0
+                self._account.rate = self.limit_rpm / 60.0
+                self._account.tokens = self._account.capacity
+            bucket.refill(now)
+            self._account.refill(now)
+            if any(self._waiting[other] for other in Lane if other < lane):
+                return min(_MAX_SLICE_SEC, 1.0 / bucket.rate)
+            floor = self._reserves.get(lane, 0.0)
+            wait = max(
+                bucket.shortfall(floor * bucket.capacity),
+                self._account.shortfall(floor * self._account.capacity),
+            )
+            if wait > 0:
+                return wait
+            bucket.tokens -= 1.0
+            self._account.tokens -= 1.0
+            bucket.granted += 1
+            self._account.granted += 1
+            self._lane_granted[lane] += 1
+            return 0.0
+
+    def _mark_waiting(self, lane: Lane, delta: int) -> None:
+        with self._lock:
+            self._waiting[lane] += delta
+
+    def _record_wait(self, endpoint: str, lane: Lane, waited: float) -> None:
+        bucket = self._buckets.get(endpoint) or self._buckets["data"]
+        with self._lock:
+            bucket.waited += 1
+            bucket.wait_sec += waited
+            self._lane_wait_sec[lane] += waited
+
+    def acquire(self, endpoint: str, lane: Lane = Lane.NORMAL) -> float:
+        """Block the calling thread until a token is granted; returns seconds waited.
+
+        Coroutines must use :meth:`acquire_async`; sleeping here would stall
+        the event loop for the whole wait.
+        """
+
+        wait = self._reserve(endpoint, lane)
+        if wait <= 0:
+            return 0.0
+        if _on_event_loop():
+            logger.warning(
+                "broker.rate_wait_on_event_loop",
+                extra={"endpoint": endpoint, "lane": lane.name.lower()},
+            )
+        started = self._clock()
+        self._mark_waiting(lane, 1)
+        try:
+            while wait > 0:
+                time.sleep(min(wait, _MAX_SLICE_SEC))
+                wait = self._reserve(endpoint, lane)
+        finally:
+            self._mark_waiting(lane, -1)
+        waited = self._clock() - started
+        self._record_wait(endpoint, lane, waited)
+        return waited
+
+    async def acquire_async(self, endpoint: str, lane: Lane = Lane.NORMAL) -> float:
+        """Coroutine variant of :meth:`acquire` that yields to the event loop."""
+
+        wait = self._reserve(endpoint, lane)
+        if wait <= 0:
+            return 0.0
+        started = self._clock()
+        self._mark_waiting(lane, 1)
+        try:
+            while wait > 0:
+                await asyncio.sleep(min(wait, _MAX_SLICE_SEC))
+                wait = self._reserve(endpoint, lane)
+        finally:
+            self._mark_waiting(lane, -1)
+        waited = self._clock() - started
+        self._record_wait(endpoint, lane, waited)
+        return waited
+
+    # ------------------------------------------------------------------
+    # Feedback from responses
+    # ------------------------------------------------------------------
+    def observe(self, headers: Mapping[str, Any] | None) -> None:
+        """Fold ``X-RateLimit-*`` headers into the account budget."""
+
+        headers = headers or {}
+        limit = _header(headers, "X-RateLimit-Limit")
+        remaining = _header(headers, "X-RateLimit-Remaining")
+        reset = _header(headers, "X-RateLimit-Reset")
+        with self._lock:
+            now = self._clock()
+            self._account.refill(now)
+            if limit is not None and limit > 0 and limit != self.limit_rpm:
+                self.limit_rpm = limit
+                capacity = max(1.0, limit / 60.0 * self.burst_sec)
+                self._account.capacity = capacity
+                self._account.tokens = min(self._account.tokens, capacity)
+                if not self._paced_until:
+                    self._account.rate = limit / 60.0
+            if remaining is not None and reset is not None:
+                reset_in = reset - self._wall() if reset > _EPOCH_THRESHOLD else reset
+                reset_in = max(0.0, reset_in)
+                self._remaining = remaining
+                self._reset_at = self._wall() + reset_in
+                available = max(0.0, remaining)
+                # The broker's count is authoritative (other processes share the key).
+                self._account.tokens = min(self._account.tokens, available)
+                if reset_in > 0:
+                    # Spread what is left evenly over the rest of the window.
+                    self._account.rate = min(self.limit_rpm / 60.0, available / reset_in)
+                    self._paced_until = now + reset_in
+                else:
+                    self._paced_until = now
+
+    def block(self, seconds: float) -> None:
+        """Hold every lane for ``seconds`` after the broker signalled a rate limit."""
+
+        with self._lock:
+            self.rate_limited += 1
+            until = self._clock() + max(0.0, float(seconds))
+            if until > self._blocked_until:
+                self._blocked_until = until
+        logger.warning("broker.rate_limited", extra={"block_sec": round(float(seconds), 3)})
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            for bucket in (self._account, *self._buckets.values()):
+                bucket.refill(now)
+            reset_in = None
+            if self._reset_at is not None:
+                reset_in = round(max(0.0, self._reset_at - self._wall()), 3)
+            return {
+                "limit_rpm": self.limit_rpm,
+                "remaining": self._remaining,
+                "reset_in": reset_in,
+                "paced": bool(self._paced_until and now < self._paced_until),
+                "blocked_for": round(max(0.0, self._blocked_until - now), 3),
+                "rate_limited": self.rate_limited,
+                "retries": self.retries,
+                "account": self._account.snapshot(),
+                "buckets": {name: bucket.snapshot() for name, bucket in self._buckets.items()},
+                "lanes": {
+                    lane.name.lower(): {
+                        "granted": self._lane_granted[lane],
+                        "waiting": self._waiting[lane],
+                        "wait_sec": round(self._lane_wait_sec[lane], 3),
+                    }
+                    for lane in Lane
+                },
+            }
+
+
+_GOVERNOR: Optional[RateGovernor] = None
+_GOVERNOR_LOCK = threading.Lock()
+
+
+def get_governor() -> RateGovernor:
+    """Return the process-wide governor, creating it from env on first use."""
+
+    global _GOVERNOR
+    if _GOVERNOR is None:
+        with _GOVERNOR_LOCK:
+            if _GOVERNOR is None:
+                _GOVERNOR = RateGovernor.from_env()
+    return _GOVERNOR
+
+
+def set_governor(governor: Optional[RateGovernor]) -> None:
+    """Replace the process-wide governor (tests, custom limits)."""
+
+    global _GOVERNOR
+    with _GOVERNOR_LOCK:
+        _GOVERNOR = governor
+
+
+__all__ = [
+    "ENDPOINT_CLASSES",
+    "Lane",
+    "RateGovernor",
+    "TokenBucket",
+    "classify",
+    "get_governor",
+    "set_governor",
+]
@@ -1,14 +1,18 @@
-"""Centralized rate limited queue with backoff."""
+"""Centralized rate limited queue with backoff.
+
+Admission is delegated to the process-wide :mod:`core.rate_governor`, so
+queued tasks share their budget with every other broker caller.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import random
-import time
 from dataclasses import dataclass
 from typing import Awaitable, Callable, Optional
 
+from core.rate_governor import Lane, RateGovernor, get_governor
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,13 +25,23 @@ class RateLimitState:
 class RateLimitedQueue:
     """Async queue that enforces broker API rate limits."""
 
-    def __init__(self, max_concurrency: int = 5) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        *,
+        endpoint: str = "account",
+        lane: Lane = Lane.BACKGROUND,
+        governor: Optional[RateGovernor] = None,
+    ) -> None:
         self._queue: asyncio.Queue[Callable[[], Awaitable[None]]] = asyncio.Queue()
         self._state = RateLimitState(remaining=None, reset_time=None)
         self._max_concurrency = max_concurrency
         self._workers: list[asyncio.Task[None]] = []
         self._lock = asyncio.Lock()
         self._running = False
+        self._endpoint = endpoint
+        self._lane = lane
+        self._governor = governor or get_governor()
 
     async def start(self) -> None:
         if self._running:
@@ -58,6 +72,7 @@ class RateLimitedQueue:
             reset = headers.get("X-RateLimit-Reset")
             self._state.remaining = int(remaining) if remaining else None
             self._state.reset_time = float(reset) if reset else None
+        self._governor.observe(headers)
 
     async def _worker(self) -> None:
         while self._running:
@@ -72,12 +87,4 @@ class RateLimitedQueue:
             self._queue.task_done()
 
     async def _throttle(self) -> None:
-        async with self._lock:
-            remaining = self._state.remaining
-            reset_time = self._state.reset_time
-        if remaining is not None and remaining <= 0 and reset_time:
-            delay = max(0.0, reset_time - time.time())
-            jitter = random.uniform(0, 1)
-            await asyncio.sleep(delay + jitter)
-        else:
-            await asyncio.sleep(random.uniform(0, 0.1))
+        await self._governor.acquire_async(self._endpoint, self._lane)
@@ -0,0 +1,273 @@
+"""Immutable runtime configuration snapshot shared by the trading hot paths.
+
+Per-decision code used to call ``os.getenv`` and re-parse strings for every
+knob it needed. :func:`get_config` instead returns a frozen
+:class:`RuntimeConfig` built once from three layers, in increasing
+precedence:
+
+1. the ``runtime`` mapping of the YAML/JSON file named by
+   ``RUNTIME_CONFIG_FILE`` (default ``config/runtime.yaml``, optional),
+   keyed by environment-variable name;
+2. the process environment;
+3. runtime overrides passed to :func:`reload_config`.
+
+Readers share the snapshot by reference and never lock. :func:`reload_config`
+(``POST /debug/config/reload`` or ``SIGHUP``) builds a new snapshot, swaps it
+in atomically and calls subscribers with ``(old, new)``. Code that writes a
+variable the snapshot reads calls :func:`reload_config` afterwards;
+``core.runtime_flags.get_runtime_flags`` returns this snapshot's flags and
+reloads on its own when a flag variable changed in the environment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from core.runtime_flags import EnvSignature, RuntimeFlags, _build_runtime_flags, _env_signature
+
+try:  # pragma: no cover - import guard exercised indirectly
+    import yaml  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - executed in minimal environments
+    yaml = None
+
+LOGGER = logging.getLogger("gigatrader.config")
+
+DEFAULT_CONFIG_FILE = "config/runtime.yaml"
+
+_TRUTHY = {"1", "true", "on", "yes"}
+
+Subscriber = Callable[[Optional["RuntimeConfig"], "RuntimeConfig"], None]
+
+
+@dataclass(frozen=True, slots=True)
+class OptionSelectionConfig:
+    """Contract-selection knobs used by ``OptionGateway``."""
+
+    target_delta: float = 0.30
+    delta_band: float = 0.05
+    min_oi: int = 150
+    min_volume: int = 75
+    min_dte: int = 7
+    max_dte: int = 45
+    price_max: float = 50.0
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionConfig:
+    """Bracket defaults applied by ``ExecutionEngine``, in percent."""
+
+    default_tp_pct: float = 1.0
+    default_sl_pct: float = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class KillSwitchConfig:
+    """Environment side of the kill switch; the file itself is still polled live."""
+
+    env_engaged: bool = False
+    file: str = "runtime/kill_switch"
+    test_disarm: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    version: int
+    loaded_at: float
+    flags: RuntimeFlags
+    options: OptionSelectionConfig
+    execution: ExecutionConfig
+    kill_switch: KillSwitchConfig
+    config_file: Optional[str] = None
+    overrides: Tuple[str, ...] = ()
+    # Flag variables as the environment held them when this snapshot was built.
+    flag_env: EnvSignature = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-friendly view with broker credentials left out."""
+
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "config_file": self.config_file,
+            "overrides": list(self.overrides),
+            "flags": self.flags.model_dump(exclude={"alpaca_key", "alpaca_secret"}),
+            "options": asdict(self.options),
+            "execution": asdict(self.execution),
+            "kill_switch": asdict(self.kill_switch),
+        }
+
+
+def _cast(source: Mapping[str, str], name: str, default: Any) -> Any:
+    value = source.get(name)
+    if value is None:
+        return default
+    try:
+        return type(default)(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _truthy(value: Optional[str]) -> bool:
+    return (value or "").strip().lower() in _TRUTHY
+
+
+def _read_file_layer(path: Path) -> Dict[str, str]:
+    if not path.is_file():
+        return {}
+    try:
+        text = path.read_text(encoding="utf-8")
+        payload = yaml.safe_load(text) if yaml is not None else json.loads(text)
+    except Exception:  # noqa: BLE001 - a broken file must not take the process down
+        LOGGER.exception("runtime config file %s could not be parsed", path)
+        return {}
+    section = payload.get("runtime") if isinstance(payload, dict) else None
+    if not isinstance(section, dict):
+        return {}
+    return {str(key): str(value) for key, value in section.items() if value is not None}
+
+
+def build_config(
+    overrides: Optional[Mapping[str, Any]] = None, *, version: int = 0
+) -> RuntimeConfig:
+    """Parse every layer once into a new snapshot without installing it."""
+
+    load_dotenv(override=False)
+    flag_env = _env_signature()
+    config_file = Path(os.getenv("RUNTIME_CONFIG_FILE", DEFAULT_CONFIG_FILE))
+    source: Dict[str, str] = _read_file_layer(config_file)
+    source.update(os.environ)
+    override_values = {
+        str(key): str(value) for key, value in (overrides or {}).items() if value is not None
+    }
+    source.update(override_values)
+
+    defaults = OptionSelectionConfig()
+    options = OptionSelectionConfig(
+        target_delta=_cast(source, "OPTIONS_TARGET_DELTA", defaults.target_delta),
+        delta_band=_cast(source, "OPTIONS_DELTA_BAND", defaults.delta_band),
+        min_oi=_cast(source, "OPTIONS_MIN_OI", defaults.min_oi),
+        min_volume=_cast(source, "OPTIONS_MIN_VOLUME", defaults.min_volume),
+        min_dte=_cast(source, "OPTIONS_MIN_DTE", defaults.min_dte),
+        max_dte=_cast(source, "OPTIONS_MAX_DTE", defaults.max_dte),
+        price_max=_cast(source, "OPTIONS_PRICE_MAX", defaults.price_max),
+    )
+    execution_defaults = ExecutionConfig()
+    execution = ExecutionConfig(
+        default_tp_pct=_cast(source, "DEFAULT_TP_PCT", execution_defaults.default_tp_pct),
+        default_sl_pct=_cast(source, "DEFAULT_SL_PCT", execution_defaults.default_sl_pct),
+    )
+    kill_switch = KillSwitchConfig(
+        env_engaged=_truthy(source.get("KILL_SWITCH")),
+        file=source.get("KILL_SWITCH_FILE", KillSwitchConfig().file),
+        test_disarm=_truthy(source.get("GT_TEST_DISARM_KILL_SWITCH")),
+    )
+    return RuntimeConfig(
+        version=version,
+        loaded_at=time.time(),
+        flags=_build_runtime_flags(source),
+        options=options,
+        execution=execution,
+        kill_switch=kill_switch,
+        config_file=str(config_file) if config_file.is_file() else None,
+        overrides=tuple(sorted(override_values)),
+        flag_env=flag_env,
+    )
+
+
+_CONFIG: Optional[RuntimeConfig] = None
+_OVERRIDES: Dict[str, Any] = {}
+_SUBSCRIBERS: List[Subscriber] = []
+_LOCK = threading.Lock()
+
+
+def get_config() -> RuntimeConfig:
+    """Current snapshot; built on first use, then only replaced by :func:`reload_config`."""
+
+    config = _CONFIG
+    if config is not None:
+        return config
+    with _LOCK:
+        if _CONFIG is None:
+            _install(build_config(_OVERRIDES, version=1))
+        return _CONFIG
+
+
+def reload_config(overrides: Optional[Mapping[str, Any]] = None) -> RuntimeConfig:
+    """Rebuild the snapshot, swap it in and notify subscribers.
+
+    ``overrides`` replaces the whole runtime-override layer when given (pass
+    an empty mapping to clear it); otherwise the current overrides are kept.
+    """
+
+    global _OVERRIDES
+    with _LOCK:
+        if overrides is not None:
+            _OVERRIDES = dict(overrides)
+        previous = _CONFIG
+        version = previous.version + 1 if previous is not None else 1
+        config = _install(build_config(_OVERRIDES, version=version))
+        subscribers = list(_SUBSCRIBERS)
+    for callback in subscribers:
+        try:
+            callback(previous, config)
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("runtime config subscriber failed")
+    LOGGER.info("runtime config reloaded", extra={"version": config.version})
+    return config
+
+
+def _install(config: RuntimeConfig) -> RuntimeConfig:
+    global _CONFIG
+    _CONFIG = config
+    return config
+
+
+def subscribe(callback: Subscriber) -> Callable[[], None]:
+    """Call ``callback(old, new)`` after every reload; returns an unsubscribe function."""
+
+    with _LOCK:
+        _SUBSCRIBERS.append(callback)
+
+    def _unsubscribe() -> None:
+        with _LOCK:
+            if callback in _SUBSCRIBERS:
+                _SUBSCRIBERS.remove(callback)
+
+    return _unsubscribe
+
+
+def install_reload_signal(loop: asyncio.AbstractEventLoop) -> bool:
+    """Reload the snapshot on ``SIGHUP`` where the platform and loop allow it."""
+
+    sighup = getattr(signal, "SIGHUP", None)
+    if sighup is None:
+        return False
+    try:
+        loop.add_signal_handler(sighup, reload_config)
+    except (NotImplementedError, RuntimeError, ValueError):
+        return False
+    return True
+
+
+__all__ = [
+    "ExecutionConfig",
+    "KillSwitchConfig",
+    "OptionSelectionConfig",
+    "RuntimeConfig",
+    "build_config",
+    "get_config",
+    "install_reload_signal",
+    "reload_config",
+    "subscribe",
+]
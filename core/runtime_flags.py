@@ -2,17 +2,12 @@ from __future__ import annotations
 
 import os
 import re
-import threading
-from typing import Literal
+from typing import Literal, Mapping
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field
 
 
-_FLAGS_CACHE: "RuntimeFlags | None" = None
-_FLAGS_SIGNATURE: tuple[tuple[str, str | None], ...] | None = None
-_CACHE_LOCK = threading.Lock()
-
 _FALSEY = {"0", "false", "no", "off", "f", "n", ""}
 _TRUEY = {"1", "true", "yes", "on", "t", "y"}
 
@@ -54,8 +49,8 @@ def _sanitize_url(value: str | None, *, default: str) -> str:
     return candidate.rstrip("/")
 
 
-def _determine_paper_mode(base_url: str) -> bool:
-    use_paper_override = os.getenv("ALPACA_USE_PAPER")
+def _determine_paper_mode(base_url: str, source: Mapping[str, str]) -> bool:
+    use_paper_override = source.get("ALPACA_USE_PAPER")
     if use_paper_override is not None:
         return parse_bool(use_paper_override, default=True)
     lowered = base_url.lower()
@@ -63,7 +58,7 @@ def _determine_paper_mode(base_url: str) -> bool:
         return True
     if "api.alpaca.markets" in lowered and "paper" not in lowered:
         return False
-    env_override = os.getenv("ALPACA_PAPER")
+    env_override = source.get("ALPACA_PAPER")
     return parse_bool(env_override, default=True)
 
 
@@ -120,24 +115,33 @@ _SIGNATURE_KEYS = (
 )
 
 
-def _env_signature() -> tuple[tuple[str, str | None], ...]:
+EnvSignature = tuple[tuple[str, str | None], ...]
+
+
+def _env_signature() -> EnvSignature:
     return tuple((name, os.getenv(name)) for name in _SIGNATURE_KEYS)
 
 
-def _build_runtime_flags() -> RuntimeFlags:
-    """Internal helper to hydrate :class:`RuntimeFlags` from the environment."""
+def _build_runtime_flags(source: Mapping[str, str] | None = None) -> RuntimeFlags:
+    """Internal helper to hydrate :class:`RuntimeFlags` from the environment.
+
+    ``source`` replaces ``os.environ`` as the lookup mapping; the runtime
+    config snapshot passes its merged YAML/env/override layers here.
+    """
 
     load_dotenv(override=False)
+    if source is None:
+        source = os.environ
 
     def _parse_bool(name: str, default: bool) -> bool:
-        return parse_bool(os.getenv(name), default=default)
+        return parse_bool(source.get(name), default=default)
 
-    broker = os.getenv("BROKER", "alpaca").strip() or "alpaca"
-    profile = os.getenv("PROFILE", "paper").strip() or "paper"
+    broker = source.get("BROKER", "alpaca").strip() or "alpaca"
+    profile = source.get("PROFILE", "paper").strip() or "paper"
     mock_mode = _parse_bool("MOCK_MODE", False)
     dry_run = _parse_bool("DRY_RUN", False)
 
-    mds_env = os.getenv("MARKET_DATA_SOURCE")
+    mds_env = source.get("MARKET_DATA_SOURCE")
     if mds_env:
         market_data_source = mds_env.strip().lower() or "mock"
     else:
@@ -149,45 +153,45 @@ def _build_runtime_flags() -> RuntimeFlags:
             market_data_source = "mock"
 
     api_base = _sanitize_url(
-        os.getenv("API_BASE") or os.getenv("API_BASE_URL"),
+        source.get("API_BASE") or source.get("API_BASE_URL"),
         default="http://127.0.0.1:8000",
     )
-    api_port = _coerce_int(os.getenv("API_PORT"), 8000)
-    ui_port = _coerce_int(os.getenv("UI_PORT"), 8501)
+    api_port = _coerce_int(source.get("API_PORT"), 8000)
+    ui_port = _coerce_int(source.get("UI_PORT"), 8501)
 
-    env_base = os.getenv("ALPACA_BASE_URL") or os.getenv("APCA_API_BASE_URL")
+    env_base = source.get("ALPACA_BASE_URL") or source.get("APCA_API_BASE_URL")
     alpaca_base = _sanitize_url(
         env_base,
         default="https://paper-api.alpaca.markets",
     )
 
-    paper_trading = _determine_paper_mode(alpaca_base)
+    paper_trading = _determine_paper_mode(alpaca_base, source)
     profile_lower = profile.lower()
     if profile_lower == "live":
         paper_trading = False
     elif profile_lower == "paper":
         paper_trading = True
 
-    trading_mode = os.getenv("TRADING_MODE", "").strip().lower()
+    trading_mode = source.get("TRADING_MODE", "").strip().lower()
     if trading_mode == "live":
         paper_trading = False
     elif trading_mode == "paper":
         paper_trading = True
 
     alpaca_key = (
-        os.getenv("ALPACA_KEY_ID")
-        or os.getenv("ALPACA_API_KEY_ID")
-        or os.getenv("APCA_API_KEY_ID")
-        or os.getenv("ALPACA_API_KEY")
+        source.get("ALPACA_KEY_ID")
+        or source.get("ALPACA_API_KEY_ID")
+        or source.get("APCA_API_KEY_ID")
+        or source.get("ALPACA_API_KEY")
     )
     alpaca_secret = (
-        os.getenv("ALPACA_SECRET_KEY")
-        or os.getenv("ALPACA_API_SECRET_KEY")
-        or os.getenv("APCA_API_SECRET_KEY")
-        or os.getenv("ALPACA_API_SECRET")
+        source.get("ALPACA_SECRET_KEY")
+        or source.get("ALPACA_API_SECRET_KEY")
+        or source.get("APCA_API_SECRET_KEY")
+        or source.get("ALPACA_API_SECRET")
     )
 
-    auto_restart = parse_bool(os.getenv("AUTO_RESTART"), default=True)
+    auto_restart = parse_bool(source.get("AUTO_RESTART"), default=True)
 
     # Normalise broker setting – if mock_mode is forced we always report mock.
     broker_normalized: Broker = "alpaca"
@@ -231,21 +235,27 @@ def runtime_flags_from_env() -> RuntimeFlags:
 
 
 def get_runtime_flags() -> RuntimeFlags:
-    global _FLAGS_CACHE, _FLAGS_SIGNATURE
-    signature = _env_signature()
-    with _CACHE_LOCK:
-        if _FLAGS_CACHE is None or signature != _FLAGS_SIGNATURE:
-            _FLAGS_CACHE = _build_runtime_flags()
-            _FLAGS_SIGNATURE = signature
-        return _FLAGS_CACHE
+    """Flags of the current :mod:`core.runtime_config` snapshot.
+
+    Broker factories and the execution engine therefore see the same file,
+    environment and override layers. The snapshot is rebuilt first when a
+    flag variable in the environment changed since it was taken.
+    """
+
+    from core.runtime_config import get_config, reload_config
+
+    config = get_config()
+    if config.flag_env != _env_signature():
+        config = reload_config()
+    return config.flags
 
 
 def refresh_runtime_flags() -> RuntimeFlags:
-    global _FLAGS_CACHE, _FLAGS_SIGNATURE
-    with _CACHE_LOCK:
-        _FLAGS_CACHE = _build_runtime_flags()
-        _FLAGS_SIGNATURE = _env_signature()
-        return _FLAGS_CACHE
+    """Rebuild the runtime config snapshot and return its flags."""
+
+    from core.runtime_config import reload_config
+
+    return reload_config().flags
 
 
 def require_alpaca_keys() -> None:
@@ -0,0 +1,277 @@
+"""Precomputed US equity trading calendar.
+
+Every NYSE session in a range of years is expanded once into sorted arrays of
+epoch seconds (extended-hours start, regular open, regular close,
+extended-hours end). Exchange holidays, early closes and daylight-saving
+shifts are resolved while the arrays are built. After that, questions such as
+"is the market open", "when is the next open" or "which session minute is
+this" are ``bisect`` lookups on floats, with no timezone conversions.
+
+The regular-session minutes are numbered consecutively across sessions. The
+gap between two bars measured in session minutes therefore skips nights,
+weekends, holidays and the missing hours after an early close.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+_EASTERN = ZoneInfo("America/New_York")
+
+_PRE_OPEN_SEC = 4 * 3600  # 04:00 ET
+_OPEN_SEC = 9 * 3600 + 30 * 60  # 09:30 ET
+_CLOSE_SEC = 16 * 3600  # 16:00 ET
+_EARLY_CLOSE_SEC = 13 * 3600  # 13:00 ET
+_POST_CLOSE_SEC = 20 * 3600  # 20:00 ET
+_EARLY_POST_CLOSE_SEC = 17 * 3600  # 17:00 ET on early-close days
+
+DEFAULT_FIRST_YEAR = 2000
+DEFAULT_YEARS_AHEAD = 2
+
+# Unscheduled full-day closures that no rule can derive.
+SPECIAL_CLOSURES = (
+    date(2001, 9, 11),
+    date(2001, 9, 12),
+    date(2001, 9, 13),
+    date(2001, 9, 14),
+    date(2004, 6, 11),
+    date(2007, 1, 2),
+    date(2012, 10, 29),
+    date(2012, 10, 30),
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    following = date(year + month // 12, month % 12 + 1, 1)
+    last = following - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday."""
+
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> Set[date]:
+    """Full-day NYSE holidays observed in ``year`` (special closures excluded)."""
+
+    holidays = {
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, 0),  # Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    # A New Year's Day that falls on Saturday is not observed on the prior Friday.
+    new_year = date(year, 1, 1)
+    if new_year.weekday() < 5:
+        holidays.add(new_year)
+    elif new_year.weekday() == 6:
+        holidays.add(new_year + timedelta(days=1))
+    if year >= 1998:
+        holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return holidays
+
+
+def nyse_early_closes(year: int, holidays: Set[date]) -> Set[date]:
+    """13:00 ET closes: July 3rd, the day after Thanksgiving and Christmas Eve."""
+
+    candidates = (
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    )
+    return {day for day in candidates if day.weekday() < 5 and day not in holidays}
+
+
+class TradingCalendar:
+    """NYSE sessions for ``first_year``..``last_year`` as sorted epoch arrays.
+
+    ``pre_opens``, ``opens``, ``closes`` and ``post_closes`` are float64 epoch
+    seconds with one entry per session. ``days`` holds the matching session
+    dates and ``early_close`` flags 13:00 ET closes. Scalar queries bisect
+    list copies of the arrays. :meth:`session_minutes` is the vectorized form
+    for whole bar series. Times outside the precomputed range are treated as
+    closed.
+    """
+
+    def __init__(
+        self,
+        first_year: int,
+        last_year: int,
+        *,
+        special_closures: Iterable[date] = SPECIAL_CLOSURES,
+    ) -> None:
+        if last_year < first_year:
+            raise ValueError("last_year must not precede first_year")
+        self.first_year = first_year
+        self.last_year = last_year
+        closures = set(special_closures)
+
+        days: List[date] = []
+        early: List[bool] = []
+        for year in range(first_year, last_year + 1):
+            holidays = nyse_holidays(year) | closures
+            early_closes = nyse_early_closes(year, holidays)
+            day = date(year, 1, 1)
+            while day.year == year:
+                if day.weekday() < 5 and day not in holidays:
+                    days.append(day)
+                    early.append(day in early_closes)
+                day += timedelta(days=1)
+
+        count = len(days)
+        midnight = np.empty(count, dtype=np.float64)
+        for index, day in enumerate(days):
+            # DST switches at 02:00, so the noon offset holds for the whole session.
+            noon = datetime(day.year, day.month, day.day, 12, tzinfo=_EASTERN)
+            midnight[index] = noon.timestamp() - 12 * 3600
+        self.days = np.array(days, dtype="datetime64[D]")
+        self.early_close = np.array(early, dtype=bool)
+        self.pre_opens = midnight + _PRE_OPEN_SEC
+        self.opens = midnight + _OPEN_SEC
+        self.closes = midnight + np.where(self.early_close, _EARLY_CLOSE_SEC, _CLOSE_SEC)
+        self.post_closes = midnight + np.where(
+            self.early_close, _EARLY_POST_CLOSE_SEC, _POST_CLOSE_SEC
+        )
+        lengths = ((self.closes - self.opens) // 60).astype(np.int64)
+        # Session-minute number of each session's first regular minute.
+        self.minute_offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+
+        self._pre_opens = self.pre_opens.tolist()
+        self._opens = self.opens.tolist()
+        self._closes = self.closes.tolist()
+        self._post_closes = self.post_closes.tolist()
+        self._minute_offsets = self.minute_offsets.tolist()
+
+    def __len__(self) -> int:
+        return len(self._opens)
+
+    def covers(self, ts: float) -> bool:
+        return bool(self._opens) and self._pre_opens[0] <= ts < self._post_closes[-1]
+
+    # ------------------------------------------------------------------
+    # Scalar queries
+    def session_index(self, ts: float) -> int:
+        """Index of the last session whose regular open is at or before ``ts``.
+
+        Returns ``-1`` before the first session.
+        """
+
+        return bisect_right(self._opens, ts) - 1
+
+    def is_open(self, ts: float) -> bool:
+        """True while the regular session is trading at epoch ``ts``."""
+
+        index = bisect_right(self._opens, ts) - 1
+        return index >= 0 and ts < self._closes[index]
+
+    def is_extended_hours(self, ts: float) -> bool:
+        """True in the pre-market or after-hours window of a trading day."""
+
+        index = bisect_right(self._pre_opens, ts) - 1
+        if index < 0 or ts >= self._post_closes[index]:
+            return False
+        return not self._opens[index] <= ts < self._closes[index]
+
+    def next_open(self, ts: float) -> Optional[float]:
+        """Epoch of the first regular open strictly after ``ts``."""
+
+        index = bisect_right(self._opens, ts)
+        return self._opens[index] if index < len(self._opens) else None
+
+    def next_close(self, ts: float) -> Optional[float]:
+        """Epoch of the first regular close strictly after ``ts``."""
+
+        index = bisect_right(self._closes, ts)
+        return self._closes[index] if index < len(self._closes) else None
+
+    def seconds_until_open(self, ts: float) -> float:
+        """Seconds until the next regular open (``inf`` beyond the range)."""
+
+        upcoming = self.next_open(ts)
+        return float("inf") if upcoming is None else upcoming - ts
+
+    def session_minute(self, ts: float) -> Optional[int]:
+        """Consecutive regular-session minute of ``ts``, ``None`` outside a session."""
+
+        index = bisect_right(self._opens, ts) - 1
+        if index < 0 or ts >= self._closes[index]:
+            return None
+        return self._minute_offsets[index] + int((ts - self._opens[index]) // 60)
+
+    # ------------------------------------------------------------------
+    # Vectorized queries
+    def session_minutes(self, timestamps: np.ndarray) -> np.ndarray:
+        """:meth:`session_minute` for an array of epochs, NaN outside sessions."""
+
+        ts = np.asarray(timestamps, dtype=np.float64)
+        index = np.searchsorted(self.opens, ts, side="right") - 1
+        clipped = np.maximum(index, 0)
+        inside = (index >= 0) & (ts < self.closes[clipped])
+        minutes = self.minute_offsets[clipped] + (ts - self.opens[clipped]) // 60
+        return np.where(inside, minutes, np.nan)
+
+
+_CALENDAR: Optional[TradingCalendar] = None
+_CALENDAR_LOCK = threading.Lock()
+
+
+def get_calendar() -> TradingCalendar:
+    """Process-wide calendar from ``DEFAULT_FIRST_YEAR`` to a couple of years ahead."""
+
+    global _CALENDAR
+    if _CALENDAR is not None:
+        return _CALENDAR
+    with _CALENDAR_LOCK:
+        if _CALENDAR is None:
+            last_year = datetime.now(timezone.utc).year + DEFAULT_YEARS_AHEAD
+            _CALENDAR = TradingCalendar(DEFAULT_FIRST_YEAR, last_year)
+        return _CALENDAR
+
+
+__all__ = [
+    "SPECIAL_CLOSURES",
+    "TradingCalendar",
+    "get_calendar",
+    "nyse_early_closes",
+    "nyse_holidays",
+]
@@ -3,7 +3,7 @@
 from .adapter_alpaca import AlpacaAdapter
 from .engine import ExecutionEngine
 from .types import ExecIntent, ExecResult
-from .updates import UpdateBus
+from .updates import UpdateBus, UpdateEvent, get_update_bus
 
 __all__ = [
     "ExecutionEngine",
@@ -11,4 +11,6 @@ __all__ = [
     "ExecIntent",
     "ExecResult",
     "UpdateBus",
+    "UpdateEvent",
+    "get_update_bus",
 ]
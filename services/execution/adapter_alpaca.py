@@ -9,6 +9,7 @@ from typing import Any, Awaitable, Callable, Dict, Optional
 
 from app.config import get_settings
 from app.rate_limit import RateLimitError, backoff_request
+from core.rate_governor import Lane, RateGovernor, get_governor
 from services.telemetry import record_order_latency_async
 
 # NOTE: import alpaca types lazily so unit tests can stub the adapter without installing deps.
@@ -23,6 +24,7 @@ class AlpacaAdapter:
         client: Optional[object] = None,
         settings: Optional[object] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        governor: Optional[RateGovernor] = None,
     ) -> None:
         self._settings = settings
         self._client = client
@@ -30,6 +32,7 @@ class AlpacaAdapter:
         self._lock = asyncio.Lock()
         self._max_retries = int(os.getenv("EXEC_MAX_RETRIES", "5"))
         self._max_wait = float(os.getenv("EXEC_RETRY_MAX_WAIT_SEC", "30"))
+        self._governor = governor or get_governor()
 
     async def _ensure_client(self) -> object:
         if self._client is not None:
@@ -52,22 +55,35 @@ class AlpacaAdapter:
         loop = self._loop or asyncio.get_running_loop()
         return await loop.run_in_executor(None, fn)
 
-    async def _call_with_retries(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+    async def _call_with_retries(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        endpoint: str = "orders",
+        lane: Lane = Lane.CRITICAL,
+    ) -> Any:
+        # 429s are retried (and paced) inside ``backoff_request`` via the shared
+        # governor; this loop only retries transient 5xx responses.
         delay = 1.0
         for attempt in range(self._max_retries + 1):
             try:
-                return await backoff_request(fn, max_retries=self._max_retries)
-            except RateLimitError:
-                if attempt == self._max_retries:
-                    raise
-                await asyncio.sleep(delay)
+                return await backoff_request(
+                    fn,
+                    max_retries=self._max_retries,
+                    governor=self._governor,
+                    endpoint=endpoint,
+                    lane=lane,
+                )
             except Exception as exc:  # pragma: no cover - network errors only occur live
+                if isinstance(exc, RateLimitError):
+                    raise
                 status = getattr(exc, "status_code", None)
                 if status is None:
                     status = getattr(getattr(exc, "response", None), "status_code", None)
                 if status is not None and 500 <= int(status) < 600:
                     if attempt == self._max_retries:
                         raise
+                    self._governor.record_retry()
                     await asyncio.sleep(delay)
                 else:
                     raise
@@ -136,7 +152,8 @@ class AlpacaAdapter:
             request = req_cls(**kwargs)
             return await self._run_blocking(lambda: client.submit_order(request))
 
-        async with record_order_latency_async():
+        symbol = payload.get("symbol")
+        async with record_order_latency_async(endpoint="submit_order", symbol=symbol):
             resp = await self._call_with_retries(_call)
         return {
             "id": str(getattr(resp, "id", "")),
@@ -5,13 +5,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-import os
+import time
 import uuid
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from core.runtime_flags import get_runtime_flags
+from core.runtime_config import get_config
 
 try:  # pragma: no cover - backend optional in pure services tests
     from backend.services.orchestrator import can_execute_trade, record_order_attempt
@@ -28,14 +28,18 @@ except Exception:  # pragma: no cover - fallback when backend unavailable
 
 from backend.utils.structlog import jlog
 from services.execution.adapter_alpaca import AlpacaAdapter
+from services.execution.idempotency import IdempotencyIndex
 from services.execution.types import ExecIntent, ExecResult
-from services.execution.updates import UpdateBus
+from services.execution.updates import FILL, POSITION, UpdateBus
 from services.risk.engine import Proposal, RiskManager
 from services.risk.state import Position, StateProvider
+from services.runtime.tracing import mark
 from services.telemetry import metrics
+from services.telemetry.registry import ORDER_ACK_SECONDS, SIGNAL_TO_ORDER_SECONDS
 
 
 EXECUTION_LOG_PATH = Path("logs/execution_debug.log")
+_TERMINAL_STATUSES = {"filled", "canceled", "cancelled", "rejected", "expired", "done_for_day"}
 
 
 def _ensure_debug_logger() -> logging.Logger:
@@ -93,6 +97,7 @@ class ExecutionEngine:
         state: StateProvider,
         adapter: Optional[AlpacaAdapter] = None,
         updates: Optional[UpdateBus] = None,
+        intents: Optional[IdempotencyIndex] = None,
     ) -> None:
         self.log = logging.getLogger("gigatrader.execution")
         self.debug_log = EXEC_DEBUG_LOG
@@ -100,10 +105,14 @@ class ExecutionEngine:
         self.state = state
         self.adapter = adapter or AlpacaAdapter()
         self.updates = updates or UpdateBus()
-        self.default_tp = float(os.getenv("DEFAULT_TP_PCT", "1.0"))
-        self.default_sl = float(os.getenv("DEFAULT_SL_PCT", "0.5"))
+        defaults = get_config().execution
+        self.default_tp = defaults.default_tp_pct
+        self.default_sl = defaults.default_sl_pct
         self._intent_lock = asyncio.Lock()
-        self._seen_intents: dict[str, str] = {}
+        # Intent key -> client order ID. Entries expire, and with them the
+        # per-order bookkeeping below, so memory stays flat over long uptimes.
+        self.intents = intents if intents is not None else IdempotencyIndex()
+        self.intents.add_evict_listener(self._on_intent_evicted)
         self._orders: dict[str, Dict[str, Any]] = {}
         self._order_fill_qty: dict[str, float] = {}
 
@@ -115,6 +124,12 @@ class ExecutionEngine:
 
         await self.updates.run(_handler)
 
+    def _on_intent_evicted(self, key: str, client_order_id: str) -> None:
+        order = self._orders.pop(client_order_id, None)
+        if order is not None:
+            broker_id = order.get("order_id") or order.get("alpaca_order_id")
+            self._order_fill_qty.pop(str(broker_id), None)
+
     def _intent_key(self, intent: ExecIntent) -> str:
         return intent.idempotency_key()
 
@@ -155,7 +170,7 @@ class ExecutionEngine:
 
     async def _forget_intent(self, key: str) -> None:
         async with self._intent_lock:
-            self._seen_intents.pop(key, None)
+            self.intents.forget(key)
 
     def _record_attempt(
         self,
@@ -200,7 +215,7 @@ class ExecutionEngine:
 
         key = self._intent_key(intent)
         async with self._intent_lock:
-            existing = self._seen_intents.get(key)
+            existing = self.intents.get(key)
             if existing is not None:
                 metrics.inc_order_reject("duplicate_intent")
                 result = ExecResult(
@@ -216,9 +231,9 @@ class ExecutionEngine:
                 return result
             client_order_id = intent.client_tag or str(uuid.uuid4())
             # Pre-populate with the generated client order id so in-flight duplicates see it.
-            self._seen_intents[key] = client_order_id
+            self.intents.put(key, client_order_id)
 
-        flags = get_runtime_flags()
+        flags = get_config().flags
         kill_switch_obj = getattr(self.risk, "kill_switch", None)
         kill_switch_engaged = False
         kill_reason = None
@@ -235,6 +250,7 @@ class ExecutionEngine:
         allowed, guard_reason = can_execute_trade(
             flags, kill_switch_engaged, kill_reason=kill_reason
         )
+        mark(intent.trace, "guards")
         if not allowed:
             await self._forget_intent(key)
             reason_code = guard_reason or "execution_guard"
@@ -274,10 +290,11 @@ class ExecutionEngine:
             is_option=intent.asset_class == "option",
         )
         decision = self.risk.pre_trade_check(proposal)
+        mark(intent.trace, "risk")
         if not decision.allow:
             metrics.inc_order_reject(f"risk_denied_{decision.reason or 'unknown'}")
             async with self._intent_lock:
-                self._seen_intents.pop(key, None)
+                self.intents.forget(key)
             reason = f"risk_denied:{decision.reason}"
             context = {
                 "symbol": intent.symbol,
@@ -319,12 +336,20 @@ class ExecutionEngine:
             jlog("trade.route", route="broker", payload=payload)
         except Exception:  # pragma: no cover - logging guard
             self.log.debug("failed to emit trade.route", exc_info=True)
+        sent_at = time.perf_counter()
+        signal_at = intent.meta.get("signal_at")
+        if isinstance(signal_at, float):
+            SIGNAL_TO_ORDER_SECONDS.labels(asset_class=intent.asset_class).observe(
+                sent_at - signal_at
+            )
+        mark(intent.trace, "order_build")
         try:
             response = await self.adapter.submit_order(payload)
         except Exception as exc:  # pragma: no cover - network errors simulated in integration tests
+            mark(intent.trace, "broker_error")
             metrics.inc_order_reject(f"submit_failed_{exc.__class__.__name__}")
             async with self._intent_lock:
-                self._seen_intents.pop(key, None)
+                self.intents.forget(key)
             reason = f"submit_failed:{exc}"
             context = {
                 "symbol": intent.symbol,
@@ -354,6 +379,10 @@ class ExecutionEngine:
             self._record_attempt(intent, sent=True, accepted=False, reason=result.reason)
             return result
 
+        ORDER_ACK_SECONDS.labels(asset_class=intent.asset_class).observe(
+            time.perf_counter() - sent_at
+        )
+        mark(intent.trace, "broker_ack")
         order_id: Optional[str] = None
         status: str = "pending"
         if isinstance(response, dict):
@@ -364,7 +393,7 @@ class ExecutionEngine:
             status = getattr(response, "status", None) or status
         alpaca_order_id = order_id or client_order_id
         async with self._intent_lock:
-            self._seen_intents[key] = client_order_id
+            self.intents.put(key, client_order_id)
             self._orders[client_order_id] = {
                 "alpaca_order_id": alpaca_order_id,
                 "order_id": order_id,
@@ -469,6 +498,10 @@ class ExecutionEngine:
 
         order_data = update.get("order", update)
         client_order_id = order_data.get("client_order_id")
+        if not client_order_id or client_order_id not in self._orders:
+            # The bus carries every account update; fills for orders this
+            # engine did not place reach the state through broker reconcile.
+            return
         order_id = order_data.get("id")
         status = (order_data.get("status") or update.get("event") or "").lower()
         symbol = order_data.get("symbol") or order_data.get("asset_symbol")
@@ -495,10 +528,10 @@ class ExecutionEngine:
                 self._order_fill_qty.get(order_id, 0.0) + fill_qty_delta
             )
 
-        if client_order_id and client_order_id in self._orders:
-            self._orders[client_order_id]["status"] = status or self._orders[client_order_id].get(
-                "status", ""
-            )
+        order = self._orders[client_order_id]
+        order["status"] = status or order.get("status", "")
+        if status in _TERMINAL_STATUSES:
+            self.intents.mark_terminal(client_order_id)
         if status in {"canceled", "rejected"}:
             return
 
@@ -542,7 +575,27 @@ class ExecutionEngine:
             except TypeError:
                 self.state.mark_trade(symbol)  # type: ignore[arg-type]
 
+        # State is reconciled; let push consumers (exit watcher, UI) react.
+        self.updates.publish(
+            FILL,
+            symbol=symbol,
+            client_order_id=client_order_id,
+            order_id=order_id,
+            status=status,
+            data={
+                "side": side,
+                "qty": fill_qty_delta,
+                "price": fill_price,
+                "asset_class": asset_class,
+            },
+        )
+        self.updates.publish(
+            POSITION,
+            symbol=symbol,
+            data={"qty": new_qty, "notional": new_notional, "is_option": asset_class == "option"},
+        )
+
     def clear_intent_cache(self) -> None:
         """Clear idempotency cache (primarily for tests)."""
 
-        self._seen_intents.clear()
+        self.intents.clear()
@@ -0,0 +1,297 @@
+"""Bounded, time-windowed idempotency index shared by the execution paths.
+
+Intent keys map to the client order ID that was (or is being) submitted for
+them. Entries live for ``IDEMPOTENCY_WINDOW_SEC`` or, once their order is
+terminal, for ``IDEMPOTENCY_TERMINAL_TTL_SEC``; the map never holds more than
+``IDEMPOTENCY_MAX_ENTRIES``. Misses can fall through to a persistent lookup
+(the OMS ``orders`` table), which a Bloom filter over recently seen keys
+skips for intents that were never submitted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+DEFAULT_WINDOW_SEC = 24 * 3600.0
+DEFAULT_TERMINAL_TTL_SEC = 300.0
+DEFAULT_MAX_ENTRIES = 50_000
+
+Loader = Callable[[str, float], Optional[str]]
+EvictListener = Callable[[str, str], None]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(1, int(capacity))
+        bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.size = max(8, bits)
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+@dataclass(slots=True)
+class IdempotencyEntry:
+    key: str
+    client_order_id: str
+    created_at: float
+    terminal_at: Optional[float] = None
+
+
+class IdempotencyIndex:
+    """Thread-safe intent-key -> client order ID map with bounded memory."""
+
+    def __init__(
+        self,
+        *,
+        window_sec: Optional[float] = None,
+        terminal_ttl_sec: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        loader: Optional[Loader] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.window_sec = (
+            window_sec
+            if window_sec is not None
+            else _env_float("IDEMPOTENCY_WINDOW_SEC", DEFAULT_WINDOW_SEC)
+        )
+        self.terminal_ttl_sec = (
+            terminal_ttl_sec
+            if terminal_ttl_sec is not None
+            else _env_float("IDEMPOTENCY_TERMINAL_TTL_SEC", DEFAULT_TERMINAL_TTL_SEC)
+        )
+        self.max_entries = int(
+            max_entries
+            if max_entries is not None
+            else _env_float("IDEMPOTENCY_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        )
+        self.loader = loader
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, IdempotencyEntry]" = OrderedDict()
+        self._by_cid: dict[str, str] = {}
+        self._terminal: "OrderedDict[str, float]" = OrderedDict()
+        self._listeners: List[EvictListener] = []
+        # Two generations approximate a sliding window: keys stay visible for
+        # at least one window and at most two. A generation that fills up
+        # rotates early; if that drops keys still inside the window, every
+        # miss goes to the loader until those keys have aged out.
+        self._bloom = BloomFilter(self.max_entries)
+        self._bloom_prev: Optional[BloomFilter] = None
+        self._bloom_started = clock()
+        self._bloom_touched = self._bloom_started
+        self._bloom_prev_touched = self._bloom_started
+        self._loader_until = float("-inf")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> Optional[str]:
+        """Client order ID for ``key`` from memory, else from the loader."""
+
+        with self._lock:
+            evicted = self._prune(self._clock())
+            entry = self._entries.get(key)
+            cid = entry.client_order_id if entry is not None else None
+            lookup = cid is None and self.loader is not None and self.might_contain(key)
+            since = self._clock() - self.window_sec
+        self._notify(evicted)
+        if lookup:
+            return self.loader(key, since)  # type: ignore[misc]
+        return cid
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            evicted = self._prune(self._clock())
+            found = key in self._entries
+        self._notify(evicted)
+        return found
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def might_contain(self, key: str) -> bool:
+        """False only if ``key`` was not recorded within the last window."""
+
+        with self._lock:
+            if self._clock() < self._loader_until:
+                return True
+            return key in self._bloom or (self._bloom_prev is not None and key in self._bloom_prev)
+
+    def key_for(self, client_order_id: str) -> Optional[str]:
+        with self._lock:
+            return self._by_cid.get(client_order_id)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def put(self, key: str, client_order_id: str) -> None:
+        now = self._clock()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._by_cid.pop(previous.client_order_id, None)
+                self._terminal.pop(key, None)
+            self._entries[key] = IdempotencyEntry(key, client_order_id, now)
+            self._by_cid[client_order_id] = key
+            self._note(key, now)
+            evicted = self._prune(now)
+        self._notify(evicted)
+
+    def note(self, key: str) -> None:
+        """Record that ``key`` was persisted without holding it in memory."""
+
+        with self._lock:
+            self._note(key, self._clock())
+
+    def rebind(self, old_cid: str, new_cid: str) -> None:
+        with self._lock:
+            key = self._by_cid.pop(old_cid, None)
+            if key is None:
+                return
+            self._entries[key].client_order_id = new_cid
+            self._by_cid[new_cid] = key
+
+    def forget(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._by_cid.pop(entry.client_order_id, None)
+            self._terminal.pop(key, None)
+            return entry.client_order_id
+
+    def mark_terminal(self, client_order_id: str) -> None:
+        """Start the (shorter) terminal expiry for ``client_order_id``'s entry."""
+
+        now = self._clock()
+        with self._lock:
+            key = self._by_cid.get(client_order_id)
+            if key is None or key in self._terminal:
+                return
+            self._entries[key].terminal_at = now
+            self._terminal[key] = now
+            evicted = self._prune(now)
+        self._notify(evicted)
+
+    def add_evict_listener(self, callback: EvictListener) -> None:
+        """Call ``callback(key, client_order_id)`` whenever an entry expires."""
+
+        with self._lock:
+            self._listeners.append(callback)
+
+    def warm(self, keys: Iterable[str]) -> None:
+        """Seed the Bloom filter with keys persisted before this process started."""
+
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                self._note(key, now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_cid.clear()
+            self._terminal.clear()
+
+    # ------------------------------------------------------------------
+    # Expiry
+    # ------------------------------------------------------------------
+    def _note(self, key: str, now: float) -> None:
+        bloom = self._bloom
+        if now - self._bloom_started >= self.window_sec or bloom.count >= bloom.capacity:
+            dropped_until = self._bloom_prev_touched + self.window_sec
+            if self._bloom_prev is not None and dropped_until > now:
+                self._loader_until = max(self._loader_until, dropped_until)
+            self._bloom_prev = bloom
+            self._bloom_prev_touched = self._bloom_touched
+            self._bloom = BloomFilter(self.max_entries)
+            self._bloom_started = now
+        if key not in self._bloom:
+            self._bloom.add(key)
+        self._bloom_touched = now
+
+    def _prune(self, now: float) -> List[IdempotencyEntry]:
+        evicted: List[IdempotencyEntry] = []
+        cutoff = now - self.terminal_ttl_sec
+        while self._terminal:
+            key, terminal_at = next(iter(self._terminal.items()))
+            if terminal_at > cutoff:
+                break
+            self._terminal.popitem(last=False)
+            evicted.append(self._entries.pop(key))
+        cutoff = now - self.window_sec
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if entry.created_at > cutoff and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+            self._terminal.pop(entry.key, None)
+            evicted.append(entry)
+        for entry in evicted:
+            self._by_cid.pop(entry.client_order_id, None)
+        return evicted
+
+    def _notify(self, evicted: List[IdempotencyEntry]) -> None:
+        # Listeners run outside the lock; they may take their own locks.
+        if not evicted:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for entry in evicted:
+            for callback in listeners:
+                callback(entry.key, entry.client_order_id)
+
+
+_DEFAULT_INDEX: Optional[IdempotencyIndex] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_idempotency_index() -> IdempotencyIndex:
+    """Process-wide index shared by ``OrderRouter`` and ``ExecutionEngine``."""
+
+    global _DEFAULT_INDEX
+    with _DEFAULT_LOCK:
+        if _DEFAULT_INDEX is None:
+            _DEFAULT_INDEX = IdempotencyIndex()
+        return _DEFAULT_INDEX
+
+
+__all__ = [
+    "BloomFilter",
+    "IdempotencyEntry",
+    "IdempotencyIndex",
+    "get_idempotency_index",
+]
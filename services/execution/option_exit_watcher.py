@@ -6,11 +6,13 @@ import asyncio
 import logging
 import math
 import time
+from contextlib import suppress
 from typing import Dict, Optional
 
 from services.execution.engine import ExecutionEngine
 from services.execution.types import ExecIntent
-from services.options.chain import ChainSource, OptionContract
+from services.execution.updates import FILL, POSITION, UpdateBus, UpdateEvent
+from services.options.chain import ChainSource, OptionChain, as_chain
 from services.risk.state import Position, StateProvider
 
 
@@ -29,7 +31,11 @@ def _extract_mark(metadata: Optional[dict]) -> Optional[float]:
 
 
 class OptionExitWatcher:
-    """Poll option positions and trigger exits based on configurable P&L."""
+    """Watch option positions and trigger exits based on configurable P&L.
+
+    With an ``updates`` bus, fills and position changes are evaluated as soon
+    as they are published; the poll loop remains for mark-to-market moves.
+    """
 
     def __init__(
         self,
@@ -41,9 +47,11 @@ class OptionExitWatcher:
         tp_pct: float = 25.0,
         sl_pct: float = 10.0,
         cache_ttl: float = 60.0,
+        updates: UpdateBus | None = None,
     ) -> None:
         self.state = state
         self.exec = exec_engine
+        self.updates = updates
         self.chain = chain_source
         self.poll_interval = max(5.0, float(poll_interval))
         self.tp_pct = float(tp_pct)
@@ -51,22 +59,58 @@ class OptionExitWatcher:
         self.cache_ttl = max(10.0, float(cache_ttl))
         self.log = logging.getLogger("gigatrader.option-exit")
         self._inflight: Dict[str, float] = {}
-        self._chain_cache: Dict[str, tuple[float, list[OptionContract]]] = {}
+        self._chain_cache: Dict[str, tuple[float, OptionChain]] = {}
 
     async def run(self, shutdown: asyncio.Event) -> None:
-        """Execute the polling loop until shutdown is signalled."""
+        """Execute the polling loop (and the update consumer) until shutdown."""
 
-        while not shutdown.is_set():
-            try:
-                await self._tick()
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:  # pragma: no cover - defensive runtime guard
-                self.log.error("option_exit.tick_failed", extra={"error": str(exc)})
-            try:
-                await asyncio.wait_for(shutdown.wait(), timeout=self.poll_interval)
-            except asyncio.TimeoutError:
-                continue
+        push = asyncio.create_task(self._consume_updates()) if self.updates is not None else None
+        try:
+            while not shutdown.is_set():
+                try:
+                    await self._tick()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # pragma: no cover - defensive runtime guard
+                    self.log.error("option_exit.tick_failed", extra={"error": str(exc)})
+                try:
+                    await asyncio.wait_for(shutdown.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            if push is not None:
+                push.cancel()
+                with suppress(asyncio.CancelledError):
+                    await push
+
+    async def _consume_updates(self) -> None:
+        assert self.updates is not None
+        # Only the latest change per symbol matters for an exit decision.
+        sub = self.updates.subscribe(
+            (FILL, POSITION), maxsize=256, policy="coalesce", key=lambda event: event.symbol
+        )
+        try:
+            async for event in sub:
+                try:
+                    await self._on_update(event)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # pragma: no cover - defensive runtime guard
+                    self.log.error(
+                        "option_exit.update_failed",
+                        extra={"symbol": event.symbol, "error": str(exc)},
+                    )
+        finally:
+            sub.close()
+
+    async def _on_update(self, event: UpdateEvent) -> None:
+        if not event.symbol:
+            return
+        position = self.state.get_positions().get(event.symbol)
+        if position is None:
+            self._inflight.pop(event.symbol, None)
+            return
+        await self._evaluate_position(position)
 
     async def _tick(self) -> None:
         try:
@@ -115,7 +159,7 @@ class OptionExitWatcher:
         now = time.time()
         cached = self._chain_cache.get(underlying)
         if cached and now - cached[0] < self.cache_ttl:
-            contracts = cached[1]
+            chain = cached[1]
         else:
             try:
                 fetched = await self.chain.fetch(underlying)
@@ -123,16 +167,18 @@ class OptionExitWatcher:
                 raise
             except Exception:  # pragma: no cover - network/SDK errors
                 return None
-            contracts = list(fetched)
-            self._chain_cache[underlying] = (now, contracts)
-        for contract in contracts:
-            if contract.symbol == option_symbol:
-                if contract.mid is not None:
-                    return float(contract.mid)
-                bid = contract.bid or 0.0
-                ask = contract.ask or 0.0
-                if bid and ask:
-                    return (bid + ask) / 2.0
+            chain = as_chain(fetched)
+            self._chain_cache[underlying] = (now, chain)
+        row = chain.find(option_symbol)
+        if row is None:
+            return None
+        mid = float(chain.mid[row])
+        if not math.isnan(mid):
+            return mid
+        bid = float(chain.bid[row])
+        ask = float(chain.ask[row])
+        if bid > 0 and ask > 0:
+            return (bid + ask) / 2.0
         return None
 
     async def _submit_exit(self, position: Position, direction: float) -> None:
@@ -37,5 +37,8 @@ class PreopenQueue:
         async with self._lock:
             return len(self._q)
 
+    def __len__(self) -> int:
+        return len(self._q)
+
 
 __all__ = ["PreopenIntent", "PreopenQueue"]
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from services.runtime.tracing import Trace
 
 Side = Literal["buy", "sell"]
 AssetClass = Literal["equity", "option"]
@@ -26,6 +29,7 @@ class ExecIntent:
     meta: Dict[str, Any] = field(default_factory=dict)
     time_in_force: Optional[str] = None
     order_type: Optional[str] = None
+    trace: Optional["Trace"] = field(default=None, repr=False, compare=False)
 
     def idempotency_key(self) -> str:
         """Stable key describing the unique semantics of the intent."""
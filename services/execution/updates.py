@@ -1,13 +1,317 @@
-"""Order update streaming abstractions."""
+"""In-process fan-out of order, fill and position events.
+
+Publishers push :class:`UpdateEvent` objects onto an :class:`UpdateBus`; each
+subscriber reads from its own bounded :class:`Subscription`, so a slow
+consumer never stalls the publisher or its peers. When a subscription is
+full it either drops its oldest event (``drop_oldest``, the default), drops
+the new one (``drop_newest``) or, with ``coalesce``, keeps only the latest
+pending event per key (for example per symbol). ``keep_all`` never drops:
+``maxsize`` only marks the backlog at which a warning is logged. Every topic carries its own
+sequence number, and subscriptions count the gaps they observe.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Awaitable, Callable, Dict
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, Optional
+
+from services.telemetry.registry import QUEUE_DEPTH
+
+ORDER = "order"
+FILL = "fill"
+POSITION = "position"
+TOPICS = (ORDER, FILL, POSITION)
+
+POLICIES = ("drop_oldest", "drop_newest", "coalesce", "keep_all")
+
+log = logging.getLogger("gigatrader.execution.updates")
+
+
+class SubscriptionClosed(Exception):
+    """Raised by :meth:`Subscription.get` once the subscription is closed."""
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateEvent:
+    """One order, fill or position change."""
+
+    topic: str
+    seq: int
+    symbol: Optional[str] = None
+    client_order_id: Optional[str] = None
+    order_id: Optional[str] = None
+    status: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    ts: float = field(default_factory=time.time)
+
+
+def _order_status(order: Dict[str, Any], update: Dict[str, Any]) -> Optional[str]:
+    status = order.get("status") or update.get("event") or update.get("state") or ""
+    return str(status).lower() or None
+
+
+def _default_key(event: UpdateEvent) -> Hashable:
+    return (event.topic, event.symbol or event.client_order_id)
+
+
+class Subscription:
+    """Bounded per-consumer queue; iterate it or ``await get()``."""
+
+    def __init__(
+        self,
+        bus: "UpdateBus",
+        topics: Iterable[str],
+        *,
+        maxsize: int,
+        policy: str,
+        key: Callable[[UpdateEvent], Hashable],
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"unknown overflow policy: {policy}")
+        self.topics = frozenset(topics)
+        self.maxsize = max(1, int(maxsize))
+        self.policy = policy
+        self.dropped = 0
+        self.gaps = 0
+        self._bus = bus
+        self._key = key
+        self._lock = threading.Lock()
+        self._fifo: Deque[UpdateEvent] = deque()
+        self._latest: "OrderedDict[Hashable, UpdateEvent]" = OrderedDict()
+        self._last_seq: Dict[str, int] = {}
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self.closed = False
+
+    def __len__(self) -> int:
+        return len(self._latest) if self.policy == "coalesce" else len(self._fifo)
+
+    def _offer(self, event: UpdateEvent) -> None:
+        with self._lock:
+            if self.policy == "coalesce":
+                key = self._key(event)
+                if key in self._latest:
+                    self.dropped += 1
+                elif len(self._latest) >= self.maxsize:
+                    self._latest.popitem(last=False)
+                    self.dropped += 1
+                self._latest[key] = event
+            elif self.policy == "keep_all":
+                self._fifo.append(event)
+                backlog = len(self._fifo)
+                if backlog == self.maxsize:
+                    log.warning("updates.backlog", extra={"pending": backlog})
+            elif len(self._fifo) >= self.maxsize:
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return
+                self._fifo.popleft()
+                self._fifo.append(event)
+            else:
+                self._fifo.append(event)
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._ready.set()
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._ready.set)
+            except RuntimeError:
+                # The consumer's loop is gone.
+                self.close()
+
+    def get_nowait(self) -> Optional[UpdateEvent]:
+        with self._lock:
+            if self.policy == "coalesce":
+                if not self._latest:
+                    return None
+                _, event = self._latest.popitem(last=False)
+            else:
+                if not self._fifo:
+                    return None
+                event = self._fifo.popleft()
+        last = self._last_seq.get(event.topic)
+        if last is not None and event.seq > last + 1:
+            self.gaps += 1
+        self._last_seq[event.topic] = event.seq
+        return event
+
+    async def get(self) -> UpdateEvent:
+        while True:
+            event = self.get_nowait()
+            if event is not None:
+                return event
+            if self.closed:
+                raise SubscriptionClosed()
+            self._ready.clear()
+            # Re-check: an event may have landed between get_nowait and clear.
+            if len(self):
+                continue
+            await self._ready.wait()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> UpdateEvent:
+        try:
+            return await self.get()
+        except SubscriptionClosed:
+            raise StopAsyncIteration from None
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._bus.unsubscribe(self)
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "topics": sorted(self.topics),
+            "policy": self.policy,
+            "pending": len(self),
+            "dropped": self.dropped,
+            "gaps": self.gaps,
+        }
 
 
 class UpdateBus:
-    """Placeholder update bus that can be swapped with a real Alpaca stream."""
+    """Typed pub/sub for order updates; safe to publish from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        self._counters = {topic: itertools.count(1) for topic in TOPICS}
+
+    def subscribe(
+        self,
+        topics: Iterable[str] = TOPICS,
+        *,
+        maxsize: int = 1024,
+        policy: str = "drop_oldest",
+        key: Callable[[UpdateEvent], Hashable] = _default_key,
+    ) -> Subscription:
+        """Register a consumer; call from the event loop that will read it."""
+
+        topics = [topics] if isinstance(topics, str) else list(topics)
+        unknown = set(topics) - set(TOPICS)
+        if unknown:
+            raise ValueError(f"unknown topics: {sorted(unknown)}")
+        sub = Subscription(self, topics, maxsize=maxsize, policy=policy, key=key)
+        with self._lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    def publish(
+        self,
+        topic: str,
+        *,
+        symbol: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+        order_id: Optional[str] = None,
+        status: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> UpdateEvent:
+        with self._lock:
+            event = UpdateEvent(
+                topic=topic,
+                seq=next(self._counters[topic]),
+                symbol=symbol,
+                client_order_id=client_order_id,
+                order_id=order_id,
+                status=status,
+                data=dict(data or {}),
+            )
+            targets = [sub for sub in self._subscribers if topic in sub.topics]
+        for sub in targets:
+            sub._offer(event)
+        return event
+
+    def publish_order(self, update: Dict[str, Any]) -> UpdateEvent:
+        """Publish a raw broker order update (Alpaca trade-update shape)."""
+
+        order = update.get("order") if isinstance(update.get("order"), dict) else update
+        return self.publish(
+            ORDER,
+            symbol=order.get("symbol"),
+            client_order_id=order.get("client_order_id") or update.get("client_order_id"),
+            order_id=order.get("id"),
+            status=_order_status(order, update),
+            data=update,
+        )
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return [sub.stats() for sub in subscribers]
+
+    def pending(self) -> int:
+        """Events queued across all subscriptions."""
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return sum(len(sub) for sub in subscribers)
 
     async def run(self, on_update: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
-        # No-op stub for paper trading in unit tests. Real implementation will wire Alpaca streams.
-        return None
+        """Feed every raw order update to ``on_update`` until cancelled."""
+
+        # Order updates must not be dropped: a missed fill skews positions.
+        sub = self.subscribe(ORDER, maxsize=10_000, policy="keep_all")
+        try:
+            async for event in sub:
+                try:
+                    await on_update(event.data)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:  # pragma: no cover - handler bugs must not kill the loop
+                    log.exception("updates.handler_failed", extra={"seq": event.seq})
+        finally:
+            sub.close()
+
+
+_DEFAULT_BUS: Optional[UpdateBus] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_update_bus() -> UpdateBus:
+    """Process-wide bus shared by the broker stream and the runtime."""
+
+    global _DEFAULT_BUS
+    with _DEFAULT_LOCK:
+        if _DEFAULT_BUS is None:
+            _DEFAULT_BUS = UpdateBus()
+            QUEUE_DEPTH.labels(queue="update_bus").set_function(_DEFAULT_BUS.pending)
+        return _DEFAULT_BUS
+
+
+__all__ = [
+    "FILL",
+    "ORDER",
+    "POLICIES",
+    "POSITION",
+    "Subscription",
+    "SubscriptionClosed",
+    "TOPICS",
+    "UpdateBus",
+    "UpdateEvent",
+    "get_update_bus",
+]
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from core.runtime_config import get_config
 from services.execution.engine import ExecutionEngine
 from services.execution.types import ExecIntent
 from services.options.alpaca_chain import AlpacaChainSource
@@ -14,19 +14,6 @@ from services.options.select import select_contract
 from services.risk.engine import Proposal, RiskManager
 
 
-def _env_cast(name: str, default: Any) -> Any:
-    value = os.getenv(name)
-    if value is None:
-        return default
-    cast_type = type(default)
-    try:
-        if cast_type is bool:
-            return value.strip().lower() in {"1", "true", "yes", "y", "on"}
-        return cast_type(value)
-    except Exception:
-        return default
-
-
 class OptionGateway:
     """Fetch, validate, and submit option trades using shared infrastructure."""
 
@@ -50,25 +37,19 @@ class OptionGateway:
         option_type = "call" if strategy_side == "buy" else "put"
         order_side = "buy"
 
-        target_delta = float(_env_cast("OPTIONS_TARGET_DELTA", 0.30))
-        delta_band = float(_env_cast("OPTIONS_DELTA_BAND", 0.05))
-        min_oi = int(_env_cast("OPTIONS_MIN_OI", 150))
-        min_volume = int(_env_cast("OPTIONS_MIN_VOLUME", 75))
-        min_dte = int(_env_cast("OPTIONS_MIN_DTE", 7))
-        max_dte = int(_env_cast("OPTIONS_MAX_DTE", 45))
-        price_max = float(_env_cast("OPTIONS_PRICE_MAX", 50.0))
+        cfg = get_config().options
 
         contracts = await self.chain.fetch(underlying)
         selected = select_contract(
             contracts,
             option_type,
-            target_delta,
-            delta_band,
-            min_oi,
-            min_volume,
-            min_dte,
-            max_dte,
-            price_max,
+            cfg.target_delta,
+            cfg.delta_band,
+            cfg.min_oi,
+            cfg.min_volume,
+            cfg.min_dte,
+            cfg.max_dte,
+            cfg.price_max,
         )
         if selected is None:
             return {"accepted": False, "reason": "no_contract_found"}
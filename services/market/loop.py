@@ -18,6 +18,7 @@ from app.config import get_settings
 from services.market.indicators import OpeningRange, RollingATR, RollingRSI, RollingZScore
 from services.market.store import BarRow, TSStore
 from services.runtime.logging import with_trace
+from services.runtime.tracing import Trace, get_tracer, mark
 from services.strategy.types import Bar as StrategyBar
 
 _MAX_BACKOFF_SECONDS = 60
@@ -46,6 +47,7 @@ class MarketLoop:
         self._backoff = 1.0
         self._on_bar = on_bar
         self._metrics = metrics
+        self._tracer = get_tracer()
         self.log = logger or logging.getLogger(__name__)
 
     @staticmethod
@@ -121,6 +123,13 @@ class MarketLoop:
 
     def _on_bar_factory(self, symbol: str):
         async def handler(bar: Bar) -> None:
+            trace = self._tracer.start("bar", symbol=symbol)
+            try:
+                await _handle(bar, trace)
+            finally:
+                self._tracer.finish(trace)
+
+        async def _handle(bar: Bar, trace: Optional[Trace]) -> None:
             state = self._ensure_state(symbol)
             session_date = bar.timestamp.date()
             if state["session_date"] != session_date:
@@ -132,6 +141,7 @@ class MarketLoop:
             zscore = state["zscore"].update(float(bar.close))
             orb_state = state["orb"].update(float(bar.high), float(bar.low))
             breakout = state["orb"].breakout(float(bar.close))
+            mark(trace, "indicators")
 
             self.store.write(
                 BarRow(
@@ -149,6 +159,7 @@ class MarketLoop:
                     orb_breakout=breakout,
                 )
             )
+            mark(trace, "bar_store")
 
             self.msgs += 1
             self.heartbeat = time.time()
@@ -168,6 +179,7 @@ class MarketLoop:
                     low=float(bar.low),
                     close=float(bar.close),
                     volume=float(bar.volume or 0.0),
+                    trace=trace,
                 )
                 try:
                     await self._on_bar(symbol, strategy_bar)
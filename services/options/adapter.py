@@ -11,10 +11,12 @@ import os
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from core.config import MOCK_MODE
 from core.runtime_flags import get_runtime_flags
+from services.options.chain import OptionChain
 
 MIN_OPEN_INTEREST = 25
 """Minimum open interest required for a contract to be considered liquid."""
@@ -64,27 +66,28 @@ def _load_mock_chain(symbol: str, as_of: pd.Timestamp) -> pd.DataFrame:
     )
 
 
-def _filter_liquidity(df: pd.DataFrame) -> pd.DataFrame:
-    filtered = df.copy()
-    filtered = filtered.dropna(subset=["bid", "ask", "oi", "expiry"])
-    filtered["expiry"] = pd.to_datetime(filtered["expiry"], utc=False)
-    filtered = filtered[filtered["expiry"].dt.dayofweek == _ALLOWED_EXPIRY_WEEKDAY]
-    filtered = filtered[filtered["oi"] >= MIN_OPEN_INTEREST]
-
-    # Ensure positive bid/ask and compute mid for spread calculations.
-    filtered = filtered[(filtered["bid"] > 0) & (filtered["ask"] > 0)]
-    filtered = filtered[filtered["ask"] >= filtered["bid"]]
-
-    mid = (filtered["bid"] + filtered["ask"]) / 2
-    filtered = filtered.assign(mid=mid)
-    filtered = filtered[filtered["mid"] > 0]
-
-    spread = filtered["ask"] - filtered["bid"]
-    spread_bps = (spread / filtered["mid"]) * 10_000
-    filtered = filtered[spread_bps <= MAX_SPREAD_BPS]
-
-    filtered = filtered.sort_values(["expiry", "strike", "side"]).reset_index(drop=True)
-    return filtered
+def _liquid_rows(chain: OptionChain, mid: np.ndarray) -> np.ndarray:
+    """Rows of ``chain`` that pass the liquidity filters, ordered by expiry, strike, side."""
+
+    # datetime64[D] counts days from Thursday 1970-01-01; +3 makes Monday 0.
+    weekday = (chain.expiry.astype(np.int64) + 3) % 7
+    with np.errstate(invalid="ignore", divide="ignore"):
+        spread_bps = (chain.ask - chain.bid) / mid * 10_000
+        mask = (
+            ~np.isnat(chain.expiry)
+            & (weekday == _ALLOWED_EXPIRY_WEEKDAY)
+            & (chain.oi >= MIN_OPEN_INTEREST)
+            & (chain.bid > 0)
+            & (chain.ask > 0)
+            & (chain.ask >= chain.bid)
+            & (mid > 0)
+            & (spread_bps <= MAX_SPREAD_BPS)
+        )
+    rows = np.flatnonzero(mask)
+    order = np.lexsort(
+        (~chain.is_call[rows], chain.strike[rows], chain.expiry[rows].astype(np.int64))
+    )
+    return rows[order]
 
 
 def _mock_mode_enabled() -> bool:
@@ -110,9 +113,10 @@ def get_option_chain(symbol: str, as_of: Any) -> pd.DataFrame:
     Returns
     -------
     pandas.DataFrame
-        A DataFrame containing the filtered contracts with greeks and
-        liquidity columns. The frame always contains a ``mid`` column for
-        downstream consumers.
+        The recorded contracts that pass the liquidity filters, with the
+        recorded columns and dtypes plus a ``mid`` column for downstream
+        consumers. The filters run over a columnar :class:`OptionChain`
+        view of the frame.
     """
 
     as_of_ts = pd.to_datetime(as_of)
@@ -133,4 +137,8 @@ def get_option_chain(symbol: str, as_of: Any) -> pd.DataFrame:
         return pd.DataFrame(columns=columns)
 
     raw = _load_mock_chain(symbol, as_of_ts)
-    return _filter_liquidity(raw)
+    chain = OptionChain.from_pandas(raw, underlying=symbol.upper())
+    mid = (chain.bid + chain.ask) / 2
+    rows = _liquid_rows(chain, mid)
+    filtered = raw.iloc[rows].assign(expiry=pd.to_datetime(raw["expiry"].iloc[rows]), mid=mid[rows])
+    return filtered.reset_index(drop=True)
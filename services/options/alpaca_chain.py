@@ -4,14 +4,36 @@ from __future__ import annotations
 
 import asyncio
 import datetime as _dt
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.config import get_settings
+from services.options.chain import ChainSource, OptionChain
 
 
 class OptionsConfigError(RuntimeError):
     """Raised when option chain configuration is invalid."""
 
-from app.config import get_settings
-from services.options.chain import ChainSource, OptionContract
+
+_COLUMNS = (
+    "symbol",
+    "expiry",
+    "is_call",
+    "dte",
+    "strike",
+    "bid",
+    "ask",
+    "mid",
+    "iv",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "volume",
+    "oi",
+)
 
 
 def _calculate_mid(bid: Optional[float], ask: Optional[float]) -> Optional[float]:
@@ -45,53 +67,49 @@ class AlpacaChainSource(ChainSource):
             self._client = OptionHistoricalDataClient(key, secret)
         return self._client
 
-    async def fetch(self, underlying: str) -> List[OptionContract]:
+    async def fetch(self, underlying: str) -> OptionChain:
         loop = asyncio.get_running_loop()
 
-        def _call() -> List[OptionContract]:
+        def _call() -> OptionChain:
             client = self._get_client()
             from alpaca.data.requests import OptionChainRequest
 
             request = OptionChainRequest(symbol=underlying)
             response = client.get_option_chain(request)
             today = _dt.date.today()
-            contracts: List[OptionContract] = []
+            columns: Dict[str, List[object]] = {name: [] for name in _COLUMNS}
             for option in getattr(response, "options", []) or []:
                 expiration = getattr(option, "expiration", None)
+                if isinstance(expiration, _dt.datetime):
+                    expiration = expiration.date()
                 if isinstance(expiration, _dt.date):
                     dte = (expiration - today).days
-                    expiry_str = expiration.isoformat()
-                elif isinstance(expiration, _dt.datetime):
-                    expiration_date = expiration.date()
-                    dte = (expiration_date - today).days
-                    expiry_str = expiration_date.isoformat()
                 else:
+                    expiration = None
                     dte = 0
-                    expiry_str = str(expiration)
                 greeks = getattr(option, "greeks", None)
-                delta = getattr(greeks, "delta", None)
-                iv = getattr(greeks, "iv", None)
                 bid = getattr(option, "bid", None)
                 ask = getattr(option, "ask", None)
-                mid = _calculate_mid(bid, ask)
-                contracts.append(
-                    OptionContract(
-                        symbol=getattr(option, "symbol", ""),
-                        underlying=underlying,
-                        expiry=expiry_str,
-                        strike=float(getattr(option, "strike", 0.0) or 0.0),
-                        side="call" if getattr(option, "right", "").lower() == "call" else "put",
-                        delta=delta,
-                        iv=iv,
-                        bid=bid,
-                        ask=ask,
-                        mid=mid,
-                        volume=getattr(option, "volume", None),
-                        oi=getattr(option, "open_interest", None),
-                        dte=int(dte),
-                        raw=getattr(option, "__dict__", None),
-                    )
-                )
-            return contracts
+                columns["symbol"].append(getattr(option, "symbol", ""))
+                columns["expiry"].append(expiration)
+                columns["is_call"].append(getattr(option, "right", "").lower() == "call")
+                columns["dte"].append(dte)
+                columns["strike"].append(float(getattr(option, "strike", 0.0) or 0.0))
+                columns["bid"].append(bid)
+                columns["ask"].append(ask)
+                columns["mid"].append(_calculate_mid(bid, ask))
+                columns["iv"].append(getattr(greeks, "iv", None))
+                for greek in ("delta", "gamma", "theta", "vega", "rho"):
+                    columns[greek].append(getattr(greeks, greek, None))
+                columns["volume"].append(getattr(option, "volume", None))
+                columns["oi"].append(getattr(option, "open_interest", None))
+            return OptionChain(
+                underlying,
+                symbol=columns.pop("symbol"),
+                expiry=np.array(columns.pop("expiry"), dtype="datetime64[D]"),
+                is_call=columns.pop("is_call"),
+                dte=columns.pop("dte"),
+                **{name: np.array(values, dtype=np.float64) for name, values in columns.items()},
+            )
 
         return await loop.run_in_executor(None, _call)
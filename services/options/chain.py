@@ -1,12 +1,38 @@
-"""Option chain abstractions."""
+"""Option chain abstractions.
+
+:class:`OptionChain` holds a whole chain column-wise, one NumPy array per
+field, so filters and rankings are vectorized masks instead of loops over
+contract objects. Missing numeric values are ``NaN``. Single contracts are
+materialized as :class:`OptionContract` only when a caller asks for one.
+"""
 
 from __future__ import annotations
 
+import datetime as _dt
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Protocol
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Protocol, Union
+
+import numpy as np
 
 Side = Literal["call", "put"]
 
+_FLOAT_FIELDS = (
+    "strike",
+    "bid",
+    "ask",
+    "mid",
+    "iv",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "oi",
+    "volume",
+    "underlying_price",
+)
+_FIELDS = ("symbol", "expiry", "is_call", "dte") + _FLOAT_FIELDS
+
 
 @dataclass(slots=True)
 class OptionContract:
@@ -26,10 +52,231 @@ class OptionContract:
     oi: Optional[int]
     dte: int
     raw: Dict[str, Any] | None = None
+    gamma: Optional[float] = None
+    theta: Optional[float] = None
+    vega: Optional[float] = None
+    rho: Optional[float] = None
+
+
+def _float_or_none(value: float) -> Optional[float]:
+    return None if value != value else float(value)
+
+
+def _int_or_none(value: float) -> Optional[int]:
+    return None if value != value else int(value)
+
+
+def _float_column(values: Iterable[Any], count: int) -> np.ndarray:
+    return np.fromiter(
+        (np.nan if value is None else value for value in values), dtype=np.float64, count=count
+    )
+
+
+class OptionChain:
+    """Columnar option chain for one underlying.
+
+    ``symbol`` is an object array of contract symbols, ``expiry`` is
+    ``datetime64[D]``, ``is_call`` is boolean and ``dte`` is ``int32``; every
+    other column is ``float64`` with ``NaN`` for missing values (open
+    interest and volume included). Indexing with an integer materializes an
+    :class:`OptionContract`; indexing with a slice, mask or index array
+    returns another chain (basic slices share memory with this one).
+    """
+
+    __slots__ = ("underlying",) + _FIELDS + ("_rows",)
+
+    def __init__(
+        self,
+        underlying: str,
+        *,
+        symbol: Any,
+        expiry: Any,
+        is_call: Any,
+        dte: Any = None,
+        **columns: Any,
+    ) -> None:
+        unknown = set(columns) - set(_FLOAT_FIELDS)
+        if unknown:
+            raise TypeError(f"unknown option chain columns: {sorted(unknown)}")
+        self.underlying = underlying
+        self.symbol = np.asarray(symbol, dtype=object)
+        size = self.symbol.shape[0]
+        self.expiry = np.asarray(expiry, dtype="datetime64[D]")
+        self.is_call = np.asarray(is_call, dtype=bool)
+        self.dte = (
+            np.zeros(size, dtype=np.int32) if dte is None else np.asarray(dte, dtype=np.int32)
+        )
+        for name in _FLOAT_FIELDS:
+            column = columns.get(name)
+            setattr(
+                self,
+                name,
+                np.full(size, np.nan) if column is None else np.asarray(column, dtype=np.float64),
+            )
+        self._rows: Optional[Dict[str, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    @classmethod
+    def empty(cls, underlying: str = "") -> "OptionChain":
+        return cls(underlying, symbol=[], expiry=[], is_call=[])
+
+    @classmethod
+    def from_contracts(
+        cls, contracts: Iterable[OptionContract], underlying: Optional[str] = None
+    ) -> "OptionChain":
+        items = list(contracts)
+        count = len(items)
+        if underlying is None:
+            underlying = items[0].underlying if items else ""
+        return cls(
+            underlying,
+            symbol=[c.symbol for c in items],
+            expiry=[_parse_expiry(c.expiry) for c in items],
+            is_call=[c.side == "call" for c in items],
+            dte=[c.dte for c in items],
+            **{
+                name: _float_column((getattr(c, name, None) for c in items), count)
+                for name in _FLOAT_FIELDS
+                if name != "underlying_price"
+            },
+        )
+
+    @classmethod
+    def from_pandas(cls, frame: Any, underlying: Optional[str] = None) -> "OptionChain":
+        """Build from a frame with ``expiry``, ``strike`` and ``side`` columns.
+
+        ``dte`` is taken from the frame, else measured from an ``as_of``
+        column, else from today.
+        """
+
+        import pandas as pd
+
+        count = len(frame)
+        expiry = pd.to_datetime(frame["expiry"]).to_numpy(dtype="datetime64[D]")
+        if "dte" in frame:
+            dte = frame["dte"].to_numpy()
+        else:
+            if "as_of" in frame:
+                start = pd.to_datetime(frame["as_of"]).to_numpy(dtype="datetime64[D]")
+            else:
+                start = np.datetime64(_dt.date.today(), "D")
+            dte = (expiry - start).astype(np.int64)
+        if underlying is None:
+            underlying = str(frame["underlying"].iloc[0]) if "underlying" in frame and count else ""
+        side = frame["side"] if "side" in frame else frame["type"]
+        return cls(
+            underlying,
+            symbol=frame["symbol"].to_numpy(dtype=object) if "symbol" in frame else [""] * count,
+            expiry=expiry,
+            is_call=side.astype(str).str.lower().eq("call").to_numpy(),
+            dte=dte,
+            **{
+                name: pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=np.float64)
+                for name in _FLOAT_FIELDS
+                if name in frame
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Views and lookups
+    def __len__(self) -> int:
+        return self.symbol.shape[0]
+
+    def __iter__(self) -> Iterator[OptionContract]:
+        for row in range(len(self)):
+            yield self.contract(row)
+
+    def __getitem__(self, selector: Any) -> Union[OptionContract, "OptionChain"]:
+        if isinstance(selector, (int, np.integer)):
+            return self.contract(int(selector))
+        return self.take(selector)
+
+    def take(self, selector: Any) -> "OptionChain":
+        """Rows picked by a slice, boolean mask or index array."""
+
+        view = OptionChain.__new__(OptionChain)
+        view.underlying = self.underlying
+        for name in _FIELDS:
+            setattr(view, name, getattr(self, name)[selector])
+        view._rows = None
+        return view
+
+    def find(self, symbol: str) -> Optional[int]:
+        """Row of the contract with ``symbol``; the lookup table is built once."""
+
+        if self._rows is None:
+            self._rows = {value: row for row, value in enumerate(self.symbol.tolist())}
+        return self._rows.get(symbol)
+
+    def contract(self, row: int) -> OptionContract:
+        """Materialize one row as an :class:`OptionContract`."""
+
+        return OptionContract(
+            symbol=str(self.symbol[row]),
+            underlying=self.underlying,
+            expiry=str(self.expiry[row]),
+            strike=float(self.strike[row]),
+            side="call" if self.is_call[row] else "put",
+            delta=_float_or_none(self.delta[row]),
+            iv=_float_or_none(self.iv[row]),
+            bid=_float_or_none(self.bid[row]),
+            ask=_float_or_none(self.ask[row]),
+            mid=_float_or_none(self.mid[row]),
+            volume=_int_or_none(self.volume[row]),
+            oi=_int_or_none(self.oi[row]),
+            dte=int(self.dte[row]),
+            gamma=_float_or_none(self.gamma[row]),
+            theta=_float_or_none(self.theta[row]),
+            vega=_float_or_none(self.vega[row]),
+            rho=_float_or_none(self.rho[row]),
+        )
+
+    @property
+    def side(self) -> np.ndarray:
+        """``"call"``/``"put"`` labels (computed on demand)."""
+
+        return np.where(self.is_call, "call", "put").astype(object)
+
+    def to_pandas(self) -> Any:
+        """DataFrame with one column per field; numeric columns share memory with the chain."""
+
+        import pandas as pd
+
+        data: Dict[str, Any] = {
+            "symbol": self.symbol,
+            "underlying": np.full(len(self), self.underlying, dtype=object),
+            "expiry": self.expiry,
+            "side": self.side,
+            "dte": self.dte,
+        }
+        for name in _FLOAT_FIELDS:
+            data[name] = getattr(self, name)
+        return pd.DataFrame(data, copy=False)
+
+
+def _parse_expiry(value: Any) -> np.datetime64:
+    if isinstance(value, _dt.datetime):
+        value = value.date()
+    try:
+        return np.datetime64(value, "D")
+    except ValueError:
+        return np.datetime64("NaT", "D")
+
+
+def as_chain(contracts: Union[OptionChain, Iterable[OptionContract]]) -> OptionChain:
+    """Accept either a columnar chain or a sequence of contracts."""
+
+    if isinstance(contracts, OptionChain):
+        return contracts
+    return OptionChain.from_contracts(contracts)
 
 
 class ChainSource(Protocol):
     """Interface for fetching option chains with greeks."""
 
-    async def fetch(self, underlying: str) -> List[OptionContract]:
-        """Return contracts for the provided underlying symbol."""
+    async def fetch(self, underlying: str) -> OptionChain:
+        """Return the chain for the provided underlying symbol."""
+
+
+__all__: List[str] = ["ChainSource", "OptionChain", "OptionContract", "Side", "as_chain"]
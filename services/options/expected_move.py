@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, Union
 
+import numpy as np
 import pandas as pd
 
+from services.options.chain import OptionChain
 
-def expected_move(chain: pd.DataFrame, as_of: Any) -> float:
+
+def expected_move(chain: Union[OptionChain, pd.DataFrame], as_of: Any) -> float:
     """Estimate the expected move using the ATM implied volatility.
 
     The computation uses the nearest expiry after ``as_of`` and averages the
@@ -17,35 +20,33 @@ def expected_move(chain: pd.DataFrame, as_of: Any) -> float:
     is the time to expiry expressed in years.
     """
 
-    if chain.empty:
+    if not isinstance(chain, OptionChain):
+        if chain.empty:
+            raise ValueError("Option chain is empty")
+        chain = OptionChain.from_pandas(chain)
+    if len(chain) == 0:
         raise ValueError("Option chain is empty")
 
-    as_of_ts = pd.to_datetime(as_of)
-    df = chain.copy()
-    df["expiry"] = pd.to_datetime(df["expiry"], utc=False)
-    df = df[df["expiry"] > as_of_ts]
-    if df.empty:
+    as_of_ts = pd.to_datetime(as_of).to_datetime64().astype("datetime64[s]")
+    expiry = chain.expiry.astype("datetime64[s]")
+    upcoming = np.flatnonzero(expiry > as_of_ts)
+    if upcoming.size == 0:
         raise ValueError("No expiries after the as_of timestamp")
 
-    expiry = df["expiry"].min()
-    window = df[df["expiry"] == expiry]
+    nearest = expiry[upcoming].min()
+    window = upcoming[expiry[upcoming] == nearest]
 
-    if "underlying_price" not in window.columns:
+    underlying_price = float(chain.underlying_price[window[0]])
+    if math.isnan(underlying_price):
         raise ValueError("Chain is missing underlying_price information")
 
-    underlying_price = float(window["underlying_price"].iloc[0])
-
-    window = window.assign(distance=(window["strike"] - underlying_price).abs())
-    min_distance = window["distance"].min()
-    atm = window[window["distance"] == min_distance]
-
-    if atm.empty or atm["iv"].isna().all():
+    distance = np.abs(chain.strike[window] - underlying_price)
+    atm_iv = chain.iv[window[distance == distance.min()]]
+    if atm_iv.size == 0 or np.isnan(atm_iv).all():
         raise ValueError("Unable to determine ATM implied volatility")
 
-    atm_iv = float(atm["iv"].mean())
-    time_fraction = (expiry - as_of_ts) / pd.Timedelta(days=365)
-    time_years = float(time_fraction)
+    time_years = float((nearest - as_of_ts) / np.timedelta64(365, "D"))
     if time_years <= 0:
         raise ValueError("Time to expiry must be positive")
 
-    return underlying_price * atm_iv * math.sqrt(time_years)
+    return underlying_price * float(np.nanmean(atm_iv)) * math.sqrt(time_years)
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterable, Optional, Union
 
-from services.options.chain import OptionContract, Side
+import numpy as np
+
+from services.options.chain import OptionChain, OptionContract, Side, as_chain
 
 
 def select_contract(
-    contracts: List[OptionContract],
+    contracts: Union[OptionChain, Iterable[OptionContract]],
     side: Side,
     target_delta: float,
     delta_band: float,
@@ -18,27 +20,32 @@ def select_contract(
     max_dte: int,
     price_max: float,
 ) -> Optional[OptionContract]:
-    """Choose the best contract given liquidity and delta constraints."""
+    """Choose the best contract given liquidity and delta constraints.
+
+    Candidates are ranked by distance to the target delta, then nearest
+    expiry, then highest volume; only the winner is materialized.
+    """
 
+    chain = as_chain(contracts)
     want = target_delta if side == "call" else -target_delta
     lo, hi = want - delta_band, want + delta_band
-    candidates: list[OptionContract] = []
-    for contract in contracts:
-        if contract.side != side:
-            continue
-        if contract.delta is None or contract.mid is None:
-            continue
-        if contract.oi is None or contract.volume is None:
-            continue
-        if contract.oi < min_oi or contract.volume < min_volume:
-            continue
-        if not (min_dte <= contract.dte <= max_dte):
-            continue
-        if contract.mid <= 0 or contract.mid > price_max:
-            continue
-        if lo <= contract.delta <= hi:
-            candidates.append(contract)
-    if not candidates:
+    # NaN compares False, so missing delta/mid/oi/volume drop out of the mask.
+    with np.errstate(invalid="ignore"):
+        mask = (
+            (chain.is_call == (side == "call"))
+            & (chain.oi >= min_oi)
+            & (chain.volume >= min_volume)
+            & (chain.dte >= min_dte)
+            & (chain.dte <= max_dte)
+            & (chain.mid > 0)
+            & (chain.mid <= price_max)
+            & (chain.delta >= lo)
+            & (chain.delta <= hi)
+        )
+    rows = np.flatnonzero(mask)
+    if rows.size == 0:
         return None
-    candidates.sort(key=lambda c: (abs(c.delta - want), c.dte, -c.volume))
-    return candidates[0]
+    order = np.lexsort(
+        (-chain.volume[rows], chain.dte[rows], np.abs(chain.delta[rows] - want))
+    )
+    return chain.contract(int(rows[order[0]]))
@@ -57,10 +57,10 @@ def _price_for_action(contract: OptionContract, action: LegAction) -> float:
 
 
 def _signed_greek(contract: OptionContract, action: LegAction, key: str) -> float | None:
-    value = None
-    if key == "delta":
-        value = _to_float(contract.delta)
-    else:
+    # Contracts materialized from an OptionChain carry their greeks as fields;
+    # hand-built ones may still only have them in ``raw``.
+    value = _to_float(getattr(contract, key, None))
+    if value is None and key != "delta":
         value = _extract_from_raw(contract, key)
 
     if value is None:
@@ -1,6 +1,7 @@
 """Policy helpers for execution gating and sizing."""
 
-from .gates import should_trade  # noqa: F401
+from .engine import PolicyDecision, PolicyEngine  # noqa: F401
+from .gates import get_policy_engine, should_trade  # noqa: F401
 from .sizing import size_position  # noqa: F401
 
-__all__ = ["should_trade", "size_position"]
+__all__ = ["PolicyDecision", "PolicyEngine", "get_policy_engine", "should_trade", "size_position"]
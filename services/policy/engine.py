@@ -0,0 +1,189 @@
+"""Compiled policy gate evaluated over batches of candidate contexts."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from strategies.registry import AlphaSpec, StrategyRegistry
+
+ALPHA_ENV_KEYS = ("POLICY_ALPHA_MIN", "ALPHA_MIN")
+PROBA_ENV_KEYS = ("POLICY_PROBA_MIN", "PROBA_MIN")
+DEFAULT_ALPHA_MIN = 0.15
+DEFAULT_PROBA_MIN = 0.55
+
+
+def _env_float(keys: Tuple[str, ...], default: float) -> float:
+    for key in keys:
+        value = os.getenv(key)
+        if not value:
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            continue
+    return default
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyConfig:
+    alpha_min: float = DEFAULT_ALPHA_MIN
+    proba_min: float = DEFAULT_PROBA_MIN
+
+    @classmethod
+    def from_env(cls) -> "PolicyConfig":
+        return cls(
+            alpha_min=_env_float(ALPHA_ENV_KEYS, DEFAULT_ALPHA_MIN),
+            proba_min=_env_float(PROBA_ENV_KEYS, DEFAULT_PROBA_MIN),
+        )
+
+
+@dataclass(slots=True)
+class PolicyDecision:
+    allow: bool
+    alpha: Optional[float]
+    alpha_blend: float
+    alpha_min: float
+    alpha_status: str
+    proba_up: Optional[float]
+    proba_min: float
+    proba_status: str
+    reason_codes: List[str]
+
+    @property
+    def decision(self) -> str:
+        return "allow" if self.allow else "block"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Gate fields in the shape ``should_trade`` merges into its context."""
+        return {
+            "alpha": self.alpha,
+            "alpha_blend": self.alpha_blend,
+            "alpha_min": self.alpha_min,
+            "alpha_status": self.alpha_status,
+            "proba_up": self.proba_up,
+            "proba_min": self.proba_min,
+            "proba_status": self.proba_status,
+            "reason_codes": list(self.reason_codes),
+            "decision": self.decision,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledBlend:
+    features: Tuple[str, ...]
+    weights: np.ndarray
+    callables: Tuple[AlphaSpec, ...]
+    denominator: float
+
+
+def _compile(registry: StrategyRegistry) -> _CompiledBlend:
+    specs = registry.specs()
+    vectorised = [spec for spec in specs if spec.feature]
+    return _CompiledBlend(
+        features=tuple(spec.feature for spec in vectorised),  # type: ignore[misc]
+        weights=np.array([spec.weight for spec in vectorised], dtype=float),
+        callables=tuple(spec for spec in specs if not spec.feature),
+        denominator=float(sum(abs(spec.weight) for spec in specs)),
+    )
+
+
+class PolicyEngine:
+    """Alpha/probability gate with configuration and registry snapshotted up front.
+
+    Alphas registered with a ``feature`` key are blended for a whole batch as
+    one ``contexts x alphas`` matrix product; other alphas fall back to calling
+    their function per context. Call :meth:`reload` after changing the
+    ``POLICY_*`` environment or the registry's weights.
+    """
+
+    def __init__(self, registry: StrategyRegistry, config: Optional[PolicyConfig] = None) -> None:
+        self.registry = registry
+        self._explicit_config = config
+        self.reload()
+
+    def reload(self) -> None:
+        self.config = self._explicit_config or PolicyConfig.from_env()
+        self._blend = _compile(self.registry)
+
+    def blend_many(self, contexts: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        compiled = self._blend
+        if not contexts or compiled.denominator == 0:
+            return np.zeros(len(contexts), dtype=float)
+        numerator = np.zeros(len(contexts), dtype=float)
+        if compiled.features:
+            matrix = np.array(
+                [[ctx.get(key, 0.0) for key in compiled.features] for ctx in contexts],
+                dtype=float,
+            )
+            # ``None`` features become NaN; treat them like absent ones.
+            numerator += np.nan_to_num(matrix, nan=0.0) @ compiled.weights
+        for spec in compiled.callables:
+            numerator += spec.weight * np.array([float(spec.fn(ctx)) for ctx in contexts])  # type: ignore[arg-type]
+        return numerator / compiled.denominator
+
+    def evaluate_many(self, contexts: Sequence[Mapping[str, Any]]) -> List[PolicyDecision]:
+        blends = self.blend_many(contexts)
+        alpha_min = self.config.alpha_min
+        proba_min = self.config.proba_min
+        decisions: List[PolicyDecision] = []
+        for ctx, blended in zip(contexts, blends.tolist(), strict=True):
+            provided = _optional_float(ctx.get("alpha"))
+            alpha = provided if provided is not None else blended
+            raw_proba = ctx["proba_up"] if "proba_up" in ctx else ctx.get("probability")
+            proba = _optional_float(raw_proba)
+            if proba is not None:
+                proba = max(0.0, min(1.0, proba))
+
+            failures: List[str] = []
+            info: List[str] = []
+            if alpha is None:
+                alpha_status = "missing"
+                info.append("alpha_missing")
+            elif alpha < alpha_min:
+                alpha_status = "fail"
+                failures.append("alpha_below_min")
+            else:
+                alpha_status = "pass"
+            if proba is None:
+                proba_status = "missing"
+                info.append("proba_missing")
+            elif proba < proba_min:
+                proba_status = "fail"
+                failures.append("proba_below_min")
+            else:
+                proba_status = "pass"
+
+            allow = not failures
+            decisions.append(
+                PolicyDecision(
+                    allow=allow,
+                    alpha=alpha,
+                    alpha_blend=blended,
+                    alpha_min=alpha_min,
+                    alpha_status=alpha_status,
+                    proba_up=proba,
+                    proba_min=proba_min,
+                    proba_status=proba_status,
+                    reason_codes=(["ok"] if allow else failures) + info,
+                )
+            )
+        return decisions
+
+    def evaluate(self, ctx: Mapping[str, Any]) -> PolicyDecision:
+        return self.evaluate_many([ctx])[0]
+
+
+__all__ = ["PolicyConfig", "PolicyDecision", "PolicyEngine"]
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Set
 
 from core.kill_switch import KillSwitch
+from core.runtime_config import get_config
 from services.risk.presets import PRESETS, RiskPreset
-from services.risk.state import Position, StateProvider
+from services.risk.state import Position, RiskSnapshot, StateProvider, build_snapshot
 
 
 @dataclass(slots=True)
@@ -35,6 +36,19 @@ class Decision:
     max_qty: Optional[float] = None
 
 
+@dataclass(slots=True)
+class _Pending:
+    """Exposure already granted to earlier proposals in the same batch."""
+
+    notional: float = 0.0
+    qty: Dict[str, float] = field(default_factory=dict)
+    symbol_notional: Dict[str, float] = field(default_factory=dict)
+    new_symbols: Set[str] = field(default_factory=set)
+
+
+_NO_PENDING = _Pending()
+
+
 def _env_float(name: str, default: float) -> float:
     value = os.getenv(name)
     if not value:
@@ -62,30 +76,39 @@ def _env_bool(name: str, default: bool) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
-def _truthy(val: str | None) -> bool:
-    return (val or "").strip().lower() in {"1", "true", "on", "yes"}
+@lru_cache(maxsize=8)
+def _file_kill_switch(path: str) -> KillSwitch:
+    return KillSwitch(path)
 
 
 def _kill_switch_engaged(kill_switch: KillSwitch | None) -> bool:
     """Return True if any kill-switch signal is active."""
 
+    cfg = get_config().kill_switch
+
     # 1) Explicit ON (env) — highest priority
-    if _truthy(os.getenv("KILL_SWITCH")):
+    if cfg.env_engaged:
         return True
 
     # 2) Explicit ON (file) — next priority
-    file_path = Path(os.getenv("KILL_SWITCH_FILE", "runtime/kill_switch"))
+    checked_file: Optional[str] = None
     try:
-        if file_path.exists() and file_path.name != ".pytest-no-kill.flag":
-            return True
+        if os.path.basename(cfg.file) != ".pytest-no-kill.flag":
+            if _file_kill_switch(cfg.file).engaged_sync():
+                return True
+            checked_file = os.path.abspath(cfg.file)
     except Exception:
         pass
 
     # 3) Test override — only forces OFF if not explicitly ON
-    if _truthy(os.getenv("GT_TEST_DISARM_KILL_SWITCH")):
+    if cfg.test_disarm:
         return False
 
-    # Runtime kill-switch object (if provided)
+    # Runtime kill-switch object (if provided); skipped when it watches the
+    # file already checked above, since both share one watcher.
+    path = getattr(kill_switch, "path", None)
+    if path is not None and checked_file is not None and os.path.abspath(path) == checked_file:
+        return False
     if kill_switch is not None:
         try:
             engaged_sync = getattr(kill_switch, "engaged_sync", None)
@@ -99,7 +122,13 @@ def _kill_switch_engaged(kill_switch: KillSwitch | None) -> bool:
 
 
 class RiskManager:
-    """Central risk engine enforcing static caps before broker interaction."""
+    """Central risk engine enforcing static caps before broker interaction.
+
+    Checks read a :class:`RiskSnapshot` from the state provider, which is
+    rebuilt only when the provider's version changes. Kill-switch files are
+    followed by :class:`~core.kill_switch.KillSwitchWatcher`, so checking them
+    does not touch the filesystem.
+    """
 
     def __init__(self, state: StateProvider, kill_switch: KillSwitch | None = None) -> None:
         profile = os.getenv("RISK_PROFILE", "balanced").strip().lower()
@@ -119,18 +148,33 @@ class RiskManager:
         self.state = state
         self.kill_switch = kill_switch or KillSwitch()
 
-    def _risk_budget_dollars(self) -> float:
+    def _kill_switch_active(self) -> bool:
+        ks = getattr(self, "kill_switch", None)
+        if ks is None:
+            ks = KillSwitch()
+            self.kill_switch = ks
+        return _kill_switch_engaged(ks)
+
+    def snapshot(self) -> RiskSnapshot:
+        provider = getattr(self.state, "risk_snapshot", None)
+        if callable(provider):
+            return provider()
+        return build_snapshot(self.state)
+
+    def _risk_budget_dollars(self, equity: Optional[float] = None) -> float:
         """Return the per-trade dollar risk budget."""
 
-        equity: Optional[float]
-        try:
-            equity = self.state.get_account_equity()
-        except Exception:
-            equity = None
+        if equity is None:
+            try:
+                equity = self.state.get_account_equity()
+            except Exception:
+                equity = None
         base = equity if equity is not None and equity > 0 else self.cfg.max_notional
         return (self.cfg.per_trade_risk_pct / 100.0) * base
 
-    def _additional_notional(self, proposal: Proposal, position: Optional[Position]) -> float:
+    def _additional_notional(
+        self, proposal: Proposal, position: Optional[Position], pending_qty: float = 0.0
+    ) -> float:
         """Return the incremental notional the trade would add."""
 
         side = proposal.side.lower()
@@ -138,7 +182,7 @@ class RiskManager:
             return abs(proposal.qty * proposal.price)
 
         direction = 1.0 if side == "buy" else -1.0
-        existing_qty = position.qty if position is not None else 0.0
+        existing_qty = (position.qty if position is not None else 0.0) + pending_qty
         post_qty = existing_qty + direction * proposal.qty
         additional_qty = max(0.0, abs(post_qty) - abs(existing_qty))
         return additional_qty * proposal.price
@@ -150,40 +194,87 @@ class RiskManager:
         symbol_oi: Optional[int] = None,
         symbol_vol: Optional[int] = None,
     ) -> Decision:
-        ks = getattr(self, "kill_switch", None)
-        if ks is None:
-            ks = KillSwitch()
-            self.kill_switch = ks
-
-        if _kill_switch_engaged(ks):
+        if self._kill_switch_active():
             return Decision(False, "kill_switch_active")
+        return self._check(proposal, self.snapshot(), _NO_PENDING, symbol_oi, symbol_vol)
 
-        day_pnl = self.state.get_day_pnl()
-        if day_pnl <= -abs(self.cfg.daily_loss_limit):
+    def pre_trade_check_many(
+        self,
+        proposals: Sequence[Proposal],
+        *,
+        symbol_meta: Optional[Mapping[str, Mapping[str, Optional[int]]]] = None,
+    ) -> List[Decision]:
+        """Check ``proposals`` in order against one snapshot.
+
+        Each allowed proposal's exposure counts against the ones after it, as
+        if it had already filled. ``symbol_meta`` maps a symbol to its
+        ``symbol_oi``/``symbol_vol`` for option checks.
+        """
+
+        if self._kill_switch_active():
+            return [Decision(False, "kill_switch_active") for _ in proposals]
+        snap = self.snapshot()
+        pending = _Pending()
+        decisions: List[Decision] = []
+        for proposal in proposals:
+            meta = (symbol_meta or {}).get(proposal.symbol) or {}
+            decision = self._check(
+                proposal, snap, pending, meta.get("symbol_oi"), meta.get("symbol_vol")
+            )
+            if decision.allow:
+                self._reserve(proposal, snap, pending)
+            decisions.append(decision)
+        return decisions
+
+    def _reserve(self, proposal: Proposal, snap: RiskSnapshot, pending: _Pending) -> None:
+        symbol = proposal.symbol
+        added = self._additional_notional(
+            proposal, snap.positions.get(symbol), pending.qty.get(symbol, 0.0)
+        )
+        pending.notional += added
+        pending.symbol_notional[symbol] = pending.symbol_notional.get(symbol, 0.0) + added
+        direction = 1.0 if proposal.side.lower() == "buy" else -1.0
+        pending.qty[symbol] = pending.qty.get(symbol, 0.0) + direction * proposal.qty
+        if symbol not in snap.positions:
+            pending.new_symbols.add(symbol)
+
+    def _check(
+        self,
+        proposal: Proposal,
+        snap: RiskSnapshot,
+        pending: _Pending,
+        symbol_oi: Optional[int],
+        symbol_vol: Optional[int],
+    ) -> Decision:
+        if snap.day_pnl <= -abs(self.cfg.daily_loss_limit):
             return Decision(False, "daily_loss_limit_breached")
 
         if proposal.qty <= 0 or proposal.price <= 0:
             return Decision(False, "invalid_qty_or_price")
 
-        positions = self.state.get_positions()
-        existing_position = positions.get(proposal.symbol)
-        additional_notional = self._additional_notional(proposal, existing_position)
+        symbol = proposal.symbol
+        existing_position = snap.positions.get(symbol)
+        additional_notional = self._additional_notional(
+            proposal, existing_position, pending.qty.get(symbol, 0.0)
+        )
 
-        portfolio_notional = self.state.get_portfolio_notional()
+        portfolio_notional = snap.portfolio_notional + pending.notional
         if portfolio_notional + additional_notional > self.cfg.max_notional + 1e-9:
             return Decision(False, "max_portfolio_notional_exceeded")
 
-        open_positions = sum(1 for pos in positions.values() if abs(pos.qty) > 0)
-        if proposal.symbol not in positions and open_positions >= self.cfg.max_positions:
+        open_positions = snap.open_positions + len(pending.new_symbols)
+        known = symbol in snap.positions or symbol in pending.new_symbols
+        if not known and open_positions >= self.cfg.max_positions:
             return Decision(False, "max_positions_exceeded")
 
         existing_symbol_notional = abs(existing_position.notional) if existing_position else 0.0
+        existing_symbol_notional += pending.symbol_notional.get(symbol, 0.0)
         if existing_symbol_notional + additional_notional > self.cfg.max_symbol_notional + 1e-9:
             return Decision(False, "max_symbol_notional_exceeded")
 
         last_age = getattr(self.state, "last_trade_age", None)
         if callable(last_age):
-            age = last_age(proposal.symbol)
+            age = last_age(symbol)
             if age is not None and age < self.cfg.cooldown_sec:
                 return Decision(False, "cooldown_active")
 
@@ -201,7 +292,7 @@ class RiskManager:
             risk_per_share = abs(proposal.price - proposal.est_sl)
             if risk_per_share <= 0:
                 return Decision(False, "invalid_stop_for_risk")
-            risk_budget = self._risk_budget_dollars()
+            risk_budget = self._risk_budget_dollars(snap.account_equity)
             if risk_budget <= 0:
                 return Decision(False, "per_trade_risk_exceeded", max_qty=0.0)
             max_qty = max(risk_budget / risk_per_share, 0.0)
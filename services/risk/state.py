@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 
 @dataclass(slots=True)
@@ -18,6 +19,100 @@ class Position:
     metadata: Optional[dict] = None
 
 
+def _is_open(position: Any) -> bool:
+    return position is not None and abs(getattr(position, "qty", 0.0)) > 0
+
+
+@dataclass(frozen=True, slots=True)
+class RiskSnapshot:
+    """Point-in-time portfolio figures consumed by the risk engine.
+
+    ``version`` changes whenever the underlying state changes; providers that
+    cannot track changes report ``None`` and are rebuilt on every request.
+    """
+
+    version: Optional[int]
+    day_pnl: float
+    portfolio_notional: float
+    account_equity: Optional[float]
+    open_positions: int
+    positions: Mapping[str, Position]
+
+
+def build_snapshot(state: "StateProvider", version: Optional[int] = None) -> RiskSnapshot:
+    """Assemble a snapshot from the provider's getters (O(positions))."""
+
+    positions = state.get_positions()
+    try:
+        equity = state.get_account_equity()
+    except Exception:
+        equity = None
+    return RiskSnapshot(
+        version=version,
+        day_pnl=state.get_day_pnl(),
+        portfolio_notional=state.get_portfolio_notional(),
+        account_equity=equity,
+        open_positions=sum(1 for pos in positions.values() if _is_open(pos)),
+        positions=MappingProxyType(positions),
+    )
+
+
+class PositionBook(Dict[str, Position]):
+    """Position dict that keeps the open-position count current and reports writes."""
+
+    def __init__(
+        self,
+        data: Mapping[str, Position] | Iterable[Tuple[str, Position]] = (),
+        on_change: Optional[Callable[[], None]] = None,
+    ) -> None:
+        super().__init__()
+        self.open_count = 0
+        self._on_change = on_change
+        self.update(data)
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+    def __setitem__(self, key: str, value: Position) -> None:
+        self.open_count += _is_open(value) - _is_open(dict.get(self, key))
+        dict.__setitem__(self, key, value)
+        self._changed()
+
+    def __delitem__(self, key: str) -> None:
+        self.open_count -= _is_open(dict.get(self, key))
+        dict.__delitem__(self, key)
+        self._changed()
+
+    def pop(self, key: str, *default: Any) -> Any:  # type: ignore[override]
+        if key in self:
+            value = dict.pop(self, key)
+            self.open_count -= _is_open(value)
+            self._changed()
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Tuple[str, Position]:
+        key, value = dict.popitem(self)
+        self.open_count -= _is_open(value)
+        self._changed()
+        return key, value
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self.open_count = 0
+        self._changed()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
 class StateProvider:
     """Abstraction over live portfolio state.
 
@@ -36,16 +131,38 @@ class StateProvider:
     def get_account_equity(self) -> Optional[float]:  # pragma: no cover - interface definition
         return None
 
+    def risk_snapshot(self) -> RiskSnapshot:
+        return build_snapshot(self)
+
+
+_VERSIONED_FIELDS = frozenset({"day_pnl", "positions", "portfolio_notional", "account_equity"})
+
 
 @dataclass
 class InMemoryState(StateProvider):
-    """Simple in-memory implementation for tests and local dry-runs."""
+    """Simple in-memory implementation for tests and local dry-runs.
+
+    Assigning any risk-relevant attribute, or writing to ``positions``,
+    bumps ``version`` so cached risk snapshots are rebuilt. Mutating a
+    ``Position`` object in place is not tracked.
+    """
 
     day_pnl: float = 0.0
     positions: Dict[str, Position] = field(default_factory=dict)
     portfolio_notional: float = 0.0
     account_equity: Optional[float] = None
     last_trade_ts_by_symbol: Dict[str, float] = field(default_factory=dict)
+    version: int = field(default=0, compare=False, repr=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "positions" and not isinstance(value, PositionBook):
+            value = PositionBook(value, self._touch)
+        object.__setattr__(self, name, value)
+        if name in _VERSIONED_FIELDS:
+            self._touch()
+
+    def _touch(self) -> None:
+        object.__setattr__(self, "version", self.__dict__.get("version", 0) + 1)
 
     def get_day_pnl(self) -> float:
         return self.day_pnl
@@ -59,6 +176,24 @@ class InMemoryState(StateProvider):
     def get_account_equity(self) -> Optional[float]:
         return self.account_equity
 
+    def risk_snapshot(self) -> RiskSnapshot:
+        cached: Optional[RiskSnapshot] = self.__dict__.get("_snapshot")
+        if cached is not None and cached.version == self.version:
+            return cached
+        book = self.positions
+        snapshot = RiskSnapshot(
+            version=self.version,
+            day_pnl=self.day_pnl,
+            portfolio_notional=self.portfolio_notional,
+            account_equity=self.account_equity,
+            open_positions=book.open_count if isinstance(book, PositionBook) else sum(
+                1 for pos in book.values() if _is_open(pos)
+            ),
+            positions=MappingProxyType(book),
+        )
+        object.__setattr__(self, "_snapshot", snapshot)
+        return snapshot
+
     def mark_trade(self, symbol: str, when: Optional[float] = None) -> None:
         self.last_trade_ts_by_symbol[symbol] = when if when is not None else time.time()
 
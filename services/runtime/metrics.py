@@ -6,6 +6,8 @@ import logging
 import threading
 from typing import Callable, Dict, Tuple
 
+from services.telemetry.registry import CONTENT_TYPE, Counter, Gauge, Registry, get_registry
+
 try:  # pragma: no cover - ImportError path exercised in CI envs without stdlib http.server
     from http.server import BaseHTTPRequestHandler, HTTPServer
 
@@ -17,33 +19,36 @@ StatusFn = Callable[[], Tuple[bool, str]]
 
 
 class Metrics:
-    """Thread-safe metrics container supporting counters and gauges."""
+    """Flat counters and gauges kept in the shared telemetry registry.
+
+    ``render`` returns the whole registry, so the runner's ``/metrics`` also
+    exposes the hot-path histograms recorded elsewhere in the process.
+    """
 
-    def __init__(self) -> None:
-        self._counters: Dict[str, float] = {}
-        self._gauges: Dict[str, float] = {}
-        self._lock = threading.Lock()
+    def __init__(self, registry: Registry | None = None) -> None:
+        self.registry = registry or get_registry()
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
 
     def inc(self, name: str, amount: float = 1.0) -> None:
-        with self._lock:
-            self._counters[name] = self._counters.get(name, 0.0) + amount
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters.setdefault(name, self.registry.counter(name))
+        counter.inc(amount)
 
     def set(self, name: str, value: float) -> None:
-        with self._lock:
-            self._gauges[name] = value
+        gauge = self._gauges.get(name)
+        if gauge is None:
+            gauge = self._gauges.setdefault(name, self.registry.gauge(name))
+        gauge.set(value)
 
     def snapshot(self) -> Tuple[Dict[str, float], Dict[str, float]]:
-        with self._lock:
-            return dict(self._counters), dict(self._gauges)
+        counters = {name: counter.value for name, counter in list(self._counters.items())}
+        gauges = {name: gauge.value for name, gauge in list(self._gauges.items())}
+        return counters, gauges
 
     def render(self) -> str:
-        counters, gauges = self.snapshot()
-        lines = []
-        for key, value in counters.items():
-            lines.append(f"# TYPE {key} counter\n{key} {value}")
-        for key, value in gauges.items():
-            lines.append(f"# TYPE {key} gauge\n{key} {value}")
-        return "\n".join(lines) + "\n"
+        return self.registry.render()
 
 
 class MetricsServer:
@@ -85,17 +90,17 @@ class MetricsServer:
         class Handler(BaseHTTPRequestHandler):  # pragma: no cover - exercised in integration
             protocol_version = "HTTP/1.1"
 
-            def _write(self, code: int, body: str) -> None:
+            def _write(self, code: int, body: str, content_type: str = "text/plain") -> None:
                 payload = body.encode()
                 self.send_response(code)
-                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Type", content_type)
                 self.send_header("Content-Length", str(len(payload)))
                 self.end_headers()
                 self.wfile.write(payload)
 
             def do_GET(self) -> None:  # type: ignore[override]
                 if self.path == "/metrics":
-                    self._write(200, server_ref.metrics.render())
+                    self._write(200, server_ref.metrics.render(), CONTENT_TYPE)
                     return
                 if self.path == "/healthz":
                     ok, message = server_ref.health_cb()
@@ -20,9 +20,12 @@ from backend.services.orchestrator import (
     drain_preopen_queue,
     set_preopen_window_active,
 )
+from core.runtime_config import reload_config
 from core.runtime_flags import get_runtime_flags
 from services.execution.engine import ExecutionEngine
+from services.execution.idempotency import get_idempotency_index
 from services.execution.option_exit_watcher import OptionExitWatcher
+from services.execution.updates import get_update_bus
 from services.execution.types import ExecIntent
 from services.gateway.options import OptionGateway
 from services.market.loop import MarketLoop
@@ -30,6 +33,8 @@ from services.risk.engine import RiskManager
 from services.risk.state import InMemoryState
 from services.runtime.logging import setup_logging, with_trace
 from services.runtime.metrics import Metrics, MetricsServer
+from services.runtime.tracing import get_tracer, mark
+from services.sentiment.history import SentimentHistory
 from services.sentiment.poller import Poller
 from services.sentiment.store import SentiStore
 from services.strategy.engine import StrategyEngine
@@ -69,6 +74,7 @@ class MockMarketLoop:
         self.iterations = int(os.getenv("MOCK_ITERATIONS", "20"))
         self.interval = float(os.getenv("MOCK_BAR_INTERVAL", "0.2"))
         self._rng = random.Random(42)
+        self._tracer = get_tracer()
 
     async def run(self) -> None:
         self.log.info(
@@ -84,6 +90,7 @@ class MockMarketLoop:
                 close = max(0.01, base + delta)
                 high = max(base, close) + abs(self._rng.uniform(0, 0.2))
                 low = min(base, close) - abs(self._rng.uniform(0, 0.2))
+                trace = self._tracer.start("bar", symbol=symbol)
                 bar = StrategyBar(
                     ts=ts,
                     open=base,
@@ -91,8 +98,12 @@ class MockMarketLoop:
                     low=low,
                     close=close,
                     volume=float(100 + iteration),
+                    trace=trace,
                 )
-                await self._on_bar(symbol, bar)
+                try:
+                    await self._on_bar(symbol, bar)
+                finally:
+                    self._tracer.finish(trace)
                 prices[symbol] = close
                 if self._metrics:
                     with suppress(AttributeError):
@@ -128,10 +139,20 @@ class Runner:
         self.ready_timeout = int(os.getenv("READY_CHECK_TIMEOUT_SEC", "5"))
         self.state = InMemoryState()
         self.risk = RiskManager(self.state)
-        self.exec = ExecutionEngine(risk=self.risk, state=self.state)
+        self.exec = ExecutionEngine(
+            risk=self.risk,
+            state=self.state,
+            updates=get_update_bus(),
+            intents=get_idempotency_index(),
+        )
         self.opt_gateway = OptionGateway(exec_engine=self.exec, risk_manager=self.risk)
         self.strategy = StrategyEngine(self.exec, self.opt_gateway, self.state)
-        self.senti_store = SentiStore()
+        self.senti_history = SentimentHistory(
+            os.getenv("SENTI_HISTORY_PATH", "runtime/sentiment_history.ndjson"),
+            snapshot_sec=float(os.getenv("SENTI_SNAPSHOT_SEC", "300") or 300),
+            retention_sec=float(os.getenv("SENTI_HISTORY_RETENTION_HRS", "72") or 72) * 3600,
+        )
+        self.senti_store = SentiStore(history=self.senti_history)
         self.poller: Optional[Poller] = None
         self.market_loop: Optional[MarketLoop] = None
         self.symbols: Sequence[str] = ()
@@ -158,6 +179,7 @@ class Runner:
                 tp_pct=self.opt_tp_pct,
                 sl_pct=self.opt_sl_pct,
                 cache_ttl=max(self.option_exit_poll, 30.0),
+                updates=self.exec.updates,
             )
 
     # ------------------------------------------------------------------
@@ -219,8 +241,9 @@ class Runner:
         mode = os.getenv("TRADING_MODE", "paper").strip().lower()
         if mode not in {"paper", "live"}:
             raise SystemExit("TRADING_MODE must be paper or live")
-        if mode == "paper":
-            os.environ.setdefault("ALPACA_PAPER", "true")
+        if mode == "paper" and "ALPACA_PAPER" not in os.environ:
+            os.environ["ALPACA_PAPER"] = "true"
+            reload_config()
         else:
             confirm = os.getenv("LIVE_CONFIRM")
             if confirm != "I_UNDERSTAND":
@@ -246,8 +269,16 @@ class Runner:
                 extra=with_trace(),
             )
             return None
+        from services.sentiment.seen import SeenIndex
+
         fetcher = AlpacaNewsFetcher(key, secret)
-        return Poller(store=self.senti_store, symbols=self.symbols, fetcher=fetcher)
+        lookback_hours = int(os.getenv("SENTI_NEWS_LOOKBACK_HRS", "6"))
+        ttl_hours = float(os.getenv("SENTI_SEEN_TTL_HRS", str(max(24, 2 * lookback_hours))))
+        seen = SeenIndex(
+            path=os.getenv("SENTI_SEEN_PATH", "runtime/sentiment_seen.json"),
+            ttl_sec=ttl_hours * 3600,
+        )
+        return Poller(store=self.senti_store, symbols=self.symbols, fetcher=fetcher, seen=seen)
 
     async def _sentiment_task(self) -> None:
         if not self.poller:
@@ -257,6 +288,7 @@ class Runner:
         while not self.shutdown.is_set():
             try:
                 result = self.poller.run_once()
+                self.senti_history.maybe_snapshot()
                 self.metrics.inc("sentiment_ticks")
                 self.metrics.set("sentiment_symbols", float(len(result)))
             except asyncio.CancelledError:
@@ -276,6 +308,7 @@ class Runner:
     async def _handle_bar(self, symbol: str, bar: StrategyBar) -> None:
         score, count, _velocity = self.senti_store.get(symbol)
         sentiment_value = score if count else None
+        mark(bar.trace, "sentiment")
         try:
             await self.strategy.on_bar(symbol, bar, sentiment_value)
             self.metrics.inc("strategy_bars")
@@ -488,6 +521,10 @@ class Runner:
                     logger=logging.getLogger("gigatrader.market"),
                 )
         self.poller = self._build_poller()
+        if self.poller:
+            self.senti_history.restore()
+            warmed = self.senti_store.warm_start()
+            self.log.info("sentiment.warm_start", extra=with_trace({"points": warmed}))
         self.ms.start()
         self._install_signals()
         self.log.info(
@@ -518,6 +555,8 @@ class Runner:
                 task.cancel()
             with suppress(Exception):
                 await asyncio.gather(*self._tasks, return_exceptions=True)
+            if self.poller:
+                self.senti_history.save()
             self.ms.stop()
             self.log.info("runner.stop", extra=with_trace())
 
@@ -0,0 +1,217 @@
+"""Lightweight span tracing for the bar → signal → risk → order pipeline.
+
+A :class:`Trace` rides along on the strategy ``Bar`` and the resulting
+``ExecIntent``; each stage boundary records a monotonic timestamp with
+:func:`mark`. When the trace finishes, the time between consecutive marks is
+observed into the ``gigatrader_pipeline_stage_seconds`` histogram and a
+sample of whole traces is kept in a ring buffer that can be dumped as JSON or
+in the Chrome trace-event format (``chrome://tracing`` / Perfetto).
+
+Tracing is off unless ``PIPELINE_TRACE_ENABLED`` is set. Disabled,
+:meth:`Tracer.start` returns ``None`` and :func:`mark` is a single ``is None``
+check, so instrumented call sites cost next to nothing.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from services.telemetry.registry import REGISTRY
+
+DEFAULT_SAMPLE_RATE = 0.01
+DEFAULT_BUFFER = 256
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "gigatrader_pipeline_stage_seconds",
+    "Time spent between consecutive pipeline stage marks of a traced bar.",
+    ("stage",),
+)
+TRACE_SECONDS = REGISTRY.histogram(
+    "gigatrader_pipeline_trace_seconds",
+    "End-to-end duration of a traced bar, from arrival to the last stage.",
+    ("name",),
+)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class Trace:
+    """Monotonic stage timestamps for one event moving through the pipeline."""
+
+    __slots__ = ("trace_id", "name", "attrs", "started_ns", "wall_start", "marks", "finished")
+
+    def __init__(self, trace_id: int, name: str, attrs: Dict[str, Any]) -> None:
+        self.trace_id = trace_id
+        self.name = name
+        self.attrs = attrs
+        self.started_ns = time.perf_counter_ns()
+        self.wall_start = time.time()
+        self.marks: List[Tuple[str, int]] = []
+        self.finished = False
+
+    def mark(self, stage: str) -> None:
+        self.marks.append((stage, time.perf_counter_ns()))
+
+    def stages(self) -> List[Tuple[str, float]]:
+        """``(stage, seconds since the previous mark)`` in recorded order."""
+
+        out: List[Tuple[str, float]] = []
+        previous = self.started_ns
+        for stage, at in self.marks:
+            out.append((stage, (at - previous) / 1e9))
+            previous = at
+        return out
+
+    @property
+    def duration(self) -> float:
+        end = self.marks[-1][1] if self.marks else self.started_ns
+        return (end - self.started_ns) / 1e9
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "attrs": dict(self.attrs),
+            "start": self.wall_start,
+            "duration_ms": self.duration * 1000.0,
+            "stages": [
+                {"stage": stage, "ms": seconds * 1000.0} for stage, seconds in self.stages()
+            ],
+        }
+
+
+def mark(trace: Optional[Trace], stage: str) -> None:
+    """Record ``stage`` on ``trace`` if the event is being traced."""
+
+    if trace is not None:
+        trace.mark(stage)
+
+
+class Tracer:
+    """Starts traces, aggregates stage latency and keeps sampled dumps."""
+
+    def __init__(
+        self,
+        *,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None,
+        capacity: Optional[int] = None,
+    ) -> None:
+        self.enabled = (
+            enabled if enabled is not None else _env_bool("PIPELINE_TRACE_ENABLED", False)
+        )
+        self.sample_rate = (
+            sample_rate
+            if sample_rate is not None
+            else _env_float("PIPELINE_TRACE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)
+        )
+        size = (
+            capacity
+            if capacity is not None
+            else _env_float("PIPELINE_TRACE_BUFFER", DEFAULT_BUFFER)
+        )
+        self._samples: Deque[Trace] = deque(maxlen=max(1, int(size)))
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._random = random.random
+
+    def start(self, name: str, **attrs: Any) -> Optional[Trace]:
+        if not self.enabled:
+            return None
+        return Trace(next(self._ids), name, attrs)
+
+    def finish(self, trace: Optional[Trace]) -> None:
+        if trace is None or trace.finished:
+            return
+        trace.finished = True
+        for stage, seconds in trace.stages():
+            STAGE_SECONDS.labels(stage=stage).observe(seconds)
+        TRACE_SECONDS.labels(name=trace.name).observe(trace.duration)
+        if self._random() < self.sample_rate:
+            with self._lock:
+                self._samples.append(trace)
+
+    def samples(self) -> List[Trace]:
+        with self._lock:
+            return list(self._samples)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def dump(self) -> List[Dict[str, Any]]:
+        return [trace.as_dict() for trace in self.samples()]
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Sampled traces as Chrome trace events, one row per trace."""
+
+        events: List[Dict[str, Any]] = []
+        pid = os.getpid()
+        for trace in self.samples():
+            base_us = trace.wall_start * 1e6
+            args = {"trace_id": trace.trace_id, **trace.attrs}
+            events.append(
+                {
+                    "name": trace.name,
+                    "cat": "pipeline",
+                    "ph": "X",
+                    "ts": base_us,
+                    "dur": trace.duration * 1e6,
+                    "pid": pid,
+                    "tid": trace.trace_id,
+                    "args": args,
+                }
+            )
+            previous = trace.started_ns
+            for stage, at in trace.marks:
+                events.append(
+                    {
+                        "name": stage,
+                        "cat": "pipeline.stage",
+                        "ph": "X",
+                        "ts": base_us + (previous - trace.started_ns) / 1e3,
+                        "dur": (at - previous) / 1e3,
+                        "pid": pid,
+                        "tid": trace.trace_id,
+                        "args": args,
+                    }
+                )
+                previous = at
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_TRACER: Optional[Tracer] = None
+_TRACER_LOCK = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer configured from the environment."""
+
+    global _TRACER
+    if _TRACER is not None:
+        return _TRACER
+    with _TRACER_LOCK:
+        if _TRACER is None:
+            _TRACER = Tracer()
+        return _TRACER
+
+
+__all__ = ["Trace", "Tracer", "get_tracer", "mark"]
@@ -7,6 +7,7 @@ __all__ = [
     "hf_model",
     "onnx_model",
     "store",
+    "seen",
     "poller",
     "fetchers",
     "api",
@@ -0,0 +1,237 @@
+"""Batched sentiment inference engine shared by the ONNX and HF backends."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Protocol, Sequence, Tuple
+
+log = logging.getLogger("gigatrader.sentiment")
+
+Probs = Dict[str, float]
+
+
+def env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and case so trivially different headlines share a cache slot."""
+    return " ".join(text.split()).lower()
+
+
+def text_key(text: str) -> str:
+    return hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class Backend(Protocol):
+    name: str
+
+    def run(self, texts: Sequence[str]) -> List[Probs]: ...
+
+
+class CallableBackend:
+    """Adapt a per-text scoring function (e.g. a heuristic fallback) to the batch protocol."""
+
+    def __init__(self, fn: Callable[[str], Probs], name: str = "callable") -> None:
+        self._fn = fn
+        self.name = name
+
+    def run(self, texts: Sequence[str]) -> List[Probs]:
+        return [self._fn(text) for text in texts]
+
+
+class TextCache:
+    """Bounded LRU of inference results keyed by normalized-text hash."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = max(0, int(maxsize))
+        self._data: "OrderedDict[str, Probs]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Probs]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Probs) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+@dataclass(slots=True)
+class InferenceStats:
+    requests: int = 0
+    cache_hits: int = 0
+    batches: int = 0
+    batched_items: int = 0
+    busy_sec: float = 0.0
+
+    def snapshot(self, latencies_ms: Sequence[float]) -> Dict[str, float]:
+        ordered = sorted(latencies_ms)
+
+        def pct(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return float(ordered[min(len(ordered) - 1, int(p * (len(ordered) - 1) + 0.5))])
+
+        return {
+            "requests": float(self.requests),
+            "cache_hits": float(self.cache_hits),
+            "cache_hit_rate": self.cache_hits / self.requests if self.requests else 0.0,
+            "batches": float(self.batches),
+            "avg_batch_size": self.batched_items / self.batches if self.batches else 0.0,
+            "throughput_per_sec": self.batched_items / self.busy_sec if self.busy_sec else 0.0,
+            "batch_latency_p50_ms": pct(0.50),
+            "batch_latency_p95_ms": pct(0.95),
+        }
+
+
+class InferenceEngine:
+    """Score texts in dynamically sized batches with memoization.
+
+    ``score_many`` runs synchronously and splits its input into chunks of at
+    most ``max_batch``. ``submit`` enqueues a single text; a worker thread
+    drains the queue whenever ``max_batch`` texts are pending or the oldest has
+    waited ``max_wait_ms``, so concurrent callers share one backend call.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        *,
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        cache_size: Optional[int] = None,
+    ) -> None:
+        self.backend = backend
+        self.max_batch = max(1, max_batch or env_int("SENTI_BATCH_MAX", 32))
+        wait_ms = max_wait_ms if max_wait_ms is not None else env_int("SENTI_BATCH_WAIT_MS", 20)
+        self.max_wait = max(0.0, float(wait_ms)) / 1000.0
+        size = cache_size if cache_size is not None else env_int("SENTI_CACHE_SIZE", 4096)
+        self.cache = TextCache(size)
+        self.stats = InferenceStats()
+        self._latencies: Deque[float] = deque(maxlen=1024)
+        self._run_lock = threading.Lock()
+        self._pending: Deque[Tuple[str, Future]] = deque()
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Synchronous batch path
+    # ------------------------------------------------------------------
+    def score_many(self, texts: Sequence[str]) -> List[Probs]:
+        keys = [text_key(text) for text in texts]
+        results: List[Optional[Probs]] = [None] * len(texts)
+        misses: Dict[str, str] = {}
+        for idx, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[idx] = cached
+            elif key not in misses:
+                misses[key] = texts[idx]
+        self.stats.requests += len(texts)
+        # In-call duplicates are served without inference, so they count as hits.
+        self.stats.cache_hits += len(texts) - len(misses)
+
+        if misses:
+            computed = self._run(list(misses.values()))
+            for key, probs in zip(misses, computed, strict=True):
+                self.cache.put(key, probs)
+            by_key = dict(zip(misses, computed, strict=True))
+            for idx, key in enumerate(keys):
+                if results[idx] is None:
+                    results[idx] = by_key[key]
+        return [dict(value or {}) for value in results]
+
+    def score(self, text: str) -> Probs:
+        return self.score_many([text])[0]
+
+    def _run(self, texts: List[str]) -> List[Probs]:
+        # Length-sorted chunks keep per-batch padding close to the real token counts.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        by_index: Dict[int, Probs] = {}
+        for start in range(0, len(order), self.max_batch):
+            chunk = order[start : start + self.max_batch]
+            began = time.perf_counter()
+            with self._run_lock:
+                probs = self.backend.run([texts[i] for i in chunk])
+            elapsed = time.perf_counter() - began
+            self.stats.batches += 1
+            self.stats.batched_items += len(chunk)
+            self.stats.busy_sec += elapsed
+            self._latencies.append(elapsed * 1000.0)
+            by_index.update(zip(chunk, probs, strict=True))
+        return [by_index[i] for i in range(len(texts))]
+
+    # ------------------------------------------------------------------
+    # Asynchronous micro-batching path
+    # ------------------------------------------------------------------
+    def submit(self, text: str) -> "Future[Probs]":
+        future: "Future[Probs]" = Future()
+        cached = self.cache.get(text_key(text))
+        if cached is not None:
+            self.stats.requests += 1
+            self.stats.cache_hits += 1
+            future.set_result(cached)
+            return future
+        with self._cond:
+            self._pending.append((text, future))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain, name="senti-infer", daemon=True
+                )
+                self._worker.start()
+            self._cond.notify()
+        return future
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait(timeout=1.0)
+                    if not self._pending:
+                        self._worker = None
+                        return
+                deadline = time.monotonic() + self.max_wait
+                while len(self._pending) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                size = min(self.max_batch, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(size)]
+            try:
+                results = self.score_many([text for text, _ in batch])
+            except Exception as exc:  # pragma: no cover - backend failure
+                log.warning("sentiment.infer_failed", extra={"error": str(exc), "size": len(batch)})
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            for (_, future), probs in zip(batch, results, strict=True):
+                future.set_result(probs)
+
+    def snapshot(self) -> Dict[str, float]:
+        data = self.stats.snapshot(list(self._latencies))
+        data["cache_size"] = float(len(self.cache))
+        data["backend"] = self.backend.name  # type: ignore[assignment]
+        return data
@@ -8,13 +8,14 @@ class AlpacaNewsFetcher:
     Robust to version differences in NewsClient/NewsRequest signatures.
     """
 
-    def __init__(self):
-        self.api_key = os.environ.get("ALPACA_API_KEY_ID")
-        self.api_secret = os.environ.get("ALPACA_API_SECRET_KEY")
+    def __init__(self, api_key=None, secret=None):
+        self.api_key = api_key or os.environ.get("ALPACA_API_KEY_ID")
+        self.api_secret = secret or os.environ.get("ALPACA_API_SECRET_KEY")
         if not self.api_key or not self.api_secret:
             raise RuntimeError("Missing ALPACA_API_KEY_ID/ALPACA_API_SECRET_KEY")
         self.NewsClient = None
         self.NewsRequest = None
+        self._client = None
         self._import_news_client()
 
     def _import_news_client(self):
@@ -73,10 +74,18 @@ class AlpacaNewsFetcher:
         except Exception as e:
             raise RuntimeError(f"Could not build NewsRequest for symbol={symbol}: {e}")
 
-    def fetch_headlines(self, symbol: str, hours_back: int = 24, limit: int = 50):
-        start = datetime.now(timezone.utc) - timedelta(hours=hours_back)
+    def fetch_headlines(self, symbol: str, hours_back: int = 24, limit: int = 50, since=None):
+        """
+        Fetch headlines for ``symbol`` published in the last ``hours_back`` hours.
+        ``since`` (aware datetime) narrows the window for incremental polling.
+        """
         end = datetime.now(timezone.utc)
-        client = self._make_client()
+        start = end - timedelta(hours=hours_back)
+        if since is not None and since > start:
+            start = since
+        if self._client is None:
+            self._client = self._make_client()
+        client = self._client
         req = self._build_request(symbol, start, end, limit)
         res = client.get_news(req)
 
@@ -2,44 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Dict
+import threading
+from typing import Dict, List, Sequence
 
+from services.sentiment.engine import InferenceEngine, env_int
 from services.sentiment.types import NewsItem, ScoredItem
 
-_tokenizer = None
-_pipeline = None
+_engines: Dict[str, InferenceEngine] = {}
+_engines_lock = threading.Lock()
 
 
-def _load(model_name: str) -> None:
-    """Load the HF model on first use."""
-    global _tokenizer, _pipeline
-    if _pipeline is not None:
-        return
-    from transformers import (
-        AutoModelForSequenceClassification,
-        AutoTokenizer,
-        TextClassificationPipeline,
-    )
+class HFBackend:
+    """HuggingFace text-classification pipeline run over whole batches."""
 
-    _tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForSequenceClassification.from_pretrained(model_name)
-    _pipeline = TextClassificationPipeline(
-        model=model,
-        tokenizer=_tokenizer,
-        return_all_scores=True,
-        truncation=True,
-    )
+    def __init__(self, model_name: str, batch_size: int | None = None) -> None:
+        from transformers import (
+            AutoModelForSequenceClassification,
+            AutoTokenizer,
+            TextClassificationPipeline,
+        )
 
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self.name = f"hf:{model_name}"
+        self._batch_size = batch_size or env_int("SENTI_BATCH_MAX", 32)
+        self._pipeline = TextClassificationPipeline(
+            model=model,
+            tokenizer=tokenizer,
+            return_all_scores=True,
+            truncation=True,
+        )
 
-def infer(item: NewsItem, model_name: str) -> ScoredItem:
-    """Infer sentiment for a news item using HuggingFace FinBERT."""
-    _load(model_name)
-    assert _pipeline is not None
-    text = f"{item.title} {item.summary or ''}".strip()
-    scores = _pipeline(text)[0]
-    score_map: Dict[str, float] = {
-        entry["label"].lower(): float(entry["score"]) for entry in scores
-    }
+    def run(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        outputs = self._pipeline(list(texts), batch_size=self._batch_size, padding=True)
+        return [
+            {entry["label"].lower(): float(entry["score"]) for entry in scores}
+            for scores in outputs
+        ]
+
+
+def get_engine(model_name: str) -> InferenceEngine:
+    """Return the shared batching engine for ``model_name``, loading it on first use."""
+    with _engines_lock:
+        engine = _engines.get(model_name)
+        if engine is None:
+            engine = InferenceEngine(HFBackend(model_name))
+            _engines[model_name] = engine
+        return engine
+
+
+def _text(item: NewsItem) -> str:
+    return f"{item.title} {item.summary or ''}".strip()
+
+
+def _scored(item: NewsItem, score_map: Dict[str, float], model_name: str) -> ScoredItem:
     value = score_map.get("positive", 0.0) - score_map.get("negative", 0.0)
     if value > 0.1:
         label = "pos"
@@ -52,5 +68,19 @@ def infer(item: NewsItem, model_name: str) -> ScoredItem:
         label=label,
         score=float(value),
         model=f"hf:{model_name}",
-        features=score_map,
+        features=dict(score_map),
     )
+
+
+def infer(item: NewsItem, model_name: str) -> ScoredItem:
+    """Infer sentiment for a news item using HuggingFace FinBERT."""
+    return _scored(item, get_engine(model_name).score(_text(item)), model_name)
+
+
+def infer_batch(items: Sequence[NewsItem], model_name: str) -> List[ScoredItem]:
+    """Infer sentiment for many news items in batched pipeline calls."""
+    results = get_engine(model_name).score_many([_text(item) for item in items])
+    return [
+        _scored(item, score_map, model_name)
+        for item, score_map in zip(items, results, strict=True)
+    ]
@@ -0,0 +1,239 @@
+"""Append-only, time-indexed sentiment history per symbol."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+log = logging.getLogger("gigatrader.sentiment")
+
+# Records without a timestamp (static backtest fixtures) are in effect for
+# every as-of query.
+ALWAYS = float("-inf")
+
+
+@dataclass(slots=True)
+class SentimentSeries:
+    """Columnar (ts, score) arrays for one symbol, sorted by timestamp."""
+
+    ts: array = field(default_factory=lambda: array("d"))
+    score: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def append(self, ts: float, score: float) -> None:
+        if not self.ts or ts >= self.ts[-1]:
+            self.ts.append(ts)
+            self.score.append(score)
+            return
+        # Late arrival: keep the columns sorted.
+        idx = bisect_right(self.ts, ts)
+        self.ts.insert(idx, ts)
+        self.score.insert(idx, score)
+
+    def span(self, start: float, end: float) -> Tuple[int, int]:
+        """Index range of points with ``start < ts <= end``."""
+        return bisect_right(self.ts, start), bisect_right(self.ts, end)
+
+    def trim_before(self, cutoff: float) -> int:
+        idx = bisect_left(self.ts, cutoff)
+        if idx:
+            del self.ts[:idx]
+            del self.score[:idx]
+        return idx
+
+
+@dataclass(slots=True)
+class RollingSentiment:
+    mean: float
+    count: int
+    last: float
+    velocity: float
+
+
+class SentimentHistory:
+    """Point-in-time sentiment series shared by live scoring and backtests.
+
+    Reads never mutate state: ``as_of`` is a binary search over the
+    timestamp column and ``rolling`` aggregates a window on demand. When a
+    ``path`` is configured, ``maybe_snapshot`` writes the columns to disk at
+    most every ``snapshot_sec`` seconds and ``restore`` reads them back.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        snapshot_sec: float = 300.0,
+        retention_sec: Optional[float] = None,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.snapshot_sec = float(snapshot_sec)
+        self.retention_sec = retention_sec
+        self._series: Dict[str, SentimentSeries] = {}
+        self._lock = threading.Lock()
+        self._last_snapshot = 0.0
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def append(self, symbol: str, ts: float, score: float) -> None:
+        with self._lock:
+            series = self._series.get(symbol)
+            if series is None:
+                series = self._series[symbol] = SentimentSeries()
+            series.append(float(ts), float(score))
+            self._dirty = True
+
+    def extend(self, rows: Iterable[Tuple[str, float, float]]) -> None:
+        for symbol, ts, score in rows:
+            self.append(symbol, ts, score)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def symbols(self) -> List[str]:
+        return sorted(self._series)
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in self._series.values())
+
+    def as_of(self, symbol: str, ts: float, default: Optional[float] = None) -> Optional[float]:
+        """Latest score recorded at or before ``ts``."""
+        series = self._series.get(symbol)
+        if series is None:
+            return default
+        idx = bisect_right(series.ts, ts)
+        if idx == 0:
+            return default
+        return series.score[idx - 1]
+
+    def points(self, symbol: str, start: float, end: float) -> List[Tuple[float, float]]:
+        series = self._series.get(symbol)
+        if series is None:
+            return []
+        lo, hi = series.span(start, end)
+        return list(zip(series.ts[lo:hi], series.score[lo:hi], strict=True))
+
+    def rolling(self, symbol: str, now: float, window_sec: float) -> RollingSentiment:
+        """Mean/count/last over ``(now - window_sec, now]``; velocity is ``last - mean``."""
+        series = self._series.get(symbol)
+        if series is None:
+            return RollingSentiment(0.0, 0, 0.0, 0.0)
+        lo, hi = series.span(now - window_sec, now)
+        count = hi - lo
+        if count == 0:
+            return RollingSentiment(0.0, 0, 0.0, 0.0)
+        total = math.fsum(series.score[lo:hi])
+        mean = total / count
+        last = series.score[hi - 1]
+        return RollingSentiment(mean, count, last, last - mean)
+
+    def replay(
+        self, symbols: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[float, str, float]]:
+        """Yield ``(ts, symbol, score)`` across symbols in timestamp order."""
+        wanted = list(symbols) if symbols is not None else self.symbols()
+        streams = [
+            zip(series.ts, repeat(symbol), series.score)
+            for symbol in wanted
+            if (series := self._series.get(symbol)) is not None
+        ]
+        return heapq.merge(*streams)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def maybe_snapshot(self, now: Optional[float] = None) -> bool:
+        now = now or time.time()
+        if self.path is None or not self._dirty or now - self._last_snapshot < self.snapshot_sec:
+            return False
+        if self.retention_sec is not None:
+            with self._lock:
+                for series in self._series.values():
+                    series.trim_before(now - self.retention_sec)
+        self.save()
+        self._last_snapshot = now
+        return True
+
+    def save(self, path: str | Path | None = None) -> None:
+        target = Path(path) if path else self.path
+        if target is None:
+            return
+        with self._lock:
+            rows = [
+                {"symbol": symbol, "ts": list(series.ts), "score": list(series.score)}
+                for symbol, series in sorted(self._series.items())
+            ]
+            self._dirty = False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                for row in rows:
+                    handle.write(json.dumps(row) + "\n")
+            os.replace(tmp_name, target)
+        except OSError as exc:
+            log.warning(
+                "sentiment.history.save_failed", extra={"path": str(target), "error": str(exc)}
+            )
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    def restore(self) -> "SentimentHistory":
+        """Load the snapshot at ``path`` (if any) into this history."""
+        if self.path is not None:
+            _read_ndjson(self, self.path)
+            self._dirty = False
+        return self
+
+
+def load_ndjson(path: str | Path) -> SentimentHistory:
+    """Read a snapshot or a plain ``{"symbol", "score"[, "ts"]}`` NDJSON file.
+
+    The returned history has no snapshot path, so it is read-only on disk.
+    """
+    history = SentimentHistory()
+    _read_ndjson(history, Path(path))
+    return history
+
+
+def _read_ndjson(history: SentimentHistory, source: Path) -> None:
+    # Column rows ("ts"/"score" lists) come from ``save``; per-item rows
+    # without "ts" are treated as always in effect. Missing files are empty.
+    try:
+        handle = source.open("r", encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            symbol = str(obj.get("symbol", "")).upper()
+            if not symbol:
+                continue
+            ts_raw = obj.get("ts")
+            score_raw = obj.get("score", 0.0)
+            if isinstance(ts_raw, list) and isinstance(score_raw, list):
+                for ts, score in zip(ts_raw, score_raw, strict=False):
+                    history.append(symbol, float(ts), float(score))
+            else:
+                ts = float(ts_raw) if ts_raw is not None else ALWAYS
+                history.append(symbol, ts, float(score_raw))
@@ -3,30 +3,84 @@
 from __future__ import annotations
 
 import math
-from typing import Dict
+import threading
+from typing import Dict, List, Optional, Sequence
 
 try:  # pragma: no cover - optional heavy dependency
     import numpy as np
 except ModuleNotFoundError:  # pragma: no cover - lightweight fallback
     np = None  # type: ignore[assignment]
 
-_tokenizer = None
-_session = None
-
+from services.sentiment.engine import CallableBackend, InferenceEngine, env_int
+
+_engines: Dict[str, InferenceEngine] = {}
+_engines_lock = threading.Lock()
+
+
+class OnnxBackend:
+    """FinBERT ONNX session run over padded batches."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+    ) -> None:
+        try:
+            import onnxruntime as ort  # type: ignore
+            from transformers import AutoTokenizer  # type: ignore
+        except ModuleNotFoundError as exc:  # pragma: no cover - optional dep guard
+            raise RuntimeError("onnx runtime dependencies are unavailable") from exc
+
+        options = ort.SessionOptions()
+        intra = intra_op_threads
+        if intra is None:
+            intra = env_int("SENTI_ONNX_INTRA_THREADS", 0)
+        inter = inter_op_threads
+        if inter is None:
+            inter = env_int("SENTI_ONNX_INTER_THREADS", 0)
+        if intra > 0:
+            options.intra_op_num_threads = intra
+        if inter > 0:
+            options.inter_op_num_threads = inter
+        self.name = f"onnx:{path}"
+        self._tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
+        self._session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self._input_names = {inp.name for inp in self._session.get_inputs()}
+
+    def run(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        # Pad to the longest text in this batch only, not the model maximum.
+        tokens = self._tokenizer(
+            list(texts), return_tensors="np", truncation=True, padding="longest"
+        )
+        inputs = {key: value for key, value in tokens.items() if key in self._input_names}
+        logits = self._session.run(None, inputs)[0]
+        return [_to_probs(_softmax(row)) for row in logits]
+
+
+def _to_probs(probs) -> Dict[str, float]:
+    return {
+        "negative": float(probs[0]),
+        "neutral": float(probs[1]),
+        "positive": float(probs[2]),
+    }
 
-def _load(path: str) -> None:
-    """Load the ONNX session on first use."""
-    global _tokenizer, _session
-    if _session is not None:
-        return
-    try:
-        import onnxruntime as ort  # type: ignore
-        from transformers import AutoTokenizer  # type: ignore
-    except ModuleNotFoundError as exc:  # pragma: no cover - optional dep guard
-        raise RuntimeError("onnx runtime dependencies are unavailable") from exc
 
-    _tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
-    _session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+def get_engine(path: str) -> InferenceEngine:
+    """Return the shared batching engine for ``path`` (heuristic if ONNX is unavailable)."""
+    with _engines_lock:
+        engine = _engines.get(path)
+        if engine is None:
+            try:
+                if np is None:
+                    raise RuntimeError("numpy unavailable")
+                backend = OnnxBackend(path)
+            except RuntimeError:
+                backend = CallableBackend(_fallback_scores, name="onnx-fallback")
+            engine = InferenceEngine(backend)
+            _engines[path] = engine
+        return engine
 
 
 def _softmax(values):  # type: ignore[override]
@@ -65,21 +119,9 @@ def _fallback_scores(text: str) -> Dict[str, float]:
 
 def infer(text: str, path: str) -> Dict[str, float]:
     """Infer sentiment probabilities using an ONNX model."""
-    try:
-        _load(path)
-    except RuntimeError:
-        return _fallback_scores(text)
-
-    if np is None:
-        return _fallback_scores(text)
-
-    assert _tokenizer is not None and _session is not None
-    tokens = _tokenizer(text, return_tensors="np", truncation=True)
-    inputs = {key: value for key, value in tokens.items()}
-    logits = _session.run(None, inputs)[0][0]
-    probs = _softmax(logits)
-    return {
-        "negative": float(probs[0]),
-        "neutral": float(probs[1]),
-        "positive": float(probs[2]),
-    }
+    return get_engine(path).score(text)
+
+
+def infer_batch(texts: Sequence[str], path: str) -> List[Dict[str, float]]:
+    """Infer sentiment probabilities for many texts in batched session runs."""
+    return get_engine(path).score_many(texts)
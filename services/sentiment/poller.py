@@ -1,71 +1,158 @@
 """Sentiment poller that fetches Alpaca news headlines and scores them."""
 from __future__ import annotations
 
+import hashlib
+import inspect
 import logging
 import os
 import threading
 import time
-from typing import Dict, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from services.sentiment.fetchers import AlpacaNewsFetcher
-from services.sentiment.rule_model import infer as rule_infer
+from services.sentiment.rule_model import infer_batch as rule_infer_batch
+from services.sentiment.seen import SeenIndex
 from services.sentiment.store import SentiStore
 from services.sentiment.types import NewsItem, ScoredItem
 
+BatchScorer = Callable[[Sequence[NewsItem]], List[ScoredItem]]
+
+# Re-fetch a little before the watermark so items published with a lagging
+# ``updated_at`` are not missed; the seen index absorbs the overlap.
+_WATERMARK_OVERLAP_SEC = 60.0
+
+
+def _parse_ts(raw: Any) -> Optional[float]:
+    if isinstance(raw, datetime):
+        dt = raw
+    elif raw:
+        try:
+            dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
 
 class Poller:
-    """Fetch Alpaca headlines for configured symbols and score them."""
+    """Fetch Alpaca headlines for configured symbols and score them.
+
+    Each poll only scores headlines that are absent from ``seen``; fetches are
+    narrowed to the per-symbol watermark and run concurrently across symbols,
+    and all new headlines are scored in a single ``scorer`` batch.
+    """
 
     def __init__(
         self,
         store: SentiStore,
         symbols: Sequence[str],
         fetcher: Optional[AlpacaNewsFetcher] = None,
+        *,
+        seen: Optional[SeenIndex] = None,
+        scorer: BatchScorer = rule_infer_batch,
+        max_workers: Optional[int] = None,
     ) -> None:
         self.store = store
         self.symbols = list(symbols)
         self.interval = int(os.getenv("SENTI_POLL_SEC", "300"))
         self.lookback_hours = int(os.getenv("SENTI_NEWS_LOOKBACK_HRS", "6"))
         self.fetcher = fetcher or self._build_fetcher()
+        self.scorer = scorer
+        if seen is None:
+            default_ttl = str(max(24, 2 * self.lookback_hours))
+            ttl_hours = float(os.getenv("SENTI_SEEN_TTL_HRS", default_ttl))
+            seen = SeenIndex(path=os.getenv("SENTI_SEEN_PATH") or None, ttl_sec=ttl_hours * 3600)
+        self.seen = seen
+        self.max_workers = max_workers or int(os.getenv("SENTI_FETCH_WORKERS", "8"))
         self.log = logging.getLogger("gigatrader.sentiment")
+        try:
+            params = inspect.signature(self.fetcher.fetch_headlines).parameters
+            self._fetch_since = "since" in params
+        except (TypeError, ValueError):  # pragma: no cover - builtins/mocks
+            self._fetch_since = False
 
     def _build_fetcher(self) -> AlpacaNewsFetcher:
         api_key = os.environ["ALPACA_API_KEY_ID"]
         secret = os.environ["ALPACA_API_SECRET_KEY"]
         return AlpacaNewsFetcher(api_key=api_key, secret=secret)
 
-    def _score_headline(self, symbol: str, headline: str, ts: float) -> ScoredItem:
-        item = NewsItem(
-            id=f"alpaca:{symbol}:{int(ts)}:{abs(hash(headline)) & 0xffff}",
+    def _to_item(self, symbol: str, raw: Any, now: float) -> Optional[NewsItem]:
+        if isinstance(raw, dict):
+            title = str(raw.get("headline") or raw.get("title") or "")
+            summary = raw.get("summary") or None
+            ts = _parse_ts(raw.get("updated_at") or raw.get("created_at")) or now
+            upstream_id = str(raw.get("id") or "")
+        else:
+            title, summary, ts, upstream_id = str(raw), None, now, ""
+        if not title:
+            return None
+        if not upstream_id:
+            # Stable across processes (unlike ``hash``) so persisted IDs match.
+            digest = hashlib.blake2b(title.strip().lower().encode("utf-8"), digest_size=8)
+            upstream_id = digest.hexdigest()
+        return NewsItem(
+            id=f"alpaca:{symbol}:{upstream_id}",
             source="alpaca",
             ts=ts,
             symbol=symbol,
-            title=headline,
+            title=title,
+            summary=summary,
         )
-        return rule_infer(item)
+
+    def _fetch(self, symbol: str) -> List[Any]:
+        kwargs: Dict[str, Any] = {"hours_back": self.lookback_hours}
+        mark = self.seen.watermark(symbol)
+        if self._fetch_since and mark is not None:
+            kwargs["since"] = datetime.fromtimestamp(mark - _WATERMARK_OVERLAP_SEC, tz=timezone.utc)
+        try:
+            return list(self.fetcher.fetch_headlines(symbol, **kwargs) or [])
+        except Exception as exc:  # pragma: no cover - network errors
+            self.log.warning(
+                "sentiment.fetch_failed",
+                extra={"symbol": symbol, "error": str(exc)},
+            )
+            return []
+
+    def _fetch_all(self) -> Dict[str, List[Any]]:
+        workers = max(1, min(self.max_workers, len(self.symbols)))
+        if workers == 1:
+            return {symbol: self._fetch(symbol) for symbol in self.symbols}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="senti-fetch") as pool:
+            return dict(zip(self.symbols, pool.map(self._fetch, self.symbols), strict=True))
 
     def run_once(self, now: Optional[float] = None) -> Dict[str, List[ScoredItem]]:
         now = now or time.time()
-        per_symbol: Dict[str, List[ScoredItem]] = {}
-        for symbol in self.symbols:
-            try:
-                headlines = self.fetcher.fetch_headlines(symbol, hours_back=self.lookback_hours)
-            except Exception as exc:  # pragma: no cover - network errors
-                self.log.warning(
-                    "sentiment.fetch_failed",
-                    extra={"symbol": symbol, "error": str(exc)},
-                )
-                per_symbol[symbol] = []
-                continue
-            if not headlines:
-                per_symbol[symbol] = []
-                continue
-            scored_items: List[ScoredItem] = []
-            for headline in headlines:
-                scored = self._score_headline(symbol, headline, now)
-                scored_items.append(scored)
+        per_symbol: Dict[str, List[ScoredItem]] = {symbol: [] for symbol in self.symbols}
+        pending: List[NewsItem] = []
+        latest: Dict[str, float] = {}
+        for symbol, headlines in self._fetch_all().items():
+            items = [item for raw in headlines if (item := self._to_item(symbol, raw, now))]
+            fresh = set(self.seen.filter_new((item.id for item in items), now, mark=False))
+            for item in items:
+                if item.id in fresh:
+                    pending.append(item)
+                    fresh.discard(item.id)
+            if items:
+                latest[symbol] = max(item.ts for item in items)
+
+        if pending:
+            for scored in self.scorer(pending):
+                symbol = scored.item.symbol
+                per_symbol.setdefault(symbol, []).append(scored)
                 self.store.upsert(symbol, scored.score, now)
-            per_symbol[symbol] = scored_items
+
+        # Only scored headlines count as seen: if the scorer raised above, the
+        # same items are fetched and scored again on the next poll.
+        self.seen.mark((item.id for item in pending), now)
+        for symbol, ts in latest.items():
+            self.seen.advance(symbol, ts)
+        self.seen.prune(now)
+        self.seen.save()
         return per_symbol
 
     def serve_forever(self) -> None:
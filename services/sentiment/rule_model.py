@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from typing import List, Sequence, Tuple
+
 from services.sentiment.types import NewsItem, ScoredItem
 
 POS = {
@@ -32,6 +35,13 @@ NEG = {
     "slump",
 }
 
+# Keyword table built once: (keyword, +1 for POS / -1 for NEG).
+_LEXICON: Tuple[Tuple[str, int], ...] = tuple(
+    [(word, 1) for word in sorted(POS)] + [(word, -1) for word in sorted(NEG)]
+)
+# Keywords are lowercase letters only, so no match can span two joined texts.
+_SEP = "\n"
+
 
 def score_text(text: str) -> float:
     """Score text by counting positive and negative keywords."""
@@ -44,10 +54,45 @@ def score_text(text: str) -> float:
     return max(-1.0, min(1.0, raw))
 
 
-def infer(item: NewsItem) -> ScoredItem:
-    """Infer sentiment for a news item using the rule model."""
-    text = f"{item.title} {item.summary or ''}".strip()
-    score = score_text(text)
+def score_texts(texts: Sequence[str]) -> List[float]:
+    """Score many texts at once; results match ``score_text`` exactly.
+
+    All texts are joined into one buffer and each keyword is located with
+    ``str.find`` (a C-level scan) instead of being tested against every text
+    separately. After a hit the scan skips to the next text, because a keyword
+    counts at most once per text.
+    """
+    if not texts:
+        return []
+    lowered = [text.lower() for text in texts]
+    starts: List[int] = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + len(_SEP)
+    starts.append(offset)
+    buffer = _SEP.join(lowered)
+    find = buffer.find
+    net = [0] * len(lowered)
+    hit = [False] * len(lowered)
+    for word, sign in _LEXICON:
+        pos = find(word)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            net[idx] += sign
+            hit[idx] = True
+            pos = find(word, starts[idx + 1])
+    return [
+        max(-1.0, min(1.0, value / 4.0)) if any_hit else 0.0
+        for value, any_hit in zip(net, hit, strict=True)
+    ]
+
+
+def _text(item: NewsItem) -> str:
+    return f"{item.title} {item.summary or ''}".strip()
+
+
+def _scored(item: NewsItem, score: float) -> ScoredItem:
     if score > 0.1:
         label = "pos"
     elif score < -0.1:
@@ -61,3 +106,14 @@ def infer(item: NewsItem) -> ScoredItem:
         model="rule",
         features={"pos_neg": score},
     )
+
+
+def infer(item: NewsItem) -> ScoredItem:
+    """Infer sentiment for a news item using the rule model."""
+    return _scored(item, score_text(_text(item)))
+
+
+def infer_batch(items: Sequence[NewsItem]) -> List[ScoredItem]:
+    """Score a batch of news items with the rule model."""
+    scores = score_texts([_text(item) for item in items])
+    return [_scored(item, score) for item, score in zip(items, scores, strict=True)]
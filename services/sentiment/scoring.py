@@ -1,4 +1,5 @@
 import re
+from typing import List, Optional, Sequence
 
 _POS = {
     "beat","beats","beating","surge","surged","surging","soar","soared","soaring",
@@ -30,3 +31,44 @@ def heuristic_score(headline: str, summary: str = "") -> float:
     raw = (pos - neg) / max(1, (pos + neg))
     # clamp to [-1,1]
     return max(-1.0, min(1.0, raw))
+
+
+# Lexicon compiled once into a word -> (pos, neg) increment table.
+_WEIGHTS = {w: (1 if w in _POS else 0, 1 if w in _NEG else 0) for w in _POS | _NEG}
+# Texts are lowercased before joining, so an uppercase sentinel never collides
+# with a real token and still splits the token stream between texts.
+_BREAK = "BRK"
+
+
+def heuristic_scores(
+    headlines: Sequence[str], summaries: Optional[Sequence[str]] = None
+) -> List[float]:
+    """
+    Batch form of ``heuristic_score``: one tokenizer pass over all headlines.
+    Results match the per-item function exactly.
+    """
+    if not headlines:
+        return []
+    if summaries is None:
+        summaries = [""] * len(headlines)
+    pairs = zip(headlines, summaries, strict=True)
+    joined = f" {_BREAK} ".join([f"{h} {s}".lower() for h, s in pairs])
+    hits = [tok for tok in _TOKEN.findall(joined) if tok in _WEIGHTS or tok == _BREAK]
+    out: List[float] = []
+    pos = neg = 0
+    for tok in hits:
+        if tok == _BREAK:
+            out.append(_ratio(pos, neg))
+            pos = neg = 0
+            continue
+        p_inc, n_inc = _WEIGHTS[tok]
+        pos += p_inc
+        neg += n_inc
+    out.append(_ratio(pos, neg))
+    return out
+
+
+def _ratio(pos: int, neg: int) -> float:
+    if pos == 0 and neg == 0:
+        return 0.0
+    return max(-1.0, min(1.0, (pos - neg) / max(1, (pos + neg))))
@@ -0,0 +1,111 @@
+"""Persistent seen-headline index with TTL and per-symbol fetch watermarks."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+log = logging.getLogger("gigatrader.sentiment")
+
+
+class SeenIndex:
+    """Track headline IDs already scored so each one is only scored once.
+
+    Entries expire ``ttl_sec`` after they were first seen; the TTL should be
+    at least the fetch lookback window so an expired ID can never be fetched
+    again. When ``path`` is set the index and watermarks survive restarts.
+    """
+
+    def __init__(self, path: str | Path | None = None, ttl_sec: float = 24 * 3600) -> None:
+        self.path = Path(path) if path else None
+        self.ttl = float(ttl_sec)
+        self._seen: Dict[str, float] = {}
+        self._watermarks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._seen
+
+    def filter_new(
+        self, ids: Iterable[str], now: Optional[float] = None, *, mark: bool = True
+    ) -> List[str]:
+        """Return IDs not seen before, marking them as seen at ``now`` unless ``mark`` is false."""
+        now = now or time.time()
+        fresh: List[str] = []
+        with self._lock:
+            for item_id in ids:
+                if item_id in self._seen:
+                    continue
+                if mark:
+                    self._seen[item_id] = now
+                fresh.append(item_id)
+        return fresh
+
+    def mark(self, ids: Iterable[str], now: Optional[float] = None) -> None:
+        """Record ``ids`` as seen at ``now``; used once they have been scored."""
+        now = now or time.time()
+        with self._lock:
+            for item_id in ids:
+                self._seen.setdefault(item_id, now)
+
+    def watermark(self, symbol: str) -> Optional[float]:
+        return self._watermarks.get(symbol)
+
+    def advance(self, symbol: str, ts: float) -> None:
+        with self._lock:
+            if ts > self._watermarks.get(symbol, 0.0):
+                self._watermarks[symbol] = ts
+
+    def prune(self, now: Optional[float] = None) -> int:
+        now = now or time.time()
+        cutoff = now - self.ttl
+        with self._lock:
+            expired = [key for key, ts in self._seen.items() if ts < cutoff]
+            for key in expired:
+                del self._seen[key]
+        return len(expired)
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            log.warning(
+                "sentiment.seen.load_failed", extra={"path": str(self.path), "error": str(exc)}
+            )
+            return
+        self._seen = {str(k): float(v) for k, v in (payload.get("seen") or {}).items()}
+        self._watermarks = {str(k): float(v) for k, v in (payload.get("watermarks") or {}).items()}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {"seen": dict(self._seen), "watermarks": dict(self._watermarks)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_name, self.path)
+        except OSError as exc:
+            log.warning(
+                "sentiment.seen.save_failed", extra={"path": str(self.path), "error": str(exc)}
+            )
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
@@ -5,7 +5,10 @@ from __future__ import annotations
 import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from services.sentiment.history import SentimentHistory
 
 
 @dataclass(slots=True)
@@ -19,35 +22,62 @@ class SentimentState:
 
 
 class SentiStore:
-    """In-memory store maintaining rolling sentiment per symbol."""
+    """In-memory store maintaining rolling sentiment per symbol.
+
+    When a ``SentimentHistory`` is attached every upsert is also appended to
+    it, and ``warm_start`` rebuilds the rolling state from that history.
+    """
 
-    def __init__(self, ttl_min: int = 120, decay_per_min: float = 0.01) -> None:
+    def __init__(
+        self,
+        ttl_min: int = 120,
+        decay_per_min: float = 0.01,
+        history: Optional["SentimentHistory"] = None,
+    ) -> None:
         self.ttl = ttl_min * 60
         self.decay = decay_per_min
+        self.history = history
         self.by_symbol: Dict[str, SentimentState] = defaultdict(SentimentState)
 
-    def _decay(self, symbol: str, now: float) -> None:
-        state = self.by_symbol[symbol]
+    def _decay_factor(self, state: SentimentState, now: float) -> float:
         if state.last_seen == 0:
-            return
+            return 1.0
         minutes = max(0.0, (now - state.last_seen) / 60.0)
-        decay_factor = max(0.0, 1.0 - self.decay * minutes)
-        state.score *= decay_factor
-        state.velocity *= decay_factor
+        return max(0.0, 1.0 - self.decay * minutes)
 
-    def upsert(self, symbol: str, value: float, now: float | None = None) -> None:
-        now = now or time.time()
-        self._decay(symbol, now)
+    def _apply(self, symbol: str, value: float, now: float) -> None:
         state = self.by_symbol[symbol]
+        factor = self._decay_factor(state, now)
+        state.score *= factor
+        state.velocity *= factor
         state.velocity = value - state.score
         state.score = max(-1.0, min(1.0, 0.5 * state.score + 0.5 * value))
         state.count += 1
         state.last_seen = now
 
+    def upsert(self, symbol: str, value: float, now: float | None = None) -> None:
+        now = now or time.time()
+        self._apply(symbol, value, now)
+        if self.history is not None:
+            self.history.append(symbol, now, value)
+
     def get(self, symbol: str, now: float | None = None) -> Tuple[float, int, float]:
         now = now or time.time()
-        state = self.by_symbol[symbol]
-        if state.last_seen and (now - state.last_seen) > self.ttl:
+        state = self.by_symbol.get(symbol)
+        if state is None or (state.last_seen and (now - state.last_seen) > self.ttl):
             return 0.0, 0, 0.0
-        self._decay(symbol, now)
-        return state.score, state.count, state.velocity
+        factor = self._decay_factor(state, now)
+        return state.score * factor, state.count, state.velocity * factor
+
+    def warm_start(self, now: float | None = None) -> int:
+        """Replay history points inside the TTL window; returns points applied."""
+        if self.history is None:
+            return 0
+        now = now or time.time()
+        applied = 0
+        for ts, symbol, value in self.history.replay():
+            if now - ts > self.ttl or ts > now:
+                continue
+            self._apply(symbol, value, ts)
+            applied += 1
+        return applied
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Iterator, Dict
 import csv, json
 
+from services.sentiment.history import SentimentHistory, load_ndjson
+
 @dataclass
 class BarRow:
     ts: float; symbol: str; open: float; high: float; low: float; close: float; volume: float
@@ -35,3 +37,7 @@ def load_sentiment(ndjson_path: str) -> Dict[str, float]:
     except FileNotFoundError:
         pass
     return out
+
+def load_sentiment_history(ndjson_path: str) -> SentimentHistory:
+    """Point-in-time sentiment for replay; rows without ``ts`` apply to every bar."""
+    return load_ndjson(ndjson_path)
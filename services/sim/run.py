@@ -1,6 +1,6 @@
 import os, json, asyncio
 from pathlib import Path
-from services.sim.loader import load_bars, load_sentiment
+from services.sim.loader import load_bars, load_sentiment_history
 from services.strategy.types import Bar
 from services.strategy.engine import StrategyEngine
 from services.sim.exec_stub import RecordingExec
@@ -42,12 +42,12 @@ async def run_sim():
         first_symbol=ordered[0] if ordered else None
         if first_symbol and first_symbol in first_close:
             rsi.last_close=first_close[first_symbol]
-    senti=load_sentiment(senti_path)
+    senti=load_sentiment_history(senti_path)
     out_file=Path("artifacts"); out_file.mkdir(parents=True, exist_ok=True)
     out_file=out_file/"sim_result.jsonl"
     with out_file.open("w") as out:
         for br in bars:
-            s=senti.get(br.symbol, 0.0)
+            s=senti.as_of(br.symbol, br.ts, 0.0)
             await se.on_bar(br.symbol, Bar(ts=br.ts, open=br.open, high=br.high, low=br.low, close=br.close, volume=br.volume), s)
         for rec in exec.records:
             out.write(json.dumps(rec)+"\n")
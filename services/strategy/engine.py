@@ -6,16 +6,14 @@ import asyncio
 import logging
 import math
 import os
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional
 
 from backend.services.orchestrator import queue_preopen_intent, record_decision_cycle
 from core.market_hours import market_is_open, seconds_until_open
-from backend.config.extended_universe import (
-    is_extended as is_extended_session,
-    is_rth as is_rth_session,
-    load_extended_tickers,
-)
+from core.trading_calendar import get_calendar
+from backend.config.extended_universe import load_extended_tickers
 from backend.services.universe_registry import get_override_universe
 from services.execution.engine import ExecutionEngine
 from services.execution.preopen_queue import PreopenIntent
@@ -27,6 +25,8 @@ from services.strategy.options_strat import OptionStrategy
 from services.strategy.regime import RegimeDetector
 from services.strategy.types import Bar, OrderPlan
 from services.strategy.universe import Universe
+from services.runtime.tracing import Trace, mark
+from services.telemetry.registry import BAR_TO_SIGNAL_SECONDS
 
 
 FALLBACK_UNIVERSE = ["AAPL", "MSFT", "NVDA", "SPY"]
@@ -116,6 +116,7 @@ class StrategyEngine:
         self.option_strategies.append(strategy)
 
     async def on_bar(self, symbol: str, bar: Bar, senti: Optional[float]) -> None:
+        bar_received = time.perf_counter()
         normalized_symbol = symbol.upper()
         if senti is not None:
             self.latest_sentiment[normalized_symbol] = senti
@@ -124,8 +125,9 @@ class StrategyEngine:
             senti = self.latest_sentiment.get(normalized_symbol)
 
         now = datetime.now(timezone.utc)
-        extended_now = is_extended_session(now)
-        rth_now = is_rth_session(now)
+        rth_now = get_calendar().is_open(now.timestamp())
+        # Outside RTH every instant falls in Alpaca's pre, after or overnight window.
+        extended_now = not rth_now
 
         override_universe = get_override_universe()
         base_universe = self.universe.get()
@@ -147,6 +149,7 @@ class StrategyEngine:
             return
 
         regime = self.regime.update(bar.high, bar.low, bar.close)
+        mark(bar.trace, "universe_regime")
 
         if self._senti_min > 0:
             senti_mag = abs(senti) if senti is not None else None
@@ -181,6 +184,11 @@ class StrategyEngine:
                 plan = strategy.on_bar(normalized_symbol, bar, senti, regime)
                 if plan is None:
                     continue
+                signal_at = time.perf_counter()
+                mark(bar.trace, "signal")
+                BAR_TO_SIGNAL_SECONDS.labels(strategy=type(strategy).__name__).observe(
+                    signal_at - bar_received
+                )
                 total_signals += 1
                 tif, order_type = self._resolve_order_params(
                     market_open=market_open,
@@ -198,6 +206,8 @@ class StrategyEngine:
                         order_type=order_type,
                         current_price=bar.close,
                         extended_hours=extended_for_order,
+                        signal_at=signal_at,
+                        trace=bar.trace,
                     )
                 except ValueError as exc:
                     self.log.warning(
@@ -217,8 +227,13 @@ class StrategyEngine:
                 plan = strategy.on_bar(normalized_symbol, bar, senti, regime)
                 if plan is None:
                     continue
+                BAR_TO_SIGNAL_SECONDS.labels(strategy=type(strategy).__name__).observe(
+                    time.perf_counter() - bar_received
+                )
+                mark(bar.trace, "signal")
                 total_signals += 1
                 await self._route_option_plan(plan)
+                mark(bar.trace, "option_route")
                 orders_submitted += 1
 
         record_decision_cycle(
@@ -259,6 +274,8 @@ class StrategyEngine:
         order_type: str | None = None,
         current_price: float = 0.0,
         extended_hours: bool = False,
+        signal_at: Optional[float] = None,
+        trace: Optional[Trace] = None,
     ) -> bool:
         side = "buy" if str(plan.side).lower() == "buy" else "sell"
         tif_value = (time_in_force or "").lower() if time_in_force else None
@@ -293,6 +310,9 @@ class StrategyEngine:
         intent_meta: Dict[str, Any] = {}
         if extended_hours:
             intent_meta["extended_hours"] = True
+        if signal_at is not None:
+            # perf_counter() timestamp; the execution engine reports signal-to-order.
+            intent_meta["signal_at"] = signal_at
 
         resolved_tif = tif_value if tif_value else None
         resolved_order_type = order_kind if (order_type is not None or extended_hours) else None
@@ -309,6 +329,7 @@ class StrategyEngine:
             time_in_force=resolved_tif or time_in_force,
             order_type=resolved_order_type,
             meta=intent_meta,
+            trace=trace,
         )
         await self.exec.submit(intent)
         return True
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from services.runtime.tracing import Trace
 
 
 @dataclass(slots=True)
@@ -16,6 +19,7 @@ class Bar:
     low: float
     close: float
     volume: float
+    trace: Optional["Trace"] = field(default=None, repr=False, compare=False)
 
 
 @dataclass(slots=True)
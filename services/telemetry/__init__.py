@@ -1,8 +1,14 @@
 """Telemetry helpers for runtime metrics."""
 
 from .metrics import metrics, TelemetryMetrics, record_order_latency, record_order_latency_async
+from .registry import Registry, get_registry
+from .sketch import DDSketch, WindowedSketch
 
 __all__ = [
+    "DDSketch",
+    "Registry",
+    "WindowedSketch",
+    "get_registry",
     "metrics",
     "TelemetryMetrics",
     "record_order_latency",
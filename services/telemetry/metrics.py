@@ -2,32 +2,15 @@
 
 from __future__ import annotations
 
-import math
+import os
 import threading
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
-
-def _percentile(sorted_values: Deque[float] | list[float], quantile: float) -> Optional[float]:
-    """Return the ``quantile`` (0-1) for ``sorted_values`` using linear interpolation."""
-
-    if not sorted_values:
-        return None
-    values = list(sorted_values)
-    if len(values) == 1:
-        return float(values[0])
-    q = min(max(quantile, 0.0), 1.0)
-    pos = (len(values) - 1) * q
-    lower = math.floor(pos)
-    upper = math.ceil(pos)
-    if lower == upper:
-        return float(values[int(pos)])
-    lower_value = float(values[lower])
-    upper_value = float(values[upper])
-    weight = pos - lower
-    return lower_value + (upper_value - lower_value) * weight
+from services.telemetry.registry import REGISTRY
+from services.telemetry.sketch import DEFAULT_WINDOWS, WindowedSketch
 
 
 def _normalize_code(code: Any) -> str:
@@ -42,33 +25,141 @@ def _normalize_code(code: Any) -> str:
     return text or "unknown"
 
 
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Quantiles reported per latency window.
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+# Prometheus mirrors of the counters below, exported by the registry.
+_REJECTS = REGISTRY.counter(
+    "gigatrader_order_rejects_total", "Orders rejected before or by the broker.", ("code",)
+)
+_WS_RECONNECTS = REGISTRY.counter(
+    "gigatrader_ws_reconnects_total", "Market/trade websocket reconnects."
+)
+_DATA_STALENESS = REGISTRY.gauge(
+    "gigatrader_data_staleness_seconds", "Age of the newest market data seen."
+)
+
+
+def _latency_window() -> str:
+    return os.getenv("TELEMETRY_LATENCY_WINDOW", "5m")
+
+
+def _max_label_sets() -> int:
+    try:
+        return max(1, int(os.getenv("TELEMETRY_MAX_LATENCY_LABELS", "512")))
+    except ValueError:
+        return 512
+
+
 class TelemetryMetrics:
-    """Simple in-process aggregator for trading telemetry."""
+    """Simple in-process aggregator for trading telemetry.
+
+    Order latency goes into windowed quantile sketches (see
+    :mod:`services.telemetry.sketch`): one for all orders and one per label
+    set (``endpoint``, ``symbol``), so ``observe`` is O(1) and percentile
+    reads do not sort samples. Per-label sketches idle for longer than the
+    widest window are dropped, and at most ``max_label_sets`` are kept
+    (least recently observed evicted first).
+    """
 
-    def __init__(self, *, max_latency_samples: int = 512) -> None:
+    def __init__(
+        self,
+        *,
+        windows: Iterable[Tuple[str, float, int]] = DEFAULT_WINDOWS,
+        clock: Callable[[], float] = time.monotonic,
+        max_label_sets: Optional[int] = None,
+    ) -> None:
         self._lock = threading.Lock()
-        self._latency_samples: Deque[float] = deque(maxlen=max_latency_samples)
-        self._latency_count: int = 0
+        self._windows = tuple(windows)
+        self._clock = clock
+        self._latency = WindowedSketch(self._windows, clock=clock)
+        self._max_span = max((span for _, span, _ in self._windows), default=0.0)
+        self._max_label_sets = max_label_sets if max_label_sets is not None else _max_label_sets()
+        # Least recently observed first; values are (last observed, sketch).
+        self._latency_by_label: "OrderedDict[LabelKey, Tuple[float, WindowedSketch]]" = (
+            OrderedDict()
+        )
         self._order_rejects: Dict[str, int] = defaultdict(int)
         self._ws_reconnects: int = 0
         self._data_staleness: Optional[float] = None
 
     # ------------------------------------------------------------------
     # Counters
-    def observe_order_latency(self, latency_ms: float) -> None:
+    def observe_order_latency(
+        self,
+        latency_ms: float,
+        *,
+        endpoint: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> None:
         latency = max(float(latency_ms), 0.0)
+        labels = _label_key(endpoint=endpoint, symbol=symbol)
         with self._lock:
-            self._latency_samples.append(latency)
-            self._latency_count += 1
+            self._latency.observe(latency)
+            if labels:
+                now = self._clock()
+                entry = self._latency_by_label.pop(labels, None)
+                if entry is None:
+                    self._evict_label_sets(now)
+                    sketch = WindowedSketch(self._windows, clock=self._clock)
+                else:
+                    sketch = entry[1]
+                self._latency_by_label[labels] = (now, sketch)
+                sketch.observe(latency)
+
+    def _evict_label_sets(self, now: float) -> None:
+        """Make room for one more label set; caller holds the lock."""
+
+        horizon = now - self._max_span
+        while self._latency_by_label:
+            oldest, (seen, _) = next(iter(self._latency_by_label.items()))
+            if len(self._latency_by_label) < self._max_label_sets and seen >= horizon:
+                break
+            del self._latency_by_label[oldest]
+
+    def latency_quantile(
+        self,
+        quantile: float,
+        *,
+        window: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> Optional[float]:
+        """Order latency ``quantile`` (0-1) over ``window``, optionally per label.
+
+        Raises ``ValueError`` for a window this instance does not track.
+        """
+
+        name = window or _latency_window()
+        if name not in self._latency.windows:
+            raise ValueError(
+                f"unknown latency window {name!r}; expected one of {self._latency.windows}"
+            )
+        labels = _label_key(endpoint=endpoint, symbol=symbol)
+        with self._lock:
+            if labels:
+                entry = self._latency_by_label.get(labels)
+                if entry is None:
+                    return None
+                sketch = entry[1]
+            else:
+                sketch = self._latency
+            values, _ = sketch.quantiles((quantile,), name)
+        return values[0]
 
     def inc_order_reject(self, code: Any) -> None:
         key = _normalize_code(code)
         with self._lock:
             self._order_rejects[key] += 1
+        _REJECTS.labels(code=key).inc()
 
     def inc_ws_reconnect(self) -> None:
         with self._lock:
             self._ws_reconnects += 1
+        _WS_RECONNECTS.inc()
 
     def set_data_staleness(self, seconds: Optional[float]) -> None:
         value: Optional[float]
@@ -81,28 +172,44 @@ class TelemetryMetrics:
                 value = None
         with self._lock:
             self._data_staleness = value
+        _DATA_STALENESS.set(value if value is not None else float("nan"))
 
     # ------------------------------------------------------------------
-    def snapshot(self) -> Dict[str, Any]:
+    def snapshot(self, *, labels: bool = False) -> Dict[str, Any]:
+        default_window = _latency_window()
         with self._lock:
-            latencies = list(self._latency_samples)
-            latency_count = self._latency_count
+            windows = {w: _window_summary(self._latency, w) for w in self._latency.windows}
+            latency_count = self._latency.count
+            latest = self._latency.latest
+            by_label = (
+                [
+                    {
+                        **dict(key),
+                        "windows": {w: _window_summary(sketch, w) for w in sketch.windows},
+                    }
+                    for key, (_, sketch) in self._latency_by_label.items()
+                ]
+                if labels
+                else None
+            )
             rejects = dict(self._order_rejects)
             ws_reconnects = self._ws_reconnects
             staleness = self._data_staleness
 
-        latencies_sorted = sorted(latencies)
-        p50 = _percentile(latencies_sorted, 0.5) if latencies_sorted else None
-        p95 = _percentile(latencies_sorted, 0.95) if latencies_sorted else None
-        latest = latencies[-1] if latencies else None
+        current = windows.get(default_window) or {}
+        latency: Dict[str, Any] = {
+            "p50": current.get("p50"),
+            "p95": current.get("p95"),
+            "count": latency_count,
+            "latest": latest,
+            "window": default_window,
+            "windows": windows,
+        }
+        if by_label is not None:
+            latency["by_label"] = by_label
 
         return {
-            "order_latency_ms": {
-                "p50": p50,
-                "p95": p95,
-                "count": latency_count,
-                "latest": latest,
-            },
+            "order_latency_ms": latency,
             "order_rejects_total": {
                 "total": sum(rejects.values()),
                 "by_code": rejects,
@@ -112,11 +219,26 @@ class TelemetryMetrics:
         }
 
 
+def _label_key(**labels: Optional[str]) -> LabelKey:
+    return tuple((name, str(value)) for name, value in labels.items() if value is not None)
+
+
+def _window_summary(sketch: WindowedSketch, window: str) -> Dict[str, Any]:
+    values, count = sketch.quantiles(_QUANTILES, window)
+    summary: Dict[str, Any] = {
+        f"p{int(q * 100)}": value for q, value in zip(_QUANTILES, values, strict=True)
+    }
+    summary["count"] = count
+    return summary
+
+
 metrics = TelemetryMetrics()
 
 
 @contextmanager
-def record_order_latency() -> Iterator[None]:
+def record_order_latency(
+    *, endpoint: Optional[str] = None, symbol: Optional[str] = None
+) -> Iterator[None]:
     """Context manager to time synchronous broker calls."""
 
     start = time.perf_counter()
@@ -124,11 +246,13 @@ def record_order_latency() -> Iterator[None]:
         yield
     finally:
         elapsed_ms = (time.perf_counter() - start) * 1000.0
-        metrics.observe_order_latency(elapsed_ms)
+        metrics.observe_order_latency(elapsed_ms, endpoint=endpoint, symbol=symbol)
 
 
 @asynccontextmanager
-async def record_order_latency_async() -> AsyncIterator[None]:
+async def record_order_latency_async(
+    *, endpoint: Optional[str] = None, symbol: Optional[str] = None
+) -> AsyncIterator[None]:
     """Async context manager to time awaited broker calls."""
 
     start = time.perf_counter()
@@ -136,4 +260,4 @@ async def record_order_latency_async() -> AsyncIterator[None]:
         yield
     finally:
         elapsed_ms = (time.perf_counter() - start) * 1000.0
-        metrics.observe_order_latency(elapsed_ms)
+        metrics.observe_order_latency(elapsed_ms, endpoint=endpoint, symbol=symbol)
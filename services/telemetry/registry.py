@@ -0,0 +1,460 @@
+"""Process-wide Prometheus metrics registry.
+
+Counters and histograms accumulate into per-thread shards, so the hot path
+never takes a lock; shards are summed when the registry is scraped. Gauges
+hold a single value or a callback evaluated at scrape time (queue depths).
+:func:`Registry.render` produces the Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import re
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; spans sub-millisecond in-process hops up to slow broker round trips.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _RowOwner:
+    """Thread-local handle whose finalizer retires the thread's row."""
+
+    __slots__ = ("row", "__weakref__")
+
+    def __init__(self, row: List[float]) -> None:
+        self.row = row
+
+
+class _Shards:
+    """Per-thread rows of floats; only the owning thread writes its row.
+
+    When a thread exits, its row is folded into a shared base row and
+    dropped, so short-lived threads do not leave rows behind.
+    """
+
+    __slots__ = ("width", "_local", "_rows", "_base", "_lock")
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self._local = threading.local()
+        self._rows: Dict[int, List[float]] = {}
+        self._base = [0.0] * width
+        # Reentrant: a finalizer may run on a thread that already holds it.
+        self._lock = threading.RLock()
+
+    def mine(self) -> List[float]:
+        try:
+            return self._local.owner.row
+        except AttributeError:
+            row = [0.0] * self.width
+            owner = _RowOwner(row)
+            with self._lock:
+                self._rows[id(row)] = row
+            # The thread-local dict (and ``owner``) goes away when the thread ends.
+            weakref.finalize(owner, self._retire, row)
+            self._local.owner = owner
+            return row
+
+    def _retire(self, row: List[float]) -> None:
+        with self._lock:
+            self._rows.pop(id(row), None)
+            for index, value in enumerate(row):
+                self._base[index] += value
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            rows = list(self._rows.values())
+            totals = list(self._base)
+        for row in rows:
+            for index, value in enumerate(row):
+                totals[index] += value
+        return totals
+
+
+class CounterChild:
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        self._shards.mine()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class GaugeChild:
+    __slots__ = ("_value", "_function", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Optional[Callable[[], float]]) -> None:
+        """Report ``function()`` at scrape time instead of the stored value."""
+
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        function = self._function
+        if function is None:
+            return self._value
+        try:
+            return float(function())
+        except Exception:  # noqa: BLE001 - a broken callback must not fail the scrape
+            return math.nan
+
+
+class HistogramChild:
+    __slots__ = ("_bounds", "_shards")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # One slot per finite bucket, one for +Inf, then the running sum.
+        self._shards = _Shards(len(bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        row = self._shards.mine()
+        row[bisect.bisect_left(self._bounds, value)] += 1
+        row[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[Tuple[float, float]], float, float]:
+        """``(cumulative buckets, sum, count)``; the last bucket bound is +Inf."""
+
+        totals = self._shards.totals()
+        buckets: List[Tuple[float, float]] = []
+        running = 0.0
+        for bound, count in zip((*self._bounds, math.inf), totals[:-1], strict=True):
+            running += count
+            buckets.append((bound, running))
+        return buckets, totals[-1], running
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        if not _NAME_RE.match(name):
+            raise ValueError(f"invalid metric name: {name!r}")
+        for label in labelnames:
+            if not _LABEL_RE.match(label) or label.startswith("__") or label == "le":
+                raise ValueError(f"invalid label name: {label!r}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # Unlabelled series are exported (at zero) as soon as they exist.
+            self.labels()
+
+    def _new_child(self) -> object:
+        raise NotImplementedError
+
+    def labels(self, *values: object, **kwargs: object):
+        if kwargs:
+            if values:
+                raise ValueError("pass label values positionally or by name, not both")
+            try:
+                values = tuple(kwargs[name] for name in self.labelnames)
+            except KeyError as exc:
+                raise ValueError(f"missing label {exc.args[0]!r} for {self.name}") from None
+            if len(kwargs) != len(self.labelnames):
+                raise ValueError(f"unexpected labels for {self.name}: {sorted(kwargs)}")
+        elif len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def children(self) -> List[Tuple[LabelValues, object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> List[str]:
+        help_text = (self.documentation or self.name).replace("\\", "\\\\").replace("\n", "\\n")
+        lines = [
+            f"# HELP {self.name} {help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+            for key, child in self.children()
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    @property
+    def value(self) -> float:
+        return self._default().value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set_function(self, function: Optional[Callable[[], float]]) -> None:
+        self._default().set_function(function)
+
+    @property
+    def value(self) -> float:
+        return self._default().value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        bounds = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+        if not bounds:
+            raise ValueError("histogram needs at least one finite bucket")
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+    def _render_samples(self) -> List[str]:
+        lines: List[str] = []
+        bucket_labels = (*self.labelnames, "le")
+        for key, child in self.children():
+            buckets, total, count = child.snapshot()
+            for bound, cumulative in buckets:
+                labels = _format_labels(bucket_labels, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {_format_value(count)}")
+        return lines
+
+
+class Registry:
+    """Named metric families; registering an existing name returns it."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(
+        self, cls: type, name: str, documentation: str, labelnames: Sequence[str], **kw: object
+    ):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+                    raise ValueError(
+                        f"metric {name} already registered as {existing.kind}"
+                        f" with labels {existing.labelnames}"
+                    )
+                return existing
+            metric = cls(name, documentation, labelnames, **kw)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(
+        self, name: str, documentation: str = "", labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str = "", labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str = "",
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = Registry()
+
+
+def get_registry() -> Registry:
+    return REGISTRY
+
+
+# ----------------------------------------------------------------------
+# Hot-path instruments: where time goes between a bar and a broker ack.
+# ----------------------------------------------------------------------
+BAR_TO_SIGNAL_SECONDS = REGISTRY.histogram(
+    "gigatrader_bar_to_signal_seconds",
+    "Time from a bar reaching the strategy engine to a strategy emitting a signal.",
+    ("strategy",),
+)
+SIGNAL_TO_ORDER_SECONDS = REGISTRY.histogram(
+    "gigatrader_signal_to_order_seconds",
+    "Time from a signal to its order being handed to the broker adapter.",
+    ("asset_class",),
+)
+ORDER_ACK_SECONDS = REGISTRY.histogram(
+    "gigatrader_order_ack_seconds",
+    "Broker round trip from order submission to acknowledgement.",
+    ("asset_class",),
+)
+DB_WRITE_SECONDS = REGISTRY.histogram(
+    "gigatrader_db_write_seconds",
+    "Duration of OMS store writes.",
+    ("table",),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "gigatrader_queue_depth",
+    "Events waiting in an in-process queue.",
+    ("queue",),
+)
+
+
+__all__ = [
+    "BAR_TO_SIGNAL_SECONDS",
+    "CONTENT_TYPE",
+    "Counter",
+    "DB_WRITE_SECONDS",
+    "DEFAULT_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "ORDER_ACK_SECONDS",
+    "QUEUE_DEPTH",
+    "REGISTRY",
+    "Registry",
+    "SIGNAL_TO_ORDER_SECONDS",
+    "get_registry",
+]
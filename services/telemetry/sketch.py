@@ -0,0 +1,177 @@
+"""Mergeable streaming quantile sketches with sliding time windows."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# (label, window seconds, slices per window)
+DEFAULT_WINDOWS: Tuple[Tuple[str, float, int], ...] = (
+    ("1m", 60.0, 12),
+    ("5m", 300.0, 10),
+    ("1h", 3600.0, 12),
+)
+
+
+class DDSketch:
+    """Log-bucketed quantile sketch (DDSketch) over non-negative values.
+
+    Every quantile is returned within ``relative_accuracy`` of the true value,
+    ``add`` is O(1) and two sketches with the same accuracy merge exactly by
+    adding bucket counts.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "_gamma_ln",
+        "_min_value",
+        "_bins",
+        "zero_count",
+        "count",
+        "sum",
+        "max",
+    )
+
+    def __init__(
+        self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, *, min_value: float = 1e-6
+    ) -> None:
+        self.relative_accuracy = relative_accuracy
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._gamma_ln = math.log(gamma)
+        self._min_value = min_value
+        self._bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        if value > self._min_value:
+            key = math.ceil(math.log(value) / self._gamma_ln)
+            self._bins[key] = self._bins.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        if other._gamma_ln != self._gamma_ln:
+            raise ValueError("cannot merge sketches with different accuracy")
+        bins = self._bins
+        for key, n in other._bins.items():
+            bins[key] = bins.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        if other.max > self.max:
+            self.max = other.max
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Several quantiles in one pass over the buckets."""
+
+        if not self.count:
+            return [None] * len(qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        ranks = [min(max(qs[i], 0.0), 1.0) * (self.count - 1) for i in order]
+        out: List[Optional[float]] = [None] * len(qs)
+        pos = 0
+        seen = self.zero_count
+        while pos < len(order) and ranks[pos] < seen:
+            out[order[pos]] = 0.0
+            pos += 1
+        for key in sorted(self._bins):
+            if pos >= len(order):
+                break
+            seen += self._bins[key]
+            while pos < len(order) and ranks[pos] < seen:
+                # Bucket midpoint (in log space) keeps the relative error bound.
+                value = 2.0 * math.exp(key * self._gamma_ln) / (1.0 + math.exp(self._gamma_ln))
+                out[order[pos]] = min(value, self.max)
+                pos += 1
+        while pos < len(order):
+            out[order[pos]] = self.max
+            pos += 1
+        return out
+
+
+class WindowedSketch:
+    """Quantiles over sliding 1 m / 5 m / 1 h windows.
+
+    Each window is a ring of time slices, each slice its own sketch; a query
+    merges the slices that are still inside the window. Results are cached
+    until the next observation or slice rotation, so polling is nearly free.
+    """
+
+    def __init__(
+        self,
+        windows: Iterable[Tuple[str, float, int]] = DEFAULT_WINDOWS,
+        *,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._rings: Dict[str, List[Tuple[int, DDSketch]]] = {}
+        for label, span, slices in windows:
+            self._windows[label] = (span / slices, slices)
+            self._rings[label] = []
+        self.count = 0
+        self.latest: Optional[float] = None
+        self._cache: Dict[
+            Tuple[str, Tuple[float, ...]], Tuple[Tuple[int, int], List[Optional[float]], int]
+        ] = {}
+
+    @property
+    def windows(self) -> List[str]:
+        return list(self._windows)
+
+    def observe(self, value: float) -> None:
+        now = self._clock()
+        for label, (width, slices) in self._windows.items():
+            ring = self._rings[label]
+            slot = int(now // width)
+            if not ring or ring[-1][0] != slot:
+                ring.append((slot, DDSketch(self.relative_accuracy)))
+                if len(ring) > slices:
+                    del ring[0]
+            ring[-1][1].add(value)
+        self.count += 1
+        self.latest = value
+
+    def _live(self, label: str) -> List[DDSketch]:
+        width, slices = self._windows[label]
+        oldest = int(self._clock() // width) - slices + 1
+        return [sketch for slot, sketch in self._rings[label] if slot >= oldest]
+
+    def merged(self, label: str) -> DDSketch:
+        merged = DDSketch(self.relative_accuracy)
+        for sketch in self._live(label):
+            merged.merge(sketch)
+        return merged
+
+    def quantiles(self, qs: Sequence[float], window: str) -> Tuple[List[Optional[float]], int]:
+        """``(values, sample_count)`` for quantiles ``qs`` over ``window``."""
+
+        width, slices = self._windows[window]
+        oldest = int(self._clock() // width) - slices + 1
+        # Keyed on the observation count and live slice ids: any change misses.
+        state = (self.count, oldest)
+        cache_key = (window, tuple(qs))
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == state:
+            return cached[1], cached[2]
+        merged = self.merged(window)
+        values = merged.quantiles(qs)
+        self._cache[cache_key] = (state, values, merged.count)
+        return values, merged.count
+
+
+__all__ = ["DDSketch", "DEFAULT_WINDOWS", "WindowedSketch"]
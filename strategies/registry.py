@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 
 AlphaFn = Callable[[Dict[str, Any]], float]  # returns [-1, 1]
 
@@ -11,14 +11,25 @@ class AlphaSpec:
     weight: float
     fn: AlphaFn
     enabled: bool = True
+    # Context key the alpha reads verbatim; lets batch evaluators skip ``fn``.
+    feature: Optional[str] = None
 
 
 class StrategyRegistry:
     def __init__(self):
         self._alphas: Dict[str, AlphaSpec] = {}
 
-    def register(self, name: str, fn: AlphaFn, weight: float = 1.0, enabled: bool = True):
-        self._alphas[name] = AlphaSpec(name=name, fn=fn, weight=weight, enabled=enabled)
+    def register(
+        self,
+        name: str,
+        fn: AlphaFn,
+        weight: float = 1.0,
+        enabled: bool = True,
+        feature: Optional[str] = None,
+    ):
+        self._alphas[name] = AlphaSpec(
+            name=name, fn=fn, weight=weight, enabled=enabled, feature=feature
+        )
 
     def set_weight(self, name: str, weight: float):
         self._alphas[name].weight = weight
@@ -26,6 +37,9 @@ class StrategyRegistry:
     def enable(self, name: str, enabled: bool = True):
         self._alphas[name].enabled = enabled
 
+    def specs(self) -> List[AlphaSpec]:
+        return [spec for spec in self._alphas.values() if spec.enabled]
+
     def blend(self, ctx: Dict[str, Any]) -> float:
         num, den = 0.0, 0.0
         for spec in self._alphas.values():
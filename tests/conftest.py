@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pytest
 
+from core.runtime_config import reload_config
 from tests.fixtures.env_mode import require_mock, require_paper  # noqa: F401
 from tests.fixtures.server_stack import server_stack  # noqa: F401
 
@@ -21,6 +22,14 @@ def env_mock_mode():
     return os.environ["MOCK_MODE"]
 
 
+@pytest.fixture(autouse=True)
+def runtime_config_snapshot():
+    """Start every test from a snapshot of the current environment."""
+
+    reload_config({})
+    yield
+
+
 if pytest_playwright is None:
     @pytest.fixture
     def page():  # pragma: no cover - exercised when playwright absent
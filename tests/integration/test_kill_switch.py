@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import time
 
-from core.kill_switch import KillSwitch
+from core.kill_switch import KillSwitch, KillSwitchWatcher
+
+
+def _no_stat(*args, **kwargs):
+    raise AssertionError("engaged_sync must not touch the filesystem")
 
 
 def test_kill_switch_engage_and_reset(tmp_path) -> None:
@@ -32,3 +38,52 @@ def test_kill_switch_reason_metadata(tmp_path) -> None:
     kill.reset_sync()
     reset_info = kill.info_sync()
     assert reset_info["engaged"] is False
+
+
+def test_kill_switch_watcher_publishes_external_changes(tmp_path) -> None:
+    path = tmp_path / "halt_watch"
+
+    async def runner() -> None:
+        kill = KillSwitch(path)
+        queue = kill.subscribe()
+        # Another process writing or removing the file must reach subscribers.
+        staged = tmp_path / "halt_watch.tmp"
+        staged.write_text('{"engaged": true, "reason": "ops"}', encoding="utf-8")
+        os.replace(staged, path)
+        event = await asyncio.wait_for(queue.get(), timeout=2.0)
+        assert event.action == "engaged" and event.reason == "ops"
+        assert kill.engaged_sync() and kill.reason_sync() == "ops"
+
+        path.unlink()
+        event = await asyncio.wait_for(queue.get(), timeout=2.0)
+        assert event.action == "reset"
+        assert not kill.engaged_sync()
+        kill.unsubscribe(queue)
+
+    asyncio.run(runner())
+
+
+def test_engaged_sync_reads_watcher_state_and_close_releases_fds(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "halt_fresh"
+    watcher = KillSwitchWatcher(path, poll_interval=60.0)
+    watcher.start()
+    deadline = time.monotonic() + 2.0
+    while watcher.mode == "idle" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    kill = KillSwitch(path, watch=True)
+    kill._watcher = watcher
+
+    # An engage in this process is visible at once, without a stat per check.
+    kill.engage_sync("ops")
+    with monkeypatch.context() as patched:
+        patched.setattr(os, "stat", _no_stat)
+        patched.setattr(type(path), "exists", _no_stat)
+        assert kill.engaged_sync()
+    kill.reset_sync()
+    assert not kill.engaged_sync()
+
+    fds_before = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+    watcher.close()
+    assert watcher.closed and not watcher._thread.is_alive()
+    if fds_before is not None:
+        assert len(os.listdir("/proc/self/fd")) < fds_before
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from backend.routers.deps import BrokerService
+from backend.services.broker_snapshot import ORDER_BOOK_LIMIT, BrokerSnapshot
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingAdapter:
+    def __init__(self) -> None:
+        self.calls = {"account": 0, "positions": 0, "orders": 0}
+
+    def fetch_account(self):
+        self.calls["account"] += 1
+        time.sleep(0.05)
+        return {"equity": "1000"}
+
+    def fetch_positions(self):
+        self.calls["positions"] += 1
+        return [{"symbol": "AAPL", "qty": "1"}]
+
+    def fetch_orders(self, *, status: str = "all", limit: int = 50):
+        self.calls["orders"] += 1
+        return [
+            {"id": "o2", "symbol": "MSFT", "status": "new"},
+            {"id": "o1", "symbol": "AAPL", "status": "filled"},
+        ]
+
+
+def test_broker_service_reads_through_snapshot() -> None:
+    clock = _Clock()
+    adapter = _CountingAdapter()
+    snapshot = BrokerSnapshot(max_age_sec=5.0, clock=clock)
+    service = BrokerService(adapter=adapter, flags=object(), snapshot=snapshot)
+
+    threads = [threading.Thread(target=service.get_account) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert adapter.calls["account"] == 1  # single flight
+
+    assert [o["id"] for o in service.get_orders(status="open")] == ["o2"]
+    assert [o["id"] for o in service.get_orders(status="closed")] == ["o1"]
+    service.get_positions()
+    service.get_positions()
+    assert adapter.calls == {"account": 1, "positions": 1, "orders": 1}
+
+    snapshot.apply_order_update({"event": "fill", "order": {"id": "o2", "status": "filled"}})
+    snapshot.apply_order_update(
+        {"event": "new", "order": {"id": "o3", "symbol": "NVDA", "status": "new"}}
+    )
+    assert [o["id"] for o in service.get_orders(status="open")] == ["o3"]
+    assert adapter.calls["orders"] == 1
+    # A fill invalidates positions and account; orders stay served from memory.
+    service.get_positions()
+    assert adapter.calls["positions"] == 2
+
+    snapshot.update(account={"equity": "2000"})
+    assert service.get_account() == {"equity": "2000"}
+    clock.now = 6.0
+    assert service.get_account() == {"equity": "1000"}
+    assert adapter.calls["account"] == 2
+
+
+def test_order_scopes_fall_back_to_broker_when_book_is_full() -> None:
+    class _BookAdapter:
+        def __init__(self) -> None:
+            self.queries = []
+
+        def fetch_orders(self, *, status: str = "all", limit: int = 50):
+            self.queries.append((status, limit))
+            if status == "open":
+                return [{"id": "old-open", "status": "new"}]
+            return [{"id": f"o{idx}", "status": "filled"} for idx in range(limit)]
+
+    adapter = _BookAdapter()
+    snapshot = BrokerSnapshot(max_age_sec=5.0, clock=_Clock())
+    service = BrokerService(adapter=adapter, flags=object(), snapshot=snapshot)
+
+    assert len(service.get_orders(status="all", limit=200)) == 200
+    assert adapter.queries == [("all", ORDER_BOOK_LIMIT)]
+    # No open order among the newest ORDER_BOOK_LIMIT; ask the broker for that scope.
+    assert [o["id"] for o in service.get_orders(status="open", limit=10)] == ["old-open"]
+    assert adapter.queries[-1] == ("open", 10)
+
+
+def test_reconcile_pages_merge_into_the_full_order_book() -> None:
+    clock = _Clock()
+    snapshot = BrokerSnapshot(max_age_sec=5.0, clock=clock)
+    snapshot.merge_orders([{"id": "o9", "status": "new"}])
+    # No full book yet: the next read still refreshes it.
+    assert snapshot.stats()["age_sec"]["orders"] is None
+
+    book = [{"id": f"o{idx}", "status": "filled"} for idx in range(ORDER_BOOK_LIMIT, 0, -1)]
+    snapshot.update(orders=book)
+    clock.now = 4.0
+    snapshot.merge_orders(
+        [{"id": "new-1", "status": "new"}, {"id": f"o{ORDER_BOOK_LIMIT}", "status": "canceled"}]
+    )
+
+    orders = snapshot.orders(lambda: [])
+    assert len(orders) == ORDER_BOOK_LIMIT
+    assert [order["id"] for order in orders[:3]] == ["new-1", f"o{ORDER_BOOK_LIMIT}", "o499"]
+    assert orders[1]["status"] == "canceled"
+    assert snapshot.stats()["age_sec"]["orders"] == 0.0
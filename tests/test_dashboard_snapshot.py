@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+
+from backend.services.dashboard_snapshot import DashboardSnapshotter
+
+
+def test_dashboard_snapshot_versions_and_deltas() -> None:
+    state = {"equity": 100.0}
+    calls = {"account": 0}
+
+    def account() -> dict:
+        calls["account"] += 1
+        return dict(state)
+
+    async def stream() -> dict:
+        return {"running": True}
+
+    def broken() -> dict:
+        raise RuntimeError("broker down")
+
+    clock = {"now": 0.0}
+    snapper = DashboardSnapshotter(
+        {"account": account, "stream": stream, "orders": broken},
+        min_interval_sec=1.0,
+        clock=lambda: clock["now"],
+    )
+
+    async def runner() -> None:
+        await snapper.refresh()
+        first = snapper.view()
+        assert first.full and first.version == 1
+        assert first.sections["account"] == {"equity": 100.0}
+        assert first.errors == {"orders": "broker down"}
+
+        # Within the interval concurrent viewers reuse the collection.
+        await asyncio.gather(snapper.refresh(), snapper.refresh())
+        assert calls["account"] == 1
+
+        clock["now"] = 2.0
+        await snapper.refresh()
+        assert snapper.version == 1  # nothing changed, same ETag
+        assert snapper.view(since=1, epoch=snapper.epoch).sections == {}
+
+        state["equity"] = 101.0
+        clock["now"] = 4.0
+        await snapper.refresh()
+        delta = snapper.view(since=1, epoch=snapper.epoch)
+        assert not delta.full and delta.version == 2
+        assert delta.sections == {"account": {"equity": 101.0}}
+        assert delta.etag != first.etag
+
+        # Unknown epoch (e.g. backend restarted) gets everything.
+        assert set(snapper.view(since=1, epoch="other").sections) == {"account", "stream", "orders"}
+
+    asyncio.run(runner())
+
+
+def test_volatile_fields_do_not_bump_the_version() -> None:
+    beats = {"n": 0}
+
+    def stream() -> dict:
+        beats["n"] += 1
+        return {"running": True, "last_heartbeat": beats["n"], "history": list(range(beats["n"]))}
+
+    snapper = DashboardSnapshotter(
+        {"stream": stream},
+        min_interval_sec=0.0,
+        volatile={"stream": ("last_heartbeat", "history")},
+    )
+
+    async def runner() -> None:
+        await snapper.refresh()
+        await snapper.refresh()
+        assert beats["n"] == 2 and snapper.version == 1
+
+    asyncio.run(runner())
+
+
+def test_dashboard_endpoint_collects_real_sections_and_revalidates(monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from backend import api
+
+    monkeypatch.setattr(api._dashboard, "min_interval_sec", 0.0)
+    client = TestClient(api.app)
+
+    first = client.get("/dashboard/snapshot")
+    assert first.status_code == 200
+    payload = first.json()
+    assert "orders" not in payload["errors"]
+    assert isinstance(payload["sections"]["orders"], list)
+
+    second = client.get("/dashboard/snapshot", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
@@ -2,7 +2,10 @@ import asyncio
 
 import pytest
 
+from core.runtime_config import reload_config
 from services.execution.engine import ExecutionEngine
+from services.execution.idempotency import IdempotencyIndex
+from services.execution.updates import FILL, POSITION, UpdateBus
 from services.execution.types import ExecIntent
 from app.risk.manager import RiskManager
 from services.risk.state import InMemoryState
@@ -38,6 +41,7 @@ def _force_disarm_kill_switch(risk: RiskManager) -> None:
 def test_happy_path_bracket_and_risk_ok(monkeypatch):
     monkeypatch.setenv("DEFAULT_TP_PCT", "1.0")
     monkeypatch.setenv("DEFAULT_SL_PCT", "0.5")
+    reload_config()
     state = InMemoryState()
     risk = RiskManager(state)
     _force_disarm_kill_switch(risk)
@@ -149,3 +153,176 @@ def test_process_updates_reconciles_state(monkeypatch):
     assert state.portfolio_notional == pytest.approx(202.0)
     assert state.day_pnl == pytest.approx(3.5)
     assert state.last_trade_ts_by_symbol["AAPL"] == pytest.approx(1_700_000_010.0)
+
+
+def test_terminal_orders_expire_from_idempotency_index(monkeypatch):
+    monkeypatch.setenv("COOLDOWN_SEC", "0")
+    now = [1_700_000_000.0]
+    intents = IdempotencyIndex(
+        window_sec=3600, terminal_ttl_sec=60, max_entries=100, clock=lambda: now[0]
+    )
+    state = InMemoryState()
+    risk = RiskManager(state)
+    _force_disarm_kill_switch(risk)
+    engine = ExecutionEngine(risk=risk, state=state, adapter=FakeAdapter(), intents=intents)
+
+    intent = ExecIntent(symbol="MSFT", side="buy", qty=5, limit_price=50.0)
+    first = _run(engine.submit(intent))
+    order_id = engine._orders[first.client_order_id]["alpaca_order_id"]
+    _run(
+        engine.process_update(
+            {
+                "order": {
+                    "id": order_id,
+                    "client_order_id": first.client_order_id,
+                    "symbol": "MSFT",
+                    "side": "buy",
+                    "filled_qty": "5",
+                    "fill_price": "50",
+                    "status": "filled",
+                }
+            }
+        )
+    )
+    assert _run(engine.submit(intent)).reason == "duplicate_intent"
+
+    now[0] += 61
+    assert _run(engine.submit(intent)).accepted is True
+    assert first.client_order_id not in engine._orders
+    assert order_id not in engine._order_fill_qty
+
+
+def test_idempotency_index_bounds_memory_and_gates_loader():
+    lookups: list[str] = []
+
+    def loader(key: str, since: float) -> str | None:
+        lookups.append(key)
+        return "cid-persisted" if key == "persisted" else None
+
+    intents = IdempotencyIndex(window_sec=3600, terminal_ttl_sec=60, max_entries=3, loader=loader)
+    intents.warm(["persisted"])
+    for idx in range(5):
+        intents.put(f"k{idx}", f"cid-{idx}")
+
+    assert len(intents) == 3 and "k0" not in intents
+    assert intents.get("k4") == "cid-4"
+    assert intents.get("persisted") == "cid-persisted"
+    assert intents.get("never-seen") is None
+    assert lookups == ["persisted"]
+
+
+def test_idempotency_index_falls_back_to_loader_after_bloom_overflow():
+    now = [1_700_000_000.0]
+    submitted: dict[str, str] = {}
+
+    def loader(key: str, since: float) -> str | None:
+        return submitted.get(key)
+
+    intents = IdempotencyIndex(
+        window_sec=3600, terminal_ttl_sec=60, max_entries=4, loader=loader, clock=lambda: now[0]
+    )
+    for idx in range(20):
+        now[0] += 1.0
+        submitted[f"k{idx}"] = f"cid-{idx}"
+        # The engine records each intent twice; repeats must not fill the filter.
+        intents.put(f"k{idx}", f"cid-{idx}")
+        intents.put(f"k{idx}", f"cid-{idx}")
+
+    assert "k0" not in intents
+    assert intents.get("k0") == "cid-0"
+
+    now[0] += 2 * 3600
+    intents.put("fresh", "cid-fresh")
+    assert not intents.might_contain("k0")
+
+
+def test_update_bus_fans_out_with_overflow_policies():
+    async def scenario():
+        bus = UpdateBus()
+        fifo = bus.subscribe(FILL, maxsize=2)
+        latest = bus.subscribe((FILL, POSITION), policy="coalesce", key=lambda e: e.symbol)
+        for qty in (1, 2, 3):
+            bus.publish(FILL, symbol="AAPL", data={"qty": qty})
+        bus.publish(POSITION, symbol="MSFT", data={"qty": 5})
+
+        first = await fifo.get()
+        second = await fifo.get()
+        assert [first.seq, second.seq] == [2, 3]
+        assert fifo.dropped == 1
+        assert [(await latest.get()).data["qty"], (await latest.get()).data["qty"]] == [3, 5]
+
+        bus.publish(FILL, symbol="AAPL", data={"qty": 4})
+        bus.publish(FILL, symbol="AAPL", data={"qty": 5})
+        bus.publish(FILL, symbol="AAPL", data={"qty": 6})
+        await fifo.get()
+        await fifo.get()
+        assert fifo.gaps == 1
+        fifo.close()
+        assert [event async for event in fifo] == []
+
+    _run(scenario())
+
+
+def test_engine_consumes_order_updates_and_publishes_fills():
+    async def scenario():
+        bus = UpdateBus()
+        state = InMemoryState()
+        engine = ExecutionEngine(
+            risk=RiskManager(state), state=state, adapter=FakeAdapter(), updates=bus
+        )
+        engine._orders["c-1"] = {"alpaca_order_id": "o-1", "status": "accepted"}
+        fills = bus.subscribe((FILL, POSITION))
+        loop_task = asyncio.create_task(engine.run_update_loop())
+        await asyncio.sleep(0)
+
+        # Fills for orders placed elsewhere on the account are not applied.
+        bus.publish_order(
+            {
+                "event": "fill",
+                "order": {
+                    "id": "o-9",
+                    "client_order_id": "manual-9",
+                    "symbol": "AAPL",
+                    "side": "buy",
+                    "filled_qty": "7",
+                    "fill_price": "10",
+                    "status": "filled",
+                },
+            }
+        )
+        bus.publish_order(
+            {
+                "event": "fill",
+                "order": {
+                    "id": "o-1",
+                    "client_order_id": "c-1",
+                    "symbol": "AAPL",
+                    "side": "buy",
+                    "filled_qty": "3",
+                    "fill_price": "10",
+                    "status": "filled",
+                },
+            }
+        )
+        fill = await asyncio.wait_for(fills.get(), timeout=1.0)
+        position = await asyncio.wait_for(fills.get(), timeout=1.0)
+        loop_task.cancel()
+
+        assert (fill.topic, fill.symbol, fill.data["qty"]) == (FILL, "AAPL", 3.0)
+        assert (position.topic, position.data["qty"]) == (POSITION, 3.0)
+        assert state.positions["AAPL"].qty == pytest.approx(3.0)
+        assert "o-9" not in engine._order_fill_qty
+
+    _run(scenario())
+
+
+def test_keep_all_subscription_never_drops():
+    async def scenario():
+        bus = UpdateBus()
+        sub = bus.subscribe(FILL, maxsize=2, policy="keep_all")
+        for qty in range(5):
+            bus.publish(FILL, symbol="AAPL", data={"qty": qty})
+        assert [(await sub.get()).data["qty"] for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert sub.dropped == 0
+
+    _run(scenario())
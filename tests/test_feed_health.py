@@ -1,8 +1,9 @@
 import datetime as dt
 
+import numpy as np
 from pytest import approx
 
-from app.data.quality import FeedHealth
+from app.data.quality import FeedHealth, _session_gaps
 
 
 def test_is_stale_after_threshold():
@@ -29,3 +30,61 @@ def test_latency_percentiles():
     summary = health.latency_summary("MSFT")
     assert summary["p50"] == approx(0.15, rel=1e-2)
     assert summary["p95"] == approx(0.37, rel=1e-2)
+
+
+def test_stale_symbols_sweeps_universe_and_reports_transitions():
+    changes = []
+    health = FeedHealth(on_state_change=lambda symbol, status: changes.append((symbol, status)))
+    base = dt.datetime(2024, 1, 2, 15, 0, tzinfo=dt.timezone.utc)
+    for idx in range(200):
+        event_ts = base - dt.timedelta(seconds=idx % 10)
+        health.note_event(f"SYM{idx}", event_ts, event_ts)
+
+    stale = health.stale_symbols(base + dt.timedelta(seconds=1), 5)
+
+    expected = {f"SYM{idx}" for idx in range(200) if idx % 10 + 1 > 5}
+    assert set(stale) == expected
+    assert {symbol for symbol, status in changes if status == "STALE"} == expected
+    assert health.get_status("SYM0") == "OK"
+    assert health.get_status("SYM9") == "STALE"
+
+    health.set_market_open(False)
+    assert health.stale_symbols(base + dt.timedelta(hours=1), 5) == []
+
+
+def test_latency_ring_keeps_most_recent_samples():
+    health = FeedHealth()
+    base = dt.datetime(2024, 1, 2, 15, 0, tzinfo=dt.timezone.utc)
+    for idx in range(600):
+        latency = 10.0 if idx < 100 else 0.5
+        health.note_event("SPY", base, base + dt.timedelta(seconds=latency))
+    health.note_event("QQQ", base, base + dt.timedelta(seconds=0.25))
+
+    summaries = health.latency_summaries()
+
+    assert summaries["SPY"] == {"p50": approx(0.5), "p95": approx(0.5)}
+    assert summaries["QQQ"] == health.latency_summary("QQQ") == {"p50": 0.25, "p95": 0.25}
+    assert health.latency_summaries(["iwm"]) == {"IWM": {"p50": None, "p95": None}}
+
+
+def test_session_gaps_count_session_minutes_only():
+    friday_close = dt.datetime(2024, 1, 5, 20, 59, tzinfo=dt.timezone.utc)
+    monday_open = dt.datetime(2024, 1, 8, 14, 30, tzinfo=dt.timezone.utc)
+    timestamps = np.array(
+        [
+            friday_close.timestamp(),
+            monday_open.timestamp(),
+            (monday_open + dt.timedelta(minutes=1)).timestamp(),
+            (monday_open + dt.timedelta(minutes=5)).timestamp(),
+        ]
+    )
+
+    gaps = _session_gaps(timestamps)
+
+    assert gaps == [
+        (
+            (monday_open + dt.timedelta(minutes=1)).timestamp(),
+            (monday_open + dt.timedelta(minutes=5)).timestamp(),
+            3,
+        )
+    ]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from services.sentiment.engine import InferenceEngine
 from services.sentiment.filters import dedupe, language_filter, source_whitelist
-from services.sentiment.rule_model import score_text
+from services.sentiment.rule_model import score_text, score_texts
+from services.sentiment.scoring import heuristic_score, heuristic_scores
 from services.sentiment.types import NewsItem
 
 
@@ -46,3 +48,50 @@ def test_filters_and_rule_scoring() -> None:
 
     assert score_text("record surge growth") > 0
     assert score_text("fraud lawsuit slump") < 0
+
+
+def test_batch_scorers_match_per_item() -> None:
+    headlines = [
+        "AAPL beats on strong growth",
+        "Lossurge: recall of downgraded units",
+        "",
+        "MSFT\nmisses, shares FELL after probe",
+        "Record profit tops estimates; analysts upgrade",
+        "Nothing to see here",
+    ]
+    summaries = ["", "cut guidance", "", "fraud probe widens", "beats", ""]
+    assert score_texts(headlines) == [score_text(h) for h in headlines]
+    assert heuristic_scores(headlines, summaries) == [
+        heuristic_score(h, s) for h, s in zip(headlines, summaries, strict=True)
+    ]
+    assert score_texts([]) == [] and heuristic_scores([]) == []
+
+
+def test_inference_engine_batches_and_caches() -> None:
+    calls: list[int] = []
+
+    class _LengthBackend:
+        name = "test"
+
+        def run(self, texts):
+            calls.append(len(texts))
+            return [{"positive": float(len(t)), "negative": 0.0, "neutral": 0.0} for t in texts]
+
+    backend = _LengthBackend()
+    engine = InferenceEngine(backend, max_batch=2, max_wait_ms=5, cache_size=8)
+
+    texts = ["AAPL beats", "MSFT misses badly", "aapl   BEATS", "NVDA record quarter"]
+    results = engine.score_many(texts)
+    assert calls == [2, 1]
+    assert results[0] == results[2]
+    assert results[1]["positive"] == float(len("MSFT misses badly"))
+
+    again = engine.submit("MSFT misses badly").result(timeout=1)
+    assert again == results[1]
+    fresh = [engine.submit(text) for text in ("TSLA recall", "AMD upgrade")]
+    assert [f.result(timeout=1)["positive"] for f in fresh] == [11.0, 11.0]
+
+    stats = engine.snapshot()
+    assert stats["cache_hits"] == 2.0
+    assert stats["requests"] == 7.0
+    assert stats["batches"] >= 3.0
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routes import logs
+from backend.services.log_query import LogQuery, iter_lines_reverse, tail
+
+
+def _write(path: Path, events: list[dict], *, partial: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        for evt in events:
+            handle.write(json.dumps(evt) + "\n")
+        handle.write(partial)
+
+
+def _event(idx: int, level: str = "INFO") -> dict:
+    return {
+        "timestamp": f"2024-01-01T00:{idx // 60:02d}:{idx % 60:02d}+00:00",
+        "level": level,
+        "event": "order_update" if idx % 2 else "heartbeat",
+        "seq": idx,
+    }
+
+
+def test_reverse_reader_spans_block_boundaries(tmp_path: Path) -> None:
+    path = tmp_path / "logs.ndjson"
+    _write(path, [_event(i) for i in range(200)])
+    seqs = [json.loads(line)["seq"] for line in iter_lines_reverse(path, block_size=97)]
+    assert seqs == list(range(199, -1, -1))
+
+    query = LogQuery.build(event="order_update", since="2024-01-01T00:03:00Z")
+    events, cursor = tail(path, 5, query)
+    assert [evt["seq"] for evt in events] == [191, 193, 195, 197, 199]
+    assert cursor == path.stat().st_size
+
+
+def test_logs_endpoint_filters_and_polls_by_cursor(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "runtime" / "logs.ndjson"
+    diag_path = tmp_path / "logs" / "ui_diagnostics.ndjson"
+    monkeypatch.setattr(logs, "_LOG_PATH", log_path)
+    monkeypatch.setattr(logs, "_UI_DIAG", diag_path)
+    events = [_event(i, "ERROR" if i % 10 == 0 else "INFO") for i in range(50)]
+    _write(log_path, events, partial='{"seq": ')
+
+    app = FastAPI()
+    app.include_router(logs.router)
+    client = TestClient(app)
+
+    resp = client.get("/logs", params={"tail": 3, "level": "error"})
+    assert [evt["seq"] for evt in resp.json()] == [20, 30, 40]
+    cursor = resp.headers[logs.CURSOR_HEADER]
+
+    # Nothing new yet; the half-written line is not returned.
+    assert client.get("/logs", params={"cursor": cursor}).json() == []
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write('99, "level": "ERROR", "timestamp": "2024-01-01T01:00:00+00:00"}\n')
+    diag = {"type": "ui_diagnostics", "summary": {"timestamp": "2024-01-01T02:00:00+00:00"}}
+    _write(diag_path, [diag])
+
+    resp = client.get("/logs", params={"cursor": cursor})
+    body = resp.json()
+    assert [evt.get("seq") for evt in body] == [99, None]
+    assert client.get("/logs", params={"cursor": resp.headers[logs.CURSOR_HEADER]}).json() == []
+
+
+def test_out_of_range_timestamps_do_not_break_queries(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "runtime" / "logs.ndjson"
+    monkeypatch.setattr(logs, "_LOG_PATH", log_path)
+    monkeypatch.setattr(logs, "_UI_DIAG", tmp_path / "logs" / "ui_diagnostics.ndjson")
+    bad = [{"timestamp": stamp, "level": "ERROR", "seq": -1} for stamp in ("1e20", "-1e20", "inf")]
+    _write(log_path, [_event(0, "ERROR"), *bad, _event(1, "ERROR")])
+
+    query = LogQuery.build(level="error", since="2024-01-01T00:00:00Z")
+    events, _ = tail(log_path, 10, query)
+    assert [evt["seq"] for evt in events] == [0, 1]
+
+    app = FastAPI()
+    app.include_router(logs.router)
+    resp = TestClient(app).get("/logs", params={"since": "1e20", "tail": 10})
+    assert resp.status_code == 200
@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from services.runtime.metrics import Metrics
+from services.telemetry.registry import Registry
+
+
+def test_counter_merges_per_thread_shards():
+    registry = Registry()
+    counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.labels(kind="bar").inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.labels(kind="bar").value == 4000
+    assert 'jobs_total{kind="bar"} 4000' in registry.render()
+    # Rows of exited threads are folded into the base row and released.
+    assert counter.labels(kind="bar")._shards._rows == {}
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.histogram("hop_seconds", "Hop.", ("stage",), buckets=(0.1, 1.0))
+    child = histogram.labels(stage="ack")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE hop_seconds histogram" in lines
+    assert 'hop_seconds_bucket{stage="ack",le="0.1"} 2' in lines
+    assert 'hop_seconds_bucket{stage="ack",le="1"} 3' in lines
+    assert 'hop_seconds_bucket{stage="ack",le="+Inf"} 4' in lines
+    assert 'hop_seconds_count{stage="ack"} 4' in lines
+    assert 'hop_seconds_sum{stage="ack"} 3.65' in lines
+
+
+def test_gauge_function_and_label_escaping():
+    registry = Registry()
+    depth = [3]
+    gauge = registry.gauge("queue_depth", "Depth.", ("queue",))
+    gauge.labels(queue='a"b').set_function(lambda: depth[0])
+    depth[0] = 7
+
+    assert 'queue_depth{queue="a\\"b"} 7' in registry.render()
+
+
+def test_registry_rejects_conflicting_definitions():
+    registry = Registry()
+    counter = registry.counter("events_total")
+
+    assert registry.counter("events_total") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("events_total")
+    with pytest.raises(ValueError):
+        registry.counter("bad-name")
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+    with pytest.raises(ValueError):
+        registry.histogram("lat_seconds", labelnames=("stage",)).observe(1.0)
+
+
+def test_runtime_metrics_render_through_registry():
+    registry = Registry()
+    metrics = Metrics(registry)
+    metrics.inc("market_bars")
+    metrics.inc("market_bars", 2)
+    metrics.set("last_bar_ts", 12.5)
+
+    counters, gauges = metrics.snapshot()
+
+    assert counters == {"market_bars": 3}
+    assert gauges == {"last_bar_ts": 12.5}
+    rendered = metrics.render()
+    assert "# TYPE market_bars counter\nmarket_bars 3" in rendered
+    assert "last_bar_ts 12.5" in rendered
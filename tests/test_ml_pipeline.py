@@ -2,10 +2,16 @@ import numpy as np
 
 from app.data.market import MockDataClient
 from app.ml.models import SklearnModel
+from app.ml import selection
+from app.ml.selection import CANDIDATES, TrainingScheduler
 from app.ml.trainer import latest_feature_row, train_intraday_classifier
 
 
-def test_training_and_prediction(tmp_path):
+def test_training_and_prediction(tmp_path, monkeypatch):
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("a single symbol trains inline")
+
+    monkeypatch.setattr(selection, "ProcessPoolExecutor", _no_pool)
     client = MockDataClient()
     metrics = train_intraday_classifier(["AAPL"], client, out_dir=tmp_path)
     assert "AAPL" in metrics
@@ -16,3 +22,20 @@ def test_training_and_prediction(tmp_path):
     probs = model.predict_proba(features)
     assert probs.shape[1] == 2
     assert np.isfinite(probs).all()
+
+
+def test_scheduler_trains_per_symbol_artifacts(tmp_path):
+    client = MockDataClient()
+    scheduler = TrainingScheduler(
+        max_workers=2, screen_fraction=0.5, min_screen_rows=50, min_pool_tasks=1
+    )
+    metrics = train_intraday_classifier(
+        ["AAPL", "MSFT"], client, out_dir=tmp_path, scheduler=scheduler
+    )
+    assert set(metrics) == {"AAPL", "MSFT"}
+
+    names = {path.name for path in tmp_path.glob("*.joblib")}
+    assert {"intraday_lr.joblib", "intraday_lr_AAPL.joblib", "intraday_lr_MSFT.joblib"} <= names
+    assert not list(tmp_path.glob("*.tmp"))
+    for dropped in scheduler.abandoned.values():
+        assert dropped and set(dropped) < set(CANDIDATES)
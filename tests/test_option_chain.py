@@ -0,0 +1,80 @@
+"""Tests for the columnar option chain."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from services.execution.option_exit_watcher import OptionExitWatcher
+from services.options.chain import OptionChain, OptionContract
+from services.options.select import select_contract
+
+
+def _chain() -> OptionChain:
+    return OptionChain(
+        "AAPL",
+        symbol=["C100", "C105", "P95"],
+        expiry=["2025-01-17", "2025-01-17", "2025-01-17"],
+        is_call=[True, True, False],
+        dte=[30, 30, 30],
+        strike=[100.0, 105.0, 95.0],
+        delta=[0.52, 0.31, -0.29],
+        bid=[4.9, 2.4, np.nan],
+        ask=[5.1, 2.6, np.nan],
+        mid=[5.0, 2.5, np.nan],
+        oi=[1000, 800, np.nan],
+        volume=[400, 300, 200],
+        vega=[0.2, 0.15, 0.14],
+    )
+
+
+def test_views_lookup_and_lazy_contracts():
+    chain = _chain()
+
+    calls = chain[chain.is_call]
+    head = chain[:2]
+
+    assert len(calls) == 2
+    assert np.shares_memory(head.strike, chain.strike)
+    assert chain.find("P95") == 2 and chain.find("missing") is None
+    put = chain[2]
+    assert isinstance(put, OptionContract)
+    assert put.side == "put" and put.mid is None and put.oi is None
+    assert put.expiry == "2025-01-17" and put.vega == pytest.approx(0.14)
+
+    frame = chain.to_pandas()
+    assert list(frame["side"]) == ["call", "call", "put"]
+    assert np.shares_memory(frame["delta"].to_numpy(), chain.delta)
+
+
+def test_round_trip_from_contracts_keeps_selection():
+    chain = _chain()
+    contracts = list(chain)
+
+    rebuilt = OptionChain.from_contracts(contracts)
+
+    assert list(rebuilt.symbol) == list(chain.symbol)
+    for source in (chain, contracts, rebuilt):
+        picked = select_contract(source, "call", 0.30, 0.05, 100, 100, 7, 45, 50.0)
+        assert picked is not None and picked.symbol == "C105"
+    assert select_contract(chain, "put", 0.30, 0.05, 100, 100, 7, 45, 50.0) is None
+
+
+def test_exit_watcher_reads_mid_from_cached_chain():
+    class Source:
+        calls = 0
+
+        async def fetch(self, underlying: str) -> OptionChain:
+            Source.calls += 1
+            return _chain()
+
+    watcher = OptionExitWatcher(
+        state=None, exec_engine=None, chain_source=Source()  # type: ignore[arg-type]
+    )
+    watcher._infer_underlying = lambda symbol: "AAPL"  # type: ignore[method-assign]
+
+    assert asyncio.run(watcher._fetch_mid("C105")) == pytest.approx(2.5)
+    assert asyncio.run(watcher._fetch_mid("P95")) is None
+    assert Source.calls == 1
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from services.options.adapter import (
@@ -30,3 +31,25 @@ def test_mock_adapter_filters_liquidity(monkeypatch):
     # Should preserve both call and put at the ATM strike
     assert set(chain["side"]) == {"call", "put"}
     assert pd.api.types.is_datetime64_any_dtype(chain["expiry"])
+
+
+def test_mock_adapter_keeps_recorded_columns(monkeypatch):
+    monkeypatch.setenv("MOCK_MODE", "true")
+    monkeypatch.setenv("ARTIFACTS_DIR", str(Path(__file__).resolve().parent / "artifacts"))
+
+    chain = get_option_chain("SPY", "2023-08-01")
+    assert list(chain.columns) == [
+        "symbol",
+        "as_of",
+        "expiry",
+        "strike",
+        "side",
+        "iv",
+        "bid",
+        "ask",
+        "oi",
+        "underlying_price",
+        "mid",
+    ]
+    assert pd.api.types.is_integer_dtype(chain["oi"])
+    np.testing.assert_allclose(chain["mid"], (chain["bid"] + chain["ask"]) / 2)
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.risk.manager import RiskManager
+from services.execution.engine import ExecutionEngine
+from services.execution.types import ExecIntent
+from services.risk.state import InMemoryState
+from services.runtime.tracing import Tracer, mark
+from tests.fakes import FakeAdapter
+from tests.test_execution_engine import _force_disarm_kill_switch
+
+
+def test_disabled_tracer_hands_out_no_traces():
+    tracer = Tracer(enabled=False)
+
+    trace = tracer.start("bar", symbol="AAPL")
+    mark(trace, "signal")
+    tracer.finish(trace)
+
+    assert trace is None
+    assert tracer.dump() == []
+
+
+def test_trace_records_stage_deltas_and_sampled_dumps():
+    tracer = Tracer(enabled=True, sample_rate=1.0, capacity=2)
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        trace = tracer.start("bar", symbol=symbol)
+        mark(trace, "indicators")
+        mark(trace, "signal")
+        tracer.finish(trace)
+        tracer.finish(trace)
+
+    dumps = tracer.dump()
+
+    assert [entry["attrs"]["symbol"] for entry in dumps] == ["MSFT", "NVDA"]
+    stages = dumps[-1]["stages"]
+    assert [stage["stage"] for stage in stages] == ["indicators", "signal"]
+    assert sum(stage["ms"] for stage in stages) == pytest.approx(dumps[-1]["duration_ms"])
+
+
+def test_chrome_trace_nests_stages_inside_the_trace():
+    tracer = Tracer(enabled=True, sample_rate=1.0)
+    trace = tracer.start("bar", symbol="SPY")
+    mark(trace, "risk")
+    mark(trace, "broker_ack")
+    tracer.finish(trace)
+
+    events = tracer.chrome_trace()["traceEvents"]
+
+    assert [event["name"] for event in events] == ["bar", "risk", "broker_ack"]
+    assert all(event["ph"] == "X" and event["tid"] == trace.trace_id for event in events)
+    outer = events[0]
+    last = events[-1]
+    # Epoch-microsecond floats only resolve to ~0.25us, so allow 1us of slack.
+    assert last["ts"] + last["dur"] <= outer["ts"] + outer["dur"] + 1.0
+
+
+def test_execution_engine_marks_intent_trace():
+    state = InMemoryState()
+    risk = RiskManager(state)
+    _force_disarm_kill_switch(risk)
+    engine = ExecutionEngine(risk=risk, state=state, adapter=FakeAdapter())
+    tracer = Tracer(enabled=True, sample_rate=1.0)
+    trace = tracer.start("bar", symbol="AAPL")
+
+    intent = ExecIntent(symbol="AAPL", side="buy", qty=1, limit_price=10.0, trace=trace)
+    result = asyncio.run(engine.submit(intent))
+
+    assert result.accepted is True
+    assert [stage for stage, _ in trace.marks] == ["guards", "risk", "order_build", "broker_ack"]
@@ -5,8 +5,10 @@ import pytest
 
 from app.execution.audit import AuditLog
 from app.execution.router import ExecIntent, OrderRouter
+from services.policy.engine import PolicyEngine
 from services.policy.gates import should_trade
 from services.policy.sizing import size_position
+from strategies.registry import StrategyRegistry, alpha_intraday_momo, alpha_mean_reversion
 
 
 class StubRisk:
@@ -122,6 +124,31 @@ def test_should_trade_blocks_on_low_metrics():
     assert "proba_below_min" in info["reason_codes"]
 
 
+def test_policy_engine_batch_matches_registry_blend(monkeypatch):
+    registry = StrategyRegistry()
+    registry.register("momo", alpha_intraday_momo, weight=2.0, feature="momo_score")
+    registry.register("mr", alpha_mean_reversion, weight=-0.5, feature="mr_score")
+    registry.register("custom", lambda ctx: ctx.get("brk_score", 0.0) * 0.5, weight=1.0)
+    engine = PolicyEngine(registry)
+
+    contexts = [
+        {"momo_score": 0.4, "mr_score": -0.2, "brk_score": 0.6, "proba_up": 0.7},
+        {"momo_score": 0.05, "probability": 0.3},
+        {"mr_score": 0.1, "alpha": "0.5", "proba_up": None},
+    ]
+    decisions = engine.evaluate_many(contexts)
+    for ctx, decision in zip(contexts, decisions, strict=True):
+        assert decision.alpha_blend == pytest.approx(registry.blend(dict(ctx)))
+    assert [d.allow for d in decisions] == [True, False, True]
+    assert decisions[1].reason_codes == ["alpha_below_min", "proba_below_min"]
+    assert decisions[2].alpha == 0.5 and decisions[2].reason_codes == ["ok", "proba_missing"]
+
+    monkeypatch.setenv("POLICY_PROBA_MIN", "0.8")
+    assert engine.evaluate(contexts[0]).allow is True
+    engine.reload()
+    assert engine.evaluate(contexts[0]).reason_codes == ["proba_below_min"]
+
+
 def test_size_position_caps_daily_loss(monkeypatch):
     monkeypatch.setenv("DAILY_LOSS_CAP_BPS", "100")
     details = size_position(
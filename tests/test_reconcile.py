@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 
-from app.execution.audit import AuditLog
+from app.execution.audit import AuditLog, AuditWriteError
 from app.execution.reconcile import Reconciler
 
 
@@ -167,3 +167,41 @@ def test_orders_list_normalized(reconcile_client: TestClient):
     }
     for order in orders:
         assert required_keys.issubset(order.keys())
+
+
+def test_audit_log_rotates_and_seeks_by_index(tmp_path: Path):
+    path = tmp_path / "audit.ndjson"
+    audit = AuditLog(path, durability="flush", max_bytes=400, backup_count=10)
+    for idx in range(30):
+        audit.append({"event": "order_new", "client_order_id": f"cid-{idx % 3}", "seq": idx})
+
+    assert len(audit.segments()) > 2
+    assert [evt["seq"] for evt in audit.tail(12)] == list(range(18, 30))
+    assert [evt["seq"] for evt in audit.find("cid-1")] == list(range(1, 30, 3))
+    assert [evt["seq"] for evt in audit.find("cid-1", limit=2)] == [25, 28]
+    audit.close()
+
+    # A missing sidecar index is rebuilt from the data file on open.
+    (tmp_path / "audit.ndjson.idx").unlink()
+    reopened = AuditLog(path)
+    assert reopened.tail(1)[0]["seq"] == 29
+    assert reopened.find("cid-2")[-1]["seq"] == 29
+    reopened.append({"event": "order_seed", "order": {"client_order_id": "cid-9"}})
+    assert reopened.find("cid-9")[0]["event"] == "order_seed"
+    reopened.close()
+
+
+def test_audit_append_raises_when_the_write_fails(tmp_path: Path, monkeypatch):
+    audit = AuditLog(tmp_path / "audit.ndjson", durability="flush")
+
+    def broken(batch):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(audit, "_write", broken)
+    with pytest.raises(AuditWriteError):
+        audit.append({"event": "order_new", "client_order_id": "cid-1"})
+
+    monkeypatch.undo()
+    audit.append({"event": "order_new", "client_order_id": "cid-2"})
+    assert audit.tail(1)[0]["client_order_id"] == "cid-2"
+    audit.close()
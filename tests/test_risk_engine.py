@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from core.runtime_config import reload_config
 from services.risk.engine import Proposal, RiskManager
 from services.risk.state import InMemoryState, Position
 
@@ -30,6 +31,7 @@ def setup_env() -> None:
 
 
 def build_manager(state: InMemoryState) -> RiskManager:
+    reload_config()
     return RiskManager(state)
 
 
@@ -219,3 +221,34 @@ def test_risk_budget_zero_blocks() -> None:
     assert not decision.allow
     assert decision.reason == "per_trade_risk_exceeded"
     assert decision.max_qty == pytest.approx(0.0)
+
+
+def test_batch_check_accumulates_exposure_and_snapshot_is_versioned() -> None:
+    setup_env()
+    os.environ["MAX_NOTIONAL"] = "5000"
+    os.environ["MAX_SYMBOL_NOTIONAL"] = "3000"
+    os.environ["MAX_POSITIONS"] = "10"
+    state = InMemoryState()
+    manager = build_manager(state)
+
+    first = manager.snapshot()
+    assert manager.snapshot() is first
+    state.positions["MSFT"] = Position("MSFT", qty=1, notional=500)
+    refreshed = manager.snapshot()
+    assert refreshed is not first and refreshed.version > first.version
+    assert refreshed.open_positions == 1
+
+    decisions = manager.pre_trade_check_many(
+        [
+            Proposal("AAPL", "buy", 20, 100),
+            Proposal("AAPL", "buy", 20, 100),
+            Proposal("TSLA", "buy", 20, 100),
+            Proposal("NVDA", "buy", 20, 100),
+        ]
+    )
+    assert [d.reason for d in decisions] == [
+        "ok",
+        "max_symbol_notional_exceeded",
+        "ok",
+        "max_portfolio_notional_exceeded",
+    ]
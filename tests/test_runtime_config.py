@@ -0,0 +1,67 @@
+import json
+
+from core.runtime_config import get_config, reload_config, subscribe
+from core.runtime_flags import get_runtime_flags
+
+
+def test_layers_resolve_file_then_env_then_overrides(monkeypatch, tmp_path):
+    config_file = tmp_path / "runtime.json"
+    config_file.write_text(
+        json.dumps({"runtime": {"OPTIONS_MIN_OI": 10, "OPTIONS_MAX_DTE": 30, "KILL_SWITCH": "on"}})
+    )
+    monkeypatch.setenv("RUNTIME_CONFIG_FILE", str(config_file))
+    monkeypatch.setenv("OPTIONS_MAX_DTE", "60")
+    monkeypatch.delenv("KILL_SWITCH", raising=False)
+
+    config = reload_config({"OPTIONS_MIN_OI": 500})
+
+    assert config.options.min_oi == 500
+    assert config.options.max_dte == 60
+    assert config.kill_switch.env_engaged is True
+    assert config.config_file == str(config_file)
+    assert config.overrides == ("OPTIONS_MIN_OI",)
+
+
+def test_snapshot_is_shared_until_reload(monkeypatch):
+    monkeypatch.setenv("DEFAULT_TP_PCT", "2.5")
+    before = get_config()
+
+    assert get_config() is before
+    assert before.execution.default_tp_pct != 2.5
+
+    after = reload_config()
+    assert after.version == before.version + 1
+    assert after.execution.default_tp_pct == 2.5
+    assert get_config() is after
+
+
+def test_subscribers_receive_old_and_new_snapshots(monkeypatch):
+    monkeypatch.setenv("ALPACA_SECRET_KEY", "shh")
+    seen = []
+    unsubscribe = subscribe(lambda old, new: seen.append((old, new)))
+    try:
+        first = get_config()
+        second = reload_config({"OPTIONS_PRICE_MAX": "25"})
+    finally:
+        unsubscribe()
+    reload_config({})
+
+    assert seen == [(first, second)]
+    assert second.options.price_max == 25.0
+    assert "alpaca_secret" not in second.as_dict()["flags"]
+
+
+def test_runtime_flags_come_from_the_snapshot(monkeypatch):
+    monkeypatch.setenv("MOCK_MODE", "false")
+    config = reload_config({"MOCK_MODE": "true", "DRY_RUN": "true"})
+
+    # Broker factories and the execution engine read the same layers.
+    assert get_runtime_flags() is config.flags
+    assert get_runtime_flags().mock_mode is True
+
+    # An in-process environment write to a flag variable rebuilds the snapshot.
+    reload_config({})
+    monkeypatch.setenv("MOCK_MODE", "true")
+    flags = get_runtime_flags()
+    assert flags.mock_mode is True
+    assert get_config().flags is flags
@@ -6,6 +6,8 @@ import sys
 import types
 from typing import Dict, List
 
+import pytest
+
 # Provide a lightweight stub for alpaca.data.historical.news so imports succeed in tests.
 _alpaca_module = types.ModuleType("alpaca")
 _alpaca_data = types.ModuleType("alpaca.data")
@@ -30,8 +32,11 @@ sys.modules.setdefault("alpaca.data", _alpaca_data)
 sys.modules.setdefault("alpaca.data.historical", _alpaca_hist)
 sys.modules.setdefault("alpaca.data.historical.news", _alpaca_news)
 
-from services.sentiment.poller import Poller
-from services.sentiment.store import SentiStore
+from services.sentiment.history import SentimentHistory, load_ndjson  # noqa: E402
+from services.sentiment.poller import Poller  # noqa: E402
+from services.sentiment.rule_model import infer_batch as rule_infer_batch  # noqa: E402
+from services.sentiment.seen import SeenIndex  # noqa: E402
+from services.sentiment.store import SentiStore  # noqa: E402
 
 
 class _StaticFetcher:
@@ -60,3 +65,119 @@ def test_pipeline_updates_store() -> None:
     assert -1.0 <= score <= 1.0
     assert velocity != 0.0
     assert set(result.keys()) >= {"AAPL", "MSFT"}
+
+
+class _RecordingFetcher:
+    """Fetcher returning Alpaca-shaped dicts and recording ``since`` arguments."""
+
+    def __init__(self, items: Dict[str, List[dict]]) -> None:
+        self.items = items
+        self.since_calls: List[object] = []
+
+    def fetch_headlines(self, symbol: str, hours_back: int = 6, since=None) -> List[dict]:
+        self.since_calls.append(since)
+        return list(self.items.get(symbol, []))
+
+
+def test_poller_scores_each_headline_once(tmp_path) -> None:
+    store = SentiStore(ttl_min=120, decay_per_min=0.0)
+    fetcher = _RecordingFetcher(
+        {
+            "AAPL": [
+                {
+                    "id": "1",
+                    "headline": "AAPL beats on record profit",
+                    "updated_at": "2024-01-02T14:30:00Z",
+                },
+                {"id": "2", "headline": "AAPL faces probe", "updated_at": "2024-01-02T14:35:00Z"},
+            ]
+        }
+    )
+    batches: List[int] = []
+
+    def scorer(items):
+        batches.append(len(items))
+        return rule_infer_batch(items)
+
+    seen = SeenIndex(path=tmp_path / "seen.json", ttl_sec=3600)
+    poller = Poller(
+        store=store, symbols=["AAPL", "MSFT"], fetcher=fetcher, seen=seen, scorer=scorer
+    )
+
+    first = poller.run_once(now=1000.0)
+    assert len(first["AAPL"]) == 2 and first["MSFT"] == []
+    assert batches == [2]
+    assert store.get("AAPL", now=1000.0)[1] == 2
+
+    second = poller.run_once(now=1010.0)
+    assert second["AAPL"] == []
+    assert batches == [2]
+    assert store.get("AAPL", now=1010.0)[1] == 2
+    assert any(call is not None for call in fetcher.since_calls)
+
+    reloaded = SeenIndex(path=tmp_path / "seen.json", ttl_sec=3600)
+    assert "alpaca:AAPL:1" in reloaded
+    assert reloaded.watermark("AAPL") is not None
+
+
+def test_poller_rescores_headlines_after_a_scorer_failure(tmp_path) -> None:
+    store = SentiStore(ttl_min=120, decay_per_min=0.0)
+    fetcher = _RecordingFetcher(
+        {
+            "AAPL": [
+                {"id": "1", "headline": "AAPL faces probe", "updated_at": "2024-01-02T14:35:00Z"}
+            ]
+        }
+    )
+    calls: List[int] = []
+
+    def scorer(items):
+        calls.append(len(items))
+        if len(calls) == 1:
+            raise RuntimeError("model failed to load")
+        return rule_infer_batch(items)
+
+    seen = SeenIndex(path=tmp_path / "seen.json", ttl_sec=3600)
+    poller = Poller(store=store, symbols=["AAPL"], fetcher=fetcher, seen=seen, scorer=scorer)
+
+    with pytest.raises(RuntimeError):
+        poller.run_once(now=1000.0)
+    assert "alpaca:AAPL:1" not in seen
+    assert seen.watermark("AAPL") is None
+
+    result = poller.run_once(now=1010.0)
+    assert calls == [1, 1]
+    assert len(result["AAPL"]) == 1
+    assert "alpaca:AAPL:1" in seen and seen.watermark("AAPL") is not None
+
+
+def test_history_as_of_and_warm_start(tmp_path) -> None:
+    path = tmp_path / "history.ndjson"
+    history = SentimentHistory(path, snapshot_sec=0.0)
+    store = SentiStore(ttl_min=120, decay_per_min=0.0, history=history)
+    store.upsert("AAPL", 0.5, now=100.0)
+    store.upsert("AAPL", -0.5, now=200.0)
+    store.upsert("MSFT", 0.2, now=150.0)
+
+    assert history.as_of("AAPL", 99.0) is None
+    assert history.as_of("AAPL", 150.0) == 0.5
+    assert history.as_of("AAPL", 250.0) == -0.5
+    rolling = history.rolling("AAPL", now=200.0, window_sec=150.0)
+    assert rolling.count == 2 and rolling.mean == 0.0 and rolling.last == -0.5
+    assert store.get("AAPL", now=300.0) == store.get("AAPL", now=300.0)
+    assert [row[1] for row in history.replay()] == ["AAPL", "MSFT", "AAPL"]
+
+    assert history.maybe_snapshot(now=300.0)
+    restored = SentimentHistory(path).restore()
+    warm = SentiStore(ttl_min=120, decay_per_min=0.0, history=restored)
+    assert warm.warm_start(now=300.0) == 3
+    assert warm.get("AAPL", now=300.0) == store.get("AAPL", now=300.0)
+
+
+def test_history_reads_static_fixture(tmp_path) -> None:
+    path = tmp_path / "senti.ndjson"
+    path.write_text('{"symbol":"aapl","score":0.25}\n{"symbol":"SPY","score":0.1,"ts":50}\n')
+    history = load_ndjson(path)
+    assert history.as_of("AAPL", 0.0) == 0.25
+    assert history.as_of("SPY", 49.0, 0.0) == 0.0
+    assert history.as_of("SPY", 60.0) == 0.1
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from services.telemetry.metrics import TelemetryMetrics
+from services.telemetry.sketch import DDSketch, WindowedSketch
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_ddsketch_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3.0, 1.0) for _ in range(5000)]
+    sketch = DDSketch(0.01)
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+
+def test_ddsketch_merge_matches_single_sketch():
+    left, right, combined = DDSketch(), DDSketch(), DDSketch()
+    for value in range(1, 501):
+        (left if value % 2 else right).add(float(value))
+        combined.add(float(value))
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    assert left.quantiles((0.5, 0.99)) == combined.quantiles((0.5, 0.99))
+    with pytest.raises(ValueError):
+        left.merge(DDSketch(0.05))
+
+
+def test_windowed_sketch_expires_old_slices():
+    clock = FakeClock()
+    sketch = WindowedSketch((("1m", 60.0, 6), ("1h", 3600.0, 12)), clock=clock)
+    for _ in range(10):
+        sketch.observe(100.0)
+
+    clock.now += 120
+    sketch.observe(5.0)
+
+    values, count = sketch.quantiles((0.5,), "1m")
+    assert count == 1
+    assert values[0] == pytest.approx(5.0, rel=0.01)
+    _, hour_count = sketch.quantiles((0.5,), "1h")
+    assert hour_count == 11
+
+
+def test_metrics_track_latency_per_label():
+    clock = FakeClock()
+    telemetry = TelemetryMetrics(clock=clock)
+    for _ in range(20):
+        telemetry.observe_order_latency(10.0, endpoint="submit_order", symbol="AAPL")
+        telemetry.observe_order_latency(200.0, endpoint="submit_order", symbol="MSFT")
+
+    assert telemetry.latency_quantile(0.5, symbol="AAPL", endpoint="submit_order") == (
+        pytest.approx(10.0, rel=0.01)
+    )
+    assert telemetry.latency_quantile(0.5, symbol="MSFT", endpoint="submit_order") == (
+        pytest.approx(200.0, rel=0.01)
+    )
+    assert telemetry.latency_quantile(0.5, symbol="TSLA") is None
+
+    snapshot = telemetry.snapshot(labels=True)
+    latency = snapshot["order_latency_ms"]
+    assert latency["count"] == 40
+    assert latency["latest"] == 200.0
+    assert set(latency["windows"]) == {"1m", "5m", "1h"}
+    assert latency["p95"] == pytest.approx(200.0, rel=0.01)
+    symbols = {entry["symbol"]: entry for entry in latency["by_label"]}
+    assert symbols["AAPL"]["windows"]["5m"]["count"] == 20
+
+
+def test_metrics_snapshot_without_samples_keeps_shape():
+    latency = TelemetryMetrics().snapshot()["order_latency_ms"]
+
+    assert latency["p50"] is None and latency["p95"] is None
+    assert latency["count"] == 0
+    assert "by_label" not in latency
+
+
+def test_metrics_reject_unknown_windows_and_bound_label_sets():
+    clock = FakeClock()
+    telemetry = TelemetryMetrics(clock=clock, max_label_sets=2)
+    telemetry.observe_order_latency(10.0, symbol="AAPL")
+    with pytest.raises(ValueError, match="1m"):
+        telemetry.latency_quantile(0.5, window="15m")
+
+    telemetry.observe_order_latency(20.0, symbol="MSFT")
+    telemetry.observe_order_latency(30.0, symbol="NVDA")
+    assert telemetry.latency_quantile(0.5, symbol="AAPL") is None
+    assert telemetry.latency_quantile(0.5, symbol="NVDA") == pytest.approx(30.0, rel=0.01)
+
+    # Label sets idle for longer than the widest window age out.
+    clock.now += 3601.0
+    telemetry.observe_order_latency(40.0, symbol="TSLA")
+    labels = telemetry.snapshot(labels=True)["order_latency_ms"]["by_label"]
+    assert [entry["symbol"] for entry in labels] == ["TSLA"]
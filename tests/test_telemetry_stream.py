@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+
+from backend.services.telemetry_stream import TelemetryHub, format_sse
+from services.execution.updates import get_update_bus
+from services.telemetry.metrics import TelemetryMetrics
+
+
+def test_telemetry_hub_pushes_and_coalesces(tmp_path, monkeypatch) -> None:
+    fresh = TelemetryMetrics()
+    monkeypatch.setattr("backend.services.telemetry_stream.telemetry_metrics", fresh)
+    log_path = tmp_path / "app.log"
+    log_path.write_text("old line\n")
+
+    async def runner() -> None:
+        hub = TelemetryHub(interval_sec=0.01, client_queue=8, log_path=log_path)
+        client = await hub.connect(["order", "metrics", "log"])
+        first = await asyncio.wait_for(client.get(), timeout=1)
+        assert first["topic"] == "metrics"  # current state on connect
+        await asyncio.sleep(0.05)
+
+        # The client is not reading: order updates coalesce per order.
+        bus = get_update_bus()
+        for status in ("new", "partially_filled", "filled"):
+            bus.publish("order", symbol="AAPL", client_order_id="cid-1", status=status)
+        fresh.observe_order_latency(12.0)
+        with log_path.open("a") as handle:
+            handle.write("fresh line\n")
+        await asyncio.sleep(0.1)
+
+        received = []
+        while True:
+            try:
+                received.append(await asyncio.wait_for(client.get(), timeout=0.2))
+            except asyncio.TimeoutError:
+                break
+        orders = [e for e in received if e["topic"] == "order"]
+        assert orders[-1]["data"]["status"] == "filled"
+        assert len(orders) <= 2  # one may already sit in the hand-off slot
+        assert any(
+            e["topic"] == "metrics" and e["data"]["order_latency_ms"]["count"] == 1
+            for e in received
+        )
+        assert [e["data"] for e in received if e["topic"] == "log"] == ["fresh line"]
+        assert format_sse(orders[-1]).startswith(f"id: {orders[-1]['seq']}\nevent: order\n")
+
+        await client.close()
+        assert hub._tasks == []
+
+    asyncio.run(runner())
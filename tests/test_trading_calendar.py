@@ -0,0 +1,59 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from core.trading_calendar import TradingCalendar, nyse_early_closes, nyse_holidays
+
+
+def _utc(*args: int) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def test_holiday_rules_match_published_schedule():
+    holidays = nyse_holidays(2024)
+
+    assert date(2024, 3, 29) in holidays  # Good Friday
+    assert date(2024, 6, 19) in holidays  # Juneteenth
+    assert date(2024, 11, 28) in holidays  # Thanksgiving
+    assert nyse_early_closes(2024, holidays) == {
+        date(2024, 7, 3),
+        date(2024, 11, 29),
+        date(2024, 12, 24),
+    }
+    # New Year's Day on a Saturday is not observed on the Friday before.
+    assert date(2021, 12, 31) not in nyse_holidays(2021) | nyse_holidays(2022)
+    assert date(2027, 12, 24) in nyse_holidays(2027)
+
+
+def test_open_close_and_next_open_follow_dst_and_early_closes():
+    calendar = TradingCalendar(2024, 2024)
+
+    assert calendar.is_open(_utc(2024, 1, 5, 14, 30))  # 09:30 EST
+    assert not calendar.is_open(_utc(2024, 7, 8, 13, 29))  # 09:29 EDT
+    assert calendar.is_open(_utc(2024, 7, 8, 13, 30))
+    assert calendar.is_open(_utc(2024, 7, 3, 16, 59))  # 12:59 EDT
+    assert not calendar.is_open(_utc(2024, 7, 3, 17, 0))  # early close
+    assert calendar.is_extended_hours(_utc(2024, 7, 3, 17, 0))
+    assert not calendar.is_extended_hours(_utc(2024, 7, 4, 15, 0))  # holiday
+
+    # Thursday close before Good Friday: the next open is Monday morning.
+    assert calendar.next_open(_utc(2024, 3, 28, 20, 0)) == _utc(2024, 4, 1, 13, 30)
+    assert calendar.seconds_until_open(_utc(2024, 12, 31, 21, 0)) == float("inf")
+
+
+def test_session_minutes_skip_closed_time():
+    calendar = TradingCalendar(2024, 2024)
+    timestamps = np.array(
+        [
+            _utc(2024, 1, 12, 20, 59),  # Friday 15:59 ET
+            _utc(2024, 1, 16, 14, 30),  # Tuesday open after MLK day
+            _utc(2024, 1, 16, 22, 0),  # after hours
+        ]
+    )
+
+    minutes = calendar.session_minutes(timestamps)
+
+    assert minutes[1] - minutes[0] == 1
+    assert np.isnan(minutes[2])
+    assert calendar.session_minute(timestamps[1]) == int(minutes[1])
+    assert calendar.session_minute(timestamps[2]) is None
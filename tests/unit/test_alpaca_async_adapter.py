@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.execution import alpaca_async
+from app.execution.alpaca_adapter import RETRY_AFTER_MAX_SEC, AlpacaOrderError, retry_delay
+from app.execution.alpaca_async import AsyncAlpacaAdapter
+
+
+def _adapter(handler) -> AsyncAlpacaAdapter:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncAlpacaAdapter(
+        base_url="https://paper.test",
+        key_id="key-1234",
+        secret_key="secret",
+        client=client,
+        backoff_base=0.1,
+    )
+
+
+def test_retry_after_is_honored_without_blocking(monkeypatch) -> None:
+    calls: list[httpx.Request] = []
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(alpaca_async.asyncio, "sleep", fake_sleep)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "2"}, json={"message": "busy"})
+        body = {"id": "o-1", "status": "accepted", "client_order_id": "cid-1"}
+        return httpx.Response(200, json=body)
+
+    adapter = _adapter(handler)
+    result = asyncio.run(adapter.place_order({"client_order_id": "cid-1", "symbol": "AAPL"}))
+
+    assert result["id"] == "o-1"
+    assert sleeps == [2.0]
+    assert calls[-1].headers["Idempotency-Key"] == "cid-1"
+    assert calls[-1].headers["APCA-API-KEY-ID"] == "key-1234"
+
+
+def test_same_surface_and_error_mapping() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v2/orders" and request.method == "GET":
+            assert request.url.params["status"] == "open"
+            return httpx.Response(200, json=[{"id": "o-1"}])
+        if request.url.path == "/v2/positions":
+            return httpx.Response(200, json=[])
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(422, json={"message": "invalid qty"})
+
+    adapter = _adapter(handler)
+
+    async def scenario() -> None:
+        assert await adapter.fetch_orders(status="open") == [{"id": "o-1"}]
+        assert await adapter.fetch_positions() == []
+        assert await adapter.cancel_order("o-1") is True
+        with pytest.raises(AlpacaOrderError):
+            await adapter.place_order({"client_order_id": "cid-2"})
+
+    asyncio.run(scenario())
+    assert adapter.map_order_state("pending_new") == "accepted"
+
+
+def test_retry_delay_without_header_is_capped() -> None:
+    response = httpx.Response(429)
+    assert 0.5 <= retry_delay(response, 0.5, 0.8) <= 0.8
+
+
+def test_retry_after_header_is_honoured_beyond_backoff_cap() -> None:
+    response = httpx.Response(429, headers={"Retry-After": "60"})
+    assert retry_delay(response, 0.5, 8.0) == 60.0
+
+    runaway = httpx.Response(503, headers={"Retry-After": "86400"})
+    assert retry_delay(runaway, 0.5, 8.0) == RETRY_AFTER_MAX_SEC
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+
+from core.event_bus import EventBus
+
+
+def test_event_bus_slow_subscriber_does_not_block_publisher() -> None:
+    async def runner() -> None:
+        bus = EventBus(maxsize=4)
+        release = asyncio.Event()
+        fast: list[int] = []
+        slow: list[int] = []
+
+        async def on_fast(payload: int) -> None:
+            fast.append(payload)
+
+        async def on_slow(payload: int) -> None:
+            await release.wait()
+            slow.append(payload)
+
+        async def on_fail(payload: int) -> None:
+            raise RuntimeError("boom")
+
+        await bus.subscribe("bars.*", on_fast)
+        await bus.subscribe("bars.AAPL", on_slow, overflow="drop_oldest")
+        failing = await bus.subscribe("*", on_fail)
+
+        for idx in range(10):
+            await asyncio.wait_for(bus.publish("bars.AAPL", idx), timeout=1)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        assert fast == list(range(10))
+        assert failing.errors == 10
+
+        release.set()
+        await asyncio.sleep(0.01)
+        # The slow worker held one event; its queue kept only the newest four.
+        assert slow == [0, 6, 7, 8, 9]
+
+        stats = bus.stats()
+        assert stats["publish_latency"]["bars.AAPL"]["count"] == 10
+        assert stats["handle_latency"]["bars.AAPL"]["count"] == 25
+        await bus.close()
+
+    asyncio.run(runner())
+
+
+def test_event_bus_coalesce_and_unsubscribe() -> None:
+    async def runner() -> None:
+        bus = EventBus()
+        gate = asyncio.Event()
+        seen: list[tuple[str, float]] = []
+
+        async def on_quote(payload: dict) -> None:
+            await gate.wait()
+            seen.append((payload["symbol"], payload["px"]))
+
+        sub = await bus.subscribe(
+            "quotes",
+            on_quote,
+            overflow="coalesce",
+            key=lambda _topic, payload: payload["symbol"],
+        )
+        await bus.publish("quotes", {"symbol": "AAPL", "px": 1.0})
+        await asyncio.sleep(0)  # worker picks up the first quote and waits
+        for px in (2.0, 3.0, 4.0):
+            await bus.publish("quotes", {"symbol": "AAPL", "px": px})
+        await bus.publish("quotes", {"symbol": "MSFT", "px": 9.0})
+        assert len(sub) == 2
+        assert sub.dropped == 2
+
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert seen == [("AAPL", 1.0), ("AAPL", 4.0), ("MSFT", 9.0)]
+
+        await bus.unsubscribe(sub)
+        await bus.publish("quotes", {"symbol": "AAPL", "px": 5.0})
+        await asyncio.sleep(0.01)
+        assert seen[-1] == ("MSFT", 9.0)
+        assert bus.stats()["subscribers"] == []
+
+    asyncio.run(runner())
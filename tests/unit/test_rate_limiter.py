@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
+from core.rate_governor import Lane, RateGovernor, classify
 from core.rate_limiter import RateLimitedQueue
 
 
@@ -36,3 +39,96 @@ def test_rate_limiter_updates_from_headers() -> None:
         await queue.stop()
 
     asyncio.run(runner())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_governor_reserves_budget_for_critical_lane() -> None:
+    clock = _Clock()
+    governor = RateGovernor(limit_rpm=60.0, burst_sec=10.0, clock=clock, wall_clock=clock)
+
+    # Background polling stops once it would dip into the 25% reserve...
+    granted = 0
+    while governor._reserve("account", Lane.BACKGROUND) == 0.0:
+        granted += 1
+    assert granted == 7
+    # ...which order traffic can still use.
+    assert governor._reserve("orders", Lane.CRITICAL) == 0.0
+
+    governor._mark_waiting(Lane.CRITICAL, 1)
+    clock.now += 60.0
+    assert governor._reserve("data", Lane.NORMAL) > 0.0
+    governor._mark_waiting(Lane.CRITICAL, -1)
+    assert governor._reserve("data", Lane.NORMAL) == 0.0
+
+    lanes = governor.snapshot()["lanes"]
+    assert lanes["background"]["granted"] == 7
+    assert lanes["critical"]["granted"] == 1
+
+
+def test_governor_paces_from_headers_and_blocks_on_429() -> None:
+    clock = _Clock()
+    governor = RateGovernor(limit_rpm=200.0, clock=clock, wall_clock=clock)
+    governor.observe(
+        {
+            "X-RateLimit-Limit": "200",
+            "X-RateLimit-Remaining": "2",
+            "X-RateLimit-Reset": "1700000010",
+        }
+    )
+
+    snap = governor.snapshot()
+    assert snap["paced"] is True
+    assert snap["account"]["tokens"] == 2.0
+    assert snap["account"]["rpm"] == 12.0
+    assert snap["reset_in"] == 10.0
+
+    assert governor._reserve("orders", Lane.CRITICAL) == 0.0
+    assert governor._reserve("orders", Lane.CRITICAL) == 0.0
+    assert governor._reserve("orders", Lane.CRITICAL) == pytest.approx(5.0)
+
+    # Once the broker window resets the full budget is available again.
+    clock.now += 10.0
+    assert governor._reserve("orders", Lane.CRITICAL) == 0.0
+    assert governor.snapshot()["paced"] is False
+
+    governor.block(3.0)
+    assert governor._reserve("orders", Lane.CRITICAL) == pytest.approx(3.0)
+    assert governor.snapshot()["rate_limited"] == 1
+
+
+def test_classify_routes_order_traffic_to_critical_lane() -> None:
+    assert classify("POST", "/v2/orders") == ("orders", Lane.CRITICAL)
+    assert classify("DELETE", "/v2/orders/abc") == ("orders", Lane.CRITICAL)
+    assert classify("GET", "/v2/orders") == ("account", Lane.BACKGROUND)
+    assert classify("GET", "/v2/account") == ("account", Lane.NORMAL)
+    assert classify("GET", "/v2/stocks/AAPL/bars") == ("data", Lane.NORMAL)
+
+
+def test_async_acquire_waits_without_blocking_the_loop(monkeypatch) -> None:
+    clock = _Clock()
+    governor = RateGovernor(limit_rpm=60.0, burst_sec=1.0, clock=clock, wall_clock=clock)
+    sleeps = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock.now += delay
+
+    def forbidden_sleep(delay: float) -> None:
+        raise AssertionError("time.sleep called from a coroutine")
+
+    monkeypatch.setattr("core.rate_governor.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr("core.rate_governor.time.sleep", forbidden_sleep)
+
+    async def scenario() -> float:
+        await governor.acquire_async("orders", Lane.CRITICAL)
+        return await governor.acquire_async("orders", Lane.CRITICAL)
+
+    waited = asyncio.run(scenario())
+    assert sleeps and waited == pytest.approx(sum(sleeps))
@@ -3,7 +3,7 @@ from __future__ import annotations
 """Small HTTP client helpers used by the Streamlit UI."""
 
 import os
-from typing import Any, Dict, Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 
 import requests
 import streamlit as st
@@ -482,6 +482,57 @@ class ApiClient:
     def exposure(self) -> Any:
         return self.get("/telemetry/exposure", default={})
 
+    def dashboard_snapshot(
+        self, previous: Optional[Mapping[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch ``/dashboard/snapshot``, merging any delta into ``previous``.
+
+        Returns the full merged snapshot (``previous`` itself when the backend
+        answers 304), or ``None`` when the backend has no snapshot endpoint.
+        """
+
+        params: Dict[str, Any] = {}
+        headers: Dict[str, str] = {}
+        if previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = str(previous["etag"])
+            params = {"since": previous.get("version"), "epoch": previous.get("epoch")}
+        try:
+            response = self._request(
+                "GET", "/dashboard/snapshot", params=params or None, headers=headers or None
+            )
+        except HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else None
+            if status in {404, 405}:
+                self._last_error = None
+                return None
+            raise
+        if response.status_code == 304 and previous:
+            return dict(previous)
+        payload = self._parse_response(response)
+        if not isinstance(payload, dict):
+            return None
+
+        sections = dict(payload.get("sections") or {})
+        errors = dict(payload.get("errors") or {})
+        if previous and not payload.get("full", True):
+            merged_sections = dict(previous.get("sections") or {})
+            merged_errors = {
+                name: message
+                for name, message in (previous.get("errors") or {}).items()
+                if name not in sections
+            }
+            merged_sections.update(sections)
+            merged_errors.update(errors)
+            sections, errors = merged_sections, merged_errors
+        return {
+            "epoch": payload.get("epoch"),
+            "version": payload.get("version"),
+            "etag": response.headers.get("ETag"),
+            "sections": sections,
+            "errors": errors,
+        }
+
     def _request_with_fallback(
         self,
         method: str,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import os
 import sys
 import time
@@ -1078,28 +1079,62 @@ def _schedule_status_poll(window: float = STATUS_POLL_WINDOW) -> None:
     st.session_state["__cc_force_poll"] = True
 
 
-def _load_remote_state(
-    api: ApiClient, backend_up: bool, health_payload: Mapping[str, Any] | None
-) -> Dict[str, Any]:
-    data: Dict[str, Any] = {}
-    if isinstance(health_payload, Mapping):
-        data["health"] = dict(health_payload)
-    else:
-        data["health"] = {}
+_DASHBOARD_STATE_KEY = "__cc_dashboard_snapshot__"
+# Sections whose fetch failure the individual-call path reports with defaults.
+_DASHBOARD_DEFAULTS: Dict[str, Any] = {
+    "telemetry": {},
+    "status": {},
+    "broker": {},
+    "account": {},
+    "positions": [],
+    "orders": [],
+    "stream": {"running": False, "source": "mock"},
+    "orchestrator": {},
+    "orchestrator_debug": {},
+    "runtime_flags": {},
+    "execution_tail": {"lines": []},
+    "strategy": {},
+    "risk": {},
+    "pnl": {},
+    "exposure": {},
+    "logs": {"lines": []},
+}
 
-    if not backend_up:
-        data["health_unreachable"] = True
-        truthy = {"1", "true", "yes", "on"}
-        env_mock_flag = (
-            str(os.environ.get("MOCK_MODE") or os.environ.get("MOCK_MARKET") or "")
-            .strip()
-            .lower()
-            in truthy
-        )
-        if env_mock_flag:
-            data["account"] = {"mock_mode": True}
-        return data
 
+def _load_dashboard_snapshot(api: ApiClient, data: Dict[str, Any]) -> bool:
+    """Fill ``data`` from ``/dashboard/snapshot``; False if it is unavailable."""
+
+    previous = st.session_state.get(_DASHBOARD_STATE_KEY)
+    try:
+        snapshot = api.dashboard_snapshot(previous if isinstance(previous, Mapping) else None)
+    except Exception:  # noqa: BLE001 - fall back to the individual endpoints
+        return False
+    if not snapshot:
+        return False
+    st.session_state[_DASHBOARD_STATE_KEY] = snapshot
+
+    sections = snapshot.get("sections") or {}
+    errors = snapshot.get("errors") or {}
+    for name, default in _DASHBOARD_DEFAULTS.items():
+        value = sections.get(name)
+        if name in errors or not isinstance(value, type(default)):
+            value = copy.deepcopy(default)
+        data[name] = value
+        if name in errors:
+            message = str(errors[name])
+            data[f"{name}_error"] = message
+            if name in {"positions", "orders"} and message[:3] in {"401", "403"}:
+                data[f"{name}_auth_error"] = True
+        elif name == "telemetry":
+            data["telemetry_error"] = None
+
+    logs_payload = data.pop("logs")
+    lines = logs_payload.get("lines") or logs_payload.get("entries") or logs_payload.get("events")
+    data["logs"] = lines if isinstance(lines, list) else []
+    return True
+
+
+def _load_sections_individually(api: ApiClient, data: Dict[str, Any]) -> None:
     try:
         telemetry_payload = api.telemetry_metrics()
     except requests.HTTPError as exc:
@@ -1137,13 +1172,6 @@ def _load_remote_state(
         data["account_error"] = str(exc)
         data["account"] = {}
 
-    health = data.get("health")
-    if isinstance(health, dict) and health.get("mock_mode"):
-        account_snapshot = data.setdefault("account", {})
-        if isinstance(account_snapshot, dict):
-            account_snapshot.setdefault("mock_mode", True)
-        st.session_state["__mock_mode__"] = True
-
     try:
         positions = api.positions()
         data["positions"] = positions if isinstance(positions, list) else []
@@ -1239,6 +1267,39 @@ def _load_remote_state(
         data["logs_error"] = str(exc)
         data["logs"] = []
 
+
+def _load_remote_state(
+    api: ApiClient, backend_up: bool, health_payload: Mapping[str, Any] | None
+) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    if isinstance(health_payload, Mapping):
+        data["health"] = dict(health_payload)
+    else:
+        data["health"] = {}
+
+    if not backend_up:
+        data["health_unreachable"] = True
+        truthy = {"1", "true", "yes", "on"}
+        env_mock_flag = (
+            str(os.environ.get("MOCK_MODE") or os.environ.get("MOCK_MARKET") or "")
+            .strip()
+            .lower()
+            in truthy
+        )
+        if env_mock_flag:
+            data["account"] = {"mock_mode": True}
+        return data
+
+    if not _load_dashboard_snapshot(api, data):
+        _load_sections_individually(api, data)
+
+    health = data.get("health")
+    if isinstance(health, dict) and health.get("mock_mode"):
+        account_snapshot = data.setdefault("account", {})
+        if isinstance(account_snapshot, dict):
+            account_snapshot.setdefault("mock_mode", True)
+        st.session_state["__mock_mode__"] = True
+
     telemetry_snapshot = data.get("telemetry")
     if isinstance(telemetry_snapshot, dict):
         positions_payload = telemetry_snapshot.get("positions")
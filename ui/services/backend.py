@@ -392,6 +392,14 @@ class RealAPI:
     def get_status(self) -> Dict[str, Any]:
         return self._request("GET", "/status", default={})
 
+    def get_dashboard_snapshot(
+        self, previous: Optional[Mapping[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return self.client.dashboard_snapshot(previous)
+        except Exception as exc:  # noqa: BLE001 - defensive network guard
+            raise BackendError(str(exc)) from exc
+
     def start_paper(self, preset: Optional[str] = None) -> Dict[str, Any]:
         payload = {"preset": preset} if preset else None
         return self._request("POST", "/paper/start", json_payload=payload)